@@ -0,0 +1,265 @@
+"""Benchmark the adaptive batch scheduler against in-order batch execution.
+
+The default mode is a deterministic discrete-event simulation. Fake tools
+with known latency distributions (a few slow searches, many fast lookups, and
+an upstream that throttles calls beyond a hidden concurrency limit) run on a
+simulated pool of workers. Batches are submitted to the pool in input order,
+as the executor did before the scheduler, and through the scheduler's
+dispatch policy. Each run repeats the batch a few times, so the scheduler's
+latency and throttling statistics carry over from one batch to the next as
+they do inside a long-lived ToolUniverse. Same seed, same numbers.
+
+``--real`` runs the same kind of workload through ToolUniverse.run with
+sleeping tools, with the scheduler enabled and disabled, and reports
+wall-clock times.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Allow running directly from the repo without installing the package
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if SRC_ROOT.exists():
+    sys.path.insert(0, str(SRC_ROOT))
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.batch_scheduler import (
+    OK,
+    THROTTLED,
+    BatchScheduler,
+    ScheduledTask,
+    note_throttled,
+)
+
+# name -> (calls per batch, mean latency in seconds, upstream, throttle capacity)
+WORKLOAD: Dict[str, Tuple[int, float, str, int]] = {
+    "fast_lookup": (120, 0.1, "lookup.example.org", 0),
+    "medium_fetch": (30, 0.6, "fetch.example.org", 0),
+    "slow_search": (8, 3.0, "search.example.org", 0),
+    "throttled_api": (40, 0.3, "api.example.org", 3),
+}
+# Extra time a throttled call spends (429, Retry-After, retry).
+THROTTLE_PENALTY = 1.0
+
+
+class _Call:
+    __slots__ = ("tool", "upstream", "latency", "capacity")
+
+    def __init__(self, tool, upstream, latency, capacity):
+        self.tool = tool
+        self.upstream = upstream
+        self.latency = latency
+        self.capacity = capacity
+
+
+def build_batch(seed: int, shuffle: bool) -> List[_Call]:
+    """One batch of calls; latencies are log-normal around each tool's mean."""
+    rng = random.Random(seed)
+    calls = []
+    for tool, (count, mean, upstream, capacity) in WORKLOAD.items():
+        for _ in range(count):
+            latency = mean * rng.lognormvariate(0, 0.35)
+            calls.append(_Call(tool, upstream, latency, capacity))
+    if shuffle:
+        rng.shuffle(calls)
+    return calls
+
+
+class _Simulation:
+    """Runs calls on ``workers`` simulated workers and returns the makespan."""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.now = 0.0
+        self.throttled = 0
+
+    def _start(self, call: _Call, running: Dict[str, int]) -> Tuple[float, str]:
+        running[call.upstream] = running.get(call.upstream, 0) + 1
+        if call.capacity and running[call.upstream] > call.capacity:
+            self.throttled += 1
+            return call.latency + THROTTLE_PENALTY, THROTTLED
+        return call.latency, OK
+
+    def in_order(self, calls: List[_Call]) -> float:
+        start, queue = self.now, deque(calls)
+        events: List[tuple] = []
+        running: Dict[str, int] = {}
+        seq = 0
+        while queue or events:
+            while queue and len(events) < self.workers:
+                call = queue.popleft()
+                latency, _ = self._start(call, running)
+                heapq.heappush(events, (self.now + latency, seq, call))
+                seq += 1
+            self.now, _, call = heapq.heappop(events)
+            running[call.upstream] -= 1
+        return self.now - start
+
+    def scheduled(self, calls: List[_Call], scheduler: BatchScheduler) -> float:
+        start = self.now
+        tasks = [
+            ScheduledTask(None, call, call.tool, call.upstream, self.workers)
+            for call in calls
+        ]
+        dispatch = scheduler.dispatch(tasks, self.workers)
+        events: List[tuple] = []
+        running: Dict[str, int] = {}
+        seq = 0
+        while dispatch.pending or events:
+            while len(events) < self.workers:
+                task = dispatch.next_task()
+                if task is None:
+                    break
+                latency, outcome = self._start(task.item, running)
+                heapq.heappush(
+                    events, (self.now + latency, seq, task, outcome, latency)
+                )
+                seq += 1
+            self.now, _, task, outcome, latency = heapq.heappop(events)
+            running[task.upstream] -= 1
+            dispatch.task_done(task)
+            scheduler.record(task.tool, latency, outcome, ceiling=task.ceiling)
+        return self.now - start
+
+
+def simulate(
+    seed: int = 7, workers: int = 8, rounds: int = 3, shuffle: bool = False
+) -> List[Tuple[float, float, int, int]]:
+    """Return ``(in_order, scheduled, in_order_429s, scheduled_429s)`` per round."""
+    baseline = _Simulation(workers)
+    adaptive = _Simulation(workers)
+    scheduler = BatchScheduler(enabled=True, clock=lambda: adaptive.now)
+    rows = []
+    for round_index in range(rounds):
+        calls = build_batch(seed + round_index, shuffle)
+        throttled_before = (baseline.throttled, adaptive.throttled)
+        in_order = baseline.in_order(calls)
+        scheduled = adaptive.scheduled(calls, scheduler)
+        rows.append(
+            (
+                in_order,
+                scheduled,
+                baseline.throttled - throttled_before[0],
+                adaptive.throttled - throttled_before[1],
+            )
+        )
+    return rows
+
+
+class SleepTool(BaseTool):
+    """Sleeps for a log-normal latency; throttles beyond its capacity."""
+
+    active: Dict[str, int] = {}
+
+    def run(self, arguments=None, **kwargs):
+        name = self.tool_config["name"]
+        count, mean, _, capacity = WORKLOAD[name]
+        scale = self.tool_config["time_scale"]
+        rng = random.Random(arguments["seed"])
+        latency = mean * rng.lognormvariate(0, 0.35) * scale
+        SleepTool.active[name] = SleepTool.active.get(name, 0) + 1
+        try:
+            if capacity and SleepTool.active[name] > capacity:
+                # What the shared HTTP client reports on a 429 response.
+                note_throttled()
+                latency += THROTTLE_PENALTY * scale
+            time.sleep(latency)
+        finally:
+            SleepTool.active[name] -= 1
+        return {"slept": latency}
+
+
+def run_real(workers: int, rounds: int, time_scale: float, shuffle: bool):
+    """Time ToolUniverse.run batches with the scheduler on and off."""
+    timings = {}
+    for enabled in (False, True):
+        tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+        tu.batch_scheduler = BatchScheduler(enabled=enabled)
+        for name in WORKLOAD:
+            tu.register_custom_tool(
+                SleepTool,
+                tool_config={
+                    "name": name,
+                    "type": "SleepTool",
+                    "description": f"Benchmark tool {name}",
+                    "time_scale": time_scale,
+                    "parameter": {
+                        "type": "object",
+                        "properties": {"seed": {"type": "integer"}},
+                        "required": ["seed"],
+                    },
+                },
+            )
+        rows = []
+        for round_index in range(rounds):
+            calls = [
+                {"name": name, "arguments": {"seed": round_index * 10_000 + i}}
+                for name, (count, *_rest) in WORKLOAD.items()
+                for i in range(count)
+            ]
+            if shuffle:
+                random.Random(round_index).shuffle(calls)
+            start = time.perf_counter()
+            tu.run(calls, max_workers=workers)
+            rows.append(time.perf_counter() - start)
+        timings[enabled] = rows
+        tu.close()
+    return list(zip(timings[False], timings[True]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=8, help="Parallel workers")
+    parser.add_argument("--rounds", type=int, default=3, help="Batches per run")
+    parser.add_argument("--seed", type=int, default=7, help="Workload seed")
+    parser.add_argument(
+        "--shuffle", action="store_true", help="Shuffle calls instead of grouping"
+    )
+    parser.add_argument(
+        "--real", action="store_true", help="Run real batches with sleeping tools"
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0.05,
+        help="Scale factor for sleep times in --real mode",
+    )
+    args = parser.parse_args()
+
+    print("=== Adaptive Batch Scheduler Benchmark ===")
+    print(
+        f"workers={args.workers}, rounds={args.rounds}, shuffle={args.shuffle}, "
+        f"calls/batch={sum(spec[0] for spec in WORKLOAD.values())}"
+    )
+    if args.real:
+        rows = run_real(args.workers, args.rounds, args.time_scale, args.shuffle)
+        for index, (in_order, scheduled) in enumerate(rows, 1):
+            print(
+                f"round {index}: in-order {in_order:.2f}s, scheduled {scheduled:.2f}s "
+                f"({in_order / scheduled:.2f}x)"
+            )
+        return
+
+    rows = simulate(args.seed, args.workers, args.rounds, args.shuffle)
+    for index, (in_order, scheduled, base_429, sched_429) in enumerate(rows, 1):
+        print(
+            f"round {index}: in-order {in_order:.2f}s ({base_429} throttled), "
+            f"scheduled {scheduled:.2f}s ({sched_429} throttled), "
+            f"speedup {in_order / scheduled:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
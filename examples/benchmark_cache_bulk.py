@@ -0,0 +1,117 @@
+"""Benchmark bulk cache reads and writes against per-key SQLite round trips.
+
+Writes ``--calls`` small tool results into a fresh persistent cache and reads
+them back from a new manager (so reads miss memory and hit SQLite), the way a
+batch run primes its cache. Reports:
+
+- ``set loop``: synchronous ``set`` per result, one commit each
+- ``async set``: ``set`` per result through the background writer, which
+  coalesces writes into group commits (timed until ``flush`` returns)
+- ``bulk_set``: one ``executemany`` in a single transaction
+- ``get loop``: ``get`` per key, one SELECT and UPDATE each
+- ``bulk_get``: chunked ``SELECT ... WHERE cache_key IN (...)``
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running directly from the repo without installing the package
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if SRC_ROOT.exists():
+    sys.path.insert(0, str(SRC_ROOT))
+
+from tooluniverse.cache.result_cache_manager import ResultCacheManager
+
+
+def _entries(calls: int):
+    return [
+        {
+            "namespace": "UniProt_get_entry",
+            "version": "v1",
+            "cache_key": f"{i:08x}",
+            "value": {"accession": f"P{i:05d}", "organism": "Homo sapiens"},
+        }
+        for i in range(calls)
+    ]
+
+
+def _manager(path: str, async_persist: bool) -> ResultCacheManager:
+    return ResultCacheManager(
+        persistent_path=path, async_persist=async_persist, memory_size=1
+    )
+
+
+def _timed(label: str, calls: int, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} {elapsed * 1000:9.1f}ms  {calls / elapsed:10.0f} ops/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5000, help="Cached results")
+    args = parser.parse_args()
+    entries = _entries(args.calls)
+    requests = [
+        {k: entry[k] for k in ("namespace", "version", "cache_key")}
+        for entry in entries
+    ]
+
+    print("=== Cache Bulk Operations Benchmark ===")
+    print(f"calls={args.calls}")
+    with tempfile.TemporaryDirectory(prefix="tu-bulk-") as directory:
+
+        def path(name):
+            return os.path.join(directory, f"{name}.sqlite")
+
+        manager = _manager(path("loop"), async_persist=False)
+        _timed(
+            "set loop",
+            args.calls,
+            lambda: [manager.set(**entry) for entry in entries],
+        )
+        manager.close()
+
+        manager = _manager(path("async"), async_persist=True)
+
+        def async_set():
+            for entry in entries:
+                manager.set(**entry)
+            manager.flush()
+
+        _timed("async set", args.calls, async_set)
+        print(f"{'':<10} {manager.stats()['group_commits']} group commits")
+        manager.close()
+
+        manager = _manager(path("bulk"), async_persist=False)
+        _timed("bulk_set", args.calls, lambda: manager.bulk_set(entries))
+        manager.close()
+
+        manager = _manager(path("bulk"), async_persist=False)
+        loop = _timed(
+            "get loop",
+            args.calls,
+            lambda: [manager.get(**request) for request in requests],
+        )
+        manager.close()
+
+        manager = _manager(path("bulk"), async_persist=False)
+        hits = {}
+        bulk = _timed(
+            "bulk_get", args.calls, lambda: hits.update(manager.bulk_get(requests))
+        )
+        assert len(hits) == args.calls
+        manager.close()
+        print(f"bulk_get speedup: {loop / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Benchmark persistent cache size and read latency per value codec.
+
+Writes synthetic tool payloads shaped like openFDA drug labels (long text
+sections), EuropePMC result pages (lists of article records), HPA tissue
+expression dicts and small single-record lookups into a fresh SQLite cache
+for each codec configuration, then reports:
+
+- ``file``: size of the SQLite file after a WAL checkpoint
+- ``values``: total size of the stored value payloads
+- ``small``: average stored size of the small single-record payloads, which
+  gain most from namespace dictionaries
+- ``read``: median ``PersistentCache.get`` latency over all keys
+
+``pickle`` with compression ``none`` is the format used before codecs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Allow running directly from the repo without installing the package
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if SRC_ROOT.exists():
+    sys.path.insert(0, str(SRC_ROOT))
+
+from tooluniverse.cache.codecs import SERIALIZERS, CacheCodec, available_compressors
+from tooluniverse.cache.sqlite_backend import PersistentCache
+
+WORDS = (
+    "protein gene expression tissue cancer drug adverse reaction label warning "
+    "dosage clinical trial patient study results method pathway variant dose "
+    "hepatic renal infusion tablet contraindicated pregnancy pediatric"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def fda_label(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "meta": {"results": {"skip": 0, "limit": 1, "total": 1}},
+        "results": [
+            {
+                "id": f"{i:032x}",
+                "set_id": f"{i * 7919:032x}",
+                "effective_time": "20240101",
+                "warnings": [_text(rng, 400)],
+                "indications_and_usage": [_text(rng, 250)],
+                "adverse_reactions": [_text(rng, 700)],
+                "openfda": {
+                    "brand_name": [f"Brand{i}"],
+                    "generic_name": [f"generic{i}"],
+                    "route": ["ORAL"],
+                    "manufacturer_name": ["Example Pharma"],
+                },
+            }
+        ],
+    }
+
+
+def europepmc_page(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "hitCount": 1000 + i,
+        "request": {"query": _text(rng, 3), "pageSize": 25},
+        "resultList": {
+            "result": [
+                {
+                    "id": str(30000000 + i * 25 + j),
+                    "source": "MED",
+                    "pmid": str(30000000 + i * 25 + j),
+                    "title": _text(rng, 14),
+                    "authorString": "Smith J, Doe A, Lee K.",
+                    "journalTitle": rng.choice(["Nature", "Cell", "Science"]),
+                    "pubYear": str(rng.randrange(2000, 2025)),
+                    "abstractText": _text(rng, 120),
+                    "isOpenAccess": rng.choice(["Y", "N"]),
+                    "citedByCount": rng.randrange(500),
+                }
+                for j in range(25)
+            ]
+        },
+    }
+
+
+def hpa_expression(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "gene": f"GENE{i}",
+        "ensembl": f"ENSG{i:011d}",
+        "tissues": [
+            {
+                "tissue": tissue,
+                "level": rng.choice(["High", "Medium", "Low", "Not detected"]),
+                "cell_types": [
+                    {
+                        "name": _text(rng, 2),
+                        "level": rng.choice(["High", "Medium", "Low"]),
+                        "reliability": rng.choice(["Approved", "Supported"]),
+                    }
+                    for _ in range(4)
+                ],
+            }
+            for tissue in WORDS[:20]
+        ],
+    }
+
+
+def small_record(rng: random.Random, i: int) -> Dict[str, Any]:
+    return {
+        "status": "success",
+        "data": {
+            "accession": f"P{i:05d}",
+            "name": _text(rng, 2),
+            "organism": "Homo sapiens",
+            "score": round(rng.random(), 3),
+            "url": f"https://rest.uniprot.org/uniprotkb/P{i:05d}",
+        },
+    }
+
+
+PAYLOADS = {
+    "openfda": fda_label,
+    "europepmc": europepmc_page,
+    "hpa": hpa_expression,
+    "uniprot": small_record,
+}
+
+
+def build_payloads(per_namespace: int, seed: int) -> List[Tuple[str, str, Any]]:
+    rng = random.Random(seed)
+    return [
+        (namespace, f"{namespace}:{i}", make(rng, i))
+        for namespace, make in PAYLOADS.items()
+        for i in range(per_namespace)
+    ]
+
+
+def measure(codec: CacheCodec, payloads, directory: str) -> Dict[str, float]:
+    path = os.path.join(directory, f"cache-{time.perf_counter_ns()}.sqlite")
+    cache = PersistentCache(path, codec=codec)
+    for namespace, key, value in payloads:
+        cache.set(key, value, namespace=namespace, version="v1", ttl=None)
+    stats = cache.stats()
+    cache.close()
+
+    # Reopen so reads start from the file, as in a new process
+    cache = PersistentCache(path, codec=codec)
+    timings = []
+    for _, key, value in payloads:
+        start = time.perf_counter()
+        entry = cache.get(key)
+        timings.append(time.perf_counter() - start)
+        assert entry is not None and entry.value == value
+    (small,) = cache._conn.execute(
+        "SELECT AVG(LENGTH(value)) FROM cache_entries WHERE namespace = 'uniprot'"
+    ).fetchone()
+    cache._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    cache.close()
+    return {
+        "file": os.path.getsize(path),
+        "values": stats["approx_bytes"],
+        "small": small,
+        "read": statistics.median(timings),
+        "dictionaries": stats["dictionaries"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--per-namespace", type=int, default=200, help="Payloads per namespace"
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Workload seed")
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.per_namespace, args.seed)
+    configs = [("pickle", "none", False)]
+    for compressor in available_compressors():
+        configs += [("pickle", compressor, False), ("pickle", compressor, True)]
+    for serializer in ("json", "msgpack"):
+        if SERIALIZERS[serializer][2]:
+            configs.append((serializer, available_compressors()[0], True))
+
+    print("=== Cache Codec Benchmark ===")
+    print(f"payloads={len(payloads)} ({', '.join(PAYLOADS)})")
+    baseline = None
+    with tempfile.TemporaryDirectory(prefix="tu-codecs-") as directory:
+        for serializer, compression, dictionaries in configs:
+            codec = CacheCodec(serializer, compression, dictionaries=dictionaries)
+            result = measure(codec, payloads, directory)
+            baseline = baseline or result
+            label = f"{serializer}+{compression}" + (" +dict" if dictionaries else "")
+            print(
+                f"{label:<22} file {result['file'] / 1024:9.1f}KB  "
+                f"values {result['values'] / 1024:9.1f}KB "
+                f"({baseline['values'] / result['values']:.1f}x smaller)  "
+                f"small {result['small']:6.0f}B  "
+                f"read {result['read'] * 1e6:7.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
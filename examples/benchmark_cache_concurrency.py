@@ -0,0 +1,104 @@
+"""Benchmark concurrent persistent cache hits.
+
+``--threads`` worker threads read random hot keys from a ``PersistentCache``
+(the SQLite layer, without the in-memory LRU in front of it) and the
+aggregate hit throughput is reported for each configuration:
+
+- ``write-through``: every hit updates ``last_accessed``/``hit_count`` on the
+  shared writer connection, as before access statistics were buffered
+- ``buffered``: hits are counted in memory and flushed in batches
+- ``buffered+readers``: buffered, and each thread reads through its own
+  read-only connection
+
+Decoding values holds the GIL, so gains come from removing the write per
+read and the shared connection lock rather than from parallel decoding.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Allow running directly from the repo without installing the package
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if SRC_ROOT.exists():
+    sys.path.insert(0, str(SRC_ROOT))
+
+from tooluniverse.cache.codecs import CacheCodec
+from tooluniverse.cache.sqlite_backend import PersistentCache
+
+CONFIGS = {
+    "write-through": {"access_flush_interval": 0, "read_connections": False},
+    "buffered": {"access_flush_interval": 5, "read_connections": False},
+    "buffered+readers": {"access_flush_interval": 5, "read_connections": True},
+}
+
+
+def populate(path: str, keys: int) -> None:
+    cache = PersistentCache(path, codec=CacheCodec("pickle", "none"))
+    cache.set_many(
+        (
+            f"key{i}",
+            {"accession": f"P{i:05d}", "organism": "Homo sapiens", "length": i},
+            "UniProt_get_entry",
+            "v1",
+            None,
+        )
+        for i in range(keys)
+    )
+    cache.close()
+
+
+def hammer(path: str, config, threads: int, reads: int, keys: int) -> float:
+    cache = PersistentCache(path, codec=CacheCodec("pickle", "none"), **config)
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(reads):
+            assert cache.get(f"key{rng.randrange(keys)}") is not None
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    cache.close()
+    return threads * reads / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="Thread counts"
+    )
+    parser.add_argument("--reads", type=int, default=2000, help="Reads per thread")
+    parser.add_argument("--keys", type=int, default=1000, help="Hot keys")
+    args = parser.parse_args()
+
+    print("=== Cache Concurrency Benchmark ===")
+    print(f"keys={args.keys} reads/thread={args.reads} cpus={os.cpu_count()}")
+    with tempfile.TemporaryDirectory(prefix="tu-concurrency-") as directory:
+        path = os.path.join(directory, "cache.sqlite")
+        populate(path, args.keys)
+        print(f"{'threads':<18}" + "".join(f"{n:>12}" for n in args.threads))
+        for name, config in CONFIGS.items():
+            rates = [
+                hammer(path, config, threads, args.reads, args.keys)
+                for threads in args.threads
+            ]
+            print(f"{name:<18}" + "".join(f"{rate:>10.0f}/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
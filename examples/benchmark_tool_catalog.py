@@ -0,0 +1,230 @@
+"""Benchmark tool loading and filtering with the indexed ToolCatalog.
+
+Builds a synthetic set of tools (10,000 by default, spread over categories,
+types and labels, with some duplicate names as in the shipped configs) and
+times the load and filter paths two ways:
+
+- ``list scan``: the list-based implementations ToolUniverse used before the
+  catalog (deduplication by ``name not in list``, filters as scans over
+  ``all_tools``), reproduced here.
+- ``catalog``: the same ToolUniverse methods running on ``tool_catalog``.
+
+Both sides return the same tools; the benchmark checks that before timing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import random
+import re
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Allow running directly from the repo without installing the package
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+if SRC_ROOT.exists():
+    sys.path.insert(0, str(SRC_ROOT))
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.logging_config import set_log_level
+
+
+def build_tools(count: int, seed: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Synthetic ``{category: [tool, ...]}``; about 2% of names repeat."""
+    rng = random.Random(seed)
+    categories: Dict[str, List[Dict[str, Any]]] = {}
+    for index in range(count):
+        name = f"tool_{rng.randrange(count) if rng.random() < 0.02 else index}"
+        category = f"category_{index % 80}"
+        categories.setdefault(category, []).append(
+            {
+                "name": name,
+                "type": f"Type{index % 120}",
+                "description": f"Synthetic tool {index} for {rng.choice(WORDS)}",
+                "label": rng.sample(WORDS, 2),
+                "parameter": {"type": "object", "properties": {}},
+            }
+        )
+    return categories
+
+
+WORDS = ["protein", "gene", "drug", "disease", "pathway", "literature", "variant"]
+
+
+def legacy_load(all_tools):
+    tool_name_list = []
+    dedup_all_tools = []
+    for each in all_tools:
+        if each["name"] not in tool_name_list:
+            tool_name_list.append(each["name"])
+            dedup_all_tools.append(each)
+    # refresh_tool_name_desc
+    tool_desc_list = []
+    all_tool_dict = {}
+    for tool in dedup_all_tools:
+        tool_desc_list.append(tool["name"] + ": " + tool["description"])
+        all_tool_dict[tool["name"]] = tool
+    return dedup_all_tools, all_tool_dict
+
+
+def legacy_filter(all_tools, include_tools=None, include_tool_types=None):
+    return [
+        tool
+        for tool in all_tools
+        if (not include_tools or tool["name"] in include_tools)
+        and (not include_tool_types or tool["type"] in include_tool_types)
+    ]
+
+
+def legacy_select(category_dicts, include_names=None, include_categories=None):
+    selected = []
+    categories = set(category_dicts)
+    if include_categories is not None:
+        categories &= set(include_categories)
+    for category in categories:
+        selected.extend(category_dicts[category])
+    if include_names is not None:
+        selected = [tool for tool in selected if tool["name"] in include_names]
+    return selected
+
+
+def legacy_find(all_tools, pattern):
+    return [
+        tool
+        for tool in all_tools
+        if re.search(pattern, tool.get("name", ""), re.IGNORECASE)
+    ]
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=10_000, help="Synthetic tools")
+    parser.add_argument("--queries", type=int, default=200, help="Filter calls")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    parser.add_argument("--seed", type=int, default=7, help="Workload seed")
+    args = parser.parse_args()
+    set_log_level("ERROR")
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    category_dicts = build_tools(args.tools, args.seed)
+    all_tools = [tool for tools in category_dicts.values() for tool in tools]
+    rng = random.Random(args.seed)
+    queries = [
+        (
+            set(rng.sample([t["name"] for t in all_tools], 20)),
+            {f"Type{rng.randrange(120)}", f"Type{rng.randrange(120)}"},
+            [f"category_{rng.randrange(80)}"],
+        )
+        for _ in range(args.queries)
+    ]
+
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+
+    def catalog_load():
+        tu.all_tools = list(all_tools)
+        tu.all_tool_dict = {}
+        tu.tool_category_dicts = category_dicts
+        tu._filter_and_deduplicate_tools(set(), None)
+
+    catalog_load()
+    loaded, _ = legacy_load(all_tools)
+    names, types, categories = queries[0]
+    assert tu.all_tools == loaded
+    assert tu.filter_tools(include_tools=names) == legacy_filter(loaded, names)
+    assert tu.filter_tools(include_tool_types=types) == legacy_filter(
+        loaded, None, types
+    )
+    assert tu.find_tools_by_pattern("_12") == legacy_find(loaded, "_12")
+
+    # Distinct patterns, so searches are not answered from the catalog's cache
+    fresh = itertools.count()
+    rows = [
+        (
+            f"load + dedup ({args.tools} tools)",
+            best_of(args.repeat, lambda: legacy_load(all_tools)),
+            best_of(args.repeat, catalog_load),
+        ),
+        (
+            f"filter_tools by name x{args.queries}",
+            best_of(
+                args.repeat, lambda: [legacy_filter(loaded, q[0]) for q in queries]
+            ),
+            best_of(
+                args.repeat,
+                lambda: [tu.filter_tools(include_tools=q[0]) for q in queries],
+            ),
+        ),
+        (
+            f"filter_tools by type x{args.queries}",
+            best_of(
+                args.repeat,
+                lambda: [legacy_filter(loaded, None, q[1]) for q in queries],
+            ),
+            best_of(
+                args.repeat,
+                lambda: [tu.filter_tools(include_tool_types=q[1]) for q in queries],
+            ),
+        ),
+        (
+            f"select_tools by category x{args.queries}",
+            best_of(
+                args.repeat,
+                lambda: [legacy_select(category_dicts, None, q[2]) for q in queries],
+            ),
+            best_of(
+                args.repeat,
+                lambda: [tu.select_tools(include_categories=q[2]) for q in queries],
+            ),
+        ),
+        (
+            f"find_tools_by_pattern x{args.queries}",
+            best_of(
+                args.repeat,
+                lambda: [legacy_find(loaded, f"_{next(fresh)}$") for _ in queries],
+            ),
+            best_of(
+                args.repeat,
+                lambda: [tu.find_tools_by_pattern(f"_{next(fresh)}$") for _ in queries],
+            ),
+        ),
+        (
+            f"find_tools_by_pattern, repeated x{args.queries}",
+            best_of(
+                args.repeat,
+                lambda: [legacy_find(loaded, "_99") for _ in queries],
+            ),
+            best_of(
+                args.repeat,
+                lambda: [tu.find_tools_by_pattern("_99") for _ in queries],
+            ),
+        ),
+    ]
+
+    print("=== Tool Catalog Benchmark ===")
+    print(f"tools={args.tools}, unique={len(loaded)}, best of {args.repeat}")
+    for label, legacy, catalog in rows:
+        print(
+            f"{label:<44} list scan {legacy * 1000:9.2f}ms  "
+            f"catalog {catalog * 1000:9.2f}ms  ({legacy / catalog:.1f}x)"
+        )
+    tu.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Offline startup benchmarks for ToolUniverse.
+
+Each scenario runs in a fresh interpreter with outbound network connections
+disabled, and records:
+
+- ``seconds``: wall time of the measured step (median over ``--repeat`` runs)
+- ``modules``: ``len(sys.modules)`` after the step
+- ``peak_rss_mb``: peak resident set size of the process
+
+Results are appended to a JSON history file (one record per run, tagged with
+the git commit). The run fails (exit code 1) when a scenario exceeds an
+absolute ceiling from the thresholds file, or when it is more than
+``max_regression`` worse than the median of recent runs on the same Python
+version and platform (and by more than ``regression_slack``, which keeps
+timer noise on very short steps from failing the run).
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --scenario import_tooluniverse --repeat 5
+    python scripts/benchmark_startup.py --no-history --thresholds my_limits.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_HISTORY = REPO_ROOT / "tests" / "reports" / "startup_benchmarks.json"
+DEFAULT_THRESHOLDS = Path(__file__).resolve().parent / "startup_thresholds.json"
+
+FILTERED_CATEGORIES = ["uniprot", "ChEMBL", "opentarget", "arxiv", "pubmed"]
+
+METRICS = ("seconds", "modules", "peak_rss_mb")
+
+_OFFLINE = """
+import socket
+
+def _offline(*args, **kwargs):
+    raise OSError("network access is disabled in startup benchmarks")
+
+socket.socket.connect = socket.socket.connect_ex = _offline
+socket.create_connection = _offline
+"""
+
+# Written by a separate interpreter, so the restore starts cold
+_SAVE_SNAPSHOT = _OFFLINE + (
+    "from tooluniverse import ToolUniverse\n"
+    "tu = ToolUniverse()\n"
+    "tu.load_tools()\n"
+    "tu.save_snapshot('startup.tus')\n"
+)
+
+# name -> (setup, measured step); both run in the probe's namespace
+SCENARIOS: Dict[str, tuple] = {
+    "import_tooluniverse": ("", "import tooluniverse"),
+    "import_tools": ("", "import tooluniverse.tools"),
+    "load_tools_all": (
+        "from tooluniverse import ToolUniverse",
+        "ToolUniverse().load_tools()",
+    ),
+    "load_tools_filtered": (
+        "from tooluniverse import ToolUniverse",
+        f"ToolUniverse().load_tools(tool_type={FILTERED_CATEGORIES!r})",
+    ),
+    "restore_snapshot": (
+        "import subprocess\n"
+        f"subprocess.run([sys.executable, '-c', {_SAVE_SNAPSHOT!r}], check=True)\n"
+        "from tooluniverse import ToolUniverse",
+        "ToolUniverse.from_snapshot('startup.tus')",
+    ),
+    "shared_client_cold": (
+        "from tooluniverse.tools import get_shared_client",
+        "get_shared_client()",
+    ),
+    "smcp_expose_tools": (
+        "from tooluniverse.smcp import SMCP\n"
+        "server = SMCP(auto_expose_tools=False, search_enabled=False)\n"
+        "server.tooluniverse.load_tools()",
+        "server._expose_tooluniverse_tools()",
+    ),
+}
+
+_PROBE = (
+    _OFFLINE
+    + """
+import json, sys, time
+
+{setup}
+start = time.perf_counter()
+{step}
+seconds = time.perf_counter() - start
+modules = len(sys.modules)
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+except ImportError:
+    import psutil
+    info = psutil.Process().memory_info()
+    peak_rss_mb = getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+print("BENCHMARK_RESULT " + json.dumps(
+    {{"seconds": seconds, "modules": modules, "peak_rss_mb": peak_rss_mb}}
+))
+"""
+)
+
+
+def _probe_env(cache_dir: str) -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if k != "TOOLUNIVERSE_LIGHT_IMPORT"}
+    env["TOOLUNIVERSE_CACHE_DIR"] = cache_dir
+    env["HF_HUB_OFFLINE"] = "1"
+    env["TOOLUNIVERSE_LOG_LEVEL"] = "ERROR"
+    src = REPO_ROOT / "src"
+    if src.exists():
+        env["PYTHONPATH"] = os.pathsep.join(
+            [str(src)] + [p for p in [env.get("PYTHONPATH")] if p]
+        )
+    return env
+
+
+def run_probe(name: str, cache_dir: str, workdir: str) -> Dict[str, float]:
+    """Run scenario ``name`` once in a fresh interpreter."""
+    setup, step = SCENARIOS[name]
+    code = _PROBE.format(setup=setup, step=step)
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=workdir,
+        env=_probe_env(cache_dir),
+        timeout=600,
+    )
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith("BENCHMARK_RESULT "):
+            return json.loads(line[len("BENCHMARK_RESULT ") :])
+    raise RuntimeError(
+        f"scenario {name} failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}"
+    )
+
+
+def run_scenarios(names: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Median seconds and worst modules/RSS of each scenario over ``repeat`` runs."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="tu-startup-") as tmp:
+        cache_dir = os.path.join(tmp, "cache")
+        # Untimed warm-up: compiles the tool catalog and warms the file cache
+        run_probe("load_tools_all", cache_dir, tmp)
+        for name in names:
+            runs = [run_probe(name, cache_dir, tmp) for _ in range(repeat)]
+            results[name] = {
+                "seconds": round(statistics.median(r["seconds"] for r in runs), 4),
+                "modules": max(r["modules"] for r in runs),
+                "peak_rss_mb": round(max(r["peak_rss_mb"] for r in runs), 1),
+            }
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_key() -> str:
+    return f"{platform.python_version()} {platform.system()}-{platform.machine()}"
+
+
+def load_history(path: Path) -> List[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        return []
+    return history if isinstance(history, list) else []
+
+
+def check_results(
+    results: Dict[str, Dict[str, float]],
+    thresholds: Dict[str, Any],
+    history: List[Dict[str, Any]],
+    environment: str,
+) -> List[str]:
+    """Return a message for every metric over its ceiling or regression budget."""
+    failures = []
+    ceilings = thresholds.get("scenarios", {})
+    max_regression = thresholds.get("max_regression")
+    baseline_runs = thresholds.get("baseline_runs", 5)
+    slack = thresholds.get("regression_slack", {})
+    previous = [
+        record["results"]
+        for record in history
+        if record.get("environment") == environment and "results" in record
+    ][-baseline_runs:]
+
+    for name, metrics in results.items():
+        for metric in METRICS:
+            value = metrics[metric]
+            ceiling = ceilings.get(name, {}).get(metric)
+            if ceiling is not None and value > ceiling:
+                failures.append(f"{name}.{metric} = {value} exceeds ceiling {ceiling}")
+            baseline = [
+                run[name][metric] for run in previous if metric in run.get(name, {})
+            ]
+            if max_regression is not None and baseline:
+                reference = statistics.median(baseline)
+                if value > reference * (
+                    1 + max_regression
+                ) and value - reference > slack.get(metric, 0):
+                    failures.append(
+                        f"{name}.{metric} = {value} is more than "
+                        f"{max_regression:.0%} above the recent median {reference}"
+                    )
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Offline startup benchmarks for ToolUniverse"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Scenario to run (repeatable; default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario")
+    parser.add_argument("--history", default=str(DEFAULT_HISTORY))
+    parser.add_argument("--thresholds", default=str(DEFAULT_THRESHOLDS))
+    parser.add_argument(
+        "--no-history", action="store_true", help="Do not append to the history"
+    )
+    parser.add_argument("--keep", type=int, default=200, help="History records to keep")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    results = run_scenarios(names, max(1, args.repeat))
+
+    with open(args.thresholds) as f:
+        thresholds = json.load(f)
+    history_path = Path(args.history)
+    history = load_history(history_path)
+    environment = environment_key()
+    failures = check_results(results, thresholds, history, environment)
+
+    print("=== ToolUniverse Startup Benchmarks ===")
+    print(f"{'scenario':<24}{'seconds':>10}{'modules':>10}{'peak RSS MB':>14}")
+    for name, metrics in results.items():
+        print(
+            f"{name:<24}{metrics['seconds']:>10.3f}{metrics['modules']:>10}"
+            f"{metrics['peak_rss_mb']:>14.1f}"
+        )
+
+    if not args.no_history:
+        history.append(
+            {
+                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "commit": _git_commit(),
+                "environment": environment,
+                "repeat": args.repeat,
+                "results": results,
+                "failures": failures,
+            }
+        )
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(history_path, "w") as f:
+            json.dump(history[-args.keep :], f, indent=2)
+        print(f"History: {history_path}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,8 @@
 from importlib.metadata import version
+import importlib
 import os
 import warnings
-from typing import Any, Optional, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from .execute_function import ToolUniverse
 from .base_tool import BaseTool
@@ -30,12 +31,12 @@ else:
     _TOOLS_AVAILABLE = False
     tools = None  # type: ignore
 
-# Check if lazy loading is enabled
-# LAZY_LOADING_ENABLED = os.getenv('TOOLUNIVERSE_LAZY_LOADING', 'true').lower() in (
-#     'true', '1', 'yes'
-# )
-LAZY_LOADING_ENABLED = (
-    False  # LAZY LOADING DISABLED BECAUSE IT'S STILL UNDER DEVELOPMENT
+# Tool classes are imported on first use unless TOOLUNIVERSE_LAZY_LOADING=false;
+# the registry resolves tool types through the build-time tool manifest.
+LAZY_LOADING_ENABLED = os.getenv("TOOLUNIVERSE_LAZY_LOADING", "true").lower() in (
+    "true",
+    "1",
+    "yes",
 )
 
 # Import MCP functionality
@@ -50,73 +51,44 @@ if not _LIGHT_IMPORT:
         # MCP functionality not available
         pass
 
-# Import SMCP with graceful fallback and consistent signatures for type checking
-try:
-    from .smcp import SMCP, create_smcp_server
-
-    _SMCP_AVAILABLE = True
-except ImportError:
-    _SMCP_AVAILABLE = False
-
-    class SMCP:  # type: ignore[no-redef]
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            raise ImportError(
-                "SMCP requires FastMCP. Install with: pip install fastmcp"
-            )
-
-    def create_smcp_server(
-        name: str = "SMCP Server",
-        tool_categories: Optional[List[str]] = None,
-        search_enabled: bool = True,
-        **kwargs: Any,
-    ) -> SMCP:
-        raise ImportError("SMCP requires FastMCP. Install with: pip install fastmcp")
+# SMCP pulls in FastMCP, which dominates import time; it is imported on first
+# access, with a fallback of consistent signatures when FastMCP is missing.
+_SMCP_EXPORTS = ("SMCP", "create_smcp_server")
+_SMCP_AVAILABLE: Optional[bool] = None
 
+if TYPE_CHECKING:
+    from .smcp import SMCP, create_smcp_server
 
-class _LazyImportProxy:
-    """A proxy that lazily imports modules and returns the requested class only when accessed."""
 
-    def __init__(self, module_name, class_name):
-        self._module_name = module_name
-        self._class_name = class_name
-        self._cached_class = None
+def _import_smcp() -> Dict[str, Any]:
+    global _SMCP_AVAILABLE
+    try:
+        from .smcp import SMCP, create_smcp_server
 
-    def __call__(self, *args, **kwargs):
-        """When the class is instantiated, import the module and create the instance."""
-        if self._cached_class is None:
-            try:
-                import importlib
+        _SMCP_AVAILABLE = True
+    except ImportError:
+        _SMCP_AVAILABLE = False
 
-                module = importlib.import_module(
-                    f".{self._module_name}", package="tooluniverse"
-                )
-                self._cached_class = getattr(module, self._class_name)
-            except (ImportError, AttributeError) as e:
+        class SMCP:  # type: ignore[no-redef]
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
                 raise ImportError(
-                    f"Failed to lazily import {self._class_name} from {self._module_name}: {e}"
+                    "SMCP requires FastMCP. Install with: pip install fastmcp"
                 )
 
-        return self._cached_class(*args, **kwargs)
-
-    def __getattr__(self, name):
-        """Forward attribute access to the actual class after importing."""
-        if self._cached_class is None:
-            try:
-                import importlib
-
-                module = importlib.import_module(
-                    f".{self._module_name}", package="tooluniverse"
-                )
-                self._cached_class = getattr(module, self._class_name)
-            except (ImportError, AttributeError) as e:
-                raise ImportError(
-                    f"Failed to lazily import {self._class_name} from {self._module_name}: {e}"
-                )
+        def create_smcp_server(  # type: ignore[misc]
+            name: str = "SMCP Server",
+            tool_categories: Optional[List[str]] = None,
+            search_enabled: bool = True,
+            **kwargs: Any,
+        ) -> SMCP:
+            raise ImportError(
+                "SMCP requires FastMCP. Install with: pip install fastmcp"
+            )
 
-        return getattr(self._cached_class, name)
+    return {"SMCP": SMCP, "create_smcp_server": create_smcp_server}
 
 
-# Only import tool classes if lazy loading is disabled
+# Tool classes: imported eagerly only if lazy loading is disabled
 MonarchTool: Any
 MonarchDiseasesForMultiplePhenoTool: Any
 ClinicalTrialsSearchTool: Any
@@ -178,6 +150,7 @@ CellosaurusSearchTool: Any
 CellosaurusQueryConverterTool: Any
 CellosaurusGetCellLineInfoTool: Any
 if not _LIGHT_IMPORT and not LAZY_LOADING_ENABLED:
+    _LAZY_EXPORTS: Dict[str, str] = {}
     # Import all tool classes immediately (old behavior) with warning suppression  # noqa: E501
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -279,108 +252,104 @@ if not _LIGHT_IMPORT and not LAZY_LOADING_ENABLED:
     from .pmc_tool import PMCTool
     from .zenodo_tool import ZenodoTool
 else:
-    # With lazy loading, create lazy import proxies that import modules only when accessed
-    MonarchTool = _LazyImportProxy("restful_tool", "MonarchTool")
-    MonarchDiseasesForMultiplePhenoTool = _LazyImportProxy(
-        "restful_tool", "MonarchDiseasesForMultiplePhenoTool"
-    )
-    ClinicalTrialsSearchTool = _LazyImportProxy("ctg_tool", "ClinicalTrialsSearchTool")
-    ClinicalTrialsDetailsTool = _LazyImportProxy(
-        "ctg_tool", "ClinicalTrialsDetailsTool"
-    )
-    OpentargetTool = _LazyImportProxy("graphql_tool", "OpentargetTool")
-    OpentargetGeneticsTool = _LazyImportProxy("graphql_tool", "OpentargetGeneticsTool")
-    OpentargetToolDrugNameMatch = _LazyImportProxy(
-        "graphql_tool", "OpentargetToolDrugNameMatch"
-    )
-    DiseaseTargetScoreTool = _LazyImportProxy("graphql_tool", "DiseaseTargetScoreTool")
-    FDADrugLabelTool = _LazyImportProxy("openfda_tool", "FDADrugLabelTool")
-    FDADrugLabelSearchTool = _LazyImportProxy("openfda_tool", "FDADrugLabelSearchTool")
-    FDADrugLabelSearchIDTool = _LazyImportProxy(
-        "openfda_tool", "FDADrugLabelSearchIDTool"
-    )
-    FDADrugLabelGetDrugGenericNameTool = _LazyImportProxy(
-        "openfda_tool", "FDADrugLabelGetDrugGenericNameTool"
-    )
-    FDADrugAdverseEventTool = _LazyImportProxy(
-        "openfda_adv_tool", "FDADrugAdverseEventTool"
-    )
-    FDACountAdditiveReactionsTool = _LazyImportProxy(
-        "openfda_adv_tool", "FDACountAdditiveReactionsTool"
-    )
-    ChEMBLTool = _LazyImportProxy("chem_tool", "ChEMBLTool")
-    ComposeTool = _LazyImportProxy("compose_tool", "ComposeTool")
-    EuropePMCTool = _LazyImportProxy("europe_pmc_tool", "EuropePMCTool")
-    SemanticScholarTool = _LazyImportProxy(
-        "semantic_scholar_tool", "SemanticScholarTool"
-    )
-    PubTatorTool = _LazyImportProxy("pubtator_tool", "PubTatorTool")
-    EFOTool = _LazyImportProxy("efo_tool", "EFOTool")
-    AgenticTool = _LazyImportProxy("agentic_tool", "AgenticTool")
-    DatasetTool = _LazyImportProxy("dataset_tool", "DatasetTool")
-    SearchSPLTool = _LazyImportProxy("dailymed_tool", "SearchSPLTool")
-    GetSPLBySetIDTool = _LazyImportProxy("dailymed_tool", "GetSPLBySetIDTool")
-    HPAGetGeneJSONTool = _LazyImportProxy("hpa_tool", "HPAGetGeneJSONTool")
-    HPAGetGeneXMLTool = _LazyImportProxy("hpa_tool", "HPAGetGeneXMLTool")
-    ReactomeRESTTool = _LazyImportProxy("reactome_tool", "ReactomeRESTTool")
-    PubChemRESTTool = _LazyImportProxy("pubchem_tool", "PubChemRESTTool")
-    URLHTMLTagTool = _LazyImportProxy("url_tool", "URLHTMLTagTool")
-    URLToPDFTextTool = _LazyImportProxy("url_tool", "URLToPDFTextTool")
-    MedlinePlusRESTTool = _LazyImportProxy("medlineplus_tool", "MedlinePlusRESTTool")
-    UniProtRESTTool = _LazyImportProxy("uniprot_tool", "UniProtRESTTool")
-    PackageTool = _LazyImportProxy("package_tool", "PackageTool")
-    USPTOOpenDataPortalTool = _LazyImportProxy("uspto_tool", "USPTOOpenDataPortalTool")
-    XMLDatasetTool = _LazyImportProxy("xml_tool", "XMLDatasetTool")
-    ToolFinderEmbedding = _LazyImportProxy(
-        "tool_finder_embedding", "ToolFinderEmbedding"
-    )
-    ToolFinderKeyword = _LazyImportProxy("tool_finder_keyword", "ToolFinderKeyword")
-    ToolFinderLLM = _LazyImportProxy("tool_finder_llm", "ToolFinderLLM")
-    EmbeddingDatabase = _LazyImportProxy("embedding_database", "EmbeddingDatabase")
-    EmbeddingSync = _LazyImportProxy("embedding_sync", "EmbeddingSync")
-    RCSBTool = _LazyImportProxy("rcsb_pdb_tool", "RCSBTool")
-    GWASAssociationSearch = _LazyImportProxy("gwas_tool", "GWASAssociationSearch")
-    GWASStudySearch = _LazyImportProxy("gwas_tool", "GWASStudySearch")
-    GWASSNPSearch = _LazyImportProxy("gwas_tool", "GWASSNPSearch")
-    GWASAssociationByID = _LazyImportProxy("gwas_tool", "GWASAssociationByID")
-    GWASStudyByID = _LazyImportProxy("gwas_tool", "GWASStudyByID")
-    GWASSNPByID = _LazyImportProxy("gwas_tool", "GWASSNPByID")
-    GWASVariantsForTrait = _LazyImportProxy("gwas_tool", "GWASVariantsForTrait")
-    GWASAssociationsForTrait = _LazyImportProxy("gwas_tool", "GWASAssociationsForTrait")
-    GWASAssociationsForSNP = _LazyImportProxy("gwas_tool", "GWASAssociationsForSNP")
-    GWASStudiesForTrait = _LazyImportProxy("gwas_tool", "GWASStudiesForTrait")
-    GWASSNPsForGene = _LazyImportProxy("gwas_tool", "GWASSNPsForGene")
-    GWASAssociationsForStudy = _LazyImportProxy("gwas_tool", "GWASAssociationsForStudy")
-    MCPClientTool = _LazyImportProxy("mcp_client_tool", "MCPClientTool")
-    MCPAutoLoaderTool = _LazyImportProxy("mcp_client_tool", "MCPAutoLoaderTool")
-    ADMETAITool = _LazyImportProxy("admetai_tool", "ADMETAITool")
-    AlphaFoldRESTTool = _LazyImportProxy("alphafold_tool", "AlphaFoldRESTTool")
-    ODPHPItemList = _LazyImportProxy("odphp_tool", "ODPHPItemList")
-    ODPHPMyHealthfinder = _LazyImportProxy("odphp_tool", "ODHPHPMyHealthfinder")
-    ODPHPTopicSearch = _LazyImportProxy("odphp_tool", "ODPHPTopicSearch")
-    ODPHPOutlinkFetch = _LazyImportProxy("odphp_tool", "ODPHPOutlinkFetch")
-    CellosaurusSearchTool = _LazyImportProxy(
-        "cellosaurus_tool", "CellosaurusSearchTool"
-    )
-    CellosaurusQueryConverterTool = _LazyImportProxy(
-        "cellosaurus_tool", "CellosaurusQueryConverterTool"
-    )
-    CellosaurusGetCellLineInfoTool = _LazyImportProxy(
-        "cellosaurus_tool", "CellosaurusGetCellLineInfoTool"
-    )
-    # Literature search tools
-    ArXivTool = _LazyImportProxy("arxiv_tool", "ArXivTool")
-    CrossrefTool = _LazyImportProxy("crossref_tool", "CrossrefTool")
-    DBLPTool = _LazyImportProxy("dblp_tool", "DBLPTool")
-    PubMedTool = _LazyImportProxy("pubmed_tool", "PubMedTool")
-    DOAJTool = _LazyImportProxy("doaj_tool", "DOAJTool")
-    UnpaywallTool = _LazyImportProxy("unpaywall_tool", "UnpaywallTool")
-    BioRxivTool = _LazyImportProxy("biorxiv_tool", "BioRxivTool")
-    MedRxivTool = _LazyImportProxy("medrxiv_tool", "MedRxivTool")
-    HALTool = _LazyImportProxy("hal_tool", "HALTool")
-    CoreTool = _LazyImportProxy("core_tool", "CoreTool")
-    PMCTool = _LazyImportProxy("pmc_tool", "PMCTool")
-    ZenodoTool = _LazyImportProxy("zenodo_tool", "ZenodoTool")
+    # With lazy loading, tool classes are imported from their module on first access
+    _LAZY_EXPORTS = {
+        "MonarchTool": "restful_tool",
+        "MonarchDiseasesForMultiplePhenoTool": "restful_tool",
+        "ClinicalTrialsSearchTool": "ctg_tool",
+        "ClinicalTrialsDetailsTool": "ctg_tool",
+        "OpentargetTool": "graphql_tool",
+        "OpentargetGeneticsTool": "graphql_tool",
+        "OpentargetToolDrugNameMatch": "graphql_tool",
+        "DiseaseTargetScoreTool": "graphql_tool",
+        "FDADrugLabelTool": "openfda_tool",
+        "FDADrugLabelSearchTool": "openfda_tool",
+        "FDADrugLabelSearchIDTool": "openfda_tool",
+        "FDADrugLabelGetDrugGenericNameTool": "openfda_tool",
+        "FDADrugAdverseEventTool": "openfda_adv_tool",
+        "FDACountAdditiveReactionsTool": "openfda_adv_tool",
+        "ChEMBLTool": "chem_tool",
+        "ComposeTool": "compose_tool",
+        "EuropePMCTool": "europe_pmc_tool",
+        "SemanticScholarTool": "semantic_scholar_tool",
+        "PubTatorTool": "pubtator_tool",
+        "EFOTool": "efo_tool",
+        "AgenticTool": "agentic_tool",
+        "DatasetTool": "dataset_tool",
+        "SearchSPLTool": "dailymed_tool",
+        "GetSPLBySetIDTool": "dailymed_tool",
+        "HPAGetGeneJSONTool": "hpa_tool",
+        "HPAGetGeneXMLTool": "hpa_tool",
+        "ReactomeRESTTool": "reactome_tool",
+        "PubChemRESTTool": "pubchem_tool",
+        "URLHTMLTagTool": "url_tool",
+        "URLToPDFTextTool": "url_tool",
+        "MedlinePlusRESTTool": "medlineplus_tool",
+        "UniProtRESTTool": "uniprot_tool",
+        "PackageTool": "package_tool",
+        "USPTOOpenDataPortalTool": "uspto_tool",
+        "XMLDatasetTool": "xml_tool",
+        "ToolFinderEmbedding": "tool_finder_embedding",
+        "ToolFinderKeyword": "tool_finder_keyword",
+        "ToolFinderLLM": "tool_finder_llm",
+        "EmbeddingDatabase": "embedding_database",
+        "EmbeddingSync": "embedding_sync",
+        "RCSBTool": "rcsb_pdb_tool",
+        "GWASAssociationSearch": "gwas_tool",
+        "GWASStudySearch": "gwas_tool",
+        "GWASSNPSearch": "gwas_tool",
+        "GWASAssociationByID": "gwas_tool",
+        "GWASStudyByID": "gwas_tool",
+        "GWASSNPByID": "gwas_tool",
+        "GWASVariantsForTrait": "gwas_tool",
+        "GWASAssociationsForTrait": "gwas_tool",
+        "GWASAssociationsForSNP": "gwas_tool",
+        "GWASStudiesForTrait": "gwas_tool",
+        "GWASSNPsForGene": "gwas_tool",
+        "GWASAssociationsForStudy": "gwas_tool",
+        "MCPClientTool": "mcp_client_tool",
+        "MCPAutoLoaderTool": "mcp_client_tool",
+        "ADMETAITool": "admetai_tool",
+        "AlphaFoldRESTTool": "alphafold_tool",
+        "ODPHPItemList": "odphp_tool",
+        "ODPHPMyHealthfinder": "odphp_tool",
+        "ODPHPTopicSearch": "odphp_tool",
+        "ODPHPOutlinkFetch": "odphp_tool",
+        "CellosaurusSearchTool": "cellosaurus_tool",
+        "CellosaurusQueryConverterTool": "cellosaurus_tool",
+        "CellosaurusGetCellLineInfoTool": "cellosaurus_tool",
+        "ArXivTool": "arxiv_tool",
+        "CrossrefTool": "crossref_tool",
+        "DBLPTool": "dblp_tool",
+        "PubMedTool": "pubmed_tool",
+        "DOAJTool": "doaj_tool",
+        "UnpaywallTool": "unpaywall_tool",
+        "BioRxivTool": "biorxiv_tool",
+        "MedRxivTool": "medrxiv_tool",
+        "HALTool": "hal_tool",
+        "CoreTool": "core_tool",
+        "PMCTool": "pmc_tool",
+        "ZenodoTool": "zenodo_tool",
+    }
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SMCP_EXPORTS:
+        exports = _import_smcp()
+        globals().update(exports)
+        return exports[name]
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(_SMCP_EXPORTS))
+
 
 __all__ = [
     "__version__",
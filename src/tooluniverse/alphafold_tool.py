@@ -1,4 +1,4 @@
-import requests
+from . import http_client
 import re
 from typing import Dict, Any, List
 from .base_tool import BaseTool
@@ -53,7 +53,7 @@ class AlphaFoldRESTTool(BaseTool):
     def _make_request(self, url: str) -> Dict[str, Any]:
         """Perform a GET request and handle common errors."""
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 url,
                 timeout=30,
                 headers={
@@ -1,4 +1,4 @@
-from .utils import extract_function_call_json, evaluate_function_call
+from .utils import extract_function_call_json
 from .exceptions import (
     ToolError,
     ToolValidationError,
@@ -9,19 +9,41 @@ from .exceptions import (
     ToolDependencyError,
     ToolServerError,
 )
+from .parameter_validator import ParameterValidator
+import asyncio
+import functools
 import json
 from pathlib import Path
-from typing import no_type_check, Optional, Dict, Any
+from typing import no_type_check, Optional, Dict, Any, List
 import hashlib
 import inspect
 
 
+class _RunSeparately:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "RUN_SEPARATELY"
+
+    def __reduce__(self):
+        # Pickles by name, so it stays a singleton across the process pool
+        return "RUN_SEPARATELY"
+
+
+#: Returned by :meth:`BaseTool.run_batch` in place of a result to have the
+#: call run on its own, through the normal single-call path.
+RUN_SEPARATELY = _RunSeparately()
+
+
 class BaseTool:
     STATIC_CACHE_VERSION = "1"
+    # Calls per run_batch() invocation for tools that implement it.
+    DEFAULT_BATCH_SIZE = 50
 
     def __init__(self, tool_config):
         self.tool_config = self._apply_defaults(tool_config)
         self._cached_version_hash: Optional[str] = None
+        self._parameter_validator: Optional[ParameterValidator] = None
 
     @classmethod
     def get_default_config_file(cls):
@@ -143,14 +165,120 @@ class BaseTool:
             will still work - they will only receive the arguments parameter.
         """
 
+    async def arun(
+        self, arguments=None, stream_callback=None, use_cache=False, validate=True
+    ):
+        """Execute the tool asynchronously.
+
+        Tools backed by native asyncio clients can override this coroutine so
+        that ``ToolUniverse.arun_one_function`` awaits them directly on the
+        event loop. The default implementation runs :meth:`run` in the loop's
+        default executor, forwarding only the keyword arguments it accepts.
+
+        Args:
+            arguments (dict, optional): Tool-specific arguments
+            stream_callback (callable, optional): Callback for streaming responses
+            use_cache (bool, optional): Whether result caching is enabled
+            validate (bool, optional): Whether parameter validation was performed
+        """
+        kwargs = {}
+        try:
+            params = inspect.signature(self.run).parameters
+            if stream_callback is not None and "stream_callback" in params:
+                kwargs["stream_callback"] = stream_callback
+            if "use_cache" in params:
+                kwargs["use_cache"] = use_cache
+            if "validate" in params:
+                kwargs["validate"] = validate
+        except (ValueError, TypeError):
+            kwargs = {}
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run, arguments, **kwargs)
+        )
+
+    def supports_async(self) -> bool:
+        """
+        Check if this tool provides a native asynchronous implementation.
+
+        Returns
+            True if the tool overrides :meth:`arun`, False otherwise
+        """
+        return type(self).arun is not BaseTool.arun
+
+    def run_batch(self, arguments_list: List[Dict[str, Any]]) -> List[Any]:
+        """Execute several calls at once.
+
+        Tools whose upstream accepts many identifiers per request (UniProt
+        accession lists, PubChem CID lists, Ensembl POST lookups, ...) override
+        this so that batch runs issue one request per chunk instead of one per
+        call. The returned list must line up with ``arguments_list``; an item
+        may be an exception instance, which is reported for that call as if
+        :meth:`run` had raised it, or :data:`RUN_SEPARATELY` for a call the
+        batched request could not answer. Such calls are run one by one
+        afterwards, each with its own deadline, so per-item fallbacks should
+        not be made inside ``run_batch``.
+
+        Args:
+            arguments_list (list): Validated argument dicts, one per call
+
+        Returns
+            List of results, one per entry in ``arguments_list``
+        """
+        return [self.run(arguments) for arguments in arguments_list]
+
+    def get_batch_size(self) -> int:
+        """Return how many calls one :meth:`run_batch` invocation takes (0 = never batched).
+
+        Tools that do not override :meth:`run_batch` are never batched. The
+        ``batch_size`` config field overrides :attr:`DEFAULT_BATCH_SIZE`.
+        """
+        if type(self).run_batch is BaseTool.run_batch:
+            return 0
+        size = self.tool_config.get("batch_size", self.DEFAULT_BATCH_SIZE)
+        try:
+            parsed = int(size)
+        except (TypeError, ValueError):
+            return 0
+        return max(0, parsed)
+
+    def get_batch_request_count(self, arguments_list: List[Dict[str, Any]]) -> int:
+        """Return how many upstream requests :meth:`run_batch` makes for a chunk.
+
+        A chunk gets the per-call timeout once for each request, so tools
+        that split a chunk (by species, by page, ...) override this.
+        """
+        return 1
+
     def check_function_call(self, function_call_json):
         if isinstance(function_call_json, str):
             function_call_json = extract_function_call_json(function_call_json)
         if function_call_json is not None:
-            return evaluate_function_call(self.tool_config, function_call_json)
+            return self.get_parameter_validator().evaluate(function_call_json)
         else:
             return False, "Invalid JSON string of function call"
 
+    def get_parameter_validator(self) -> ParameterValidator:
+        """
+        Return the compiled validator for this tool's parameter schema.
+
+        The validator is built on first use and rebuilt only if the
+        ``parameter`` schema object in ``tool_config`` is replaced.
+
+        Returns
+            ParameterValidator instance
+        """
+        validator = getattr(self, "_parameter_validator", None)
+        if (
+            validator is None
+            or validator.tool_config is not self.tool_config
+            or validator.schema is not self.tool_config.get("parameter", {})
+        ):
+            validator = ParameterValidator(self.tool_config)
+            self._parameter_validator = validator
+        return validator
+
     def get_required_parameters(self):
         """
         Retrieve required parameters from the endpoint definition.
@@ -165,7 +293,8 @@ class BaseTool:
         """
         Validate parameters against tool schema.
 
-        This method provides standard parameter validation using jsonschema.
+        This method provides standard parameter validation using a jsonschema
+        validator compiled once per tool (see :class:`ParameterValidator`).
         Subclasses can override this method to implement custom validation
         logic.
 
@@ -175,27 +304,7 @@ class BaseTool:
         Returns
             ToolError if validation fails, None if validation passes
         """
-        schema = self.tool_config.get("parameter", {})
-
-        if not schema:
-            return None  # No schema to validate against
-
-        try:
-            import jsonschema
-
-            jsonschema.validate(arguments, schema)
-            return None
-        except jsonschema.ValidationError as e:
-            return ToolValidationError(
-                f"Parameter validation failed: {e.message}",
-                details={
-                    "validation_error": str(e),
-                    "path": list(e.absolute_path) if e.absolute_path else [],
-                    "schema": schema,
-                },
-            )
-        except Exception as e:
-            return ToolValidationError(f"Validation error: {str(e)}")
+        return self.get_parameter_validator().validate(arguments)
 
     def handle_error(self, exception: Exception) -> ToolError:
         """
@@ -301,6 +410,17 @@ class BaseTool:
             return 0
         return max(0, parsed)
 
+    def get_timeout(self) -> Optional[float]:
+        """Return the per-call timeout in seconds from the tool config (None = no limit)."""
+        timeout = self.tool_config.get("timeout")
+        if timeout is None:
+            return None
+        try:
+            parsed = float(timeout)
+        except (TypeError, ValueError):
+            return None
+        return parsed if parsed > 0 else None
+
     def get_cache_namespace(self) -> str:
         """Return cache namespace identifier for this tool."""
         return self.tool_config.get("name", self.__class__.__name__)
@@ -0,0 +1,361 @@
+"""
+Latency-aware scheduling of parallel batch runs.
+
+The scheduler keeps an exponentially weighted moving average (EWMA) of each
+tool's latency and error rate, learned from every batch a ToolUniverse runs.
+It uses them to order work so that the batch finishes as early as possible:
+
+- Longest expected job first. Slow calls start early instead of clumping at
+  the end of the batch while fast calls wait behind them.
+- Per-upstream fairness. While other upstreams still have work, no upstream
+  takes more than its share of the workers. Upstreams are the hosts a tool
+  has been seen to contact, otherwise the tool itself.
+- AIMD concurrency. Each tool's concurrency limit is halved when a call is
+  throttled (HTTP 429 / ``ToolRateLimitError``) or times out. It then grows
+  back by one for every window of successful calls, up to the tool's
+  ``batch_max_concurrency`` (or the batch's ``max_workers``).
+
+The scheduling policy (:class:`BatchDispatch`) does not depend on threads, so
+it can be driven by a simulated clock as well as by a thread pool. Set
+``TOOLUNIVERSE_BATCH_SCHEDULER=false`` to submit jobs in input order instead.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+OK = "ok"
+ERROR = "error"
+THROTTLED = "throttled"
+TIMEOUT = "timeout"
+
+# Outcomes ordered from mildest to most severe (a chunk reports its worst).
+_SEVERITY = {OK: 0, ERROR: 1, TIMEOUT: 2, THROTTLED: 3}
+
+# Assumed latency, in seconds, of a tool that has never run.
+DEFAULT_LATENCY = 1.0
+DEFAULT_ALPHA = 0.3
+
+_throttle_signals: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar(
+    "tooluniverse_throttle_signals", default=None
+)
+
+
+def note_throttled(status_code: int = 429):
+    """Tell the scheduler that the running call was throttled by its upstream."""
+    signals = _throttle_signals.get()
+    if signals is not None:
+        signals.append(status_code)
+
+
+def classify_result(result: Any) -> str:
+    """Map a tool result (or a list of them) to a scheduling outcome."""
+    if isinstance(result, list):
+        outcomes = [classify_result(item) for item in result] or [OK]
+        return max(outcomes, key=_SEVERITY.__getitem__)
+    if not isinstance(result, dict) or "error" not in result:
+        return OK
+    details = result.get("error_details")
+    if isinstance(details, dict):
+        if details.get("type") == "ToolRateLimitError":
+            return THROTTLED
+        if (details.get("details") or {}).get("deadline_exceeded"):
+            return TIMEOUT
+    return ERROR
+
+
+@dataclass(eq=False)
+class ScheduledTask:
+    """One unit of batch work: ``fn(item)`` for calls of ``tool``."""
+
+    fn: Callable[[Any], Any]
+    item: Any
+    tool: str
+    upstream: str
+    ceiling: int
+    batch: bool = False
+    expected: float = field(default=0.0, init=False)
+
+
+class _ToolStats:
+    __slots__ = (
+        "latency",
+        "batch_latency",
+        "error_rate",
+        "calls",
+        "limit",
+        "successes",
+        "last_decrease",
+    )
+
+    def __init__(self):
+        self.latency: Optional[float] = None
+        self.batch_latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.limit: Optional[int] = None
+        self.successes = 0
+        self.last_decrease = float("-inf")
+
+
+class BatchScheduler:
+    """Per-tool latency/error statistics plus the policy built on them."""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        alpha: float = DEFAULT_ALPHA,
+        default_latency: float = DEFAULT_LATENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if enabled is None:
+            enabled = os.getenv("TOOLUNIVERSE_BATCH_SCHEDULER", "true").lower() not in (
+                "0",
+                "false",
+                "no",
+                "off",
+            )
+        self.enabled = bool(enabled)
+        self.alpha = alpha
+        self.default_latency = default_latency
+        self.clock = clock
+        self._stats: Dict[str, _ToolStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, tool: str) -> _ToolStats:
+        stats = self._stats.get(tool)
+        if stats is None:
+            stats = self._stats[tool] = _ToolStats()
+        return stats
+
+    def expected_latency(self, tool: str, batch: bool = False) -> float:
+        """EWMA latency of ``tool`` (run_batch chunks are tracked separately).
+
+        Tools without observations are assumed to take as long as the average
+        known tool, so unknown work is neither starved nor favoured.
+        """
+        with self._lock:
+            stats = self._stats.get(tool)
+            value = None
+            if stats is not None:
+                value = stats.batch_latency if batch else stats.latency
+            if value is not None:
+                return value
+            known = [s.latency for s in self._stats.values() if s.latency is not None]
+        return sum(known) / len(known) if known else self.default_latency
+
+    def concurrency_limit(self, tool: str, ceiling: int) -> int:
+        """Current AIMD concurrency limit of ``tool``, capped at ``ceiling``."""
+        with self._lock:
+            stats = self._stats.get(tool)
+            limit = stats.limit if stats is not None else None
+        if limit is None:
+            return max(1, ceiling)
+        return max(1, min(limit, ceiling))
+
+    def record(
+        self,
+        tool: str,
+        seconds: float,
+        outcome: str = OK,
+        *,
+        batch: bool = False,
+        ceiling: Optional[int] = None,
+    ):
+        """Fold one finished task into the statistics of ``tool``."""
+        alpha = self.alpha
+        now = self.clock()
+        with self._lock:
+            stats = self._get(tool)
+            attr = "batch_latency" if batch else "latency"
+            previous = getattr(stats, attr)
+            # Timeouts say little about normal latency; keep them out of it.
+            if outcome != TIMEOUT or previous is None:
+                value = (
+                    seconds
+                    if previous is None
+                    else previous + alpha * (seconds - previous)
+                )
+                setattr(stats, attr, value)
+            failed = 1.0 if outcome != OK else 0.0
+            stats.error_rate += alpha * (failed - stats.error_rate)
+            stats.calls += 1
+
+            # ``limit`` stays None until the tool is throttled: no cap beyond
+            # the batch's own ceiling.
+            if outcome in (THROTTLED, TIMEOUT):
+                # Multiplicative decrease, at most once per typical call
+                # duration so one burst of failures counts as one signal.
+                window = stats.latency or self.default_latency
+                if now - stats.last_decrease >= window:
+                    current = stats.limit or ceiling or 1
+                    if ceiling:
+                        current = min(current, ceiling)
+                    stats.limit = max(1, current // 2)
+                    stats.last_decrease = now
+                stats.successes = 0
+            elif outcome == OK and stats.limit is not None:
+                # Additive increase: one more slot per window of successes.
+                stats.successes += 1
+                if stats.successes >= stats.limit:
+                    stats.successes = 0
+                    stats.limit += 1
+                    if ceiling and stats.limit >= ceiling:
+                        stats.limit = None
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tool statistics: latency EWMAs, error rate and concurrency limit."""
+        with self._lock:
+            return {
+                tool: {
+                    "latency": stats.latency,
+                    "batch_latency": stats.batch_latency,
+                    "error_rate": round(stats.error_rate, 4),
+                    "calls": stats.calls,
+                    "concurrency_limit": stats.limit,
+                }
+                for tool, stats in self._stats.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def dispatch(self, tasks: List[ScheduledTask], max_workers: int) -> "BatchDispatch":
+        """Return the scheduling state for running ``tasks`` on ``max_workers``."""
+        return BatchDispatch(self, tasks, max_workers)
+
+    def run(self, tasks: List[ScheduledTask], max_workers: Optional[int]):
+        """Run ``tasks`` on up to ``max_workers`` threads in scheduled order.
+
+        With one worker, tasks run in input order on the calling thread (the
+        order cannot change the total time) but still feed the statistics.
+        Exceptions raised by a task propagate once running tasks finish.
+        """
+        if not max_workers or max_workers <= 1:
+            for task in tasks:
+                self._run_task(task)
+            return
+
+        dispatch = self.dispatch(tasks, max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+            while dispatch.pending or running:
+                while len(running) < max_workers:
+                    task = dispatch.next_task()
+                    if task is None:
+                        break
+                    running[executor.submit(self._run_task, task)] = task
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dispatch.task_done(running.pop(future))
+                    future.result()
+
+    def _run_task(self, task: ScheduledTask):
+        signals: List[int] = []
+        token = _throttle_signals.set(signals)
+        start = self.clock()
+        try:
+            result = task.fn(task.item)
+        finally:
+            _throttle_signals.reset(token)
+        outcome = THROTTLED if signals else classify_result(result)
+        self.record(
+            task.tool,
+            self.clock() - start,
+            outcome,
+            batch=task.batch,
+            ceiling=task.ceiling,
+        )
+        return result
+
+
+class BatchDispatch:
+    """Decides which task of one batch runs next.
+
+    Not thread-safe: one thread (or a simulation loop) calls
+    :meth:`next_task` whenever a worker is free and :meth:`task_done` when a
+    task finishes.
+    """
+
+    def __init__(
+        self, scheduler: BatchScheduler, tasks: List[ScheduledTask], max_workers: int
+    ):
+        self.scheduler = scheduler
+        self.max_workers = max(1, max_workers)
+        # upstream -> (tool, batch) -> tasks in input order; every task in one
+        # queue has the same expected latency.
+        self._queues: Dict[str, Dict[Tuple[str, bool], Deque[ScheduledTask]]] = {}
+        for task in tasks:
+            task.expected = scheduler.expected_latency(task.tool, task.batch)
+            queues = self._queues.setdefault(task.upstream, {})
+            queues.setdefault((task.tool, task.batch), deque()).append(task)
+        self._tool_running: Dict[str, int] = {}
+        self._upstream_running: Dict[str, int] = {}
+        # Expected seconds of unfinished (queued or running) work per upstream.
+        self._upstream_work: Dict[str, float] = {}
+        for task in tasks:
+            self._upstream_work[task.upstream] = (
+                self._upstream_work.get(task.upstream, 0.0) + task.expected
+            )
+        self.pending = len(tasks)
+
+    def next_task(self) -> Optional[ScheduledTask]:
+        """Pick the next task to start, or None if nothing may start now.
+
+        Each upstream's share of the workers is proportional to its expected
+        remaining work, so a few slow calls get enough workers to finish on
+        time while no upstream crowds out the others. Upstreams below their
+        share go first, longest task first; if none can start, any eligible
+        task may take the free worker.
+        """
+        total_work = sum(self._upstream_work.values())
+        if total_work <= 0:
+            total_work = 1.0
+
+        best: Optional[Tuple[Tuple[bool, float], Deque[ScheduledTask]]] = None
+        for upstream, queues in self._queues.items():
+            share = max(
+                1,
+                math.ceil(
+                    self.max_workers * self._upstream_work[upstream] / total_work
+                ),
+            )
+            within_share = self._upstream_running.get(upstream, 0) < share
+            for (tool, _), queue in queues.items():
+                if not queue:
+                    continue
+                task = queue[0]
+                limit = self.scheduler.concurrency_limit(tool, task.ceiling)
+                if self._tool_running.get(tool, 0) >= limit:
+                    continue
+                rank = (within_share, task.expected)
+                if best is None or rank > best[0]:
+                    best = (rank, queue)
+        if best is None:
+            return None
+
+        task = best[1].popleft()
+        self._tool_running[task.tool] = self._tool_running.get(task.tool, 0) + 1
+        self._upstream_running[task.upstream] = (
+            self._upstream_running.get(task.upstream, 0) + 1
+        )
+        self.pending -= 1
+        return task
+
+    def task_done(self, task: ScheduledTask):
+        self._tool_running[task.tool] -= 1
+        self._upstream_running[task.upstream] -= 1
+        self._upstream_work[task.upstream] = max(
+            0.0, self._upstream_work[task.upstream] - task.expected
+        )
@@ -6,6 +6,7 @@ import yaml
 import json
 import shutil
 from .base_tool import BaseTool
+from .deadline import remaining_time
 from .tool_registry import register_tool
 
 
@@ -90,6 +91,8 @@ class Boltz2DockingTool(BaseTool):
                 - templates (list[dict], optional): Structural templates.
                 - other optional boltz CLI flags (e.g., 'recycling_steps').
             timeout (int): The maximum time in seconds to wait for the Boltz command to complete.
+                Capped by the deadline of the current call; the Boltz process is killed
+                when either expires.
 
         Returns
             dict: A dictionary containing the path to the predicted structure and affinity data, or an error.
@@ -139,7 +142,7 @@ class Boltz2DockingTool(BaseTool):
                 command,
                 capture_output=True,
                 text=True,
-                timeout=timeout,
+                timeout=remaining_time(timeout),
                 check=True,  # Will raise CalledProcessError on non-zero exit codes
             )
 
@@ -1,9 +1,11 @@
 """Build optimization utilities for ToolUniverse tools."""
 
+import ast
 import json
 import hashlib
+import re
 from pathlib import Path
-from typing import Dict, Any, Set, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 
 def calculate_tool_hash(tool_config: Dict[str, Any]) -> str:
@@ -85,3 +87,134 @@ def get_changed_tools(
     save_metadata(new_metadata, metadata_file)
 
     return new_tools, changed_tools, unchanged_tools
+
+
+# Tool class manifest: which module defines each registered tool type, so the
+# registry can import one module per tool type instead of scanning the package.
+MANIFEST_FILENAME = "tool_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def source_hash(path: Path) -> str:
+    """Return the SHA-256 of a source file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def scan_tool_classes(path: Path) -> List[str]:
+    """Return the tool type names registered with ``@register_tool`` in a module.
+
+    The source is parsed, not imported, so modules with heavy or missing
+    optional dependencies can still be indexed.
+    """
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (SyntaxError, UnicodeDecodeError, OSError):
+        return []
+
+    names = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            if getattr(target, "id", getattr(target, "attr", None)) != "register_tool":
+                continue
+            name = node.name
+            if isinstance(decorator, ast.Call) and decorator.args:
+                first = decorator.args[0]
+                if isinstance(first, ast.Constant) and isinstance(first.value, str):
+                    name = first.value
+            names.append(name)
+    return names
+
+
+# A line starting with ``@register_tool`` (or ``@<module>.register_tool``).
+_REGISTER_DECORATOR = re.compile(rb"^[ \t]*@(?:\w+\.)*register_tool\b", re.MULTILINE)
+
+
+def _tool_module_paths(package_dir: Path) -> Dict[str, Path]:
+    """Top-level modules of ``package_dir`` that may register tools.
+
+    A text search for the decorator skips helper modules without parsing
+    them; :func:`scan_tool_classes` has the final say.
+    """
+    paths = {}
+    for path in sorted(package_dir.glob("*.py")):
+        if path.stem == "__init__":
+            continue
+        try:
+            source = path.read_bytes()
+        except OSError:
+            continue
+        if _REGISTER_DECORATOR.search(source):
+            paths[path.stem] = path
+    return paths
+
+
+def build_tool_manifest(package_dir: Path) -> Dict[str, Any]:
+    """Index the tool types registered by each top-level module of ``package_dir``.
+
+    Only modules that register at least one tool are recorded.
+    """
+    modules = {}
+    for module_name, path in _tool_module_paths(package_dir).items():
+        classes = scan_tool_classes(path)
+        if classes:
+            modules[module_name] = {"hash": source_hash(path), "classes": classes}
+    return {"version": MANIFEST_VERSION, "modules": modules}
+
+
+def write_tool_manifest(
+    package_dir: Path, manifest_file: Optional[Path] = None
+) -> Path:
+    """Build the tool class manifest and write it next to the package modules."""
+    manifest_file = manifest_file or package_dir / MANIFEST_FILENAME
+    manifest = build_tool_manifest(package_dir)
+    with open(manifest_file, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest_file
+
+
+def load_tool_manifest(
+    package_dir: Path, manifest_file: Optional[Path] = None
+) -> Tuple[Dict[str, str], List[str]]:
+    """Return ``(tool type -> module, stale modules)`` for ``package_dir``.
+
+    Every indexed module is checked against the hash recorded at build time.
+    Modules that changed, and new modules that register tools, are re-scanned
+    from source so the mapping stays correct; their names are returned so
+    callers can tell the manifest needs rebuilding. Returns an empty mapping
+    when no usable manifest exists.
+    """
+    manifest_file = manifest_file or package_dir / MANIFEST_FILENAME
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}, []
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}, []
+
+    indexed = manifest.get("modules") or {}
+    mapping: Dict[str, str] = {}
+    stale: List[str] = []
+    for module_name, path in _tool_module_paths(package_dir).items():
+        entry = indexed.get(module_name)
+        try:
+            current_hash = source_hash(path)
+        except OSError:
+            continue
+        if entry is not None and entry.get("hash") == current_hash:
+            classes = entry.get("classes") or []
+        else:
+            classes = scan_tool_classes(path)
+            if classes or entry is not None:
+                stale.append(module_name)
+        for class_name in classes:
+            mapping.setdefault(class_name, module_name)
+    return mapping, stale
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_tool_manifest(Path(__file__).resolve().parent)}")
@@ -0,0 +1,293 @@
+"""
+Value codecs for the persistent cache.
+
+``PersistentCache`` stores each value as a serialized, optionally compressed
+payload together with a codec tag that says how to read it back. The tag has
+the form ``serializer[+compressor[:dictionary_id]]``, for example ``pickle``,
+``pickle+zlib`` or ``json+zstd:3``. Rows written before tags existed have no
+tag and are read as ``pickle``, so old cache files stay readable.
+
+Serializers:
+
+- ``pickle`` (default): any picklable value, exact round trip
+- ``json``: orjson, when installed; values that do not survive a JSON round
+  trip unchanged (tuples, non-string keys, NaN, custom classes) are stored
+  with pickle instead
+- ``msgpack``: msgpack, when installed, with the same fallback
+
+Compressors are ``zstd`` (needs the ``zstandard`` package) and ``zlib``.
+``auto`` picks zstd when it is installed and zlib otherwise. Payloads are
+compressed when they reach ``compress_threshold`` bytes, and kept
+uncompressed when compression does not make them smaller.
+
+Tool results in one namespace share most of their structure, so small
+payloads compress poorly on their own. With dictionaries enabled the cache
+collects sample payloads per namespace and, once it has enough, builds a
+compression dictionary for that namespace (trained with zstd, or a preset
+dictionary of recent samples with zlib). Payloads of that namespace are then
+compressed with the dictionary from ``dictionary_threshold`` bytes up.
+
+Settings come from the environment (see ``CacheCodec.from_env``):
+
+- ``TOOLUNIVERSE_CACHE_SERIALIZER``: ``pickle``, ``json`` or ``msgpack``
+- ``TOOLUNIVERSE_CACHE_COMPRESSION``: ``auto``, ``zstd``, ``zlib`` or ``none``
+- ``TOOLUNIVERSE_CACHE_COMPRESS_THRESHOLD``: bytes (default 1024)
+- ``TOOLUNIVERSE_CACHE_DICTIONARIES``: ``false`` disables namespace dictionaries
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+LEGACY_TAG = "pickle"
+
+DEFAULT_COMPRESS_THRESHOLD = 1024
+DEFAULT_DICTIONARY_THRESHOLD = 64
+# Samples collected per namespace before a dictionary is built, and the
+# byte budget for them (zlib only uses the last 32KB of a preset dictionary)
+DICTIONARY_SAMPLES = 32
+DICTIONARY_SAMPLE_BYTES = 64 * 1024
+DICTIONARY_SIZE = 16 * 1024
+_ZLIB_WINDOW = 32 * 1024
+
+
+class CodecError(ValueError):
+    """A cached payload cannot be decoded with its codec tag."""
+
+
+def _pickle_dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+# name -> (dumps, loads, available)
+SERIALIZERS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any], bool]] = {
+    "pickle": (_pickle_dumps, pickle.loads, True),
+    "json": (
+        orjson.dumps if orjson else None,
+        orjson.loads if orjson else None,
+        orjson is not None,
+    ),
+    "msgpack": (_msgpack_dumps, _msgpack_loads, msgpack is not None),
+}
+
+COMPRESSORS = ("zstd", "zlib")
+
+
+def available_compressors() -> List[str]:
+    return [name for name in COMPRESSORS if name != "zstd" or zstandard is not None]
+
+
+def _compress(
+    name: str, data: bytes, level: Optional[int], dictionary: Optional[bytes]
+) -> bytes:
+    if name == "zlib":
+        level = 6 if level is None else level
+        if dictionary is None:
+            return zlib.compress(data, level)
+        compressor = zlib.compressobj(level, zdict=dictionary)
+        return compressor.compress(data) + compressor.flush()
+    if name == "zstd":
+        params = {"level": 3 if level is None else level}
+        if dictionary is not None:
+            params["dict_data"] = zstandard.ZstdCompressionDict(dictionary)
+        return zstandard.ZstdCompressor(**params).compress(data)
+    raise CodecError(f"Unknown compressor {name!r}")
+
+
+def _decompress(name: str, data: bytes, dictionary: Optional[bytes]) -> bytes:
+    if name == "zlib":
+        if dictionary is None:
+            return zlib.decompress(data)
+        decompressor = zlib.decompressobj(zdict=dictionary)
+        return decompressor.decompress(data) + decompressor.flush()
+    if name == "zstd":
+        if zstandard is None:
+            raise CodecError("zstd payload, but zstandard is not installed")
+        params = {}
+        if dictionary is not None:
+            params["dict_data"] = zstandard.ZstdCompressionDict(dictionary)
+        return zstandard.ZstdDecompressor(**params).decompress(data)
+    raise CodecError(f"Unknown compressor {name!r}")
+
+
+def parse_tag(tag: Optional[str]) -> Tuple[str, Optional[str], Optional[int]]:
+    """Split a codec tag into (serializer, compressor, dictionary id)."""
+    serializer, _, compression = (tag or LEGACY_TAG).partition("+")
+    if not compression:
+        return serializer, None, None
+    compressor, _, dictionary_id = compression.partition(":")
+    return serializer, compressor, int(dictionary_id) if dictionary_id else None
+
+
+class CacheCodec:
+    """Serializes cache values and compresses large payloads."""
+
+    def __init__(
+        self,
+        serializer: str = "pickle",
+        compression: str = "auto",
+        *,
+        compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD,
+        dictionary_threshold: int = DEFAULT_DICTIONARY_THRESHOLD,
+        dictionaries: bool = True,
+        level: Optional[int] = None,
+    ):
+        if serializer not in SERIALIZERS:
+            raise ValueError(
+                f"Unknown cache serializer {serializer!r}; "
+                f"expected one of {sorted(SERIALIZERS)}"
+            )
+        if not SERIALIZERS[serializer][2]:
+            raise ValueError(f"Cache serializer {serializer!r} is not installed")
+        if compression == "auto":
+            compression = available_compressors()[0]
+        elif compression in ("none", "", None):
+            compression = None
+        elif compression not in available_compressors():
+            raise ValueError(f"Cache compression {compression!r} is not available")
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.dictionary_threshold = dictionary_threshold
+        self.dictionaries = dictionaries and compression is not None
+        self.level = level
+
+    @classmethod
+    def from_env(cls) -> "CacheCodec":
+        """Codec configured by the ``TOOLUNIVERSE_CACHE_*`` codec variables."""
+        return cls(
+            serializer=os.getenv("TOOLUNIVERSE_CACHE_SERIALIZER", "pickle").lower(),
+            compression=os.getenv("TOOLUNIVERSE_CACHE_COMPRESSION", "auto").lower(),
+            compress_threshold=int(
+                os.getenv(
+                    "TOOLUNIVERSE_CACHE_COMPRESS_THRESHOLD",
+                    str(DEFAULT_COMPRESS_THRESHOLD),
+                )
+            ),
+            dictionaries=os.getenv("TOOLUNIVERSE_CACHE_DICTIONARIES", "true").lower()
+            in ("true", "1", "yes"),
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "serializer": self.serializer,
+            "compression": self.compression,
+            "compress_threshold": self.compress_threshold,
+            "dictionaries": self.dictionaries,
+        }
+
+    def serialize(self, value: Any) -> Tuple[bytes, str]:
+        """Serialize ``value``, returning the bytes and the serializer used."""
+        if self.serializer != "pickle":
+            dumps, loads, _ = SERIALIZERS[self.serializer]
+            try:
+                data = dumps(value)
+                if loads(data) == value:
+                    return data, self.serializer
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return _pickle_dumps(value), "pickle"
+
+    def encode(
+        self,
+        value: Any,
+        dictionary: Optional[Tuple[int, bytes]] = None,
+    ) -> Tuple[bytes, str, bytes]:
+        """Encode ``value`` as ``(payload, tag, serialized)``.
+
+        ``dictionary`` is the ``(id, data)`` of the namespace's compression
+        dictionary, if it has one. ``serialized`` is the uncompressed
+        payload, which the cache keeps as a dictionary training sample.
+        """
+        data, tag = self.serialize(value)
+        if self.compression is None:
+            return data, tag, data
+        threshold = self.compress_threshold
+        if dictionary is not None and self.dictionaries:
+            threshold = min(threshold, self.dictionary_threshold)
+        else:
+            dictionary = None
+        if len(data) < threshold:
+            return data, tag, data
+        compressed = _compress(
+            self.compression,
+            data,
+            self.level,
+            dictionary[1] if dictionary else None,
+        )
+        if len(compressed) >= len(data):
+            return data, tag, data
+        tag = f"{tag}+{self.compression}"
+        if dictionary is not None:
+            tag = f"{tag}:{dictionary[0]}"
+        return compressed, tag, data
+
+    def decode(
+        self,
+        payload: bytes,
+        tag: Optional[str],
+        dictionaries: Optional[Callable[[int], Optional[bytes]]] = None,
+    ) -> Any:
+        """Decode a payload written with codec ``tag`` (``None`` for legacy rows).
+
+        ``dictionaries`` looks up compression dictionaries by id.
+        """
+        try:
+            serializer, compressor, dictionary_id = parse_tag(tag)
+            if compressor is not None:
+                dictionary = None
+                if dictionary_id is not None:
+                    dictionary = dictionaries(dictionary_id) if dictionaries else None
+                    if dictionary is None:
+                        raise CodecError(
+                            f"Missing compression dictionary {dictionary_id}"
+                        )
+                payload = _decompress(compressor, payload, dictionary)
+            if serializer not in SERIALIZERS or not SERIALIZERS[serializer][2]:
+                raise CodecError(f"Serializer {serializer!r} is not available")
+            return SERIALIZERS[serializer][1](payload)
+        except CodecError:
+            raise
+        except Exception as exc:
+            raise CodecError(f"Cannot decode {tag or LEGACY_TAG} payload: {exc}")
+
+    def train_dictionary(self, samples: List[bytes]) -> Optional[bytes]:
+        """Build a compression dictionary from serialized sample payloads."""
+        if not samples or self.compression is None:
+            return None
+        if self.compression == "zstd":
+            try:
+                trained = zstandard.train_dictionary(DICTIONARY_SIZE, samples)
+                return trained.as_bytes()
+            except zstandard.ZstdError:
+                # Too few or too uniform samples to train; use them as is
+                return b"".join(samples)[-DICTIONARY_SIZE:]
+        # zlib preset dictionary: recent samples, the most recent last, since
+        # zlib encodes matches near the end of the dictionary most cheaply
+        return b"".join(samples)[-_ZLIB_WINDOW:]
@@ -2,68 +2,256 @@
 In-memory cache utilities for ToolUniverse.
 
 Provides a lightweight, thread-safe LRU cache with optional singleflight
-deduplication for expensive misses.
+deduplication for expensive misses (thread- and coroutine-based).
+
+The LRU cache bounds entries by count, by estimated bytes or both. In
+weighted mode (``max_bytes`` or ``namespace_bytes`` set) each value is
+weighed once on insert with :func:`estimate_size`, and least recently used
+entries are evicted until the cache fits its byte budget. Per-namespace
+budgets keep one tool with large results from pushing out the small, hot
+results of every other tool.
 """
 
 from __future__ import annotations
 
+import asyncio
+import re
+import sys
 import threading
 import time
 from collections import OrderedDict
-from contextlib import contextmanager
-from typing import Any, Dict, Iterator, Optional, Tuple
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Containers with more items than this are weighed from an evenly spaced
+# sample, and at most SIZE_BUDGET objects are visited per value
+SIZE_SAMPLE = 16
+SIZE_BUDGET = 256
+
+_UNITS = {"": 1, "b": 1, "kb": 1024, "mb": 1024**2, "gb": 1024**3}
+_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?b?)\s*$", re.IGNORECASE)
+
+
+def parse_bytes(value: Optional[str]) -> Optional[int]:
+    """Parse a byte size such as ``"512"``, ``"64KB"`` or ``"1.5GB"``."""
+    if value is None or not str(value).strip():
+        return None
+    match = _SIZE_PATTERN.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid byte size {value!r}")
+    number, unit = match.groups()
+    unit = unit.lower()
+    if unit and not unit.endswith("b"):
+        unit += "b"
+    return int(float(number) * _UNITS[unit])
+
+
+def parse_namespace_bytes(value: Optional[str]) -> Dict[str, int]:
+    """Parse ``"EuropePMC_search=64MB,*=16MB"`` into namespace byte budgets.
+
+    ``*`` sets the budget for every namespace without its own entry.
+    """
+    budgets: Dict[str, int] = {}
+    for item in (value or "").split(","):
+        if not item.strip():
+            continue
+        namespace, sep, size = item.rpartition("=")
+        if not sep or not namespace.strip():
+            raise ValueError(f"Invalid namespace budget {item!r}")
+        budgets[namespace.strip()] = parse_bytes(size)
+    return budgets
+
+
+def estimate_size(value: Any) -> int:
+    """Cheaply estimate the memory held by ``value`` in bytes.
+
+    Strings, bytes and numbers are measured exactly. Containers are walked,
+    but large ones are extrapolated from a sample of their items and the
+    walk stops after ``SIZE_BUDGET`` objects, so weighing a 20MB result
+    costs about as much as weighing a small one.
+    """
+    budget = [SIZE_BUDGET]
+
+    def weigh(obj: Any) -> int:
+        size = sys.getsizeof(obj)
+        if budget[0] <= 0 or isinstance(obj, (str, bytes, bytearray, int, float)):
+            return size
+        budget[0] -= 1
+        if isinstance(obj, dict):
+            n = len(obj)
+            if n == 0:
+                return size
+            items = obj.items() if n <= SIZE_SAMPLE else _sample(list(obj.items()))
+            sampled = [weigh(k) + weigh(v) for k, v in items]
+            return size + sum(sampled) * n // len(sampled)
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            n = len(obj)
+            if n == 0:
+                return size
+            items = obj if n <= SIZE_SAMPLE else _sample(list(obj))
+            sampled = [weigh(item) for item in items]
+            return size + sum(sampled) * n // len(sampled)
+        attributes = getattr(obj, "__dict__", None)
+        if isinstance(attributes, dict):
+            return size + weigh(attributes)
+        return size
+
+    return weigh(value)
+
+
+def _sample(items: list) -> list:
+    step = len(items) / SIZE_SAMPLE
+    return [items[int(i * step)] for i in range(SIZE_SAMPLE)]
 
 
 class LRUCache:
-    """Thread-safe LRU cache with basic telemetry."""
+    """Thread-safe LRU cache with basic telemetry.
 
-    def __init__(self, max_size: int = 128):
-        self.max_size = max(1, int(max_size))
-        self._data: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+    Args:
+        max_size: Maximum number of entries, or ``None`` for no count limit.
+        max_bytes: Byte budget for all entries; enables weighted mode.
+        namespace_bytes: Byte budgets per namespace (``"*"`` for the
+            default); enables weighted mode.
+        weigher: Returns the size of a value in bytes, defaults to
+            :func:`estimate_size`.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 128,
+        *,
+        max_bytes: Optional[int] = None,
+        namespace_bytes: Optional[Dict[str, int]] = None,
+        weigher: Optional[Callable[[Any], int]] = None,
+    ):
+        self.max_size = max(1, int(max_size)) if max_size is not None else None
+        self.max_bytes = max_bytes
+        self.namespace_bytes = dict(namespace_bytes or {})
+        self.weighted = max_bytes is not None or bool(self.namespace_bytes)
+        self._weigh = weigher or estimate_size
+        # key -> (value, timestamp, weight, namespace)
+        self._data: "OrderedDict[str, Tuple[Any, float, int, Optional[str]]]" = (
+            OrderedDict()
+        )
+        # Per-namespace recency order, kept only when namespaces have budgets
+        self._namespace_keys: Dict[Optional[str], "OrderedDict[str, None]"] = {}
+        self._namespace_used: Dict[Optional[str], int] = {}
         self._lock = threading.RLock()
+        self.current_bytes = 0
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.rejected = 0
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key not in self._data:
+            entry = self._data.get(key)
+            if entry is None:
                 self.misses += 1
                 return None
 
-            value, timestamp = self._data.pop(key)
-            self._data[key] = (value, timestamp)
+            self._data.move_to_end(key)
+            if self.namespace_bytes:
+                self._namespace_keys[entry[3]].move_to_end(key)
             self.hits += 1
-            return value
+            return entry[0]
 
-    def set(self, key: str, value: Any):
+    def set(self, key: str, value: Any, namespace: Optional[str] = None):
+        weight = self._weigh(value) if self.weighted else 0
         with self._lock:
-            if key in self._data:
-                self._data.pop(key)
-            self._data[key] = (value, time.time())
-            self._evict_if_needed()
+            self._remove(key)
+            if self.weighted and weight > self._budget_for(namespace):
+                # Storing it would flush the whole budget; keep the cache as is
+                self.rejected += 1
+                return
+            self._data[key] = (value, time.time(), weight, namespace)
+            if self.weighted:
+                self.current_bytes += weight
+                self._namespace_used[namespace] = (
+                    self._namespace_used.get(namespace, 0) + weight
+                )
+                if self.namespace_bytes:
+                    self._namespace_keys.setdefault(namespace, OrderedDict())[
+                        key
+                    ] = None
+            self._evict_if_needed(namespace)
 
     def delete(self, key: str):
         with self._lock:
-            self._data.pop(key, None)
+            self._remove(key)
 
     def clear(self):
         with self._lock:
             self._data.clear()
+            self._namespace_keys.clear()
+            self._namespace_used.clear()
+            self.current_bytes = 0
             self.hits = 0
             self.misses = 0
+            self.evictions = 0
+            self.rejected = 0
+
+    def _budget_for(self, namespace: Optional[str]) -> float:
+        budget = float("inf") if self.max_bytes is None else self.max_bytes
+        limit = self.namespace_bytes.get(namespace, self.namespace_bytes.get("*"))
+        return budget if limit is None else min(budget, limit)
 
-    def _evict_if_needed(self):
-        while len(self._data) > self.max_size:
-            self._data.popitem(last=False)
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None or not self.weighted:
+            return
+        _, _, weight, namespace = entry
+        self.current_bytes -= weight
+        used = self._namespace_used.get(namespace, 0) - weight
+        if used > 0:
+            self._namespace_used[namespace] = used
+        else:
+            self._namespace_used.pop(namespace, None)
+        keys = self._namespace_keys.get(namespace)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._namespace_keys[namespace]
+
+    def _evict_if_needed(self, namespace: Optional[str] = None):
+        if self.namespace_bytes and namespace in self._namespace_keys:
+            limit = self.namespace_bytes.get(namespace, self.namespace_bytes.get("*"))
+            while limit is not None and self._namespace_used.get(namespace, 0) > limit:
+                self._remove(next(iter(self._namespace_keys[namespace])))
+                self.evictions += 1
+        while (self.max_size is not None and len(self._data) > self.max_size) or (
+            self.max_bytes is not None and self.current_bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
 
     def stats(self) -> Dict[str, Any]:
         with self._lock:
-            return {
+            stats = {
                 "max_size": self.max_size,
                 "current_size": len(self._data),
                 "hits": self.hits,
                 "misses": self.misses,
+                "evictions": self.evictions,
             }
+            if self.weighted:
+                stats.update(
+                    {
+                        "max_bytes": self.max_bytes,
+                        "current_bytes": self.current_bytes,
+                        "rejected": self.rejected,
+                        "namespace_budgets": dict(self.namespace_bytes),
+                        "namespace_bytes": {
+                            str(namespace): used
+                            for namespace, used in sorted(
+                                self._namespace_used.items(),
+                                key=lambda item: item[1],
+                                reverse=True,
+                            )
+                        },
+                    }
+                )
+            return stats
 
     def __len__(self) -> int:
         with self._lock:
@@ -71,8 +259,8 @@ class LRUCache:
 
     def items(self) -> Iterator[Tuple[str, Any]]:
         with self._lock:
-            for key, (value, _) in list(self._data.items()):
-                yield key, value
+            for key, entry in list(self._data.items()):
+                yield key, entry[0]
 
 
 class SingleFlight:
@@ -97,3 +285,36 @@ class SingleFlight:
             with self._global:
                 if not lock.locked():
                     self._locks.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """Per-key asyncio lock manager mirroring :class:`SingleFlight` for coroutines.
+
+    Locks are bound to the event loop that first awaits them, so a single
+    instance should be shared by coroutines running on the same loop.
+    """
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._waiters: Dict[str, int] = {}
+        self._global = threading.Lock()
+
+    @asynccontextmanager
+    async def acquire(self, key: str):
+        with self._global:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = asyncio.Lock()
+                self._locks[key] = lock
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            with self._global:
+                remaining = self._waiters.get(key, 1) - 1
+                if remaining <= 0:
+                    self._waiters.pop(key, None)
+                    self._locks.pop(key, None)
+                else:
+                    self._waiters[key] = remaining
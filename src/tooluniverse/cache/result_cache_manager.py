@@ -1,5 +1,9 @@
 """
 Result cache manager that coordinates in-memory and persistent storage.
+
+Writes reach SQLite on a background thread by default. The writer coalesces
+queued writes into group commits of up to ``group_commit_size`` writes,
+waiting at most ``group_commit_latency`` seconds for a group to fill.
 """
 
 from __future__ import annotations
@@ -10,9 +14,10 @@ import queue
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from .memory_cache import LRUCache, SingleFlight
+from .codecs import CacheCodec
+from .memory_cache import AsyncSingleFlight, LRUCache, SingleFlight
 from .sqlite_backend import CacheEntry, PersistentCache
 
 logger = logging.getLogger(__name__)
@@ -32,7 +37,9 @@ class ResultCacheManager:
     def __init__(
         self,
         *,
-        memory_size: int = 256,
+        memory_size: Optional[int] = 256,
+        memory_bytes: Optional[int] = None,
+        namespace_bytes: Optional[Dict[str, int]] = None,
         persistent_path: Optional[str] = None,
         enabled: bool = True,
         persistence_enabled: bool = True,
@@ -40,11 +47,20 @@ class ResultCacheManager:
         default_ttl: Optional[int] = None,
         async_persist: Optional[bool] = None,
         async_queue_size: int = 10000,
+        codec: Optional[CacheCodec] = None,
+        group_commit_size: Optional[int] = None,
+        group_commit_latency: Optional[float] = None,
+        max_disk_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
     ):
         self.enabled = enabled
         self.default_ttl = default_ttl
 
-        self.memory = LRUCache(max_size=memory_size)
+        self.memory = LRUCache(
+            max_size=memory_size,
+            max_bytes=memory_bytes,
+            namespace_bytes=namespace_bytes,
+        )
         persistence_path = persistent_path
         if persistence_path is None:
             cache_dir = os.environ.get("TOOLUNIVERSE_CACHE_DIR")
@@ -53,13 +69,22 @@ class ResultCacheManager:
         self.persistent = None
         if persistence_enabled and persistence_path:
             try:
-                self.persistent = PersistentCache(persistence_path, enable=True)
+                self.persistent = PersistentCache(
+                    persistence_path,
+                    enable=True,
+                    codec=codec,
+                    max_disk_bytes=max_disk_bytes,
+                    max_entries=max_entries,
+                )
             except Exception as exc:
                 logger.warning("Failed to initialize persistent cache: %s", exc)
                 self.persistent = None
 
         self.singleflight = SingleFlight() if singleflight else None
-        self._init_async_persistence(async_persist, async_queue_size)
+        self.async_singleflight = AsyncSingleFlight() if singleflight else None
+        self._init_async_persistence(
+            async_persist, async_queue_size, group_commit_size, group_commit_latency
+        )
 
     # ------------------------------------------------------------------
     # Helper methods
@@ -75,12 +100,28 @@ class ResultCacheManager:
         return ttl if ttl is not None else self.default_ttl
 
     def _init_async_persistence(
-        self, async_persist: Optional[bool], async_queue_size: int
+        self,
+        async_persist: Optional[bool],
+        async_queue_size: int,
+        group_commit_size: Optional[int] = None,
+        group_commit_latency: Optional[float] = None,
     ) -> None:
         if async_persist is None:
             async_persist = os.getenv(
                 "TOOLUNIVERSE_CACHE_ASYNC_PERSIST", "true"
             ).lower() in ("true", "1", "yes")
+        if group_commit_size is None:
+            group_commit_size = int(
+                os.getenv("TOOLUNIVERSE_CACHE_GROUP_COMMIT_SIZE", "256")
+            )
+        if group_commit_latency is None:
+            group_commit_latency = (
+                float(os.getenv("TOOLUNIVERSE_CACHE_GROUP_COMMIT_MS", "5")) / 1000
+            )
+        self.group_commit_size = max(1, group_commit_size)
+        self.group_commit_latency = max(0.0, group_commit_latency)
+        self.group_commits = 0
+        self.grouped_writes = 0
 
         self.async_persist = (
             async_persist and self.persistent is not None and self.enabled
@@ -109,12 +150,9 @@ class ResultCacheManager:
             return None
 
         composed = self.compose_key(namespace, version, cache_key)
-        record = self.memory.get(composed)
-        if record:
-            if record.expires_at and record.expires_at <= self._now():
-                self.memory.delete(composed)
-            else:
-                return record.value
+        value = self._get_from_memory(composed)
+        if value is not None:
+            return value
 
         entry = self._get_from_persistent(composed)
         if entry:
@@ -127,10 +165,23 @@ class ResultCacheManager:
                     namespace=namespace,
                     version=version,
                 ),
+                namespace=namespace,
             )
             return entry.value
         return None
 
+    def get_memory(
+        self, *, namespace: str, version: str, cache_key: str
+    ) -> Optional[Any]:
+        """Like :meth:`get`, but only consult the in-memory tier.
+
+        Never touches the persistent store, so it is safe to call from an
+        event loop.
+        """
+        if not self.enabled:
+            return None
+        return self._get_from_memory(self.compose_key(namespace, version, cache_key))
+
     def set(
         self,
         *,
@@ -155,6 +206,7 @@ class ResultCacheManager:
                 namespace=namespace,
                 version=version,
             ),
+            namespace=namespace,
         )
 
         if self.persistent:
@@ -200,6 +252,9 @@ class ResultCacheManager:
     def bulk_get(self, requests: Sequence[Dict[str, str]]) -> Dict[str, Any]:
         """Fetch multiple cache entries at once.
 
+        Memory hits are served directly; the remaining keys are read from
+        the persistent layer with chunked ``IN`` queries.
+
         Args:
             requests: Iterable of dicts containing ``namespace``, ``version`` and ``cache_key``.
 
@@ -211,20 +266,84 @@ class ResultCacheManager:
             return {}
 
         hits: Dict[str, Any] = {}
+        missing: Dict[str, Tuple[str, str]] = {}
+        now = self._now()
         for request in requests:
             namespace = request["namespace"]
             version = request["version"]
-            cache_key = request["cache_key"]
-            value = self.get(
+            composed = self.compose_key(namespace, version, request["cache_key"])
+            record = self.memory.get(composed)
+            if record:
+                if record.expires_at and record.expires_at <= now:
+                    self.memory.delete(composed)
+                elif record.value is not None:
+                    hits[composed] = record.value
+                    continue
+            missing[composed] = (namespace, version)
+
+        if missing:
+            entries = self._get_many_from_persistent(list(missing))
+            for composed, entry in entries.items():
+                if entry.value is None:
+                    continue
+                namespace, version = missing[composed]
+                expires_at = entry.created_at + entry.ttl if entry.ttl else None
+                self.memory.set(
+                    composed,
+                    CacheRecord(
+                        value=entry.value,
+                        expires_at=expires_at,
+                        namespace=namespace,
+                        version=version,
+                    ),
+                    namespace=namespace,
+                )
+                hits[composed] = entry.value
+
+        return hits
+
+    def bulk_set(self, entries: Sequence[Dict[str, Any]]):
+        """Store multiple results at once.
+
+        Args:
+            entries: Dicts containing ``namespace``, ``version``, ``cache_key``,
+                ``value`` and optionally ``ttl``.
+
+        The persistent rows are written in a single transaction.
+        """
+        if not self.enabled:
+            return
+
+        now = self._now()
+        items = []
+        for entry in entries:
+            namespace = entry["namespace"]
+            version = entry["version"]
+            effective_ttl = self._ttl_or_default(entry.get("ttl"))
+            composed = self.compose_key(namespace, version, entry["cache_key"])
+            self.memory.set(
+                composed,
+                CacheRecord(
+                    value=entry["value"],
+                    expires_at=now + effective_ttl if effective_ttl else None,
+                    namespace=namespace,
+                    version=version,
+                ),
                 namespace=namespace,
-                version=version,
-                cache_key=cache_key,
             )
-            if value is not None:
-                composed = self.compose_key(namespace, version, cache_key)
-                hits[composed] = value
+            items.append(
+                {
+                    "composed": composed,
+                    "value": entry["value"],
+                    "namespace": namespace,
+                    "version": version,
+                    "ttl": effective_ttl,
+                }
+            )
 
-        return hits
+        if self.persistent and items:
+            if not self._schedule_persist("set_many", {"items": items}):
+                self._perform_persist_set_many(items)
 
     def stats(self) -> Dict[str, Any]:
         return {
@@ -239,6 +358,8 @@ class ResultCacheManager:
                 if self.async_persist and self._persist_queue is not None
                 else 0
             ),
+            "group_commits": self.group_commits,
+            "grouped_writes": self.grouped_writes,
         }
 
     def dump(self, namespace: Optional[str] = None) -> Iterator[Dict[str, Any]]:
@@ -259,6 +380,15 @@ class ResultCacheManager:
             for entry in self._iter_persistent(namespace=namespace)
         )
 
+    def _get_from_memory(self, composed_key: str) -> Optional[Any]:
+        record = self.memory.get(composed_key)
+        if record:
+            if record.expires_at and record.expires_at <= self._now():
+                self.memory.delete(composed_key)
+            else:
+                return record.value
+        return None
+
     def _get_from_persistent(self, composed_key: str) -> Optional[CacheEntry]:
         if not self.persistent:
             return None
@@ -269,6 +399,18 @@ class ResultCacheManager:
             self.persistent = None
             return None
 
+    def _get_many_from_persistent(
+        self, composed_keys: List[str]
+    ) -> Dict[str, CacheEntry]:
+        if not self.persistent:
+            return {}
+        try:
+            return self.persistent.get_many(composed_keys)
+        except Exception as exc:
+            logger.warning("Persistent cache read failed: %s", exc)
+            self.persistent = None
+            return {}
+
     def _iter_persistent(self, namespace: Optional[str]):
         if not self.persistent:
             return iter([])
@@ -286,6 +428,11 @@ class ResultCacheManager:
             return self.singleflight.acquire(composed_key)
         return _DummyContext()
 
+    def async_singleflight_guard(self, composed_key: str):
+        if self.async_singleflight:
+            return self.async_singleflight.acquire(composed_key)
+        return _DummyContext()
+
     def close(self):
         self.flush()
         self._shutdown_async_worker()
@@ -320,27 +467,49 @@ class ResultCacheManager:
         if queue_ref is None:
             return
 
-        while True:
+        stop = False
+        while not stop:
             try:
-                op, payload = queue_ref.get()
+                batch = [queue_ref.get()]
             except Exception:
                 continue
 
-            if op == "__STOP__":
-                queue_ref.task_done()
-                break
-
-            try:
-                if op == "set":
-                    self._perform_persist_set(**payload)
+            # Group commit: take more queued writes until the group is full
+            # or the first one has waited group_commit_latency
+            deadline = time.monotonic() + self.group_commit_latency
+            while len(batch) < self.group_commit_size and batch[-1][0] != "__STOP__":
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(queue_ref.get(timeout=remaining))
+                    else:
+                        batch.append(queue_ref.get_nowait())
+                except queue.Empty:
+                    break
+
+            items: List[Dict[str, Any]] = []
+            for op, payload in batch:
+                if op == "__STOP__":
+                    stop = True
+                elif op == "set":
+                    items.append(payload)
+                elif op == "set_many":
+                    items.extend(payload["items"])
                 else:
                     logger.warning("Unknown async cache operation: %s", op)
+
+            try:
+                if items:
+                    self._perform_persist_set_many(items)
+                    self.group_commits += 1
+                    self.grouped_writes += len(items)
             except Exception as exc:
                 logger.warning("Async cache write failed: %s", exc)
                 # Disable async persistence to avoid repeated failures
                 self.async_persist = False
             finally:
-                queue_ref.task_done()
+                for _ in batch:
+                    queue_ref.task_done()
 
     def _perform_persist_set(
         self,
@@ -366,6 +535,25 @@ class ResultCacheManager:
             self.persistent = None
             raise
 
+    def _perform_persist_set_many(self, items: List[Dict[str, Any]]):
+        if not self.persistent:
+            return
+        try:
+            self.persistent.set_many(
+                (
+                    item["composed"],
+                    item["value"],
+                    item["namespace"],
+                    item["version"],
+                    item["ttl"],
+                )
+                for item in items
+            )
+        except Exception as exc:
+            logger.warning("Persistent cache write failed: %s", exc)
+            self.persistent = None
+            raise
+
     def _shutdown_async_worker(self) -> None:
         if not self.async_persist or self._persist_queue is None:
             return
@@ -388,3 +576,9 @@ class _DummyContext:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         return False
+
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
@@ -3,17 +3,103 @@ SQLite-backed persistent cache for ToolUniverse.
 
 The cache stores serialized tool results with TTL and version metadata.
 Designed to be a drop-in persistent layer behind the in-memory cache.
+Values are encoded by a ``CacheCodec`` (see ``codecs``), and each row records
+the codec tag it was written with. ``get_many`` and ``set_many`` read and
+write many rows with chunked queries in a single transaction.
+
+The cache can be bounded by size (``max_disk_bytes``) and entry count
+(``max_entries``). A background maintenance thread periodically sweeps
+expired rows, evicts the least recently (``lru``) or least frequently
+(``lfu``) used entries while the cache is over a bound, and returns freed
+pages to the filesystem with incremental vacuum and a truncating WAL
+checkpoint; the size bound counts the -wal file too. New cache files are created
+with ``auto_vacuum=INCREMENTAL``; existing files are converted with a
+one-off ``VACUUM`` the first time a size bound applies to them.
+
+Reads do not write. Hits are counted in memory and the access times and
+hit counts are flushed in one batched ``UPDATE`` every
+``access_flush_interval`` seconds, so reads never wait on the WAL write
+lock. Each reading thread gets its own read-only connection, so concurrent
+hits do not serialize on the writer connection's lock. A reader is closed
+when its thread exits, and at most ``MAX_READ_CONNECTIONS`` are open at
+once; further threads read through the writer connection.
 """
 
 from __future__ import annotations
 
+import logging
 import os
-import pickle
 import sqlite3
 import threading
 import time
+import weakref
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .memory_cache import parse_bytes
+from .codecs import (
+    DICTIONARY_SAMPLE_BYTES,
+    DICTIONARY_SAMPLES,
+    CacheCodec,
+    CodecError,
+    parse_tag,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keys per ``IN (...)`` query, well below SQLite's host parameter limit
+BULK_CHUNK_SIZE = 500
+
+DEFAULT_MAINTENANCE_INTERVAL = 300.0
+# Eviction frees space down to this fraction of a bound, so that it does not
+# run again after every few writes
+EVICTION_TARGET = 0.9
+# Writes after which a bounded cache runs maintenance before its interval
+MAINTENANCE_WRITES = 1000
+# Approximate per-row bytes beyond key and value (record header, indexes)
+ROW_OVERHEAD = 64
+
+DEFAULT_ACCESS_FLUSH_INTERVAL = 5.0
+# Read connections open at once; further reading threads share the writer
+MAX_READ_CONNECTIONS = 32
+# Buffered keys after which access statistics are flushed early
+ACCESS_FLUSH_KEYS = 1000
+
+_FLUSH_ACCESS = """
+    UPDATE cache_entries
+    SET last_accessed = MAX(last_accessed, ?), hit_count = hit_count + ?
+    WHERE cache_key = ?
+"""
+
+EVICTION_ORDER = {
+    "lru": "last_accessed ASC",
+    "lfu": "hit_count ASC, last_accessed ASC",
+}
+_AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+_SELECT_ENTRY = """
+    SELECT cache_key, namespace, version, value, ttl, created_at,
+           last_accessed, expires_at, hit_count, codec
+    FROM cache_entries
+"""
+
+_UPSERT_ENTRY = """
+    INSERT INTO cache_entries(cache_key, namespace, version, value, ttl,
+                              created_at, last_accessed, expires_at,
+                              hit_count, codec)
+    VALUES(?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+    ON CONFLICT(cache_key) DO UPDATE SET
+        namespace=excluded.namespace,
+        version=excluded.version,
+        value=excluded.value,
+        codec=excluded.codec,
+        ttl=excluded.ttl,
+        created_at=excluded.created_at,
+        last_accessed=excluded.last_accessed,
+        expires_at=excluded.expires_at,
+        hit_count=excluded.hit_count
+"""
 
 
 @dataclass
@@ -28,14 +114,96 @@ class CacheEntry:
     hit_count: int
 
 
+class _ReadConnection:
+    """A thread's read connection, closed when the thread's locals are freed."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        weakref.finalize(self, conn.close)
+
+
 class PersistentCache:
     """SQLite-backed cache layer with TTL support."""
 
-    def __init__(self, path: str, *, enable: bool = True):
+    def __init__(
+        self,
+        path: str,
+        *,
+        enable: bool = True,
+        codec: Optional[CacheCodec] = None,
+        max_disk_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        eviction: Optional[str] = None,
+        maintenance_interval: Optional[float] = None,
+        access_flush_interval: Optional[float] = None,
+        read_connections: Optional[bool] = None,
+    ):
         self.enabled = enable
         self.path = path
+        self.codec = codec or CacheCodec.from_env()
+        # Bounds default to the TOOLUNIVERSE_CACHE_* variables; 0 means none
+        if max_disk_bytes is None:
+            max_disk_bytes = parse_bytes(os.getenv("TOOLUNIVERSE_CACHE_MAX_DISK_BYTES"))
+        if max_entries is None:
+            max_entries = int(os.getenv("TOOLUNIVERSE_CACHE_MAX_ENTRIES", "0"))
+        if eviction is None:
+            eviction = os.getenv("TOOLUNIVERSE_CACHE_EVICTION", "lru").lower()
+        if eviction not in EVICTION_ORDER:
+            raise ValueError(
+                f"Unknown cache eviction policy {eviction!r}; "
+                f"expected one of {sorted(EVICTION_ORDER)}"
+            )
+        if maintenance_interval is None:
+            maintenance_interval = float(
+                os.getenv(
+                    "TOOLUNIVERSE_CACHE_MAINTENANCE_INTERVAL",
+                    str(DEFAULT_MAINTENANCE_INTERVAL),
+                )
+            )
+        if access_flush_interval is None:
+            access_flush_interval = float(
+                os.getenv(
+                    "TOOLUNIVERSE_CACHE_ACCESS_FLUSH_INTERVAL",
+                    str(DEFAULT_ACCESS_FLUSH_INTERVAL),
+                )
+            )
+        if read_connections is None:
+            read_connections = os.getenv(
+                "TOOLUNIVERSE_CACHE_READ_CONNECTIONS", "true"
+            ).lower() in ("true", "1", "yes")
+        self.max_disk_bytes = max_disk_bytes or None
+        self.max_entries = max_entries or None
+        self.eviction = eviction
+        self.maintenance_interval = maintenance_interval
+        # 0 writes access statistics through on every read
+        self.access_flush_interval = access_flush_interval
+        self.read_connections = read_connections and path != ":memory:"
+        self.evictions = 0
+        self.expired_removed = 0
+        self.last_maintenance: Optional[float] = None
+        self._writes_since_maintenance = 0
+        self._maintenance_thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._maintenance_due = False
+        self._closing = False
         self._lock = threading.RLock()
         self._conn: Optional[sqlite3.Connection] = None
+        # key -> (last access time, hits) not yet written
+        self._access: Dict[str, Tuple[float, int]] = {}
+        self._access_lock = threading.Lock()
+        self.access_flushes = 0
+        self._local = threading.local()
+        # Held strongly only by each reading thread's locals, so a reader
+        # is closed when its thread exits
+        self._readers: "weakref.WeakSet[_ReadConnection]" = weakref.WeakSet()
+        self._readers_lock = threading.Lock()
+        # Compression dictionaries by id, the current one per
+        # (namespace, compressor), and training samples per namespace
+        self._dictionaries: Dict[int, bytes] = {}
+        self._namespace_dictionaries: Dict[Tuple[str, str], int] = {}
+        self._samples: Dict[str, List[bytes]] = {}
 
         if self.enabled:
             self._init_storage()
@@ -50,11 +218,71 @@ class PersistentCache:
             check_same_thread=False,
             isolation_level=None,  # autocommit
         )
+        if not self._conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone():
+            # New file: let freed pages be returned to the filesystem
+            self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
         self._conn.execute("PRAGMA journal_mode=WAL;")
+        if self.max_disk_bytes:
+            # Cap what the WAL keeps on disk after checkpoints between runs
+            self._conn.execute(f"PRAGMA journal_size_limit={int(self.max_disk_bytes)};")
         self._conn.execute("PRAGMA synchronous=NORMAL;")
         self._conn.execute("PRAGMA foreign_keys=ON;")
         self._ensure_schema()
-        self.cleanup_expired()
+        if self.maintenance_interval <= 0:
+            self.cleanup_expired()
+        if self.maintenance_interval > 0 or self.access_flush_interval > 0:
+            self._maintenance_thread = threading.Thread(
+                target=self._maintenance_loop,
+                name="PersistentCacheMaintenance",
+                daemon=True,
+            )
+            self._maintenance_thread.start()
+
+    def _reader(self) -> Optional[sqlite3.Connection]:
+        """This thread's read-only connection, or None to read via the writer."""
+        if not self.read_connections or self._conn is None:
+            return None
+        reader = getattr(self._local, "reader", None)
+        if reader is None:
+            # Check the cap and register under one lock so racing threads
+            # cannot open more than MAX_READ_CONNECTIONS between them
+            with self._readers_lock:
+                if self._conn is None or len(self._readers) >= MAX_READ_CONNECTIONS:
+                    return None
+                try:
+                    conn = sqlite3.connect(
+                        f"file:{os.path.abspath(self.path)}?mode=ro",
+                        uri=True,
+                        timeout=30,
+                        check_same_thread=False,
+                        isolation_level=None,
+                    )
+                except sqlite3.Error as exc:
+                    logger.warning(
+                        "Cache read connection failed, sharing writer: %s", exc
+                    )
+                    self.read_connections = False
+                    return None
+                reader = _ReadConnection(conn)
+                self._readers.add(reader)
+            self._local.reader = reader
+        return reader.conn
+
+    def _select(self, sql: str, params: Sequence[Any]) -> List[Tuple[Any, ...]]:
+        """Run a read query, on this thread's read connection if possible.
+
+        Rows are fetched completely so no read transaction stays open.
+        """
+        conn = self._reader()
+        if conn is not None:
+            try:
+                return conn.execute(sql, params).fetchall()
+            except sqlite3.ProgrammingError:
+                pass  # closed by close() in another thread
+        with self._lock:
+            if self._conn is None:
+                return []
+            return self._conn.execute(sql, params).fetchall()
 
     def _ensure_schema(self):
         assert self._conn is not None
@@ -79,71 +307,392 @@ class PersistentCache:
         self._conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache_entries(expires_at)"
         )
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")
+        }
+        if "codec" not in columns:
+            # Rows from before codec tags have NULL and are read as pickle
+            self._conn.execute("ALTER TABLE cache_entries ADD COLUMN codec TEXT")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_dictionaries (
+                dictionary_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                namespace TEXT NOT NULL,
+                compressor TEXT NOT NULL,
+                data BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        for dictionary_id, namespace, compressor, data in self._conn.execute(
+            "SELECT dictionary_id, namespace, compressor, data "
+            "FROM cache_dictionaries ORDER BY dictionary_id"
+        ):
+            self._dictionaries[dictionary_id] = data
+            self._namespace_dictionaries[(namespace, compressor)] = dictionary_id
+
+    def _dictionary(self, dictionary_id: int) -> Optional[bytes]:
+        data = self._dictionaries.get(dictionary_id)
+        if data is None and self._conn is not None:
+            # Trained by another process sharing the cache file
+            rows = self._select(
+                "SELECT data FROM cache_dictionaries WHERE dictionary_id = ?",
+                (dictionary_id,),
+            )
+            if rows:
+                data = self._dictionaries[dictionary_id] = rows[0][0]
+        return data
 
-    def _serialize(self, value: Any) -> bytes:
-        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    def _encode(self, value: Any, namespace: str) -> Tuple[bytes, str]:
+        codec = self.codec
+        dictionary = None
+        if codec.dictionaries:
+            dictionary_id = self._namespace_dictionaries.get(
+                (namespace, codec.compression)
+            )
+            if dictionary_id is not None:
+                dictionary = (dictionary_id, self._dictionaries[dictionary_id])
+        payload, tag, serialized = codec.encode(value, dictionary)
+        if codec.dictionaries and dictionary is None:
+            self._add_sample(namespace, serialized)
+        return payload, tag
+
+    def _add_sample(self, namespace: str, serialized: bytes):
+        if len(serialized) > DICTIONARY_SAMPLE_BYTES // 4:
+            return
+        samples = self._samples.setdefault(namespace, [])
+        samples.append(serialized)
+        while sum(map(len, samples)) > DICTIONARY_SAMPLE_BYTES:
+            samples.pop(0)
+        if len(samples) < DICTIONARY_SAMPLES:
+            return
+        del self._samples[namespace]
+        data = self.codec.train_dictionary(samples)
+        if not data or self._conn is None:
+            return
+        cur = self._conn.execute(
+            "INSERT INTO cache_dictionaries(namespace, compressor, data, created_at) "
+            "VALUES(?, ?, ?, ?)",
+            (namespace, self.codec.compression, data, time.time()),
+        )
+        self._dictionaries[cur.lastrowid] = data
+        self._namespace_dictionaries[(namespace, self.codec.compression)] = (
+            cur.lastrowid
+        )
 
-    def _deserialize(self, payload: bytes) -> Any:
-        return pickle.loads(payload)
+    def _decode(self, payload: bytes, tag: Optional[str]) -> Any:
+        return self.codec.decode(payload, tag, self._dictionary)
 
     def close(self):
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        self._closing = True
+        self._wake.set()
+        if self._maintenance_thread is not None:
+            self._maintenance_thread.join(timeout=5)
+            self._maintenance_thread = None
+        self.flush_access_stats()
+        with self._lock, self._readers_lock:
+            for reader in list(self._readers):
+                reader.conn.close()
+            self._readers.clear()
+            if self._conn:
+                self._conn.close()
+                self._conn = None
 
-    def cleanup_expired(self):
+    def cleanup_expired(self) -> int:
         if not self.enabled or not self._conn:
-            return
+            return 0
         with self._lock:
             now = time.time()
-            self._conn.execute(
+            cur = self._conn.execute(
                 "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
                 (now,),
             )
+            self.expired_removed += cur.rowcount
+            return cur.rowcount
 
-    def get(self, cache_key: str) -> Optional[CacheEntry]:
+    # ------------------------------------------------------------------
+    # Maintenance: expiry sweeps, eviction and page reclamation
+    # ------------------------------------------------------------------
+    @property
+    def bounded(self) -> bool:
+        return bool(self.max_disk_bytes or self.max_entries)
+
+    def _maintenance_loop(self):
+        maintain = self.maintenance_interval > 0
+        next_maintenance = time.monotonic()
+        while not self._closing:
+            try:
+                self.flush_access_stats()
+                if maintain and (
+                    self._maintenance_due or time.monotonic() >= next_maintenance
+                ):
+                    self._maintenance_due = False
+                    self.maintain()
+                    next_maintenance = time.monotonic() + self.maintenance_interval
+            except Exception as exc:
+                logger.warning("Persistent cache maintenance failed: %s", exc)
+            timeouts = [next_maintenance - time.monotonic()] if maintain else []
+            if self.access_flush_interval > 0:
+                timeouts.append(self.access_flush_interval)
+            self._wake.wait(max(0.0, min(timeouts)))
+            self._wake.clear()
+
+    def _note_writes(self, count: int):
+        if (
+            not self.bounded
+            or self._maintenance_thread is None
+            or self.maintenance_interval <= 0
+        ):
+            return
+        self._writes_since_maintenance += count
+        if self._writes_since_maintenance >= MAINTENANCE_WRITES:
+            self._writes_since_maintenance = 0
+            self._maintenance_due = True
+            self._wake.set()
+
+    def _record_access(self, keys: Iterable[str]):
+        now = time.time()
+        with self._access_lock:
+            for key in keys:
+                hits = self._access.get(key, (0.0, 0))[1]
+                self._access[key] = (now, hits + 1)
+            pending = len(self._access)
+        if self.access_flush_interval <= 0 or self._maintenance_thread is None:
+            self.flush_access_stats()
+        elif pending >= ACCESS_FLUSH_KEYS:
+            self._wake.set()
+
+    def flush_access_stats(self) -> int:
+        """Write buffered access times and hit counts in one transaction.
+
+        Returns the number of entries updated.
+        """
+        with self._access_lock:
+            pending, self._access = self._access, {}
+        if not pending:
+            return 0
+        with self._lock:
+            if self._conn is None:
+                return 0
+            with self._transaction() as conn:
+                conn.executemany(
+                    _FLUSH_ACCESS,
+                    [
+                        (accessed, hits, key)
+                        for key, (accessed, hits) in pending.items()
+                    ],
+                )
+        self.access_flushes += 1
+        return len(pending)
+
+    def maintain(self) -> Dict[str, int]:
+        """Sweep expired rows, evict entries over the bounds and reclaim pages.
+
+        Runs on the maintenance thread; call it directly when the thread is
+        disabled (``maintenance_interval=0``).
+        """
         if not self.enabled or not self._conn:
-            return None
+            return {}
+        # Eviction order depends on up-to-date access statistics
+        self.flush_access_stats()
+        expired = self.cleanup_expired()
+        if self.max_disk_bytes:
+            self._enable_incremental_vacuum()
+        evicted = 0
+        if self.max_entries:
+            with self._lock:
+                (count,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM cache_entries"
+                ).fetchone()
+            if count > self.max_entries:
+                evicted += self._evict(
+                    count=count - int(self.max_entries * EVICTION_TARGET)
+                )
+        reclaimed = 0
+        if self.max_disk_bytes:
+            # The bound covers the WAL as well as the main file's used pages.
+            # Row sizes are estimates, so measure again after reclaiming and
+            # evict more if needed
+            for _ in range(3):
+                reclaimed += self._reclaim_pages()
+                used = self._disk_bytes()
+                if used <= self.max_disk_bytes:
+                    break
+                # Scale the excess by how much of the footprint is row data,
+                # so page overhead does not make us evict everything at once
+                excess = used - int(self.max_disk_bytes * EVICTION_TARGET)
+                freed = self._evict(
+                    nbytes=int(excess * min(1.0, self._row_bytes() / max(used, 1)))
+                )
+                evicted += freed
+                if not freed:
+                    break
+        reclaimed += self._reclaim_pages()
+        self.last_maintenance = time.time()
+        return {"expired": expired, "evicted": evicted, "reclaimed_pages": reclaimed}
+
+    def _pragma(self, name: str) -> int:
+        return self._conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def _used_bytes(self) -> int:
+        with self._lock:
+            pages = self._pragma("page_count") - self._pragma("freelist_count")
+            return pages * self._pragma("page_size")
+
+    def _disk_bytes(self) -> int:
+        """Used pages of the main file plus the size of the write-ahead log."""
+        wal = self.path + "-wal"
+        return self._used_bytes() + (os.path.getsize(wal) if os.path.exists(wal) else 0)
+
+    def _row_bytes(self) -> int:
+        with self._lock:
+            (size,) = self._conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(value) + LENGTH(cache_key) + ?), 0) "
+                "FROM cache_entries",
+                (ROW_OVERHEAD,),
+            ).fetchone()
+            return size
+
+    def _enable_incremental_vacuum(self):
+        with self._lock:
+            if self._pragma("auto_vacuum") == 2:
+                return
+            logger.info("Converting %s to incremental auto-vacuum", self.path)
+            self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            self._conn.execute("VACUUM")
+
+    def _evict(self, *, count: Optional[int] = None, nbytes: int = 0) -> int:
+        """Delete ``count`` entries, or about ``nbytes`` of them, in eviction order."""
+        victims: List[Tuple[str]] = []
+        freed = 0
         with self._lock:
             cur = self._conn.execute(
-                """
-                SELECT cache_key, namespace, version, value, ttl, created_at,
-                       last_accessed, expires_at, hit_count
-                FROM cache_entries WHERE cache_key = ?
-                """,
-                (cache_key,),
+                "SELECT cache_key, LENGTH(value) + LENGTH(cache_key) "
+                f"FROM cache_entries ORDER BY {EVICTION_ORDER[self.eviction]}"
             )
-            row = cur.fetchone()
-            if not row:
-                return None
+            for key, size in cur:
+                if count is not None:
+                    if len(victims) >= count:
+                        break
+                elif freed >= nbytes:
+                    break
+                victims.append((key,))
+                freed += size + ROW_OVERHEAD
+            cur.close()
+        # Delete in chunks so requests are not blocked behind one long write
+        for start in range(0, len(victims), BULK_CHUNK_SIZE):
+            with self._lock:
+                if self._conn is None:
+                    break
+                with self._transaction() as conn:
+                    conn.executemany(
+                        "DELETE FROM cache_entries WHERE cache_key = ?",
+                        victims[start : start + BULK_CHUNK_SIZE],
+                    )
+        self.evictions += len(victims)
+        return len(victims)
 
-            expires_at = row[7]
-            if expires_at is not None and expires_at <= time.time():
-                self._conn.execute(
-                    "DELETE FROM cache_entries WHERE cache_key = ?", (cache_key,)
-                )
-                return None
+    def _reclaim_pages(self) -> int:
+        with self._lock:
+            if self._conn is None or self._pragma("auto_vacuum") != 2:
+                return 0
+            free = self._pragma("freelist_count")
+            if free:
+                # execute() steps the pragma once, freeing a single page;
+                # executescript() runs it to completion
+                self._conn.executescript("PRAGMA incremental_vacuum;")
+            if free or self.max_disk_bytes:
+                # A PASSIVE checkpoint leaves the -wal file at its high-water
+                # mark; TRUNCATE copies it back and empties it
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            return free
 
-            entry = CacheEntry(
-                key=row[0],
-                namespace=row[1],
-                version=row[2] or "",
-                value=self._deserialize(row[3]),
-                ttl=row[4],
-                created_at=row[5],
-                last_accessed=row[6],
-                hit_count=row[8],
-            )
+    @contextmanager
+    def _transaction(self):
+        assert self._conn is not None
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
 
-            self._conn.execute(
-                """
-                UPDATE cache_entries
-                SET last_accessed = ?, hit_count = hit_count + 1
-                WHERE cache_key = ?
-                """,
-                (time.time(), cache_key),
-            )
-            return entry
+    @staticmethod
+    def _entry(row: Sequence[Any], value: Any) -> CacheEntry:
+        return CacheEntry(
+            key=row[0],
+            namespace=row[1],
+            version=row[2] or "",
+            value=value,
+            ttl=row[4],
+            created_at=row[5],
+            last_accessed=row[6],
+            hit_count=row[8],
+        )
+
+    def _read_row(self, row: Sequence[Any], now: float) -> Optional[CacheEntry]:
+        """Decode a selected row, or return None if it is expired or unreadable."""
+        expires_at = row[7]
+        if expires_at is not None and expires_at <= now:
+            return None
+        try:
+            return self._entry(row, self._decode(row[3], row[9]))
+        except CodecError as exc:
+            logger.warning("Dropping unreadable cache entry %s: %s", row[0], exc)
+            return None
+
+    def get(self, cache_key: str) -> Optional[CacheEntry]:
+        if not self.enabled or not self._conn:
+            return None
+        rows = self._select(_SELECT_ENTRY + " WHERE cache_key = ?", (cache_key,))
+        if not rows:
+            return None
+
+        entry = self._read_row(rows[0], time.time())
+        if entry is None:
+            with self._lock:
+                if self._conn is not None:
+                    self._conn.execute(
+                        "DELETE FROM cache_entries WHERE cache_key = ?", (cache_key,)
+                    )
+            return None
+
+        self._record_access((cache_key,))
+        return entry
+
+    def get_many(self, cache_keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """Fetch many entries with chunked ``IN`` queries.
+
+        Expired or unreadable rows are deleted in a single transaction.
+        """
+        if not self.enabled or not self._conn:
+            return {}
+        keys = list(dict.fromkeys(cache_keys))
+        entries: Dict[str, CacheEntry] = {}
+        dropped: List[Tuple[str]] = []
+        now = time.time()
+        for start in range(0, len(keys), BULK_CHUNK_SIZE):
+            chunk = keys[start : start + BULK_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self._select(
+                f"{_SELECT_ENTRY} WHERE cache_key IN ({placeholders})", chunk
+            ):
+                entry = self._read_row(row, now)
+                if entry is None:
+                    dropped.append((row[0],))
+                else:
+                    entries[row[0]] = entry
+        if dropped:
+            with self._lock:
+                if self._conn is not None:
+                    with self._transaction() as conn:
+                        conn.executemany(
+                            "DELETE FROM cache_entries WHERE cache_key = ?", dropped
+                        )
+        if entries:
+            self._record_access(entries)
+        return entries
 
     def set(
         self,
@@ -159,22 +708,9 @@ class PersistentCache:
         with self._lock:
             now = time.time()
             expires_at = now + ttl if ttl else None
-            payload = self._serialize(value)
+            payload, codec = self._encode(value, namespace)
             self._conn.execute(
-                """
-                INSERT INTO cache_entries(cache_key, namespace, version, value, ttl,
-                                          created_at, last_accessed, expires_at, hit_count)
-                VALUES(?, ?, ?, ?, ?, ?, ?, ?, 0)
-                ON CONFLICT(cache_key) DO UPDATE SET
-                    namespace=excluded.namespace,
-                    version=excluded.version,
-                    value=excluded.value,
-                    ttl=excluded.ttl,
-                    created_at=excluded.created_at,
-                    last_accessed=excluded.last_accessed,
-                    expires_at=excluded.expires_at,
-                    hit_count=excluded.hit_count
-                """,
+                _UPSERT_ENTRY,
                 (
                     cache_key,
                     namespace,
@@ -184,8 +720,52 @@ class PersistentCache:
                     now,
                     now,
                     expires_at,
+                    codec,
                 ),
             )
+        self._note_writes(1)
+
+    def set_many(
+        self, items: Iterable[Tuple[str, Any, str, str, Optional[int]]]
+    ) -> int:
+        """Write ``(cache_key, value, namespace, version, ttl)`` items in one
+        transaction, returning the number of rows written.
+
+        Values that cannot be encoded are skipped with a warning instead of
+        failing the whole batch.
+        """
+        if not self.enabled or not self._conn:
+            return 0
+        with self._lock:
+            now = time.time()
+            rows = []
+            for cache_key, value, namespace, version, ttl in items:
+                try:
+                    payload, codec = self._encode(value, namespace)
+                except Exception as exc:
+                    logger.warning(
+                        "Skipping unencodable cache entry %s: %s", cache_key, exc
+                    )
+                    continue
+                expires_at = now + ttl if ttl else None
+                rows.append(
+                    (
+                        cache_key,
+                        namespace,
+                        version,
+                        payload,
+                        ttl,
+                        now,
+                        now,
+                        expires_at,
+                        codec,
+                    )
+                )
+            if rows:
+                with self._transaction() as conn:
+                    conn.executemany(_UPSERT_ENTRY, rows)
+        self._note_writes(len(rows))
+        return len(rows)
 
     def delete(self, cache_key: str):
         if not self.enabled or not self._conn:
@@ -203,18 +783,31 @@ class PersistentCache:
                 self._conn.execute(
                     "DELETE FROM cache_entries WHERE namespace = ?", (namespace,)
                 )
+                self._conn.execute(
+                    "DELETE FROM cache_dictionaries WHERE namespace = ?", (namespace,)
+                )
+                self._samples.pop(namespace, None)
+                for key in [
+                    k for k in self._namespace_dictionaries if k[0] == namespace
+                ]:
+                    self._dictionaries.pop(self._namespace_dictionaries.pop(key), None)
             else:
                 self._conn.execute("DELETE FROM cache_entries")
+                self._conn.execute("DELETE FROM cache_dictionaries")
+                self._samples.clear()
+                self._dictionaries.clear()
+                self._namespace_dictionaries.clear()
 
     def iter_entries(self, namespace: Optional[str] = None) -> Iterator[CacheEntry]:
         if not self.enabled or not self._conn:
             return iter([])
+        self.flush_access_stats()
         with self._lock:
             if namespace:
                 cur = self._conn.execute(
                     """
                     SELECT cache_key, namespace, version, value, ttl,
-                           created_at, last_accessed, hit_count
+                           created_at, last_accessed, hit_count, codec
                     FROM cache_entries WHERE namespace = ?
                     """,
                     (namespace,),
@@ -223,18 +816,23 @@ class PersistentCache:
                 cur = self._conn.execute(
                     """
                     SELECT cache_key, namespace, version, value, ttl,
-                           created_at, last_accessed, hit_count
+                           created_at, last_accessed, hit_count, codec
                     FROM cache_entries
                     """
                 )
             rows = cur.fetchall()
 
         for row in rows:
+            try:
+                value = self._decode(row[3], row[8])
+            except CodecError as exc:
+                logger.warning("Skipping unreadable cache entry %s: %s", row[0], exc)
+                continue
             yield CacheEntry(
                 key=row[0],
                 namespace=row[1],
                 version=row[2] or "",
-                value=self._deserialize(row[3]),
+                value=value,
                 ttl=row[4],
                 created_at=row[5],
                 last_accessed=row[6],
@@ -249,9 +847,55 @@ class PersistentCache:
                 "SELECT COUNT(*), SUM(LENGTH(value)) FROM cache_entries"
             )
             count, total_bytes = cur.fetchone()
+            codecs: Dict[str, int] = {}
+            for tag, tag_count in self._conn.execute(
+                "SELECT codec, COUNT(*) FROM cache_entries GROUP BY codec"
+            ):
+                serializer, compressor, dictionary_id = parse_tag(tag)
+                name = f"{serializer}+{compressor}" if compressor else serializer
+                if dictionary_id is not None:
+                    name += "+dictionary"
+                codecs[name] = codecs.get(name, 0) + tag_count
+            namespaces = {
+                namespace: {"entries": entries, "bytes": size}
+                for namespace, entries, size in self._conn.execute(
+                    "SELECT namespace, COUNT(*), "
+                    "SUM(LENGTH(value) + LENGTH(cache_key)) "
+                    "FROM cache_entries GROUP BY namespace ORDER BY 3 DESC"
+                )
+            }
+            page_size = self._pragma("page_size")
+            file_bytes = sum(
+                os.path.getsize(path)
+                for path in (self.path, self.path + "-wal")
+                if os.path.exists(path)
+            )
+            disk = {
+                "file_bytes": file_bytes,
+                "used_bytes": self._used_bytes(),
+                "free_bytes": self._pragma("freelist_count") * page_size,
+                "auto_vacuum": _AUTO_VACUUM_MODES.get(self._pragma("auto_vacuum")),
+                "max_disk_bytes": self.max_disk_bytes,
+                "max_entries": self.max_entries,
+                "eviction": self.eviction,
+                "evictions": self.evictions,
+                "expired_removed": self.expired_removed,
+                "last_maintenance": self.last_maintenance,
+            }
             return {
                 "enabled": True,
                 "entries": count or 0,
                 "approx_bytes": total_bytes or 0,
                 "path": self.path,
+                "codec": self.codec.describe(),
+                "codecs": codecs,
+                "dictionaries": len(self._dictionaries),
+                "disk": disk,
+                "namespaces": namespaces,
+                "access": {
+                    "pending": len(self._access),
+                    "flushes": self.access_flushes,
+                    "flush_interval": self.access_flush_interval,
+                    "read_connections": len(self._readers),
+                },
             }
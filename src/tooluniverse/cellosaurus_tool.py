@@ -1,6 +1,7 @@
 import os
 import re
 import requests
+from . import http_client
 from typing import Any, Dict, List, Tuple
 from difflib import SequenceMatcher
 
@@ -38,7 +39,7 @@ class CellosaurusSearchTool(BaseTool):
 
             url = f"{self.base_url}/search/cell-line"
             headers = {"Accept": "application/json"}
-            resp = requests.get(
+            resp = http_client.get(
                 url,
                 params=params,
                 headers=headers,
@@ -1271,7 +1272,7 @@ class CellosaurusGetCellLineInfoTool(BaseTool):
             url = f"{self.base_url}/cell-line/{accession}"
             headers = {"Accept": f"application/{format_type}"}
 
-            resp = requests.get(
+            resp = http_client.get(
                 url,
                 params=params,
                 headers=headers,
@@ -1,4 +1,4 @@
-import requests
+from . import http_client
 from urllib.parse import quote
 
 # from rdkit import Chem
@@ -34,7 +34,7 @@ class ChEMBLTool(BaseTool):
         headers = {"Accept": "application/json"}
         search_url = f"{self.base_url}/molecule/search.json?q={quote(compound_name)}"
         print(search_url)
-        response = requests.get(search_url, headers=headers)
+        response = http_client.get(search_url, headers=headers)
         response.raise_for_status()
         results = response.json().get("molecules", [])
         if not results or not isinstance(results, list):
@@ -58,7 +58,7 @@ class ChEMBLTool(BaseTool):
         headers = {"Accept": "application/json"}
         if query.upper().startswith("CHEMBL"):
             molecule_url = f"{self.base_url}/molecule/{quote(query)}.json"
-            response = requests.get(molecule_url, headers=headers)
+            response = http_client.get(molecule_url, headers=headers)
             response.raise_for_status()
             molecule = response.json()
             if not molecule or not isinstance(molecule, dict):
@@ -82,7 +82,7 @@ class ChEMBLTool(BaseTool):
         """
         headers = {"Accept": "application/json"}
         search_url = f"{self.base_url}/molecule/search.json?q={quote(compound_name)}"
-        response = requests.get(search_url, headers=headers)
+        response = http_client.get(search_url, headers=headers)
         response.raise_for_status()
         results = response.json().get("molecules", [])
         if not results or not isinstance(results, list):
@@ -158,7 +158,7 @@ class ChEMBLTool(BaseTool):
 
             encoded_smiles = quote(smiles)
             similarity_url = f"{self.base_url}/similarity/{encoded_smiles}/{similarity_threshold}.json?limit={max_results}"
-            sim_response = requests.get(similarity_url, headers=headers)
+            sim_response = http_client.get(similarity_url, headers=headers)
             sim_response.raise_for_status()
             sim_results = sim_response.json().get("molecules", [])
             similar_molecules = []
@@ -0,0 +1,447 @@
+"""
+Circuit breakers for upstream services.
+
+When an upstream service goes down, every call to it would otherwise wait for
+its own timeout. A breaker counts recent failures for one upstream and, past a
+threshold, *opens*: calls fail immediately until ``reset_timeout`` has passed.
+It then goes *half-open* and lets a probe call through; a success closes it
+again, a failure re-opens it.
+
+Breakers are keyed by upstream host (``"host:www.ebi.ac.uk"``, plus the port
+when the URL names one), fed by the shared HTTP client, and by tool type
+(``"type:OpenTarget"``), fed by ToolUniverse from timeouts and connection
+errors raised by tools. A call is refused while any breaker of its tool type
+or of a host the tool talks to is open.
+
+Thresholds can be set per tool with a ``circuit_breaker`` object in the tool
+config, or globally with :meth:`CircuitBreakerRegistry.configure`::
+
+    "circuit_breaker": {
+        "key": "opentargets",          # share one breaker across tool types
+        "hosts": ["api.platform.opentargets.org"],
+        "failure_rate": 0.5, "window": 20, "min_calls": 10,
+        "consecutive_failures": 5, "consecutive_timeouts": 3,
+        "reset_timeout": 30
+    }
+
+``"circuit_breaker": false`` disables the tool-type breaker for a tool. Set
+``TOOLUNIVERSE_CIRCUIT_BREAKER=false`` to disable breakers altogether.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import requests
+
+from .deadline import DeadlineExceeded
+from .logging_config import get_logger
+
+logger = get_logger("CircuitBreaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "failure_rate": 0.5,
+    "window": 20,
+    "min_calls": 10,
+    "consecutive_failures": 5,
+    "consecutive_timeouts": 3,
+    "reset_timeout": 30.0,
+    "half_open_calls": 1,
+}
+
+# Exceptions that indicate the upstream, not the request, is at fault.
+TIMEOUT_ERRORS = (TimeoutError, asyncio.TimeoutError, requests.exceptions.Timeout)
+TRANSPORT_ERRORS = TIMEOUT_ERRORS + (
+    ConnectionError,
+    requests.exceptions.ConnectionError,
+)
+
+# Hosts contacted during the current tool call, filled in by the HTTP client.
+_call_hosts: contextvars.ContextVar[Optional[Set[str]]] = contextvars.ContextVar(
+    "tooluniverse_call_hosts", default=None
+)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of contacting an upstream whose breaker is open."""
+
+    def __init__(self, key: str, retry_after: float):
+        super().__init__(
+            f"Circuit breaker for {key} is open; retry after {retry_after:.1f}s"
+        )
+        self.key = key
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for a single upstream."""
+
+    def __init__(self, key: str, **settings):
+        self.key = key
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+        self._consecutive_failures = 0
+        self._consecutive_timeouts = 0
+        self.configure(**settings)
+
+    def configure(self, **settings):
+        """Update thresholds; unknown keys are ignored."""
+        merged = dict(DEFAULT_SETTINGS)
+        merged.update(getattr(self, "settings", {}))
+        merged.update({k: v for k, v in settings.items() if k in DEFAULT_SETTINGS})
+        with self._lock:
+            self.settings = merged
+            self._outcomes = deque(
+                getattr(self, "_outcomes", ()), maxlen=int(merged["window"])
+            )
+
+    def _retry_after(self, now: float) -> float:
+        return max(0.0, self._opened_at + self.settings["reset_timeout"] - now)
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and self._retry_after(now) == 0.0:
+            self._state = HALF_OPEN
+            self._probes = 0
+        elif (
+            self._state == HALF_OPEN
+            and self._probes
+            and now - self._probe_started >= self.settings["reset_timeout"]
+        ):
+            # A probe that never reported back must not wedge the breaker.
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def retry_after(self) -> Optional[float]:
+        """Seconds until calls are let through again, or None if they are now."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == OPEN:
+                return self._retry_after(now)
+            if state == HALF_OPEN and self._probes >= self.settings["half_open_calls"]:
+                return self.settings["reset_timeout"]
+            return None
+
+    def allow(self) -> Optional[float]:
+        """Admit a call (returns None) or return the seconds to retry after."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return None
+            if state == HALF_OPEN and self._probes < self.settings["half_open_calls"]:
+                if not self._probes:
+                    self._probe_started = now
+                self._probes += 1
+                return None
+            if state == OPEN:
+                return self._retry_after(now)
+            # Half-open with its probe still in flight.
+            return self.settings["reset_timeout"]
+
+    def record(self, success: bool, timeout: bool = False):
+        """Record the outcome of an admitted call."""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            self._outcomes.append(success)
+            if success:
+                self._consecutive_failures = 0
+                self._consecutive_timeouts = 0
+                if state == HALF_OPEN:
+                    self._close()
+                return
+            self._consecutive_failures += 1
+            if timeout:
+                self._consecutive_timeouts += 1
+            if state == HALF_OPEN or self._should_open():
+                self._open()
+
+    def release(self):
+        """Give back a half-open probe whose call said nothing about the upstream."""
+        with self._lock:
+            if self._current_state(time.monotonic()) == HALF_OPEN and self._probes:
+                self._probes -= 1
+
+    def _should_open(self) -> bool:
+        settings = self.settings
+        if self._consecutive_timeouts >= settings["consecutive_timeouts"]:
+            return True
+        if self._consecutive_failures >= settings["consecutive_failures"]:
+            return True
+        calls = len(self._outcomes)
+        if calls < settings["min_calls"]:
+            return False
+        failures = calls - sum(self._outcomes)
+        return failures / calls >= settings["failure_rate"]
+
+    def _open(self):
+        if self._state == OPEN:
+            # Late failures of calls admitted before opening change nothing.
+            return
+        logger.warning(f"Circuit breaker for {self.key} opened")
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+
+    def _close(self):
+        if self._state != CLOSED:
+            logger.info(f"Circuit breaker for {self.key} closed")
+        self._state = CLOSED
+        self._outcomes.clear()
+        self._consecutive_failures = 0
+        self._consecutive_timeouts = 0
+
+    def reset(self):
+        with self._lock:
+            self._close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            calls = len(self._outcomes)
+            failures = calls - sum(self._outcomes)
+            return {
+                "state": state,
+                "retry_after": (
+                    round(self._retry_after(now), 3) if state == OPEN else None
+                ),
+                "recent_calls": calls,
+                "recent_failures": failures,
+                "consecutive_failures": self._consecutive_failures,
+                "consecutive_timeouts": self._consecutive_timeouts,
+            }
+
+
+def host_key(host: str) -> str:
+    return f"host:{(host or '').lower()}"
+
+
+class CircuitBreakerRegistry:
+    """Process-wide set of breakers plus the tool -> breaker key mapping."""
+
+    def __init__(self, enabled: Optional[bool] = None, **defaults):
+        if enabled is None:
+            enabled = os.getenv("TOOLUNIVERSE_CIRCUIT_BREAKER", "true").lower() not in (
+                "false",
+                "0",
+                "no",
+            )
+        self.enabled = enabled
+        self.defaults: Dict[str, Any] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._tool_keys: Dict[str, str] = {}
+        self._tool_hosts: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        if defaults:
+            self.configure(**defaults)
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = CircuitBreaker(key, **self.defaults)
+                    self._breakers[key] = breaker
+        return breaker
+
+    def configure(self, key: Optional[str] = None, **settings):
+        """Set thresholds for one breaker, or the defaults when ``key`` is None."""
+        if key is not None:
+            self.breaker(key).configure(**settings)
+            return
+        with self._lock:
+            self.defaults.update(
+                {k: v for k, v in settings.items() if k in DEFAULT_SETTINGS}
+            )
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.configure(**settings)
+
+    def register_tool(self, tool_name: str, tool_config: Optional[Dict[str, Any]]):
+        """Read a tool's ``circuit_breaker`` config and remember its keys."""
+        config = tool_config if isinstance(tool_config, dict) else {}
+        settings = config.get("circuit_breaker")
+        if settings is False:
+            self._tool_keys.pop(tool_name, None)
+            return
+        settings = settings if isinstance(settings, dict) else {}
+        key = settings.get("key") or f"type:{config.get('type', tool_name)}"
+        self._tool_keys[tool_name] = key
+        thresholds = {k: v for k, v in settings.items() if k in DEFAULT_SETTINGS}
+        if thresholds:
+            self.breaker(key).configure(**thresholds)
+        for host in settings.get("hosts") or ():
+            self.add_tool_host(tool_name, host)
+            if thresholds:
+                self.breaker(host_key(host)).configure(**thresholds)
+
+    def add_tool_host(self, tool_name: str, host: str):
+        self._add_tool_hosts(tool_name, [host])
+
+    def _add_tool_hosts(self, tool_name: str, hosts):
+        # track() adds hosts from worker threads while status calls read them.
+        with self._lock:
+            known = self._tool_hosts.setdefault(tool_name, set())
+            known.update(host_key(host) for host in hosts)
+
+    def tool_hosts(self, tool_name: str) -> List[str]:
+        """Breaker keys of the hosts ``tool_name`` is known to contact."""
+        with self._lock:
+            return sorted(self._tool_hosts.get(tool_name, ()))
+
+    def _tool_breaker_keys(self, tool_name: str) -> List[str]:
+        keys = []
+        key = self._tool_keys.get(tool_name)
+        if key is not None:
+            keys.append(key)
+        keys.extend(self.tool_hosts(tool_name))
+        return keys
+
+    def check_tool(self, tool_name: str) -> Optional[Tuple[str, float]]:
+        """Return ``(breaker_key, retry_after)`` if a breaker refuses the call."""
+        if not self.enabled:
+            return None
+        # Host breakers admit their probe per request, in before_request(), so
+        # they are only consulted here. They go first: the tool-type breaker
+        # must not spend its half-open probe on a call that is then refused.
+        for key in self.tool_hosts(tool_name):
+            breaker = self._breakers.get(key)
+            retry_after = breaker.retry_after() if breaker is not None else None
+            if retry_after is not None:
+                return key, retry_after
+        tool_key = self._tool_keys.get(tool_name)
+        breaker = self._breakers.get(tool_key) if tool_key is not None else None
+        retry_after = breaker.allow() if breaker is not None else None
+        if retry_after is not None:
+            return tool_key, retry_after
+        return None
+
+    @contextmanager
+    def track(self, tool_name: str) -> Iterator[None]:
+        """Record the outcome of one tool call and the hosts it contacted."""
+        if not self.enabled:
+            yield
+            return
+        hosts: Set[str] = set()
+        token = _call_hosts.set(hosts)
+        key = self._tool_keys.get(tool_name)
+        try:
+            yield
+        except CircuitOpenError:
+            # Refused by a host breaker: nothing reached the upstream.
+            if key is not None:
+                self.breaker(key).release()
+            raise
+        except DeadlineExceeded:
+            if key is not None:
+                self.breaker(key).record(False, timeout=True)
+            raise
+        except TRANSPORT_ERRORS as e:
+            if key is not None:
+                self.breaker(key).record(False, timeout=isinstance(e, TIMEOUT_ERRORS))
+            raise
+        except BaseException:
+            # Other errors blame the request, not the upstream; a half-open
+            # probe that ended this way is handed to the next call.
+            if key is not None:
+                self.breaker(key).release()
+            raise
+        else:
+            if key is not None:
+                self.breaker(key).record(True)
+        finally:
+            _call_hosts.reset(token)
+            if hosts:
+                self._add_tool_hosts(tool_name, hosts)
+
+    def before_request(self, host: str):
+        """Fail fast if ``host``'s breaker is open (called per HTTP request)."""
+        hosts = _call_hosts.get()
+        if hosts is not None:
+            hosts.add(host)
+        if not self.enabled:
+            return
+        breaker = self._breakers.get(host_key(host))
+        if breaker is None:
+            return
+        retry_after = breaker.allow()
+        if retry_after is not None:
+            raise CircuitOpenError(host_key(host), retry_after)
+
+    def after_request(self, host: str, success: bool, timeout: bool = False):
+        if self.enabled:
+            self.breaker(host_key(host)).record(success, timeout=timeout)
+
+    def tool_status(self, tool_name: str) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of the breakers that guard ``tool_name``."""
+        return {
+            key: self._breakers[key].snapshot()
+            for key in self._tool_breaker_keys(tool_name)
+            if key in self._breakers
+        }
+
+    def refusal(self, tool_name: str) -> Optional[Tuple[str, float]]:
+        """Like :meth:`check_tool`, but without admitting a half-open probe."""
+        for key in self._tool_breaker_keys(tool_name):
+            breaker = self._breakers.get(key)
+            retry_after = breaker.retry_after() if breaker is not None else None
+            if retry_after is not None:
+                return key, retry_after
+        return None
+
+    def open_tools(self) -> Dict[str, Dict[str, Any]]:
+        """Tools currently refused by an open breaker, with their retry-after."""
+        refused = {}
+        with self._lock:
+            tool_names = set(self._tool_keys) | set(self._tool_hosts)
+        for tool_name in tool_names:
+            refusal = self.refusal(tool_name)
+            if refusal is not None:
+                refused[tool_name] = {
+                    "breaker": refusal[0],
+                    "retry_after": round(refusal[1], 3),
+                }
+        return refused
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {key: breaker.snapshot() for key, breaker in self._breakers.items()}
+
+    def reset(self):
+        for breaker in list(self._breakers.values()):
+            breaker.reset()
+
+
+_registry: Optional[CircuitBreakerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Return the process-wide circuit breaker registry."""
+    global _registry
+    registry = _registry
+    if registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = CircuitBreakerRegistry()
+            registry = _registry
+    return registry
@@ -1,4 +1,4 @@
-import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -13,7 +13,7 @@ class ClinVarTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
 
     def run(self, arguments):
         query = arguments.get("query")
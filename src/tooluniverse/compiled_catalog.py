@@ -0,0 +1,359 @@
+"""
+Precompiled tool catalog.
+
+``load_tools`` otherwise parses every JSON tool config file (about 80 files,
+1.6MB) on each call, even when the application selects a handful of tools.
+This module compiles those files into one SQLite database with one pickled
+row per tool, indexes on category, name and type, and the SHA-256 of every
+source file. The database is opened read-only and memory-mapped, and
+``load_tools`` reads whole categories from it. ``load_category`` can also push
+name and type filters down to SQL, so only the selected records are decoded.
+
+A category falls back to JSON when its source file no longer matches the
+recorded hash or was not compiled (user config files, for example). When a
+default category had to be read as JSON, ``ToolUniverse`` rebuilds the catalog
+on a background thread, so the next start reads it again without the first
+one waiting for the write.
+
+Build the catalog ahead of time with ``tooluniverse-build-catalog``.
+Settings come from the environment:
+
+- ``TOOLUNIVERSE_TOOL_CATALOG``: set to ``false`` to always read JSON
+- ``TOOLUNIVERSE_TOOL_CATALOG_PATH``: catalog file (default:
+  ``tool_catalog.sqlite`` in ``TOOLUNIVERSE_CACHE_DIR`` or ``~/.tooluniverse``)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .logging_config import get_logger
+
+logger = get_logger("CompiledCatalog")
+
+CATALOG_FORMAT = 1
+CATALOG_FILENAME = "tool_catalog.sqlite"
+
+# Bound on SQL parameters per query; larger filters are sent in chunks.
+_MAX_PARAMS = 500
+
+_unwritable_paths: Set[str] = set()
+_refreshing: Dict[str, threading.Thread] = {}
+_refresh_lock = threading.Lock()
+
+
+def catalog_enabled() -> bool:
+    return os.getenv("TOOLUNIVERSE_TOOL_CATALOG", "true").lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+def default_catalog_path() -> str:
+    path = os.getenv("TOOLUNIVERSE_TOOL_CATALOG_PATH")
+    if path:
+        return path
+    base_dir = os.getenv("TOOLUNIVERSE_CACHE_DIR") or os.path.join(
+        str(Path.home()), ".tooluniverse"
+    )
+    return os.path.join(base_dir, CATALOG_FILENAME)
+
+
+def _source_entries(data: Any) -> Optional[List[Any]]:
+    # Same shapes load_tools accepts: a list of tools, or a dict of them.
+    if isinstance(data, dict):
+        return list(data.values())
+    if isinstance(data, list):
+        return data
+    return None
+
+
+def compile_catalog(tool_files: Dict[str, str], path: Optional[str] = None) -> str:
+    """Compile ``{category: json file}`` into a catalog at ``path`` and return it.
+
+    Files that cannot be read or parsed are left out, so their categories
+    keep loading from JSON. The catalog is written to a temporary file and
+    moved into place, so readers never see a partial catalog.
+    """
+    path = path or default_catalog_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(
+            """
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE sources (
+                category TEXT PRIMARY KEY,
+                file TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+            CREATE TABLE tools (
+                category TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                name TEXT,
+                type TEXT,
+                config BLOB NOT NULL,
+                PRIMARY KEY (category, position)
+            );
+            CREATE INDEX idx_tools_name ON tools(name);
+            CREATE INDEX idx_tools_type ON tools(type);
+            """
+        )
+        digests = []
+        for category, file_path in sorted(tool_files.items()):
+            try:
+                with open(file_path, "rb") as f:
+                    raw = f.read()
+                stat = os.stat(file_path)
+                entries = _source_entries(json.loads(raw))
+            except (OSError, ValueError) as e:
+                logger.debug(f"Not compiling category '{category}': {e}")
+                continue
+            if entries is None:
+                continue
+            digest = hashlib.sha256(raw).hexdigest()
+            digests.append(f"{category}:{digest}")
+            conn.execute(
+                "INSERT INTO sources VALUES (?, ?, ?, ?, ?)",
+                (
+                    category,
+                    os.path.abspath(file_path),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    digest,
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO tools VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        category,
+                        position,
+                        entry.get("name") if isinstance(entry, dict) else None,
+                        entry.get("type") if isinstance(entry, dict) else None,
+                        pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL),
+                    )
+                    for position, entry in enumerate(entries)
+                ],
+            )
+        content_hash = hashlib.sha256("\n".join(digests).encode()).hexdigest()
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [
+                ("format", str(CATALOG_FORMAT)),
+                ("content_hash", content_hash),
+                ("created_at", str(time.time())),
+            ],
+        )
+        conn.commit()
+    except BaseException:
+        conn.close()
+        os.unlink(tmp_path)
+        raise
+    conn.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+class CompiledToolCatalog:
+    """Read-only view of a compiled catalog."""
+
+    def __init__(self, path: str):
+        self.path = path
+        uri = Path(path).resolve().as_uri() + "?mode=ro"
+        self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        try:
+            self._conn.execute(f"PRAGMA mmap_size={os.path.getsize(path)}")
+            meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+            if meta.get("format") != str(CATALOG_FORMAT):
+                raise sqlite3.DatabaseError(
+                    f"unsupported catalog format {meta.get('format')!r}"
+                )
+            self.content_hash = meta["content_hash"]
+            self._sources: Dict[str, Tuple[str, int, int, str]] = {
+                row[0]: tuple(row[1:])
+                for row in self._conn.execute(
+                    "SELECT category, file, size, mtime_ns, sha256 FROM sources"
+                )
+            }
+        except BaseException:
+            self._conn.close()
+            raise
+        self._fresh: Dict[str, bool] = {}
+
+    def __enter__(self) -> "CompiledToolCatalog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    def categories(self) -> List[str]:
+        return sorted(self._sources)
+
+    def is_fresh(self, category: str, file_path: str) -> bool:
+        """Whether ``category`` was compiled from ``file_path`` as it is now.
+
+        Size and modification time are checked first; when they differ (a
+        fresh checkout, say) the file's content hash decides.
+        """
+        key = f"{category}\0{file_path}"
+        if key not in self._fresh:
+            self._fresh[key] = self._check_source(category, file_path)
+        return self._fresh[key]
+
+    def _check_source(self, category: str, file_path: str) -> bool:
+        source = self._sources.get(category)
+        if source is None:
+            return False
+        compiled_file, size, mtime_ns, digest = source
+        try:
+            if os.path.abspath(file_path) != compiled_file:
+                return False
+            stat = os.stat(file_path)
+            if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                return True
+            with open(file_path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest() == digest
+        except OSError:
+            return False
+
+    def load_category(
+        self,
+        category: str,
+        file_path: str,
+        names: Optional[Iterable[str]] = None,
+        types: Optional[Iterable[str]] = None,
+    ) -> Optional[List[Any]]:
+        """Return the tools of ``category`` in file order, or None if stale.
+
+        ``names`` and ``types``, when given, restrict the result to tools
+        with those names and types; other records are never decoded.
+        """
+        if not self.is_fresh(category, file_path):
+            return None
+        query = "SELECT position, config FROM tools WHERE category = ?"
+        params: List[Any] = [category]
+        filters = [
+            (column, sorted(set(values)))
+            for column, values in (("name", names), ("type", types))
+            if values
+        ]
+        if not filters:
+            rows = self._conn.execute(query + " ORDER BY position", params)
+            return [pickle.loads(config) for _, config in rows]
+
+        # Chunk the longest filter; a shorter one goes whole into every query.
+        filters.sort(key=lambda item: len(item[1]))
+        for column, values in filters[:-1]:
+            query += f" AND {column} IN ({', '.join('?' * len(values))})"
+            params.extend(values)
+        column, values = filters[-1]
+        rows: List[Tuple[int, bytes]] = []
+        for start in range(0, len(values), _MAX_PARAMS):
+            chunk = values[start : start + _MAX_PARAMS]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.extend(
+                self._conn.execute(
+                    f"{query} AND {column} IN ({placeholders})", params + chunk
+                )
+            )
+        rows.sort()
+        return [pickle.loads(config) for _, config in rows]
+
+
+def open_catalog(path: Optional[str] = None) -> Optional[CompiledToolCatalog]:
+    """Open the compiled catalog, or return None if it is disabled or unusable."""
+    if not catalog_enabled():
+        return None
+    path = path or default_catalog_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        return CompiledToolCatalog(path)
+    except (sqlite3.Error, OSError, KeyError) as e:
+        logger.debug(f"Ignoring tool catalog {path}: {e}")
+        return None
+
+
+def refresh_catalog(tool_files: Dict[str, str], path: Optional[str] = None) -> bool:
+    """Rebuild the catalog, returning False instead of raising on failure.
+
+    A path that could not be written is not retried in this process.
+    """
+    path = path or default_catalog_path()
+    if not catalog_enabled() or path in _unwritable_paths:
+        return False
+    try:
+        compile_catalog(tool_files, path)
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Could not rebuild tool catalog {path}: {e}")
+        _unwritable_paths.add(path)
+        return False
+    return True
+
+
+def refresh_catalog_in_background(
+    tool_files: Dict[str, str], path: Optional[str] = None
+) -> Optional[threading.Thread]:
+    """Start :func:`refresh_catalog` on a daemon thread and return the thread.
+
+    Returns the rebuild already running for ``path`` if there is one, and None
+    when the catalog is disabled or ``path`` is known to be unwritable.
+    """
+    path = path or default_catalog_path()
+    if not catalog_enabled() or path in _unwritable_paths:
+        return None
+    with _refresh_lock:
+        thread = _refreshing.get(path)
+        if thread is not None and thread.is_alive():
+            return thread
+
+        def rebuild():
+            try:
+                refresh_catalog(dict(tool_files), path)
+            finally:
+                with _refresh_lock:
+                    if _refreshing.get(path) is threading.current_thread():
+                        del _refreshing[path]
+
+        thread = threading.Thread(
+            target=rebuild, name="ToolCatalogRefresh", daemon=True
+        )
+        _refreshing[path] = thread
+        thread.start()
+    return thread
+
+
+def main():
+    """Compile the built-in tool configs (``tooluniverse-build-catalog``)."""
+    import argparse
+
+    from .default_config import default_tool_files
+
+    parser = argparse.ArgumentParser(description="Compile the ToolUniverse catalog")
+    parser.add_argument("--output", help="catalog file to write")
+    args = parser.parse_args()
+    print(f"Wrote {compile_catalog(default_tool_files, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ import re
 from datetime import datetime
 from typing import Set
 from .base_tool import BaseTool
+from .deadline import DeadlineExceeded, check_deadline
 from .tool_registry import register_tool
 
 
@@ -275,6 +276,9 @@ class ComposeTool(BaseTool):
                 # Execute inline code (existing behavior)
                 return self._execute_inline_code(arguments, stream_callback)
 
+        except DeadlineExceeded:
+            # Let the caller report the expired deadline as a structured error.
+            raise
         except Exception as e:
             error_msg = f"Error in ComposeTool '{self.name}': {str(e)}"
             traceback.print_exc()  # 打印完整堆栈
@@ -431,6 +435,10 @@ class ComposeTool(BaseTool):
             else:
                 return f"Invalid function call: Function name {tool_name} not found in loaded tools."
 
+        # Stop the composition once the enclosing call has run out of time;
+        # nested calls otherwise inherit whatever is left of its deadline.
+        check_deadline()
+
         function_call = {"name": tool_name, "arguments": arguments}
 
         result = self.tooluniverse.run_one_function(function_call)
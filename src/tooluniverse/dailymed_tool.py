@@ -1,6 +1,6 @@
 # dailymed_tool.py
 
-import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -43,7 +43,7 @@ class SearchSPLTool(BaseTool):
 
         # Allow query all if no filter conditions and only pagination provided (be careful with return data volume)
         try:
-            resp = requests.get(self.endpoint, params=params, timeout=10)
+            resp = http_client.get(self.endpoint, params=params, timeout=10)
         except Exception as e:
             return {"error": f"Failed to request DailyMed search_spls: {str(e)}"}
 
@@ -88,7 +88,7 @@ class GetSPLBySetIDTool(BaseTool):
 
         url = self.endpoint_template.format(setid=setid, fmt=fmt)
         try:
-            resp = requests.get(url, timeout=10)
+            resp = http_client.get(url, timeout=10)
         except Exception as e:
             return {"error": f"Failed to request DailyMed get_spl_by_setid: {str(e)}"}
 
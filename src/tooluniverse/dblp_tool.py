@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -31,7 +32,7 @@ class DBLPTool(BaseTool):
             "format": "json",
         }
         try:
-            response = requests.get(self.base_url, params=params, timeout=20)
+            response = http_client.get(self.base_url, params=params, timeout=20)
         except requests.RequestException as e:
             return {
                 "error": "Network error calling DBLP API",
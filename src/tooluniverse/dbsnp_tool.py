@@ -1,4 +1,4 @@
-import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -13,7 +13,7 @@ class DbSnpTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base = "https://api.ncbi.nlm.nih.gov/variation/v0"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
 
     def run(self, arguments):
         rsid = arguments.get("rsid")
@@ -0,0 +1,166 @@
+"""
+Per-call deadlines for ToolUniverse tool execution.
+
+A :class:`Deadline` is bound to the current context while a tool runs, so
+code further down the call stack (HTTP requests, subprocesses, nested
+``ComposeTool.call_tool`` invocations) can size its own timeouts with
+:func:`remaining_time` and stop early with :func:`check_deadline`.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+_current_deadline: contextvars.ContextVar[Optional["Deadline"]] = (
+    contextvars.ContextVar("tooluniverse_deadline", default=None)
+)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call runs past its deadline or is cancelled."""
+
+
+class Deadline:
+    """Absolute expiry time plus a cancellation flag for one tool call.
+
+    ``Deadline(None)`` never expires but can still be cancelled; its
+    :meth:`remaining` is None, so code sizing timeouts from it keeps its own
+    defaults instead of waiting forever.
+    """
+
+    __slots__ = ("timeout", "expires_at", "parent", "_cancelled")
+
+    def __init__(self, timeout: Optional[float], parent: Optional["Deadline"] = None):
+        if timeout is None or math.isinf(timeout):
+            self.timeout: Optional[float] = None
+            self.expires_at = math.inf
+        else:
+            self.timeout = float(timeout)
+            self.expires_at = time.monotonic() + self.timeout
+        if parent is not None and parent.expires_at < self.expires_at:
+            # A nested call can never outlive the call that issued it.
+            self.expires_at = parent.expires_at
+            self.timeout = parent.timeout
+        self.parent = parent
+        self._cancelled = threading.Event()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before expiry (0 once expired or cancelled).
+
+        None for a deadline without an expiry time that is not cancelled.
+        """
+        if self.cancelled:
+            return 0.0
+        if self.expires_at == math.inf:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0.0
+
+    def describe(self) -> str:
+        """Human-readable reason for :class:`DeadlineExceeded` messages."""
+        if self.timeout is None:
+            return "Call cancelled"
+        return f"Deadline of {self.timeout:g}s exceeded"
+
+    @property
+    def cancelled(self) -> bool:
+        deadline = self
+        while deadline is not None:
+            if deadline._cancelled.is_set():
+                return True
+            deadline = deadline.parent
+        return False
+
+    def cancel(self):
+        """Ask cooperative work bound to this deadline to stop."""
+        self._cancelled.set()
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline bound to the running call, if any."""
+    return _current_deadline.get()
+
+
+def remaining_time(default: Optional[float] = None) -> Optional[float]:
+    """Return a timeout honouring the current deadline.
+
+    Args:
+        default: Timeout to use when no deadline is active, or the upper bound
+            when one is.
+
+    Returns:
+        ``min(default, remaining)`` under a deadline, otherwise ``default``.
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    remaining = deadline.remaining()
+    if remaining is None or (default is not None and default < remaining):
+        return default
+    return remaining
+
+
+def check_deadline():
+    """Raise :class:`DeadlineExceeded` if the current call should stop."""
+    deadline = _current_deadline.get()
+    if deadline is not None and deadline.expired:
+        raise DeadlineExceeded(deadline.describe())
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Bind ``deadline`` to the current context for the duration of the block."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def call_with_deadline(
+    deadline: Deadline, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Run ``func`` under ``deadline`` and stop waiting for it on expiry.
+
+    The call runs on a daemon thread with a copy of the caller's context, so
+    the caller's own thread (for example a server worker) is released as soon
+    as the deadline passes even if ``func`` is stuck in blocking I/O. On
+    expiry the deadline is cancelled so cooperative code can wind down.
+
+    Raises:
+        DeadlineExceeded: If ``func`` has not finished when the deadline passes.
+    """
+    outcome: dict = {}
+    done = threading.Event()
+    context = contextvars.copy_context()
+
+    def target():
+        try:
+            outcome["result"] = context.run(_run_bound, deadline, func, args, kwargs)
+        except BaseException as e:  # re-raised in the calling thread
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    worker = threading.Thread(target=target, name="ToolUniverseDeadline", daemon=True)
+    worker.start()
+    if not done.wait(deadline.remaining()):
+        deadline.cancel()
+        raise DeadlineExceeded(deadline.describe())
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def _run_bound(deadline, func, args, kwargs):
+    _current_deadline.set(deadline)
+    return func(*args, **kwargs)
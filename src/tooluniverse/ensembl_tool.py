@@ -1,7 +1,12 @@
 import requests
-from .base_tool import BaseTool
+
+from . import http_client
+from .base_tool import RUN_SEPARATELY, BaseTool
 from .tool_registry import register_tool
 
+# POST lookup/symbol accepts at most 1000 symbols per request.
+LOOKUP_MAX_SYMBOLS = 1000
+
 
 @register_tool("EnsemblTool")
 class EnsemblTool(BaseTool):
@@ -14,7 +19,7 @@ class EnsemblTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base = "https://rest.ensembl.org"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {"Accept": "application/json", "Content-Type": "application/json"}
         )
@@ -26,17 +31,7 @@ class EnsemblTool(BaseTool):
             return {"error": "Missing required parameter: symbol"}
 
         # 1) symbol -> xref(s) to get Ensembl gene ID
-        xref_url = f"{self.base}/xrefs/symbol/{species}/{symbol}"
-        xref_resp = self.session.get(xref_url, timeout=20)
-        xref_resp.raise_for_status()
-        xrefs = xref_resp.json() or []
-        gene_id = None
-        for item in xrefs:
-            if item.get("type") == "gene" and item.get("id"):
-                gene_id = item["id"]
-                break
-        if not gene_id and xrefs:
-            gene_id = xrefs[0].get("id")
+        gene_id = self._gene_id(species, symbol)
         if not gene_id:
             return {"error": f"No Ensembl gene found for {symbol}"}
 
@@ -44,8 +39,82 @@ class EnsemblTool(BaseTool):
         lookup_url = f"{self.base}/lookup/id/{gene_id}?expand=1"
         look_resp = self.session.get(lookup_url, timeout=30)
         look_resp.raise_for_status()
-        data = look_resp.json() or {}
+        return self._format(look_resp.json() or {}, symbol)
+
+    def run_batch(self, arguments_list):
+        """Look up each species' symbols with one POST lookup/symbol request.
+
+        Symbols the bulk lookup does not resolve (synonyms, old names) and
+        whole requests that fail are handed back as ``RUN_SEPARATELY``;
+        :meth:`run` then searches the xrefs and reports the per-symbol error.
+        """
+        results = [None] * len(arguments_list)
+        by_species = self._group_symbols(arguments_list, results)
+        for species, positions in by_species.items():
+            symbols = list(positions)
+            found = {}
+            for start in range(0, len(symbols), LOOKUP_MAX_SYMBOLS):
+                found.update(
+                    self._lookup_symbols(
+                        species, symbols[start : start + LOOKUP_MAX_SYMBOLS]
+                    )
+                )
+            for symbol, items in positions.items():
+                for pos in items:
+                    data = found.get(symbol)
+                    if data:
+                        results[pos] = self._format(data, symbol)
+                    else:
+                        results[pos] = RUN_SEPARATELY
+        return results
+
+    def get_batch_request_count(self, arguments_list):
+        by_species = self._group_symbols(arguments_list, [None] * len(arguments_list))
+        return sum(
+            -(-len(symbols) // LOOKUP_MAX_SYMBOLS) for symbols in by_species.values()
+        )
+
+    @staticmethod
+    def _group_symbols(arguments_list, results):
+        """Map species to {symbol: [positions]}; calls without a symbol fail."""
+        by_species = {}
+        for pos, arguments in enumerate(arguments_list):
+            symbol = arguments.get("symbol")
+            if not symbol:
+                results[pos] = {"error": "Missing required parameter: symbol"}
+                continue
+            species = arguments.get("species", "homo_sapiens")
+            by_species.setdefault(species, {}).setdefault(symbol, []).append(pos)
+        return by_species
+
+    def _lookup_symbols(self, species, symbols):
+        try:
+            resp = self.session.post(
+                f"{self.base}/lookup/symbol/{species}",
+                params={"expand": 1},
+                json={"symbols": symbols},
+                timeout=60,
+            )
+            if resp.status_code != 200:
+                return {}
+            return resp.json() or {}
+        except (requests.exceptions.RequestException, ValueError):
+            return {}
+
+    def _gene_id(self, species, symbol):
+        xref_url = f"{self.base}/xrefs/symbol/{species}/{symbol}"
+        xref_resp = self.session.get(xref_url, timeout=20)
+        xref_resp.raise_for_status()
+        xrefs = xref_resp.json() or []
+        for item in xrefs:
+            if item.get("type") == "gene" and item.get("id"):
+                return item["id"]
+        if xrefs:
+            return xrefs[0].get("id")
+        return None
 
+    @staticmethod
+    def _format(data, symbol):
         transcripts = data.get("Transcript") or []
         return {
             "id": data.get("id"),
@@ -24,8 +24,11 @@ Constants:
     tool_type_mappings: Mapping of tool type strings to their implementation classes
 """
 
+import asyncio
 import copy
+import functools
 import inspect
+import itertools
 import json
 import random
 import string
@@ -36,10 +39,28 @@ import warnings
 import threading
 from pathlib import Path
 from contextlib import nullcontext
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from .utils import read_json_list, evaluate_function_call, extract_function_call_json
+from .base_tool import RUN_SEPARATELY, BaseTool
 from .exceptions import (
     ToolError,
     ToolUnavailableError,
@@ -52,7 +73,10 @@ from .tool_registry import (
     get_tool_registry,
     register_external_tool,
     get_tool_class_lazy,
+    lazy_import_tool,
     get_tool_errors,
+    get_tool_error,
+    is_tool_unavailable,
     mark_tool_unavailable,
 )
 from .logging_config import (
@@ -64,6 +88,25 @@ from .logging_config import (
     set_log_level,
 )
 from .cache.result_cache_manager import ResultCacheManager
+from .cache.memory_cache import parse_bytes, parse_namespace_bytes
+from .metrics import MetricsRegistry
+from .compiled_catalog import open_catalog, refresh_catalog_in_background
+from .tool_catalog import ToolCatalog
+from .tool_views import SPEC_FORMATS, ToolViewCache
+from .tool_snapshot import load_record, restore_snapshot, save_snapshot
+from .http_client import get_http_client, tool_http_options, tool_options_scope
+from .rate_limiter import get_rate_limiter
+from .circuit_breaker import CircuitOpenError, get_circuit_breakers
+from .process_pool import get_process_pool
+from .batch_scheduler import BatchScheduler, ScheduledTask
+from .hedging import HedgePolicy, hedge_policy
+from .deadline import (
+    Deadline,
+    DeadlineExceeded,
+    call_with_deadline,
+    current_deadline,
+    deadline_scope,
+)
 from .output_hook import HookManager
 from .default_config import default_tool_files, get_default_hook_config
 
@@ -119,6 +162,49 @@ class _BatchJob:
     skip_execution: bool = False
 
 
+_RUN_CONTEXT_PARAMS = ("stream_callback", "use_cache", "validate")
+
+
+@dataclass
+class _DispatchPlan:
+    """Per-tool execution state resolved once and reused on every call."""
+
+    tool_name: str
+    tool_instance: Any
+    tool_config: Optional[Dict[str, Any]]
+    run_callable: Any
+    run_params: Optional[frozenset]
+    cacheable: bool
+    key_fn: Optional[Callable[[Dict[str, Any]], str]]
+    batch_limit: int
+    batch_size: int = 0
+    timeout: Optional[float] = None
+    http_options: Optional[Dict[str, Any]] = None
+    process_key: Optional[str] = None
+    hedge: Optional[HedgePolicy] = None
+    cache_namespace: Optional[str] = None
+    cache_version: Optional[str] = None
+    hooks_key: Optional[tuple] = None
+    hooks_applicable: bool = False
+
+    def cache_scope(self) -> Tuple[str, str]:
+        if self.cache_namespace is None:
+            self.cache_namespace = self.tool_instance.get_cache_namespace()
+            self.cache_version = self.tool_instance.get_cache_version()
+        return self.cache_namespace, self.cache_version
+
+    def run_kwargs(self, stream_callback, use_cache, validate) -> Dict[str, Any]:
+        params = self.run_params
+        kwargs = {}
+        if stream_callback is not None and "stream_callback" in params:
+            kwargs["stream_callback"] = stream_callback
+        if "use_cache" in params:
+            kwargs["use_cache"] = use_cache
+        if "validate" in params:
+            kwargs["validate"] = validate
+        return kwargs
+
+
 class ToolCallable:
     """
     A callable wrapper for a tool that validates kwargs and calls run_one_function.
@@ -278,7 +364,16 @@ class ToolUniverse:
         self.all_tools: List[Dict[str, Any]] = []
         self.all_tool_dict: Dict[str, Dict[str, Any]] = {}
         self.tool_category_dicts: Dict[str, List[Dict[str, Any]]] = {}
+        # Indexed view of all_tools, kept in sync by _sync_tool_catalog()
+        self.tool_catalog = ToolCatalog()
+        self._catalog_synced: Optional[Tuple[List[Any], int, Any]] = None
+        # Read-only prompt and spec views, rebuilt only when a tool changes
+        self.tool_views = ToolViewCache(self.tool_catalog)
         self.tool_finder = None
+        # load_tools calls, replayed when a stale snapshot is rebuilt
+        self._load_history: List[Dict[str, Any]] = []
+        # Snapshot this instance was restored from (see from_snapshot)
+        self._snapshot = None
         if tool_files is None:
             tool_files = default_tool_files
         elif keep_default_tools:
@@ -326,7 +421,16 @@ class ToolUniverse:
         persistence_enabled = os.getenv(
             "TOOLUNIVERSE_CACHE_PERSIST", "true"
         ).lower() in ("true", "1", "yes")
-        memory_size = int(os.getenv("TOOLUNIVERSE_CACHE_MEMORY_SIZE", "256"))
+        memory_bytes = parse_bytes(os.getenv("TOOLUNIVERSE_CACHE_MEMORY_BYTES"))
+        namespace_bytes = parse_namespace_bytes(
+            os.getenv("TOOLUNIVERSE_CACHE_NAMESPACE_BYTES")
+        )
+        memory_size_env = os.getenv("TOOLUNIVERSE_CACHE_MEMORY_SIZE")
+        if memory_size_env:
+            memory_size = int(memory_size_env)
+        else:
+            # A byte budget replaces the default entry count limit
+            memory_size = None if memory_bytes else 256
         default_ttl_env = os.getenv("TOOLUNIVERSE_CACHE_DEFAULT_TTL")
         default_ttl = int(default_ttl_env) if default_ttl_env else None
         singleflight_enabled = os.getenv(
@@ -343,6 +447,8 @@ class ToolUniverse:
 
         self.cache_manager = ResultCacheManager(
             memory_size=memory_size,
+            memory_bytes=memory_bytes,
+            namespace_bytes=namespace_bytes,
             persistent_path=cache_path if persistence_enabled else None,
             enabled=cache_enabled,
             persistence_enabled=persistence_enabled,
@@ -354,6 +460,25 @@ class ToolUniverse:
             "TOOLUNIVERSE_STRICT_VALIDATION", "false"
         ).lower() in ("true", "1", "yes")
 
+        # Per-tool execution metrics (TOOLUNIVERSE_METRICS_ENABLED)
+        self.metrics = MetricsRegistry()
+
+        # Pooled HTTP client shared by all REST/GraphQL tools, and the
+        # per-host rate limits every outbound request passes through
+        self.http_client = get_http_client()
+        self.rate_limiter = get_rate_limiter()
+        self.circuit_breakers = get_circuit_breakers()
+        self.process_pool = get_process_pool()
+        # learns per-tool latencies to order and pace parallel batches
+        self.batch_scheduler = BatchScheduler()
+
+        # Per-tool dispatch plans used by run_one_function's hot path
+        self._dispatch_plans: Dict[str, _DispatchPlan] = {}
+
+        # Executor backing arun()/arun_one_function() for synchronous tools
+        self._async_executor: Optional[ThreadPoolExecutor] = None
+        self._async_executor_lock = threading.Lock()
+
         # Initialize dynamic tools namespace
         self.tools = ToolNamespace(self)
 
@@ -453,6 +578,7 @@ class ToolUniverse:
                 self.tool_category_dicts[category] = []
             if tool_name_in_config not in self.tool_category_dicts[category]:
                 self.tool_category_dicts[category].append(tool_name_in_config)
+            self.tool_catalog.add(tool_config, category)
 
         self.logger.info(f"Custom tool '{name}' registered successfully!")
         return name
@@ -484,13 +610,14 @@ class ToolUniverse:
         Returns:
             dict: Dictionary with lazy loading status and tool counts
         """
-        from .tool_registry import _discovery_completed, _lazy_registry
+        from . import tool_registry
 
         return {
             "lazy_loading_enabled": LAZY_LOADING_ENABLED,
-            "full_discovery_completed": _discovery_completed,
+            "full_discovery_completed": tool_registry._discovery_completed,
             "immediately_available_tools": len(tool_type_mappings),
-            "lazy_mappings_available": len(_lazy_registry),
+            "lazy_mappings_available": len(tool_registry._lazy_registry),
+            "lazy_registry_source": tool_registry._lazy_registry_source,
             "loaded_tools_count": (
                 len(self.all_tools) if hasattr(self, "all_tools") else 0
             ),
@@ -699,6 +826,18 @@ class ToolUniverse:
             )
         """
         self.logger.debug(f"Number of tools before load tools: {len(self.all_tools)}")
+        self._load_history.append(
+            load_record(
+                tool_type=tool_type,
+                exclude_tools=exclude_tools,
+                exclude_categories=exclude_categories,
+                include_tools=include_tools,
+                tool_config_files=tool_config_files,
+                tools_file=tools_file,
+                include_tool_types=include_tool_types,
+                exclude_tool_types=exclude_tool_types,
+            )
+        )
 
         # Handle tools_file parameter (alternative to include_tools)
         if tools_file:
@@ -776,11 +915,26 @@ class ToolUniverse:
                 cat for cat in tool_type if cat not in exclude_categories_set
             ]
 
+        # Default categories come from the compiled catalog while it matches
+        # their JSON files; other categories and stale ones are read as JSON.
+        catalog = open_catalog()
+        rebuild_catalog = False
+
         # Load tools from specified categories
         for each in categories_to_load:
             if each in all_tool_files:
                 try:
-                    loaded_data = read_json_list(all_tool_files[each])
+                    loaded_data = None
+                    if catalog is not None:
+                        # Whole categories, so tool_category_dicts does not
+                        # depend on whether the catalog exists; the include
+                        # filters apply to all_tools below.
+                        loaded_data = catalog.load_category(each, all_tool_files[each])
+                    if loaded_data is None:
+                        rebuild_catalog = rebuild_catalog or (
+                            default_tool_files.get(each) == all_tool_files[each]
+                        )
+                        loaded_data = read_json_list(all_tool_files[each])
 
                     # Handle different data formats
                     if isinstance(loaded_data, dict):
@@ -811,6 +965,11 @@ class ToolUniverse:
                     f"Tool category '{each}' not found in available tool files"
                 )
 
+        if catalog is not None:
+            catalog.close()
+        if rebuild_catalog:
+            refresh_catalog_in_background(default_tool_files)
+
         # Load auto-discovered configs from decorators
         self._load_auto_discovered_configs()
 
@@ -822,10 +981,71 @@ class ToolUniverse:
             exclude_tool_types_set,
         )
 
+        # A filtered selection imports exactly the modules backing it now;
+        # a full load leaves each tool class to be imported on first use.
+        if LAZY_LOADING_ENABLED and (
+            tool_type is not None or include_tools_set or include_tool_types_set
+        ):
+            self._import_selected_tool_modules()
+
         # Process MCP Auto Loader tools
         self.logger.debug("Checking for MCP Auto Loader tools...")
         self._process_mcp_auto_loaders()
 
+    def _import_selected_tool_modules(self):
+        """Import the modules that implement the currently loaded tool types.
+
+        Types are resolved through the lazy registry only, so a type missing
+        from it is left for ``init_tool`` instead of triggering full discovery.
+        """
+        tool_types = {
+            tool.get("type") for tool in self.all_tools if isinstance(tool, dict)
+        }
+        for tool_type in sorted(t for t in tool_types if isinstance(t, str)):
+            lazy_import_tool(tool_type)
+
+    def save_snapshot(self, path):
+        """
+        Save the loaded tools, filters, hook configuration and keyword index to a file.
+
+        Another process can restore this state with ``ToolUniverse.from_snapshot``
+        instead of loading tools again. See ``tooluniverse.tool_snapshot`` for
+        the file format and for when a snapshot is considered stale.
+
+        Args:
+            path (str): File to write. It is replaced atomically.
+
+        Returns:
+            str: The path written.
+        """
+        return save_snapshot(self, path)
+
+    @classmethod
+    def from_snapshot(cls, path, rebuild=True):
+        """
+        Create a ToolUniverse from a file written by ``save_snapshot``.
+
+        Args:
+            path (str): Snapshot file.
+            rebuild (bool, optional): What to do with a stale or damaged snapshot.
+                If True (default), load the tools again with the recorded settings
+                and rewrite the snapshot. If False, raise ``StaleSnapshotError``.
+
+        Returns:
+            ToolUniverse: Instance with the snapshot's tools loaded.
+
+        Raises:
+            SnapshotError: If ``path`` is not a snapshot file.
+            StaleSnapshotError: If the snapshot is stale and ``rebuild`` is False.
+        """
+        tu = restore_snapshot(cls, path, rebuild=rebuild)
+        if tu._snapshot is not None and LAZY_LOADING_ENABLED:
+            # Match load_tools: a filtered selection imports its modules now
+            filters = ("tool_type", "include_tools", "tools_file", "include_tool_types")
+            if any(key in load for load in tu._load_history for key in filters):
+                tu._import_selected_tool_modules()
+        return tu
+
     def _load_tool_names_from_file(self, file_path):
         """
         Load tool names from a text file (one tool name per line).
@@ -875,7 +1095,7 @@ class ToolUniverse:
             include_tool_types_set (set or None): Set of tool types to include (if None, include all)
             exclude_tool_types_set (set or None): Set of tool types to exclude (if None, exclude none)
         """
-        tool_name_list = []
+        seen_names = set()
         dedup_all_tools = []
         all_missing_keys = set()
         duplicate_names = set()
@@ -939,8 +1159,8 @@ class ToolUniverse:
                     continue
 
             # Handle duplicates
-            if tool_name not in tool_name_list:
-                tool_name_list.append(tool_name)
+            if tool_name not in seen_names:
+                seen_names.add(tool_name)
                 dedup_all_tools.append(each)
             else:
                 duplicate_names.add(tool_name)
@@ -985,13 +1205,13 @@ class ToolUniverse:
             self.logger.debug(
                 f"Loading {len(discovered_configs)} auto-discovered tool configs"
             )
+            loaded_names = {
+                tool.get("name") for tool in self.all_tools if isinstance(tool, dict)
+            }
             for _tool_type, config in discovered_configs.items():
                 # Add to all_tools if not already present
-                if "name" in config and config["name"] not in [
-                    tool.get("name")
-                    for tool in self.all_tools
-                    if isinstance(tool, dict)
-                ]:
+                if "name" in config and config["name"] not in loaded_names:
+                    loaded_names.add(config["name"])
                     self.all_tools.append(config)
                     self.logger.debug(f"Added auto-discovered config: {config['name']}")
 
@@ -1503,15 +1723,15 @@ class ToolUniverse:
         Returns:
             tuple: A tuple containing (tool_name_list, tool_desc_list) after filtering.
         """
+        self._sync_tool_catalog()
         tool_name_list = []
         tool_desc_list = []
         for tool in self.all_tools:
             tool_name_list.append(tool["name"])
             if enable_full_desc:
-                tool_desc_list.append(json.dumps(tool))
+                tool_desc_list.append(self.tool_views.json(tool, "config"))
             else:
                 tool_desc_list.append(tool["name"] + ": " + tool["description"])
-            self.all_tool_dict[tool["name"]] = tool
 
         # Apply filtering if any filter argument is provided
         if any([include_names, exclude_names, include_categories, exclude_categories]):
@@ -1530,6 +1750,44 @@ class ToolUniverse:
 
         return tool_name_list, tool_desc_list
 
+    def _sync_tool_catalog(self):
+        """Index tools added to ``all_tools`` into ``tool_catalog`` and ``all_tool_dict``.
+
+        Appending to ``all_tools`` is picked up incrementally. A list that was
+        replaced, shortened or edited at its end is indexed again from scratch.
+        """
+        tools = self.all_tools
+        synced = self._catalog_synced
+        if (
+            synced is not None
+            and synced[0] is tools
+            and synced[1] <= len(tools)
+            and (synced[1] == 0 or tools[synced[1] - 1] is synced[2])
+        ):
+            new_tools = tools[synced[1] :]
+            categories: Dict[Any, str] = {}
+        else:
+            self.tool_catalog.clear()
+            new_tools = tools
+            # Loaded categories hold configs; custom ones hold tool names
+            categories = {
+                id(tool) if isinstance(tool, dict) else tool: category
+                for category, category_tools in self.tool_category_dicts.items()
+                for tool in category_tools
+                if isinstance(tool, (dict, str))
+            }
+
+        for tool in new_tools:
+            if not isinstance(tool, dict) or "name" not in tool:
+                continue
+            if self.tool_catalog.get(tool["name"]) is not tool:
+                category = categories.get(id(tool)) or categories.get(
+                    tool["name"], tool.get("category")
+                )
+                self.tool_catalog.add(tool, category)
+            self.all_tool_dict[tool["name"]] = tool
+        self._catalog_synced = (tools, len(tools), tools[-1] if tools else None)
+
     def prepare_one_tool_prompt(self, tool):
         """
         Prepare a single tool configuration for prompt usage by filtering to essential keys.
@@ -1538,14 +1796,11 @@ class ToolUniverse:
             tool (dict): Tool configuration dictionary.
 
         Returns:
-            dict: Tool configuration with only essential keys for prompting.
+            dict: Read-only tool configuration with only essential keys for prompting.
+                  Use copy.deepcopy() on it for an editable copy.
         """
-        valid_keys = ["name", "description", "parameter", "required"]
-        tool = copy.deepcopy(tool)
-        for key in list(tool.keys()):
-            if key not in valid_keys:
-                del tool[key]
-        return tool
+        self._sync_tool_catalog()
+        return self.tool_views.view(tool, "prompt")
 
     def prepare_tool_prompts(self, tool_list, mode="prompt", valid_keys=None):
         """
@@ -1560,36 +1815,22 @@ class ToolUniverse:
             valid_keys (list, optional): Custom list of keys to keep when mode='custom'.
 
         Returns:
-            list: List of tool configurations with only specified keys.
-        """
-        if mode == "prompt":
-            valid_keys = ["name", "description", "parameter", "required"]
-        elif mode == "example":
-            valid_keys = [
-                "name",
-                "description",
-                "parameter",
-                "required",
-                "query_schema",
-                "fields",
-                "label",
-                "type",
-            ]
+            list: List of read-only tool configurations with only specified keys.
+                  The views are cached per tool; use copy.deepcopy() for editable copies.
+        """
+        if mode in ("prompt", "example"):
+            kind = mode
         elif mode == "custom":
             if valid_keys is None:
                 raise ValueError("valid_keys must be provided when mode='custom'")
+            kind = tuple(valid_keys)
         else:
             raise ValueError(
                 f"Invalid mode: {mode}. Must be 'prompt', 'example', or 'custom'"
             )
 
-        copied_list = copy.deepcopy(tool_list)
-        for tool in copied_list:
-            # Create a list of keys to avoid modifying the dictionary during iteration
-            for key in list(tool.keys()):
-                if key not in valid_keys:
-                    del tool[key]
-        return copied_list
+        self._sync_tool_catalog()
+        return self.tool_views.views(tool_list, kind)
 
     def get_tool_specification_by_names(self, tool_names, format="default"):
         """
@@ -1639,64 +1880,57 @@ class ToolUniverse:
             tool_name (str): Name of the tool to retrieve.
             return_prompt (bool, optional): If True, returns tool prepared for prompting.
                                           If False, returns full tool configuration. Defaults to False.
-            format (str, optional): Output format. Options: 'default', 'openai'.
-                                   If 'openai', returns OpenAI function calling format. Defaults to 'default'.
+            format (str, optional): Output format. Options: 'default', 'openai', 'mcp'.
+                                   If 'openai', returns OpenAI function calling format;
+                                   if 'mcp', an MCP tools/list entry. Defaults to 'default'.
 
         Returns:
-            dict or None: Tool configuration if found, None otherwise.
+            dict or None: Read-only tool configuration if found, None otherwise.
         """
         if tool_name not in self.all_tool_dict:
             warning(f"Tool name {tool_name} not found in the loaded tools.")
             return None
 
         tool_config = self.all_tool_dict[tool_name]
+        self._sync_tool_catalog()
 
         if return_prompt:
-            return self.prepare_one_tool_prompt(tool_config)
+            return self.tool_views.view(tool_config, "prompt")
+        return self.tool_views.view(
+            tool_config, format if format in SPEC_FORMATS else "default"
+        )
 
-        # Process parameter schema based on format
-        if "parameter" in tool_config and isinstance(tool_config["parameter"], dict):
-            import copy
+    def get_tool_specifications_json(self, tool_names=None, format="openai"):
+        """
+        Serialize tool specifications to a JSON array string.
 
-            processed_config = copy.deepcopy(tool_config)
-            parameter_schema = processed_config["parameter"]
+        The JSON of each tool is cached with its specification, so repeated
+        requests only join cached strings.
 
-            if (
-                "properties" in parameter_schema
-                and parameter_schema["properties"] is not None
-            ):
-                required_properties = parameter_schema.get("required", [])
-
-                if format == "openai":
-                    # For OpenAI format: remove property-level required fields
-                    for _prop_name, prop_config in parameter_schema[
-                        "properties"
-                    ].items():
-                        if isinstance(prop_config, dict) and "required" in prop_config:
-                            del prop_config["required"]
-
-                    # Ensure required is a list
-                    if not isinstance(parameter_schema.get("required"), list):
-                        parameter_schema["required"] = (
-                            required_properties if required_properties else []
-                        )
+        Args:
+            tool_names (list, optional): Tools to include. Defaults to all loaded tools.
+            format (str, optional): 'default', 'openai', 'mcp', or 'prompt'. Defaults to 'openai'.
 
-                    return {
-                        "name": processed_config["name"],
-                        "description": processed_config["description"],
-                        "parameters": parameter_schema,
-                    }
+        Returns:
+            str: JSON array of specifications. Tools not found are reported and skipped.
+        """
+        if format not in SPEC_FORMATS + ("prompt",):
+            raise ValueError(
+                f"Invalid format: {format}. Must be 'default', 'openai', 'mcp' or 'prompt'"
+            )
+        self._sync_tool_catalog()
+        if tool_names is None:
+            tools = self.all_tools
+        else:
+            tools = []
+            for tool_name in tool_names:
+                if tool_name in self.all_tool_dict:
+                    tools.append(self.all_tool_dict[tool_name])
                 else:
-                    # For default format: add required fields to properties
-                    for prop_name, prop_config in parameter_schema[
-                        "properties"
-                    ].items():
-                        if isinstance(prop_config, dict):
-                            prop_config["required"] = prop_name in required_properties
-
-                    return processed_config
-
-        return tool_config
+                    warning(f"Tool name {tool_name} not found in the loaded tools.")
+        return (
+            "[" + ", ".join(self.tool_views.json(tool, format) for tool in tools) + "]"
+        )
 
     def get_tool_type_by_name(self, tool_name):
         """
@@ -1771,6 +2005,7 @@ class ToolUniverse:
         stream_callback=None,
         use_cache: bool = False,
         max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> List[Any]:
         """Execute a list of function calls, optionally in parallel.
 
@@ -1779,6 +2014,7 @@ class ToolUniverse:
             stream_callback: Optional streaming callback.
             use_cache: Whether to enable cache lookups for each call.
             max_workers: Maximum parallel workers; values <=1 fall back to sequential execution.
+            timeout: Per-call timeout in seconds, see :meth:`run_one_function`.
 
         Returns:
             List of results aligned with ``function_calls`` order.
@@ -1807,17 +2043,18 @@ class ToolUniverse:
             stream_callback=stream_callback,
             use_cache=use_cache,
             max_workers=max_workers,
+            timeout=timeout,
         )
 
         return results
 
     def _build_batch_jobs(
-        self, function_calls: List[Dict[str, Any]]
+        self, function_calls: List[Dict[str, Any]], start_index: int = 0
     ) -> List[_BatchJob]:
         signature_to_job: Dict[str, _BatchJob] = {}
         jobs: List[_BatchJob] = []
 
-        for idx, call in enumerate(function_calls):
+        for idx, call in enumerate(function_calls, start=start_index):
             function_name = call.get("name", "")
             arguments = call.get("arguments", {})
             if not isinstance(arguments, dict):
@@ -1846,7 +2083,7 @@ class ToolUniverse:
         self,
         jobs: List[_BatchJob],
         use_cache: bool,
-        results: List[Any],
+        results: Union[List[Any], Dict[int, Any]],
     ) -> List[_BatchJob]:
         if not (
             use_cache and self.cache_manager is not None and self.cache_manager.enabled
@@ -1900,6 +2137,7 @@ class ToolUniverse:
         stream_callback,
         use_cache: bool,
         max_workers: Optional[int],
+        timeout: Optional[float] = None,
     ) -> None:
         if not jobs_to_run:
             return
@@ -1907,30 +2145,544 @@ class ToolUniverse:
         tool_semaphores: Dict[str, Optional[threading.Semaphore]] = {}
 
         def run_job(job: _BatchJob):
-            semaphore = self._get_tool_semaphore(job, tool_semaphores)
-            if semaphore:
-                semaphore.acquire()
-            try:
-                result = self.run_one_function(
-                    job.call,
-                    stream_callback=stream_callback,
-                    use_cache=use_cache,
-                )
-            finally:
-                if semaphore:
-                    semaphore.release()
-
+            result = self._run_batch_job(
+                job,
+                tool_semaphores,
+                stream_callback=stream_callback,
+                use_cache=use_cache,
+                timeout=timeout,
+            )
             for idx in job.indices:
                 results[idx] = result
+            return result
+
+        def run_chunk(chunk: List[_BatchJob]):
+            chunk_results = self._run_batch_chunk(
+                chunk, tool_semaphores, use_cache=use_cache, timeout=timeout
+            )
+            for job, result in zip(chunk, chunk_results):
+                for idx in job.indices:
+                    results[idx] = result
+            return chunk_results
+
+        if stream_callback is None:
+            chunks, singles = self._group_batch_jobs(jobs_to_run)
+        else:
+            chunks, singles = [], jobs_to_run
+        tasks = [(run_chunk, chunk) for chunk in chunks]
+        tasks.extend((run_job, job) for job in singles)
+
+        if self.batch_scheduler.enabled:
+            self.batch_scheduler.run(
+                [self._schedule_task(fn, item, max_workers) for fn, item in tasks],
+                max_workers,
+            )
+            return
 
         if max_workers and max_workers > 1:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(run_job, job) for job in jobs_to_run]
+                futures = [executor.submit(fn, item) for fn, item in tasks]
                 for future in as_completed(futures):
                     future.result()
+        else:
+            for fn, item in tasks:
+                fn(item)
+
+    def _schedule_task(
+        self, fn: Callable[[Any], Any], item, max_workers: Optional[int]
+    ) -> ScheduledTask:
+        """Describe one batch task (a job or a run_batch chunk) to the scheduler."""
+        chunk = isinstance(item, list)
+        job = item[0] if chunk else item
+        function_name = job.function_name or ""
+        ceiling = max(1, max_workers or 1)
+        plan = self._get_dispatch_plan(function_name) if function_name else None
+        if plan is not None and plan.batch_limit > 0:
+            ceiling = min(ceiling, plan.batch_limit)
+        hosts = self.circuit_breakers.tool_hosts(function_name)
+        return ScheduledTask(
+            fn,
+            item,
+            tool=function_name,
+            upstream=hosts[0] if hosts else function_name,
+            ceiling=ceiling,
+            batch=chunk,
+        )
+
+    def _group_batch_jobs(
+        self, jobs: List[_BatchJob]
+    ) -> Tuple[List[List[_BatchJob]], List[_BatchJob]]:
+        """Split jobs into ``run_batch`` chunks per tool and jobs run one by one.
+
+        Only tools that implement :meth:`BaseTool.run_batch` are chunked, in
+        chunks of their configured batch size; a tool with a single job in the
+        batch gains nothing from it and runs normally.
+        """
+        by_tool: Dict[str, List[_BatchJob]] = {}
+        singles: List[_BatchJob] = []
+        for job in jobs:
+            plan = (
+                self._get_dispatch_plan(job.function_name)
+                if job.function_name
+                else None
+            )
+            if plan is None or plan.batch_size <= 1:
+                singles.append(job)
+            else:
+                by_tool.setdefault(job.function_name, []).append(job)
+
+        chunks: List[List[_BatchJob]] = []
+        for function_name, tool_jobs in by_tool.items():
+            if len(tool_jobs) == 1:
+                singles.extend(tool_jobs)
+                continue
+            size = self._dispatch_plans[function_name].batch_size
+            for start in range(0, len(tool_jobs), size):
+                chunks.append(tool_jobs[start : start + size])
+        return chunks, singles
+
+    def _run_batch_chunk(
+        self,
+        jobs: List[_BatchJob],
+        tool_semaphores: Dict[str, Optional[threading.Semaphore]],
+        *,
+        use_cache: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """Run jobs of one tool through a single ``run_batch`` call.
+
+        Each call is validated, cached and passed through output hooks on its
+        own, exactly as :meth:`run_one_function` would; only the tool
+        execution is shared. The chunk gets ``timeout`` seconds for each
+        upstream request it makes (see ``BaseTool.get_batch_request_count``).
+        Calls the tool hands back as ``RUN_SEPARATELY`` then go through
+        :meth:`run_one_function` one by one, each under its own deadline.
+        Results are written to the cache with a single ``bulk_set``.
+        """
+        function_name = jobs[0].function_name
+        plan = self._get_dispatch_plan(function_name)
+        results: List[Any] = [None] * len(jobs)
+        pending: List[Tuple[int, _BatchJob, Dict[str, Any]]] = []
+        for pos, job in enumerate(jobs):
+            arguments = job.call.get("arguments", {})
+            error = self._check_call_shape(function_name, arguments)
+            if error is None:
+                error, arguments = self._preflight_function_call(
+                    job.call, function_name, arguments, True
+                )
+            if error is not None:
+                results[pos] = error
+            else:
+                pending.append((pos, job, arguments))
+        if not pending:
+            return results
+
+        observations = [self.metrics.observe(function_name) for _ in pending]
+        outputs = self._execute_batch_chunk(
+            plan,
+            [arguments for _, _, arguments in pending],
+            tool_semaphores,
+            jobs[0],
+            timeout,
+        )
+        chunk_error = None
+        if not isinstance(outputs, list):
+            # One error for the whole chunk: circuit open, deadline, tool crash.
+            chunk_error, outputs = outputs, [outputs] * len(pending)
+        elif len(outputs) != len(pending):
+            self.logger.warning(
+                "%s.run_batch returned %d results for %d calls; "
+                "running the calls one by one",
+                function_name,
+                len(outputs),
+                len(pending),
+            )
+            for pos, job, _ in pending:
+                results[pos] = self.run_one_function(
+                    job.call, use_cache=use_cache, timeout=timeout
+                )
+            return results
+
+        tool_instance = plan.tool_instance
+        cache_enabled = (
+            use_cache
+            and plan.cacheable
+            and self.cache_manager is not None
+            and self.cache_manager.enabled
+        )
+        apply_hooks = self.hook_manager and self._hooks_apply_to(plan, function_name)
+        cache_entries: List[Dict[str, Any]] = []
+        separate: List[Tuple[int, _BatchJob]] = []
+        for (pos, job, arguments), result, observation in zip(
+            pending, outputs, observations
+        ):
+            if result is RUN_SEPARATELY:
+                separate.append((pos, job))
+                continue
+            if observation is not None:
+                observation.mark("execution")
+            if isinstance(result, Exception):
+                result = self._create_dual_format_error(
+                    self._classify_exception(result, function_name, arguments)
+                )
+            elif chunk_error is None:
+                if apply_hooks:
+                    result = self._apply_output_hooks(
+                        result, function_name, tool_instance, arguments
+                    )
+                if cache_enabled:
+                    cache_info = job.cache_info
+                    if cache_info is None:
+                        namespace, version = plan.cache_scope()
+                        cache_info = _BatchCacheInfo(
+                            namespace, version, plan.key_fn(arguments)
+                        )
+                    cache_entries.append(
+                        {
+                            "namespace": cache_info.namespace,
+                            "version": cache_info.version,
+                            "cache_key": cache_info.cache_key,
+                            "value": result,
+                            "ttl": tool_instance.get_cache_ttl(result),
+                        }
+                    )
+            if observation is not None:
+                observation.finish(result)
+            results[pos] = result
+        if cache_entries:
+            self.cache_manager.bulk_set(cache_entries)
+        for pos, job in separate:
+            results[pos] = self.run_one_function(
+                job.call, use_cache=use_cache, timeout=timeout
+            )
+        return results
+
+    def _execute_batch_chunk(
+        self,
+        plan: _DispatchPlan,
+        arguments_list: List[Dict[str, Any]],
+        tool_semaphores: Dict[str, Optional[threading.Semaphore]],
+        job: _BatchJob,
+        timeout: Optional[float] = None,
+    ) -> Union[List[Any], dict]:
+        """Call ``run_batch`` under the tool's deadline, breakers and HTTP options.
+
+        Returns the tool's result list, or a single error payload that applies
+        to every call in the chunk.
+        """
+        function_name = plan.tool_name
+        circuit_error = self._circuit_open_error(function_name)
+        if circuit_error is not None:
+            return circuit_error
+        if timeout is None:
+            timeout = plan.timeout
+        if timeout is not None:
+            timeout *= max(
+                1, plan.tool_instance.get_batch_request_count(arguments_list)
+            )
+        deadline, owns_deadline = self._resolve_deadline(timeout, plan)
+        semaphore = self._get_tool_semaphore(job, tool_semaphores)
+        if semaphore:
+            semaphore.acquire()
+        try:
+            with self.circuit_breakers.track(function_name):
+                if owns_deadline:
+                    return call_with_deadline(
+                        deadline, self._run_tool_batch, plan, arguments_list
+                    )
+                return self._run_tool_batch(plan, arguments_list)
+        except DeadlineExceeded:
+            return self._deadline_error(function_name, deadline)
+        except CircuitOpenError as e:
+            return self._circuit_open_error(function_name, (e.key, e.retry_after))
+        except Exception as e:
+            return self._create_dual_format_error(
+                self._classify_exception(e, function_name, {})
+            )
+        finally:
+            if semaphore:
+                semaphore.release()
+
+    def _run_tool_batch(
+        self, plan: _DispatchPlan, arguments_list: List[Dict[str, Any]]
+    ) -> List[Any]:
+        if plan.process_key is not None:
+            return self.process_pool.call(plan.process_key, "run_batch", arguments_list)
+        http_options = plan.http_options
+        with tool_options_scope(http_options) if http_options else nullcontext():
+            return plan.tool_instance.run_batch(arguments_list)
+
+    def _run_batch_job(
+        self,
+        job: _BatchJob,
+        tool_semaphores: Dict[str, Optional[threading.Semaphore]],
+        *,
+        stream_callback=None,
+        use_cache: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        semaphore = self._get_tool_semaphore(job, tool_semaphores)
+        if semaphore:
+            semaphore.acquire()
+        try:
+            return self.run_one_function(
+                job.call,
+                stream_callback=stream_callback,
+                use_cache=use_cache,
+                timeout=timeout,
+            )
+        finally:
+            if semaphore:
+                semaphore.release()
+
+    def run_iter(
+        self,
+        function_calls: Iterable[Dict[str, Any]],
+        use_cache: bool = False,
+        max_workers: Optional[int] = None,
+        ordered: bool = False,
+        window: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Execute function calls lazily, yielding results as they complete.
+
+        Unlike :meth:`run`, which returns only after every call in a batch has
+        finished, this generator yields ``(index, result)`` pairs as soon as
+        each call completes, so one slow tool does not hold back the rest.
+        Input is consumed lazily in windows; identical calls are de-duplicated
+        (including against calls still in flight), cache hits are served from a
+        bulk lookup before execution, and per-tool ``batch_max_concurrency``
+        limits are honoured, exactly as for :meth:`run` batches.
+
+        Args:
+            function_calls: Iterable (possibly unbounded) of function call dictionaries.
+            use_cache (bool, optional): Whether to use result caching. Defaults to False.
+            max_workers (int, optional): Maximum parallel workers; values <=1 run sequentially.
+            ordered (bool, optional): Yield results in input order instead of completion
+                                      order. Defaults to False.
+            window (int, optional): Maximum number of input calls read ahead of the
+                                    results already yielded. Defaults to ``4 * max_workers``
+                                    (at least 16).
+            timeout (float, optional): Per-call timeout in seconds, see
+                                       :meth:`run_one_function`.
+
+        Yields:
+            tuple: ``(index, result)`` where ``index`` is the position of the call in
+            ``function_calls``.
+        """
+        workers = max_workers if max_workers and max_workers > 1 else 1
+        window = max(1, window if window else max(16, 4 * workers))
+
+        calls = iter(function_calls)
+        tool_semaphores: Dict[str, Optional[threading.Semaphore]] = {}
+        in_flight: Dict[str, _BatchJob] = {}
+        futures: Dict[Future, _BatchJob] = {}
+        ready: Dict[int, Any] = {}
+        read_count = 0
+        yielded = 0
+        exhausted = False
+
+        def read_window(limit: int) -> List[_BatchJob]:
+            nonlocal read_count, exhausted
+            chunk = list(itertools.islice(calls, limit))
+            if len(chunk) < limit:
+                exhausted = True
+            if not chunk:
+                return []
+
+            jobs = self._build_batch_jobs(chunk, start_index=read_count)
+            read_count += len(chunk)
+
+            fresh_jobs = []
+            for job in jobs:
+                running = in_flight.get(job.signature)
+                if running is not None:
+                    # Collapse onto the identical call that is still executing.
+                    running.indices.extend(job.indices)
+                else:
+                    fresh_jobs.append(job)
+
+            # Cache hits are written straight into ``ready`` by index.
+            return self._prime_batch_cache(fresh_jobs, use_cache, ready)
+
+        def drain_ready() -> Iterator[Tuple[int, Any]]:
+            nonlocal yielded
+            if ordered:
+                while yielded in ready:
+                    yield yielded, ready.pop(yielded)
+                    yielded += 1
+            else:
+                for idx in sorted(ready):
+                    yielded += 1
+                    yield idx, ready.pop(idx)
+
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            while True:
+                pending_input = read_count - yielded
+                if not exhausted and pending_input < window:
+                    for job in read_window(window - pending_input):
+                        if executor is None:
+                            result = self._run_batch_job(
+                                job,
+                                tool_semaphores,
+                                use_cache=use_cache,
+                                timeout=timeout,
+                            )
+                            for idx in job.indices:
+                                ready[idx] = result
+                            yield from drain_ready()
+                        else:
+                            in_flight[job.signature] = job
+                            future = executor.submit(
+                                self._run_batch_job,
+                                job,
+                                tool_semaphores,
+                                use_cache=use_cache,
+                                timeout=timeout,
+                            )
+                            futures[future] = job
+
+                yield from drain_ready()
+
+                if not futures:
+                    if exhausted:
+                        break
+                    continue
+
+                done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = futures.pop(future)
+                    in_flight.pop(job.signature, None)
+                    result = future.result()
+                    for idx in job.indices:
+                        ready[idx] = result
+
+                yield from drain_ready()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def map(
+        self,
+        tool_name: str,
+        arguments_iterable: Iterable[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        ordered: bool = False,
+        use_cache: bool = False,
+        window: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Apply one tool to an iterable of argument dictionaries.
+
+        Convenience wrapper around :meth:`run_iter` that builds the function
+        calls lazily, so large inputs are never materialised in memory.
+
+        Args:
+            tool_name (str): Name of the tool to execute.
+            arguments_iterable: Iterable of argument dictionaries, one per call.
+            max_workers (int, optional): Maximum parallel workers; values <=1 run sequentially.
+            ordered (bool, optional): Yield results in input order. Defaults to False.
+            use_cache (bool, optional): Whether to use result caching. Defaults to False.
+            window (int, optional): Read-ahead bound, see :meth:`run_iter`.
+            timeout (float, optional): Per-call timeout in seconds.
+
+        Yields:
+            tuple: ``(index, result)`` pairs.
+        """
+        calls = (
+            {"name": tool_name, "arguments": arguments}
+            for arguments in arguments_iterable
+        )
+        return self.run_iter(
+            calls,
+            use_cache=use_cache,
+            max_workers=max_workers,
+            ordered=ordered,
+            window=window,
+            timeout=timeout,
+        )
+
+    async def _aexecute_function_call_list(
+        self,
+        function_calls: List[Dict[str, Any]],
+        stream_callback=None,
+        use_cache: bool = False,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """Async counterpart of :meth:`_execute_function_call_list`.
+
+        Args:
+            function_calls: Ordered list of function call dictionaries.
+            stream_callback: Optional streaming callback.
+            use_cache: Whether to enable cache lookups for each call.
+            max_workers: Maximum concurrent calls; values <=1 fall back to sequential execution.
+            executor: Executor for synchronous work; defaults to the managed executor.
+            timeout: Per-call timeout in seconds, see :meth:`run_one_function`.
+
+        Returns:
+            List of results aligned with ``function_calls`` order.
+        """
+
+        if not function_calls:
+            return []
+
+        if stream_callback is not None and max_workers and max_workers > 1:
+            self.logger.warning(
+                "stream_callback is not supported with parallel batch execution; falling back to sequential mode"
+            )
+            max_workers = 1
+
+        if executor is None:
+            executor = self._get_async_executor()
+
+        jobs = self._build_batch_jobs(function_calls)
+        results: List[Any] = [None] * len(function_calls)
+
+        def prepare_jobs() -> List[_BatchJob]:
+            for job in jobs:
+                self._ensure_tool_instance(job)
+            return self._prime_batch_cache(jobs, use_cache, results)
+
+        # Tool instantiation and persistent cache reads block; keep them off the loop.
+        loop = asyncio.get_running_loop()
+        jobs_to_run = await loop.run_in_executor(executor, prepare_jobs)
+        if not jobs_to_run:
+            return results
+
+        tool_semaphores: Dict[str, Optional[asyncio.Semaphore]] = {}
+        limiter = (
+            asyncio.Semaphore(max_workers) if max_workers and max_workers > 1 else None
+        )
+
+        async def run_job(job: _BatchJob):
+            semaphore = self._get_tool_semaphore(
+                job, tool_semaphores, factory=asyncio.Semaphore
+            )
+            async with semaphore or nullcontext():
+                async with limiter or nullcontext():
+                    result = await self.arun_one_function(
+                        job.call,
+                        stream_callback=stream_callback,
+                        use_cache=use_cache,
+                        executor=executor,
+                        timeout=timeout,
+                    )
+
+            for idx in job.indices:
+                results[idx] = result
+
+        if limiter is not None:
+            await asyncio.gather(*(run_job(job) for job in jobs_to_run))
         else:
             for job in jobs_to_run:
-                run_job(job)
+                await run_job(job)
+
+        return results
 
     def _ensure_tool_instance(self, job: _BatchJob):
         if job.tool_instance is None and job.function_name:
@@ -1940,18 +2692,20 @@ class ToolUniverse:
     def _get_tool_semaphore(
         self,
         job: _BatchJob,
-        tool_semaphores: Dict[str, Optional[threading.Semaphore]],
-    ) -> Optional[threading.Semaphore]:
+        tool_semaphores: Dict[str, Any],
+        factory=threading.Semaphore,
+    ) -> Any:
         if job.function_name not in tool_semaphores:
-            tool_instance = self._ensure_tool_instance(job)
-            limit = (
-                tool_instance.get_batch_concurrency_limit()
-                if tool_instance is not None
-                else 0
+            self._ensure_tool_instance(job)
+            plan = (
+                self._get_dispatch_plan(job.function_name)
+                if job.function_name
+                else None
             )
+            limit = plan.batch_limit if plan is not None else 0
             self.logger.debug("Batch concurrency for %s: %s", job.function_name, limit)
             if limit and limit > 0:
-                tool_semaphores[job.function_name] = threading.Semaphore(limit)
+                tool_semaphores[job.function_name] = factory(limit)
             else:
                 tool_semaphores[job.function_name] = None
 
@@ -1966,6 +2720,7 @@ class ToolUniverse:
         stream_callback=None,
         use_cache: bool = False,
         max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
     ):
         """
         Execute function calls from input string or data.
@@ -1978,6 +2733,9 @@ class ToolUniverse:
             return_message (bool, optional): Whether to return formatted messages. Defaults to False.
             verbose (bool, optional): Whether to enable verbose output. Defaults to True.
             format (str, optional): Format type for parsing. Defaults to 'llama'.
+            timeout (float, optional): Per-call timeout in seconds (each call in a batch gets
+                                       its own deadline). Defaults to the tool's ``timeout``
+                                       config field.
 
         Returns:
             list or str or None:
@@ -2002,40 +2760,125 @@ class ToolUniverse:
                     stream_callback=stream_callback,
                     use_cache=use_cache,
                     max_workers=max_workers,
+                    timeout=timeout,
                 )
 
-                call_results = []
-                for idx, call_result in enumerate(batch_results):
-                    call_id = self.call_id_gen()
-                    function_call_json[idx]["call_id"] = call_id
-                    call_results.append(
-                        {
-                            "role": "tool",
-                            "content": json.dumps(
-                                {"content": call_result, "call_id": call_id}
-                            ),
-                        }
-                    )
-                revised_messages = [
-                    {
-                        "role": "assistant",
-                        "content": message,
-                        "tool_calls": json.dumps(function_call_json),
-                    }
-                ] + call_results
-                return revised_messages
+                return self._format_batch_messages(
+                    function_call_json, message, batch_results
+                )
             else:
                 return self.run_one_function(
                     function_call_json,
                     stream_callback=stream_callback,
                     use_cache=use_cache,
+                    timeout=timeout,
                 )
         else:
             error("Not a function call")
             return None
 
+    async def arun(
+        self,
+        fcall_str,
+        return_message=False,
+        verbose=True,
+        format="llama",
+        stream_callback=None,
+        use_cache: bool = False,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Asynchronously execute function calls from input string or data.
+
+        Async counterpart of :meth:`run` with identical parsing and return
+        formats. Batches keep the de-duplication, cache priming and per-tool
+        concurrency limits of the synchronous path, but run as coroutines on
+        the caller's event loop instead of a dedicated thread pool.
+
+        Args:
+            fcall_str: Input string or data containing function call information.
+            return_message (bool, optional): Whether to return formatted messages. Defaults to False.
+            verbose (bool, optional): Whether to enable verbose output. Defaults to True.
+            format (str, optional): Format type for parsing. Defaults to 'llama'.
+            stream_callback (callable, optional): Callback for streaming responses.
+            use_cache (bool, optional): Whether to use result caching. Defaults to False.
+            max_workers (int, optional): Maximum concurrent calls for batches; values <=1 run sequentially.
+            executor (Executor, optional): Executor for synchronous tools. Defaults to the
+                                           ToolUniverse-managed executor.
+            timeout (float, optional): Per-call timeout in seconds, as for :meth:`run`.
+
+        Returns:
+            list or str or None: Same as :meth:`run`.
+        """
+        if return_message:
+            function_call_json, message = self.extract_function_call_json(
+                fcall_str, return_message=return_message, verbose=verbose, format=format
+            )
+        else:
+            function_call_json = self.extract_function_call_json(
+                fcall_str, return_message=return_message, verbose=verbose, format=format
+            )
+            message = ""
+        if function_call_json is not None:
+            if isinstance(function_call_json, list):
+                batch_results = await self._aexecute_function_call_list(
+                    function_call_json,
+                    stream_callback=stream_callback,
+                    use_cache=use_cache,
+                    max_workers=max_workers,
+                    executor=executor,
+                    timeout=timeout,
+                )
+                return self._format_batch_messages(
+                    function_call_json, message, batch_results
+                )
+            else:
+                return await self.arun_one_function(
+                    function_call_json,
+                    stream_callback=stream_callback,
+                    use_cache=use_cache,
+                    executor=executor,
+                    timeout=timeout,
+                )
+        else:
+            error("Not a function call")
+            return None
+
+    def _format_batch_messages(
+        self,
+        function_calls: List[Dict[str, Any]],
+        message: str,
+        batch_results: List[Any],
+    ) -> List[Dict[str, Any]]:
+        """Attach call IDs to a batch and wrap results as chat messages."""
+        call_results = []
+        for idx, call_result in enumerate(batch_results):
+            call_id = self.call_id_gen()
+            function_calls[idx]["call_id"] = call_id
+            call_results.append(
+                {
+                    "role": "tool",
+                    "content": json.dumps({"content": call_result, "call_id": call_id}),
+                }
+            )
+        revised_messages = [
+            {
+                "role": "assistant",
+                "content": message,
+                "tool_calls": json.dumps(function_calls),
+            }
+        ] + call_results
+        return revised_messages
+
     def run_one_function(
-        self, function_call_json, stream_callback=None, use_cache=False, validate=True
+        self,
+        function_call_json,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        timeout: Optional[float] = None,
     ):
         """
         Execute a single function call.
@@ -2049,53 +2892,86 @@ class ToolUniverse:
             stream_callback (callable, optional): Callback for streaming responses.
             use_cache (bool, optional): Whether to use result caching. Defaults to False.
             validate (bool, optional): Whether to validate parameters against schema. Defaults to True.
+            timeout (float, optional): Seconds the call may take. Defaults to the tool's
+                                       ``timeout`` config field; nested calls never outlive
+                                       the deadline of the call that issued them. On expiry a
+                                       ``ToolUnavailableError`` is returned and the caller's
+                                       thread is released.
 
         Returns:
             str or dict: Result from the tool execution, or error message if validation fails.
         """
+        if not self.metrics.enabled:
+            return self._run_one_function(
+                function_call_json, stream_callback, use_cache, validate, timeout
+            )
+        observation = self.metrics.observe(function_call_json.get("name", ""))
+        result = self._run_one_function(
+            function_call_json,
+            stream_callback,
+            use_cache,
+            validate,
+            timeout,
+            observation,
+        )
+        observation.finish(result)
+        return result
+
+    def _run_one_function(
+        self,
+        function_call_json,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        timeout=None,
+        observation=None,
+    ):
+        """Body of :meth:`run_one_function`, optionally recording phase timings."""
         function_name = function_call_json.get("name", "")
         arguments = function_call_json.get("arguments", {})
 
         # Handle malformed queries gracefully
-        if not function_name:
-            return {"error": "Missing or empty function name"}
-
-        if not isinstance(arguments, dict):
-            return {
-                "error": f"Arguments must be a dictionary, got {type(arguments).__name__}"
-            }
-
-        tool_instance = None
+        malformed_error = self._check_call_shape(function_name, arguments)
+        if malformed_error is not None:
+            return malformed_error
+
+        plan = self._get_dispatch_plan(function_name)
+        deadline, owns_deadline = self._resolve_deadline(timeout, plan)
+        if deadline is not None and deadline.expired:
+            return self._deadline_error(function_name, deadline)
+        tool_instance = plan.tool_instance if plan is not None else None
         cache_namespace = None
         cache_version = None
         cache_key = None
-        composed_cache_key = None
         cache_guard = nullcontext()
 
         cache_enabled = (
-            use_cache and self.cache_manager is not None and self.cache_manager.enabled
+            use_cache
+            and plan is not None
+            and plan.cacheable
+            and self.cache_manager is not None
+            and self.cache_manager.enabled
         )
 
         if cache_enabled:
-            tool_instance = self._get_tool_instance(function_name, cache=True)
-            if tool_instance and tool_instance.supports_caching():
-                cache_namespace = tool_instance.get_cache_namespace()
-                cache_version = tool_instance.get_cache_version()
-                cache_key = self._make_cache_key(function_name, arguments)
-                composed_cache_key = self.cache_manager.compose_key(
+            cache_namespace, cache_version = plan.cache_scope()
+            cache_key = plan.key_fn(arguments)
+            cached_value = self.cache_manager.get(
+                namespace=cache_namespace,
+                version=cache_version,
+                cache_key=cache_key,
+            )
+            if cached_value is not None:
+                self.logger.debug("Cache hit for %s", function_name)
+                if observation is not None:
+                    observation.mark("cache_lookup")
+                    observation.cache_event = "hit"
+                return cached_value
+            cache_guard = self.cache_manager.singleflight_guard(
+                self.cache_manager.compose_key(
                     cache_namespace, cache_version, cache_key
                 )
-                cached_value = self.cache_manager.get(
-                    namespace=cache_namespace,
-                    version=cache_version,
-                    cache_key=cache_key,
-                )
-                if cached_value is not None:
-                    self.logger.debug(f"Cache hit for {function_name}")
-                    return cached_value
-                cache_guard = self.cache_manager.singleflight_guard(composed_cache_key)
-            else:
-                cache_enabled = False
+            )
 
         with cache_guard:
             if cache_enabled:
@@ -2104,27 +2980,29 @@ class ToolUniverse:
                     version=cache_version,
                     cache_key=cache_key,
                 )
+                if observation is not None:
+                    observation.mark("cache_lookup")
+                    observation.cache_event = "miss" if cached_value is None else "hit"
+                    observation.singleflight_wait = cached_value is not None
                 if cached_value is not None:
                     self.logger.debug(
                         f"Cache hit for {function_name} (after singleflight wait)"
                     )
                     return cached_value
+            elif observation is not None:
+                observation.skip()
 
-            # Validate parameters if requested
-            if validate:
-                validation_error = self._validate_parameters(function_name, arguments)
-                if validation_error:
-                    return self._create_dual_format_error(validation_error)
-
-            # Check function call format (existing validation)
-            check_status, check_message = self.check_function_call(function_call_json)
-            if check_status is False:
-                error_msg = "Invalid function call: " + check_message
-                return self._create_dual_format_error(
-                    ToolValidationError(
-                        error_msg, details={"check_message": check_message}
-                    )
-                )
+            call_error, arguments = self._preflight_function_call(
+                function_call_json, function_name, arguments, validate
+            )
+            if observation is not None:
+                observation.mark("validation")
+            if call_error is not None:
+                return call_error
+
+            circuit_error = self._circuit_open_error(function_name)
+            if circuit_error is not None:
+                return circuit_error
 
             # Execute the tool
             tool_arguments = arguments
@@ -2132,66 +3010,542 @@ class ToolUniverse:
                 if tool_instance is None:
                     tool_instance = self._get_tool_instance(function_name, cache=True)
 
-                if tool_instance:
-                    result, tool_arguments = self._execute_tool_with_stream(
-                        tool_instance, arguments, stream_callback, use_cache, validate
-                    )
-                else:
-                    error_msg = f"Tool '{function_name}' not found"
-                    return self._create_dual_format_error(
-                        ToolUnavailableError(
-                            error_msg,
-                            next_steps=[
-                                "Check tool name spelling",
-                                "Run tu.tools.refresh()",
-                            ],
+                if tool_instance and owns_deadline:
+                    with self.circuit_breakers.track(function_name):
+                        result, tool_arguments = call_with_deadline(
+                            deadline,
+                            self._execute_tool_with_stream,
+                            tool_instance,
+                            arguments,
+                            stream_callback,
+                            use_cache,
+                            validate,
+                            plan=plan,
                         )
-                    )
+                elif tool_instance:
+                    with self.circuit_breakers.track(function_name):
+                        result, tool_arguments = self._execute_tool_with_stream(
+                            tool_instance,
+                            arguments,
+                            stream_callback,
+                            use_cache,
+                            validate,
+                            plan=plan,
+                        )
+                else:
+                    return self._tool_not_found_error(function_name)
+            except DeadlineExceeded:
+                return self._deadline_error(function_name, deadline)
+            except CircuitOpenError as e:
+                return self._circuit_open_error(function_name, (e.key, e.retry_after))
             except Exception as e:
                 # Classify and return structured error
                 classified_error = self._classify_exception(e, function_name, arguments)
                 return self._create_dual_format_error(classified_error)
+            finally:
+                if observation is not None:
+                    observation.mark("execution")
 
             # Apply output hooks if enabled
-            if self.hook_manager:
-                context = {
-                    "tool_name": function_name,
-                    "tool_type": (
-                        tool_instance.__class__.__name__
-                        if tool_instance is not None
-                        else "unknown"
-                    ),
-                    "execution_time": time.time(),
-                    "arguments": tool_arguments,
-                }
-                result = self.hook_manager.apply_hooks(
-                    result, function_name, tool_arguments, context
+            if self.hook_manager and self._hooks_apply_to(plan, function_name):
+                result = self._apply_output_hooks(
+                    result, function_name, tool_instance, tool_arguments
                 )
+                if observation is not None:
+                    observation.mark("hooks")
 
             # Cache result if enabled
-            if cache_enabled and tool_instance and tool_instance.supports_caching():
-                if cache_key is None:
-                    cache_key = self._make_cache_key(function_name, arguments)
-                if cache_namespace is None:
-                    cache_namespace = tool_instance.get_cache_namespace()
-                if cache_version is None:
-                    cache_version = tool_instance.get_cache_version()
-                ttl = tool_instance.get_cache_ttl(result)
-                self.cache_manager.set(
-                    namespace=cache_namespace,
-                    version=cache_version,
-                    cache_key=cache_key,
-                    value=result,
-                    ttl=ttl,
+            if cache_enabled:
+                self._store_cached_result(
+                    tool_instance,
+                    function_name,
+                    arguments,
+                    result,
+                    cache_namespace,
+                    cache_version,
+                    cache_key,
                 )
+                if observation is not None:
+                    observation.mark("serialization")
 
             return result
 
-    def _execute_tool_with_stream(
-        self, tool_instance, arguments, stream_callback, use_cache=False, validate=True
+    async def arun_one_function(
+        self,
+        function_call_json,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        executor: Optional[Executor] = None,
+        timeout: Optional[float] = None,
     ):
-        """Invoke a tool, forwarding stream callbacks and other parameters when supported."""
+        """
+        Asynchronously execute a single function call.
+
+        Tools that implement a native ``arun`` coroutine are awaited directly on
+        the running event loop, with the same validation, caching (including
+        singleflight de-duplication) and output hooks as :meth:`run_one_function`.
+        All other tools run through :meth:`run_one_function` on ``executor``, or on
+        a ToolUniverse-managed thread pool when no executor is given, so the
+        event loop is never blocked by synchronous tool code.
+
+        Args:
+            function_call_json (dict): Dictionary containing function name and arguments.
+            stream_callback (callable, optional): Callback for streaming responses.
+            use_cache (bool, optional): Whether to use result caching. Defaults to False.
+            validate (bool, optional): Whether to validate parameters against schema. Defaults to True.
+            executor (Executor, optional): Executor for synchronous work. Defaults to the
+                                           ToolUniverse-managed executor.
+            timeout (float, optional): Seconds the call may take, as for
+                                       :meth:`run_one_function`. Native async tools are
+                                       cancelled on expiry.
+
+        Returns:
+            str or dict: Result from the tool execution, or error message if validation fails.
+        """
+        function_name = function_call_json.get("name", "")
+        arguments = function_call_json.get("arguments", {})
+
+        malformed_error = self._check_call_shape(function_name, arguments)
+        if malformed_error is not None:
+            return malformed_error
+
+        loop = asyncio.get_running_loop()
+        if executor is None:
+            executor = self._get_async_executor()
+
+        tool_instance = self.callable_functions.get(function_name)
+        if tool_instance is None:
+            # First use may import modules or construct clients; keep it off the loop.
+            tool_instance = await loop.run_in_executor(
+                executor, self._get_tool_instance, function_name, True
+            )
+
+        if not self._supports_native_async(tool_instance):
+            return await loop.run_in_executor(
+                executor,
+                functools.partial(
+                    self.run_one_function,
+                    function_call_json,
+                    stream_callback=stream_callback,
+                    use_cache=use_cache,
+                    validate=validate,
+                    timeout=timeout,
+                ),
+            )
+
+        observation = self.metrics.observe(function_name)
+        result = await self._arun_native_function(
+            function_call_json,
+            tool_instance,
+            executor,
+            stream_callback,
+            use_cache,
+            validate,
+            timeout,
+            observation,
+        )
+        if observation is not None:
+            observation.finish(result)
+        return result
+
+    async def _aget_cached_result(self, executor, namespace, version, cache_key):
+        """Look up a cached result without blocking the event loop.
+
+        The memory tier is checked inline; on a miss the persistent store is
+        read on ``executor``.
+        """
+        cached_value = self.cache_manager.get_memory(
+            namespace=namespace, version=version, cache_key=cache_key
+        )
+        if cached_value is not None or self.cache_manager.persistent is None:
+            return cached_value
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                self.cache_manager.get,
+                namespace=namespace,
+                version=version,
+                cache_key=cache_key,
+            ),
+        )
 
+    async def _arun_native_function(
+        self,
+        function_call_json,
+        tool_instance,
+        executor,
+        stream_callback=None,
+        use_cache=False,
+        validate=True,
+        timeout=None,
+        observation=None,
+    ):
+        """Await a tool's native ``arun`` with validation, caching and hooks."""
+        loop = asyncio.get_running_loop()
+        function_name = function_call_json.get("name", "")
+        arguments = function_call_json.get("arguments", {})
+        plan = self._get_dispatch_plan(function_name)
+        deadline, owns_deadline = self._resolve_deadline(timeout, plan)
+        if deadline is not None and deadline.expired:
+            return self._deadline_error(function_name, deadline)
+        cache_namespace = None
+        cache_version = None
+        cache_key = None
+        cache_guard = nullcontext()
+
+        cache_enabled = (
+            use_cache
+            and plan is not None
+            and plan.cacheable
+            and self.cache_manager is not None
+            and self.cache_manager.enabled
+        )
+
+        if cache_enabled:
+            cache_namespace, cache_version = plan.cache_scope()
+            cache_key = plan.key_fn(arguments)
+            cached_value = await self._aget_cached_result(
+                executor, cache_namespace, cache_version, cache_key
+            )
+            if cached_value is not None:
+                self.logger.debug("Cache hit for %s", function_name)
+                if observation is not None:
+                    observation.mark("cache_lookup")
+                    observation.cache_event = "hit"
+                return cached_value
+            cache_guard = self.cache_manager.async_singleflight_guard(
+                self.cache_manager.compose_key(
+                    cache_namespace, cache_version, cache_key
+                )
+            )
+
+        async with cache_guard:
+            if cache_enabled:
+                cached_value = await self._aget_cached_result(
+                    executor, cache_namespace, cache_version, cache_key
+                )
+                if observation is not None:
+                    observation.mark("cache_lookup")
+                    observation.cache_event = "miss" if cached_value is None else "hit"
+                    observation.singleflight_wait = cached_value is not None
+                if cached_value is not None:
+                    self.logger.debug(
+                        f"Cache hit for {function_name} (after singleflight wait)"
+                    )
+                    return cached_value
+            elif observation is not None:
+                observation.skip()
+
+            call_error, arguments = self._preflight_function_call(
+                function_call_json, function_name, arguments, validate
+            )
+            if observation is not None:
+                observation.mark("validation")
+            if call_error is not None:
+                return call_error
+
+            circuit_error = self._circuit_open_error(function_name)
+            if circuit_error is not None:
+                return circuit_error
+
+            tool_arguments = arguments
+            try:
+                if owns_deadline:
+                    with (
+                        deadline_scope(deadline),
+                        self.circuit_breakers.track(function_name),
+                    ):
+                        # wait_for cancels the tool's coroutine on expiry.
+                        result, tool_arguments = await asyncio.wait_for(
+                            self._aexecute_tool_with_stream(
+                                tool_instance,
+                                arguments,
+                                stream_callback,
+                                use_cache,
+                                validate,
+                            ),
+                            deadline.remaining(),
+                        )
+                else:
+                    with self.circuit_breakers.track(function_name):
+                        result, tool_arguments = await self._aexecute_tool_with_stream(
+                            tool_instance,
+                            arguments,
+                            stream_callback,
+                            use_cache,
+                            validate,
+                        )
+            except (asyncio.TimeoutError, DeadlineExceeded):
+                if deadline is not None:
+                    deadline.cancel()
+                return self._deadline_error(function_name, deadline)
+            except CircuitOpenError as e:
+                return self._circuit_open_error(function_name, (e.key, e.retry_after))
+            except Exception as e:
+                classified_error = self._classify_exception(e, function_name, arguments)
+                return self._create_dual_format_error(classified_error)
+            finally:
+                if observation is not None:
+                    observation.mark("execution")
+
+            # Hooks may call other (synchronous) tools, so run them off the loop.
+            if self.hook_manager and self._hooks_apply_to(plan, function_name):
+                result = await loop.run_in_executor(
+                    executor,
+                    self._apply_output_hooks,
+                    result,
+                    function_name,
+                    tool_instance,
+                    tool_arguments,
+                )
+                if observation is not None:
+                    observation.mark("hooks")
+
+            if cache_enabled:
+                self._store_cached_result(
+                    tool_instance,
+                    function_name,
+                    arguments,
+                    result,
+                    cache_namespace,
+                    cache_version,
+                    cache_key,
+                )
+                if observation is not None:
+                    observation.mark("serialization")
+
+            return result
+
+    def _check_call_shape(self, function_name, arguments) -> Optional[dict]:
+        """Return an error payload for malformed calls, or None if well-formed."""
+        if not function_name:
+            return {"error": "Missing or empty function name"}
+
+        if not isinstance(arguments, dict):
+            return {
+                "error": f"Arguments must be a dictionary, got {type(arguments).__name__}"
+            }
+        return None
+
+    def _preflight_function_call(
+        self, function_call_json, function_name, arguments, validate
+    ) -> Tuple[Optional[dict], Dict[str, Any]]:
+        """Run schema validation and call-format checks before execution.
+
+        Returns:
+            Tuple of (error payload or None, arguments to execute with). The
+            arguments differ from the input only when parameter coercion is
+            enabled for the tool.
+        """
+        validator = self._get_compiled_validator(function_name)
+        if validator is not None:
+            # Single compiled pass covering both checks below.
+            validation_error, (check_status, check_message), arguments = (
+                validator.check(arguments, validate=validate)
+            )
+        else:
+            validation_error = None
+            # Validate parameters if requested
+            if validate:
+                validation_error = self._validate_parameters(function_name, arguments)
+            if not validation_error:
+                # Check function call format (existing validation)
+                check_status, check_message = self.check_function_call(
+                    function_call_json
+                )
+
+        if validation_error:
+            return self._create_dual_format_error(validation_error), arguments
+
+        if check_status is False:
+            error_msg = "Invalid function call: " + check_message
+            return (
+                self._create_dual_format_error(
+                    ToolValidationError(
+                        error_msg, details={"check_message": check_message}
+                    )
+                ),
+                arguments,
+            )
+        return None, arguments
+
+    def _get_compiled_validator(self, function_name: str):
+        """Return the tool's compiled validator when both checks can share it.
+
+        Falls back to None (separate checks) when the tool overrides
+        ``validate_parameters`` or its schema differs from the loaded config.
+        """
+        config = self.all_tool_dict.get(function_name)
+        if config is None:
+            return None
+        tool_instance = self._get_tool_instance(function_name, cache=True)
+        if not isinstance(tool_instance, BaseTool) or (
+            type(tool_instance).validate_parameters is not BaseTool.validate_parameters
+        ):
+            return None
+        validator = tool_instance.get_parameter_validator()
+        if (
+            validator.tool_name != function_name
+            or config.get("name") != function_name
+            or validator.schema is not config.get("parameter", {})
+        ):
+            return None
+        return validator
+
+    def _tool_not_found_error(self, function_name: str) -> dict:
+        error_msg = f"Tool '{function_name}' not found"
+        return self._create_dual_format_error(
+            ToolUnavailableError(
+                error_msg,
+                next_steps=[
+                    "Check tool name spelling",
+                    "Run tu.tools.refresh()",
+                ],
+            )
+        )
+
+    def _resolve_deadline(
+        self, timeout: Optional[float], plan: Optional[_DispatchPlan]
+    ) -> Tuple[Optional[Deadline], bool]:
+        """Return the deadline governing a call and whether the call owns it.
+
+        An explicit ``timeout`` wins over the tool's configured one; either is
+        capped by a deadline inherited from an enclosing call (for example a
+        ComposeTool step). A call that only inherits a deadline does not own it.
+        """
+        inherited = current_deadline()
+        if timeout is None and plan is not None:
+            timeout = plan.timeout
+        if timeout is None:
+            return inherited, False
+        return Deadline(timeout, inherited), True
+
+    def _deadline_error(self, function_name: str, deadline: Optional[Deadline]) -> dict:
+        timeout = deadline.timeout if deadline is not None else None
+        limit = (
+            f" within {timeout:g}s" if timeout is not None else " before its deadline"
+        )
+        return self._create_dual_format_error(
+            ToolUnavailableError(
+                f"Tool '{function_name}' did not complete{limit}",
+                next_steps=[
+                    "Retry the call later",
+                    "Increase the timeout for this call or tool",
+                ],
+                details={"timeout": timeout, "deadline_exceeded": True},
+            )
+        )
+
+    def _circuit_open_error(
+        self, function_name: str, refusal: Optional[Tuple[str, float]] = None
+    ) -> Optional[dict]:
+        """Return an error if an open circuit breaker refuses ``function_name``.
+
+        ``refusal`` is an already known ``(breaker_key, retry_after)`` pair;
+        otherwise the tool's breakers are consulted.
+        """
+        if refusal is None:
+            refusal = self.circuit_breakers.check_tool(function_name)
+            if refusal is None:
+                return None
+        key, retry_after = refusal
+        return self._create_dual_format_error(
+            ToolUnavailableError(
+                f"Tool '{function_name}' is temporarily unavailable: "
+                f"circuit breaker for {key} is open",
+                next_steps=[f"Retry after {retry_after:.0f} seconds"],
+                details={
+                    "circuit_breaker": key,
+                    "circuit_state": "open",
+                    "retry_after": round(retry_after, 3),
+                },
+            )
+        )
+
+    def _apply_output_hooks(self, result, function_name, tool_instance, tool_arguments):
+        """Run configured output hooks over a tool result."""
+        context = {
+            "tool_name": function_name,
+            "tool_type": (
+                tool_instance.__class__.__name__
+                if tool_instance is not None
+                else "unknown"
+            ),
+            "execution_time": time.time(),
+            "arguments": tool_arguments,
+        }
+        return self.hook_manager.apply_hooks(
+            result, function_name, tool_arguments, context
+        )
+
+    def _store_cached_result(
+        self,
+        tool_instance,
+        function_name,
+        arguments,
+        result,
+        cache_namespace=None,
+        cache_version=None,
+        cache_key=None,
+    ) -> None:
+        if not (tool_instance and tool_instance.supports_caching()):
+            return
+        if cache_key is None:
+            cache_key = self._make_cache_key(function_name, arguments)
+        if cache_namespace is None:
+            cache_namespace = tool_instance.get_cache_namespace()
+        if cache_version is None:
+            cache_version = tool_instance.get_cache_version()
+        ttl = tool_instance.get_cache_ttl(result)
+        self.cache_manager.set(
+            namespace=cache_namespace,
+            version=cache_version,
+            cache_key=cache_key,
+            value=result,
+            ttl=ttl,
+        )
+
+    def _supports_native_async(self, tool_instance) -> bool:
+        """Return True if the tool exposes a native ``arun`` coroutine."""
+        checker = getattr(tool_instance, "supports_async", None)
+        if not callable(checker):
+            return False
+        try:
+            return bool(checker())
+        except Exception:
+            return False
+
+    def _get_async_executor(self) -> ThreadPoolExecutor:
+        """Return the managed executor used to run synchronous tools from async code."""
+        if self._async_executor is None:
+            with self._async_executor_lock:
+                if self._async_executor is None:
+                    max_workers = (
+                        int(os.getenv("TOOLUNIVERSE_ASYNC_MAX_WORKERS", "0")) or None
+                    )
+                    self._async_executor = ThreadPoolExecutor(
+                        max_workers=max_workers,
+                        thread_name_prefix="ToolUniverseAsync",
+                    )
+        return self._async_executor
+
+    def _build_run_kwargs(
+        self, run_callable, stream_callback, use_cache, validate
+    ) -> Dict[str, Any]:
+        """Build keyword arguments supported by a tool's ``run``/``arun`` signature."""
+        params = inspect.signature(run_callable).parameters
+
+        kwargs = {}
+        if stream_callback is not None and "stream_callback" in params:
+            kwargs["stream_callback"] = stream_callback
+        if "use_cache" in params:
+            kwargs["use_cache"] = use_cache
+        if "validate" in params:
+            kwargs["validate"] = validate
+        return kwargs
+
+    def _prepare_tool_arguments(self, tool_instance, arguments, stream_callback):
         tool_arguments = arguments
         stream_flag_key = (
             getattr(tool_instance, "STREAM_FLAG_KEY", None) if stream_callback else None
@@ -2206,31 +3560,127 @@ class ToolUniverse:
                 and stream_flag_key not in tool_arguments
             ):
                 tool_arguments[stream_flag_key] = True
+        return tool_arguments
 
-        # Try to pass all available parameters to the tool
-        try:
-            signature = inspect.signature(tool_instance.run)
-            params = signature.parameters
+    def _execute_tool_with_stream(
+        self,
+        tool_instance,
+        arguments,
+        stream_callback,
+        use_cache=False,
+        validate=True,
+        plan: Optional[_DispatchPlan] = None,
+    ):
+        """Invoke a tool, forwarding stream callbacks and other parameters when supported."""
 
-            # Build kwargs based on what the tool accepts
-            kwargs = {}
+        tool_arguments = self._prepare_tool_arguments(
+            tool_instance, arguments, stream_callback
+        )
 
-            # Always include arguments as first positional argument
-            if stream_callback is not None and "stream_callback" in params:
-                kwargs["stream_callback"] = stream_callback
-            if "use_cache" in params:
-                kwargs["use_cache"] = use_cache
-            if "validate" in params:
-                kwargs["validate"] = validate
+        if (
+            plan is not None
+            and plan.process_key is not None
+            and plan.tool_instance is tool_instance
+            and stream_callback is None
+        ):
+            # CPU-bound tools run in a worker process (``"execution": "process"``)
+            return (
+                self.process_pool.call(plan.process_key, "run", tool_arguments),
+                tool_arguments,
+            )
 
-            # Call with all supported parameters
-            return tool_instance.run(tool_arguments, **kwargs), tool_arguments
+        if (
+            plan is not None
+            and plan.hedge is not None
+            and plan.tool_instance is tool_instance
+            and stream_callback is None
+        ):
+            # Slow calls to idempotent tools get a second attempt (``"hedge"``)
+            result = plan.hedge.call(
+                self._invoke_tool,
+                tool_instance,
+                tool_arguments,
+                stream_callback,
+                use_cache,
+                validate,
+                plan,
+            )
+            return result, tool_arguments
+
+        return (
+            self._invoke_tool(
+                tool_instance,
+                tool_arguments,
+                stream_callback,
+                use_cache,
+                validate,
+                plan,
+            ),
+            tool_arguments,
+        )
 
+    def _invoke_tool(
+        self,
+        tool_instance,
+        tool_arguments,
+        stream_callback,
+        use_cache=False,
+        validate=True,
+        plan: Optional[_DispatchPlan] = None,
+    ):
+        """Call ``tool_instance.run`` with its HTTP options and supported parameters."""
+        if plan is not None and plan.tool_instance is tool_instance:
+            http_options = plan.http_options
+        else:
+            http_options = tool_http_options(
+                getattr(tool_instance, "tool_config", None)
+            )
+
+        # Per-tool HTTP overrides apply to shared-client requests made by the tool
+        with tool_options_scope(http_options) if http_options else nullcontext():
+            # Try to pass all available parameters to the tool
+            try:
+                if (
+                    plan is not None
+                    and plan.run_params is not None
+                    and plan.tool_instance is tool_instance
+                    and tool_instance.run == plan.run_callable
+                ):
+                    kwargs = plan.run_kwargs(stream_callback, use_cache, validate)
+                else:
+                    kwargs = self._build_run_kwargs(
+                        tool_instance.run, stream_callback, use_cache, validate
+                    )
+
+                # Call with all supported parameters
+                return tool_instance.run(tool_arguments, **kwargs)
+
+            except (ValueError, TypeError) as e:
+                # If inspection fails or tool doesn't accept extra params,
+                # fall back to simple execution with just arguments
+                self.logger.debug(f"Falling back to simple run() call: {e}")
+                return tool_instance.run(tool_arguments)
+
+    async def _aexecute_tool_with_stream(
+        self, tool_instance, arguments, stream_callback, use_cache=False, validate=True
+    ):
+        """Await a tool's native ``arun`` coroutine with the supported parameters."""
+
+        tool_arguments = self._prepare_tool_arguments(
+            tool_instance, arguments, stream_callback
+        )
+
+        try:
+            kwargs = self._build_run_kwargs(
+                tool_instance.arun, stream_callback, use_cache, validate
+            )
         except (ValueError, TypeError) as e:
-            # If inspection fails or tool doesn't accept extra params,
-            # fall back to simple execution with just arguments
-            self.logger.debug(f"Falling back to simple run() call: {e}")
-            return tool_instance.run(tool_arguments), tool_arguments
+            self.logger.debug(f"Falling back to simple arun() call: {e}")
+            kwargs = {}
+
+        http_options = tool_http_options(getattr(tool_instance, "tool_config", None))
+        with tool_options_scope(http_options) if http_options else nullcontext():
+            return await tool_instance.arun(tool_arguments, **kwargs), tool_arguments
 
     def toggle_hooks(self, enabled: bool):
         """
@@ -2338,6 +3788,92 @@ class ToolUniverse:
             self.logger.warning(f"Failed to initialize '{tool_type}': {e}")
             return None  # Return None instead of raising
 
+    def _get_dispatch_plan(self, function_name: str) -> Optional[_DispatchPlan]:
+        """Return the cached dispatch plan for a tool, building it on first use.
+
+        A plan stays valid while the cached tool instance and its loaded config
+        are unchanged; replacing either (re-registration, reload) rebuilds it.
+        """
+        plan = self._dispatch_plans.get(function_name)
+        if (
+            plan is not None
+            and plan.tool_instance is self.callable_functions.get(function_name)
+            and plan.tool_config is self.all_tool_dict.get(function_name)
+        ):
+            return plan
+
+        tool_instance = self._get_tool_instance(function_name, cache=True)
+        if tool_instance is None:
+            self._dispatch_plans.pop(function_name, None)
+            return None
+
+        run_callable = getattr(tool_instance, "run", None)
+        try:
+            params = inspect.signature(run_callable).parameters
+            run_params = frozenset(p for p in _RUN_CONTEXT_PARAMS if p in params)
+        except (ValueError, TypeError):
+            run_params = None
+
+        supports_caching = getattr(tool_instance, "supports_caching", None)
+        get_limit = getattr(tool_instance, "get_batch_concurrency_limit", None)
+        get_timeout = getattr(tool_instance, "get_timeout", None)
+        get_batch_size = getattr(tool_instance, "get_batch_size", None)
+        self.rate_limiter.add_tool_limits(self.all_tool_dict.get(function_name))
+        self.circuit_breakers.register_tool(
+            function_name, self.all_tool_dict.get(function_name)
+        )
+        tool_config = self.all_tool_dict.get(function_name)
+        process_key = None
+        if (
+            isinstance(tool_config, dict)
+            and tool_config.get("execution") == "process"
+            and self.process_pool.enabled
+        ):
+            process_key = self.process_pool.register(
+                function_name, type(tool_instance), tool_config
+            )
+        plan = _DispatchPlan(
+            tool_name=function_name,
+            tool_instance=tool_instance,
+            tool_config=self.all_tool_dict.get(function_name),
+            run_callable=run_callable,
+            run_params=run_params,
+            cacheable=bool(supports_caching()) if callable(supports_caching) else False,
+            key_fn=getattr(tool_instance, "get_cache_key", None),
+            batch_limit=get_limit() if callable(get_limit) else 0,
+            batch_size=get_batch_size() if callable(get_batch_size) else 0,
+            timeout=get_timeout() if callable(get_timeout) else None,
+            http_options=tool_http_options(self.all_tool_dict.get(function_name)),
+            process_key=process_key,
+            hedge=hedge_policy(tool_config),
+        )
+        if function_name in self.callable_functions:
+            self._dispatch_plans[function_name] = plan
+        return plan
+
+    def _hooks_apply_to(
+        self, plan: Optional[_DispatchPlan], function_name: str
+    ) -> bool:
+        """Return True if any configured output hook can apply to this tool."""
+        hook_manager = self.hook_manager
+        if plan is None:
+            return True
+        if not getattr(hook_manager, "enabled", True):
+            return False
+        hooks = getattr(hook_manager, "hooks", None)
+        if not isinstance(hooks, list):
+            return True
+        hooks_key = (id(hook_manager), id(hooks), len(hooks))
+        if plan.hooks_key != hooks_key:
+            plan.hooks_applicable = not hook_manager._is_hook_tool(
+                function_name
+            ) and any(
+                hook_manager._is_hook_applicable(hook, function_name, {})
+                for hook in hooks
+            )
+            plan.hooks_key = hooks_key
+        return plan.hooks_applicable
+
     def _get_tool_instance(self, function_name: str, cache: bool = True):
         """Get or create tool instance with optional caching."""
         # Check cache first
@@ -2345,8 +3881,7 @@ class ToolUniverse:
             return self.callable_functions[function_name]
 
         # Check if known unavailable
-        tool_errors = get_tool_errors()
-        if function_name in tool_errors:
+        if is_tool_unavailable(function_name):
             self.logger.debug(f"Tool {function_name} is unavailable")
             return None
 
@@ -2471,6 +4006,14 @@ class ToolUniverse:
             return {"enabled": False}
         return self.cache_manager.stats()
 
+    def enable_metrics(self, enabled: bool = True):
+        """Turn per-tool execution metrics on or off at runtime."""
+        self.metrics.enabled = enabled
+
+    def get_metrics(self, tool_name: Optional[str] = None) -> Dict[str, Any]:
+        """Return execution metrics for all tools, or for ``tool_name`` only."""
+        return self.metrics.snapshot(tool_name)
+
     def dump_cache(self, namespace: Optional[str] = None):
         """Iterate over cached entries (persistent layer only)."""
         if not self.cache_manager:
@@ -2479,8 +4022,14 @@ class ToolUniverse:
 
     def close(self):
         """Release resources."""
+        executor = getattr(self, "_async_executor", None)
+        if executor is not None:
+            self._async_executor = None
+            executor.shutdown(wait=False)
         if self.cache_manager:
             self.cache_manager.close()
+        if getattr(self, "_snapshot", None) is not None:
+            self._snapshot.close()
 
     def __del__(self):
         try:
@@ -2489,23 +4038,32 @@ class ToolUniverse:
             pass
 
     def get_tool_health(self, tool_name: str = None) -> dict:
-        """Get health status for tool(s)."""
-        tool_errors = get_tool_errors()
-
+        """Get health status for tool(s), including circuit breaker state."""
         if tool_name:
-            if tool_name in tool_errors:
-                return tool_errors[tool_name]
+            tool_error = get_tool_error(tool_name)
+            if tool_error is not None:
+                return tool_error
             elif tool_name in self.all_tool_dict:
-                return {"available": True}
+                health = {"available": True}
+                breakers = self.circuit_breakers.tool_status(tool_name)
+                if breakers:
+                    health["circuit_breakers"] = breakers
+                    health["circuit_open"] = (
+                        self.circuit_breakers.refusal(tool_name) is not None
+                    )
+                return health
             return {"available": False, "error": "Not found"}
 
         # Summary for all tools
+        tool_errors = get_tool_errors()
         return {
             "total": len(self.all_tool_dict),
             "available": len(self.all_tool_dict) - len(tool_errors),
             "unavailable": len(tool_errors),
             "unavailable_list": list(tool_errors.keys()),
             "details": tool_errors,
+            "circuit_open": self.circuit_breakers.open_tools(),
+            "circuit_breakers": self.circuit_breakers.snapshot(),
         }
 
     def check_function_call(self, fcall_str, function_config=None, format="llama"):
@@ -2612,24 +4170,13 @@ class ToolUniverse:
             self.logger.warning("No tools loaded. Call load_tools() first.")
             return []
 
-        filtered_tools = []
-        for tool in self.all_tools:
-            tool_name = tool.get("name", "")
-            tool_type = tool.get("type", "")
-
-            # Check inclusion/exclusion criteria
-            if include_tools and tool_name not in include_tools:
-                continue
-            if exclude_tools and tool_name in exclude_tools:
-                continue
-            if include_tool_types and tool_type not in include_tool_types:
-                continue
-            if exclude_tool_types and tool_type in exclude_tool_types:
-                continue
-
-            filtered_tools.append(tool)
-
-        return filtered_tools
+        self._sync_tool_catalog()
+        return self.tool_catalog.select(
+            include_names=include_tools or None,
+            exclude_names=exclude_tools or None,
+            include_types=include_tool_types or None,
+            exclude_types=exclude_tool_types or None,
+        )
 
     def get_required_parameters(self, tool_name):
         """
@@ -2698,26 +4245,13 @@ class ToolUniverse:
         if pattern is None or pattern == "":
             return self.all_tools
 
-        import re
-
-        flags = 0 if case_sensitive else re.IGNORECASE
-
-        matching_tools = []
-        for tool in self.all_tools:
-            found = False
-
-            if search_in in ["name", "both"]:
-                tool_name = tool.get("name", "")
-                if re.search(pattern, tool_name, flags):
-                    found = True
-
-            if search_in in ["description", "both"] and not found:
-                tool_desc = tool.get("description", "")
-                if re.search(pattern, tool_desc, flags):
-                    found = True
-
-            if found:
-                matching_tools.append(tool)
+        fields = {
+            "name": ("name",),
+            "description": ("description",),
+            "both": ("name", "description"),
+        }.get(search_in, ())
+        self._sync_tool_catalog()
+        matching_tools = self.tool_catalog.search(pattern, fields, case_sensitive)
 
         self.logger.info(
             f"Found {len(matching_tools)} tools matching pattern '{pattern}'"
@@ -2847,26 +4381,13 @@ class ToolUniverse:
             DeprecationWarning,
             stacklevel=2,
         )
-        selected_tools = []
-        # If categories are specified, use self.tool_category_dicts to filter
-        categories = set(self.tool_category_dicts.keys())
-        if include_categories is not None:
-            categories &= set(include_categories)
-        if exclude_categories is not None:
-            categories -= set(exclude_categories)
-        # Gather tools from selected categories
-        for cat in categories:
-            selected_tools.extend(self.tool_category_dicts[cat])
-        # Further filter by names if needed
-        if include_names is not None:
-            selected_tools = [
-                tool for tool in selected_tools if tool["name"] in include_names
-            ]
-        if exclude_names is not None:
-            selected_tools = [
-                tool for tool in selected_tools if tool["name"] not in exclude_names
-            ]
-        return selected_tools
+        self._sync_tool_catalog()
+        return self.tool_catalog.select(
+            include_names=include_names,
+            exclude_names=exclude_names,
+            include_categories=include_categories,
+            exclude_categories=exclude_categories,
+        )
 
     def filter_tool_lists(
         self,
@@ -2944,6 +4465,9 @@ class ToolUniverse:
             self.all_tools = []
             self.all_tool_dict = {}
             self.tool_category_dicts = {}
+            self.tool_catalog.clear()
+            self._catalog_synced = None
+            self._load_history = []
 
         # Use the enhanced load_tools method
         original_count = len(self.all_tools)
@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 from typing import Any, Dict, Optional
 from urllib.parse import quote
 from .base_tool import BaseTool
@@ -132,7 +133,7 @@ class GeneOntologyTool(BaseTool):
             url = self._build_url(url_args)
 
         try:
-            resp = requests.get(
+            resp = http_client.get(
                 url,
                 params=params,
                 timeout=self.timeout,
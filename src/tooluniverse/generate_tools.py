@@ -147,40 +147,87 @@ __all__ = ["{tool_name}"]
 
 
 def generate_init(tool_names: list, output_dir: Path) -> Path:
-    """Generate __init__.py with all imports."""
-    imports = [f"from .{name} import {name}" for name in sorted(tool_names)]
+    """Generate a lazy __init__.py plus an __init__.pyi stub for IDEs.
+
+    ``__init__.py`` maps each tool name to its module and imports the module
+    on first attribute access (PEP 562), so importing one tool does not import
+    the other several hundred. The stub lists every tool as an explicit
+    re-export for type checkers and autocompletion.
+    """
+    names = sorted(tool_names)
 
     # Generate the content without f-string escape sequences
-    all_names = ",\n    ".join(f'"{name}"' for name in sorted(tool_names))
+    all_names = ",\n    ".join(f'"{name}"' for name in names)
+    module_map = ",\n    ".join(f'"{name}": "{name}"' for name in names)
     content = f'''"""
 ToolUniverse Tools
 
-Type-safe Python interface to {len(tool_names)} scientific tools.
-Each tool is in its own module for minimal import overhead.
+Type-safe Python interface to {len(names)} scientific tools.
+Each tool is in its own module, imported on first use.
 
 Usage:
     from tooluniverse.tools import ArXiv_search_papers
     result = ArXiv_search_papers(query="machine learning")
 """
 
+import importlib
+from typing import Any, List
+
 # Import exceptions from main package
 from tooluniverse.exceptions import *
 
 # Import shared client utilities
 from ._shared_client import get_shared_client, reset_shared_client
 
-# Import all tools
-{chr(10).join(imports)}
+# Tool name -> module defining it, relative to this package
+_TOOL_MODULES = {{
+    {module_map}
+}}
 
 __all__ = [
     "get_shared_client",
     "reset_shared_client",
     {all_names}
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    module = importlib.import_module(f".{{module_name}}", __name__)
+    tool = getattr(module, name)
+    # Importing the submodule bound its name to the module; rebind it to the tool.
+    globals()[name] = tool
+    return tool
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 '''
 
     init_path = output_dir / "__init__.py"
     init_path.write_text(content)
+
+    imports = [f"from .{name} import {name} as {name}" for name in names]
+    stub = f"""# Generated by tooluniverse.generate_tools; tools resolve lazily at runtime.
+
+from tooluniverse.exceptions import *
+
+from ._shared_client import (
+    get_shared_client as get_shared_client,
+    reset_shared_client as reset_shared_client,
+)
+
+{chr(10).join(imports)}
+
+__all__ = [
+    "get_shared_client",
+    "reset_shared_client",
+    {all_names}
+]
+"""
+    (output_dir / "__init__.pyi").write_text(stub)
     return init_path
 
 
@@ -410,7 +457,11 @@ def main(format_enabled: Optional[bool] = None) -> None:
     (skip when set to "1").
     """
     from tooluniverse import ToolUniverse
-    from .build_optimizer import cleanup_orphaned_files, get_changed_tools
+    from .build_optimizer import (
+        cleanup_orphaned_files,
+        get_changed_tools,
+        write_tool_manifest,
+    )
 
     print("🔧 Generating tools...")
 
@@ -446,9 +497,9 @@ def main(format_enabled: Optional[bool] = None) -> None:
     else:
         print("✨ No changes detected, skipping tool generation")
 
-    # Always regenerate __init__.py to include all tools
+    # Always regenerate __init__.py (and its stub) to include all tools
     init_path = generate_init(list(tu.all_tool_dict.keys()), output)
-    generated_paths.append(str(init_path))
+    generated_paths.extend([str(init_path), str(init_path.with_suffix(".pyi"))])
 
     # Always ensure _shared_client.py exists
     shared_client_path = output / "_shared_client.py"
@@ -456,6 +507,10 @@ def main(format_enabled: Optional[bool] = None) -> None:
         _create_shared_client(shared_client_path)
         generated_paths.append(str(shared_client_path))
 
+    # Refresh the tool class manifest used for lazy loading
+    manifest_path = write_tool_manifest(output.parent)
+    print(f"🗂️  Updated tool manifest {manifest_path}")
+
     # Determine formatting behavior
     if format_enabled is None:
         # Enabled unless explicitly opted-out via env
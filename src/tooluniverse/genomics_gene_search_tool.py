@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -13,7 +14,7 @@ class GWASGeneSearch(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.ebi.ac.uk/gwas/rest/api"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {"Accept": "application/json", "Content-Type": "application/json"}
         )
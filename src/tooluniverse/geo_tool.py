@@ -8,6 +8,7 @@ genomics data.
 """
 
 import requests
+from . import http_client
 from typing import Dict, Any, List
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -88,7 +89,7 @@ class GEORESTTool(BaseTool):
     def _make_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Perform a GET request and handle common errors."""
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = http_client.get(url, params=params, timeout=30)
             response.raise_for_status()
 
             if self.output_format == "JSON":
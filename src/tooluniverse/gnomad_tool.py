@@ -1,5 +1,5 @@
-import requests
 import json
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -14,7 +14,7 @@ class GnomadTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base = "https://gnomad.broadinstitute.org/api"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update({"Content-Type": "application/json"})
 
     def run(self, arguments):
@@ -4,6 +4,7 @@ from graphql.validation import validate
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 import requests
+from . import http_client
 import copy
 
 
@@ -47,7 +48,7 @@ def remove_none_and_empty_values(json_obj):
 
 
 def execute_query(endpoint_url, query, variables=None):
-    response = requests.post(
+    response = http_client.post(
         endpoint_url, json={"query": query, "variables": variables}
     )
     try:
@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 from typing import Dict, Any, Optional
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -18,7 +19,7 @@ class GWASRESTTool(BaseTool):
         """Make a request to the GWAS Catalog API."""
         url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = http_client.get(url, params=params, timeout=30)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
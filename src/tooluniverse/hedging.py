@@ -0,0 +1,223 @@
+"""
+Hedged requests for idempotent, latency-sensitive tools.
+
+A hedged call starts one attempt. If that attempt is still running after a
+delay taken from the tool's own recent latencies (its p95 by default), an
+identical second attempt starts. The first attempt to succeed wins. The other
+attempt's deadline is cancelled, so cooperative code (the shared HTTP client,
+``check_deadline``) stops early, and its result is discarded. Hedging runs
+inside ToolUniverse's cache lookup and singleflight guard, so only the
+winning result is ever stored.
+
+Only tools that declare it are hedged, with a ``hedge`` object in the tool
+config::
+
+    "hedge": {
+        "percentile": 95,      # hedge calls slower than this percentile
+        "budget": 0.05,        # at most 5% extra attempts
+        "min_samples": 20,     # latencies to observe before hedging
+        "min_delay": 0.05,     # seconds; never hedge sooner than this
+        "max_delay": null,     # seconds; cap on the hedge delay
+        "window": 200          # recent latencies kept per tool
+    }
+
+``"hedge": true`` uses these defaults. Only declare it for idempotent reads
+against replicated services, since every hedge is a real extra request. Set
+``TOOLUNIVERSE_HEDGING=false`` to disable hedging altogether.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import math
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from .deadline import Deadline, DeadlineExceeded, current_deadline, deadline_scope
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "percentile": 95.0,
+    "budget": 0.05,
+    "min_samples": 20,
+    "min_delay": 0.05,
+    "max_delay": None,
+    "window": 200,
+}
+
+
+def hedging_enabled() -> bool:
+    return os.getenv("TOOLUNIVERSE_HEDGING", "true").lower() not in (
+        "0",
+        "false",
+        "no",
+        "off",
+    )
+
+
+class HedgePolicy:
+    """Latency samples, hedge budget and hedged execution for one tool."""
+
+    def __init__(self, **settings: Any):
+        merged = {**DEFAULT_SETTINGS, **settings}
+        self.percentile = min(100.0, max(0.0, float(merged["percentile"])))
+        self.budget = max(0.0, float(merged["budget"]))
+        self.min_samples = max(1, int(merged["min_samples"]))
+        self.min_delay = max(0.0, float(merged["min_delay"]))
+        max_delay = merged["max_delay"]
+        self.max_delay = float(max_delay) if max_delay is not None else None
+        window = max(1, int(merged["window"]))
+        self._samples: Deque[float] = deque(maxlen=window)
+        # Every call earns ``budget`` of a hedge; a burst can spend a window's worth.
+        self._max_tokens = max(1.0, self.budget * window)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there are too few samples."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(
+            len(ordered) - 1,
+            max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1),
+        )
+        delay = max(self.min_delay, ordered[index])
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+    def record(self, seconds: float):
+        """Add the latency of one successful attempt to the samples."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def _start_call(self):
+        with self._lock:
+            self.calls += 1
+            self._tokens = min(self._max_tokens, self._tokens + self.budget)
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self.hedges += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        delay = self.delay()
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "samples": len(self._samples),
+                "delay": delay,
+            }
+
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func``, hedging it with a second attempt if it runs slow.
+
+        Both attempts run on daemon threads under their own child of the
+        current deadline. The first attempt to return wins. An attempt that
+        raises only decides the call once no other attempt can still succeed,
+        and then its exception propagates. If the caller's deadline passes
+        first, both attempts are cancelled and ``DeadlineExceeded`` is raised.
+        """
+        self._start_call()
+        delay = self.delay()
+        if delay is None:
+            start = time.monotonic()
+            result = func(*args, **kwargs)
+            self.record(time.monotonic() - start)
+            return result
+
+        parent = current_deadline()
+        outcomes: "queue.Queue[tuple]" = queue.Queue()
+        attempts = [self._launch(func, args, kwargs, parent, outcomes, 0)]
+        running = len(attempts)
+        error: Optional[BaseException] = None
+        while True:
+            # Wake up every ``delay``: a slow first attempt is hedged as soon as
+            # the budget allows, and the caller's own deadline bounds the wait
+            # even when an attempt is stuck.
+            try:
+                index, ok, value = outcomes.get(timeout=_wait(delay, parent))
+            except queue.Empty:
+                if parent is not None and parent.expired:
+                    for deadline, _ in attempts:
+                        deadline.cancel()
+                    raise DeadlineExceeded(parent.describe())
+                if len(attempts) == 1 and self._take_hedge():
+                    attempts.append(
+                        self._launch(func, args, kwargs, parent, outcomes, 1)
+                    )
+                    running += 1
+                continue
+            running -= 1
+            if ok:
+                break
+            error = error or value
+            if running == 0:
+                raise error
+
+        now = time.monotonic()
+        for other, (deadline, start) in enumerate(attempts):
+            if other == index:
+                self.record(now - start)
+            else:
+                deadline.cancel()
+        if index == 1:
+            # The first attempt took at least this long; keep it in the
+            # samples so the delay does not drift below the real tail.
+            self.record(now - attempts[0][1])
+            with self._lock:
+                self.hedge_wins += 1
+        return value
+
+    def _launch(self, func, args, kwargs, parent, outcomes, index):
+        # Without a parent the attempt only needs to be cancellable: its
+        # remaining time reads as None, so timeouts keep their defaults.
+        deadline = Deadline(parent.remaining() if parent is not None else None, parent)
+        context = contextvars.copy_context()
+
+        def attempt():
+            try:
+                value = context.run(_call_bound, deadline, func, args, kwargs)
+            except BaseException as e:  # handed to the waiting caller
+                outcomes.put((index, False, e))
+            else:
+                outcomes.put((index, True, value))
+
+        threading.Thread(target=attempt, name="ToolUniverseHedge", daemon=True).start()
+        return deadline, time.monotonic()
+
+
+def _wait(delay: float, parent: Optional[Deadline]) -> float:
+    remaining = parent.remaining() if parent is not None else None
+    return delay if remaining is None else min(delay, remaining)
+
+
+def _call_bound(deadline, func, args, kwargs):
+    with deadline_scope(deadline):
+        return func(*args, **kwargs)
+
+
+def hedge_policy(tool_config: Optional[Dict[str, Any]]) -> Optional[HedgePolicy]:
+    """Build the hedge policy declared in a tool config, if any."""
+    if not isinstance(tool_config, dict) or not hedging_enabled():
+        return None
+    settings = tool_config.get("hedge")
+    if settings is True:
+        settings = {}
+    if not isinstance(settings, dict):
+        return None
+    return HedgePolicy(**{k: v for k, v in settings.items() if k in DEFAULT_SETTINGS})
@@ -0,0 +1,297 @@
+"""
+Shared HTTP client for ToolUniverse tools.
+
+Tools call :func:`get`, :func:`post` or :func:`request` instead of the bare
+``requests`` functions so that every call reuses one pooled
+``requests.Session``: keep-alive connections per host (no TCP+TLS handshake
+per call), a default timeout, and compressed responses (gzip/deflate, plus
+brotli/zstd when the decoders are installed).
+
+Pool sizes and the default timeout come from the environment:
+
+- ``TOOLUNIVERSE_HTTP_POOL_CONNECTIONS``: number of per-host pools kept (default 32)
+- ``TOOLUNIVERSE_HTTP_POOL_MAXSIZE``: connections kept per host (default 16)
+- ``TOOLUNIVERSE_HTTP_TIMEOUT``: default timeout in seconds (default 60)
+
+Tools can override request options with an ``"http"`` object in their JSON
+config (``timeout``, ``headers``, ``verify``, ``proxies``,
+``allow_redirects``); ToolUniverse applies it while the tool runs. Timeouts are
+always capped by the deadline of the current call (see :mod:`.deadline`).
+
+Every request also passes the per-host rate limits of :mod:`.rate_limiter`,
+so concurrent batches cannot exceed what an upstream provider allows, and the
+per-host circuit breakers of :mod:`.circuit_breaker`, so a host that is down
+fails fast. Tools that keep their own ``requests.Session`` get the same
+behaviour from :func:`rate_limited_session`.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from .batch_scheduler import note_throttled
+from .circuit_breaker import get_circuit_breakers
+from .deadline import check_deadline, remaining_time
+from .rate_limiter import get_rate_limiter
+
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_TIMEOUT = 60.0
+
+# Request options a tool config may override.
+TOOL_OPTION_KEYS = ("timeout", "headers", "verify", "proxies", "allow_redirects")
+
+_tool_options: contextvars.ContextVar[Optional[Dict[str, Any]]] = (
+    contextvars.ContextVar("tooluniverse_http_options", default=None)
+)
+
+
+def _env_number(name: str, default, cast):
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        return default
+
+
+# Responses that count as upstream failures for the circuit breaker.
+SERVER_ERRORS = frozenset((500, 502, 503, 504))
+
+# Longest Retry-After pause honoured for a host, in seconds.
+MAX_RETRY_AFTER = 300.0
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = when.timestamp() - time.time()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that applies the host's rate limit and circuit breaker.
+
+    Requests are refused with :class:`~.deadline.DeadlineExceeded` once the
+    current call's deadline has expired or been cancelled, and their timeout
+    is capped by the time left.
+
+    A 429/503 response carrying ``Retry-After`` pauses every caller of that
+    host, not just the one that received it. Connection errors, timeouts and
+    5xx responses count against the host's breaker; while it is open, requests
+    fail at once with :class:`~.circuit_breaker.CircuitOpenError`.
+    """
+
+    def send(self, request, **kwargs):
+        # Sessions of tools that bypass HTTPClient also stop once the call's
+        # deadline has passed or it was cancelled (e.g. a losing hedge)
+        check_deadline()
+        kwargs["timeout"] = _cap_timeout(kwargs.get("timeout"))
+        # Keep the port: services on one machine fail independently.
+        host = urlsplit(request.url).netloc.rpartition("@")[2].lower()
+        breakers = get_circuit_breakers()
+        breakers.before_request(host)
+        limiter = get_rate_limiter()
+        limiter.acquire(request.url)
+        try:
+            response = super().send(request, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            breakers.after_request(
+                host, False, timeout=isinstance(e, requests.exceptions.Timeout)
+            )
+            raise
+        breakers.after_request(host, response.status_code not in SERVER_ERRORS)
+        if response.status_code == 429:
+            note_throttled()
+        if response.status_code in (429, 503):
+            seconds = _retry_after_seconds(response.headers.get("Retry-After"))
+            if seconds:
+                limiter.backoff(request.url, seconds)
+        return response
+
+
+def rate_limited_session(session: Optional[requests.Session] = None, **adapter_kwargs):
+    """Return ``session`` (or a new one) with rate-limited adapters mounted.
+
+    ``adapter_kwargs`` are passed to :class:`RateLimitedAdapter`, e.g.
+    ``max_retries``.
+    """
+    session = session if session is not None else requests.Session()
+    adapter = RateLimitedAdapter(**adapter_kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class HTTPClient:
+    """Thread-safe pooled HTTP client built on a shared ``requests.Session``."""
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.pool_connections = (
+            pool_connections
+            if pool_connections is not None
+            else _env_number(
+                "TOOLUNIVERSE_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS, int
+            )
+        )
+        self.pool_maxsize = (
+            pool_maxsize
+            if pool_maxsize is not None
+            else _env_number(
+                "TOOLUNIVERSE_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE, int
+            )
+        )
+        self.timeout = (
+            timeout
+            if timeout is not None
+            else _env_number("TOOLUNIVERSE_HTTP_TIMEOUT", DEFAULT_TIMEOUT, float)
+        )
+        self.session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = RateLimitedAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=False,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Advertise every content coding urllib3 can decode here (br/zstd when
+        # the optional decoders are installed).
+        session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)[
+            "accept-encoding"
+        ]
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the shared session (``requests.request`` signature)."""
+        options = _tool_options.get()
+        if options:
+            kwargs = _apply_tool_options(kwargs, options)
+        timeout = kwargs.get("timeout")
+        if timeout is None:
+            timeout = self.timeout
+        kwargs["timeout"] = _cap_timeout(timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, params=None, **kwargs) -> requests.Response:
+        return self.request("GET", url, params=params, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs) -> requests.Response:
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+def _apply_tool_options(kwargs: Dict[str, Any], options: Dict[str, Any]):
+    kwargs = dict(kwargs)
+    for key, value in options.items():
+        if key == "headers":
+            # Call-site headers win over configured defaults.
+            kwargs["headers"] = {**value, **(kwargs.get("headers") or {})}
+        else:
+            kwargs[key] = value
+    return kwargs
+
+
+def _cap_timeout(timeout):
+    """Cap a ``requests`` timeout (number or (connect, read) tuple) by the deadline."""
+    if isinstance(timeout, tuple):
+        return tuple(remaining_time(part) for part in timeout)
+    return remaining_time(timeout)
+
+
+def tool_http_options(
+    tool_config: Optional[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """Extract the HTTP overrides declared in a tool config, if any."""
+    if not isinstance(tool_config, dict):
+        return None
+    options = tool_config.get("http")
+    if not isinstance(options, dict):
+        return None
+    options = {k: v for k, v in options.items() if k in TOOL_OPTION_KEYS}
+    return options or None
+
+
+@contextmanager
+def tool_options_scope(options: Optional[Dict[str, Any]]) -> Iterator[None]:
+    """Apply a tool's HTTP overrides to requests made inside the block."""
+    token = _tool_options.set(options)
+    try:
+        yield
+    finally:
+        _tool_options.reset(token)
+
+
+_shared_client: Optional[HTTPClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _shared_client
+    client = _shared_client
+    if client is None:
+        with _shared_lock:
+            if _shared_client is None:
+                _shared_client = HTTPClient()
+            client = _shared_client
+    return client
+
+
+def configure_http_client(**kwargs) -> HTTPClient:
+    """Replace the shared client, e.g. to change pool sizes or the default timeout."""
+    global _shared_client
+    with _shared_lock:
+        old, _shared_client = _shared_client, HTTPClient(**kwargs)
+    if old is not None:
+        old.close()
+    return _shared_client
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    return get_http_client().request(method, url, **kwargs)
+
+
+def get(url: str, params=None, **kwargs) -> requests.Response:
+    return get_http_client().get(url, params=params, **kwargs)
+
+
+def post(url: str, data=None, json=None, **kwargs) -> requests.Response:
+    return get_http_client().post(url, data=data, json=json, **kwargs)
+
+
+def head(url: str, **kwargs) -> requests.Response:
+    return get_http_client().head(url, **kwargs)
@@ -1,5 +1,6 @@
 import networkx as nx
 import requests
+from . import http_client
 import urllib.parse
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -54,7 +55,7 @@ class HumanBaseTool(BaseTool):
         encoded_gene_name = urllib.parse.quote(gene_name)
         url = f"https://mygene.info/v3/query?q={encoded_gene_name}&fields=symbol,alias&species=human"
 
-        response = requests.get(url)
+        response = http_client.get(url)
         if response.status_code != 200:
             return f"Error querying MyGene.info API: {response.status_code}"
 
@@ -121,7 +122,7 @@ class HumanBaseTool(BaseTool):
             }
 
             # Send the request to the Entrez API
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
 
             # Check if the response was successful
             if response.status_code == 200:
@@ -181,7 +182,7 @@ class HumanBaseTool(BaseTool):
 
         # Retrieve tissue-specific PPI
         try:
-            response = requests.get(network_url)
+            response = http_client.get(network_url)
             response.raise_for_status()
             data = response.json()
 
@@ -202,7 +203,7 @@ class HumanBaseTool(BaseTool):
                     target = data["genes"][e["target"]]["standard_name"]
                     weight = e["weight"]
 
-                    edge_response = requests.get(
+                    edge_response = http_client.get(
                         edge_type_url.format(
                             tissue=tissue,
                             source=G.nodes[source]["entrez"],
@@ -224,7 +225,7 @@ class HumanBaseTool(BaseTool):
         bp_url = f"https://hb.flatironinstitute.org/api/terms/annotated/?database=gene-ontology-bp&entrez={gene_id}&max_term_size=20"
 
         try:
-            response = requests.get(bp_url)
+            response = http_client.get(bp_url)
             response.raise_for_status()
             data = response.json()
 
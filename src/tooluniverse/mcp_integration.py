@@ -145,6 +145,7 @@ def _load_tools_from_mcp_server(
         # Add the auto-loader configuration directly to the tools list
         self.all_tools.append(loader_config)
         self.all_tool_dict[loader_name] = loader_config
+        self.tool_catalog.add(loader_config)
 
         print(f"✅ Created MCP auto-loader for {server_url}")
 
@@ -0,0 +1,304 @@
+"""
+Execution metrics for ToolUniverse.
+
+Provides a lightweight, thread-safe registry that ``ToolUniverse.run_one_function``
+feeds with per-tool call counts, error counts by :class:`ToolError` class,
+per-phase latency histograms, cache hit/miss/singleflight-wait counts and
+result sizes. Snapshots are available as plain dictionaries
+(``ToolUniverse.get_metrics()``) or in the Prometheus text exposition format.
+
+When the registry is disabled the execution path only performs a single
+attribute check per call.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+# Upper bounds (seconds) for latency histograms.
+LATENCY_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Upper bounds (bytes) for result size histograms.
+SIZE_BUCKETS = (
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+
+PHASES = ("validation", "cache_lookup", "execution", "hooks", "serialization")
+
+
+class Histogram:
+    """Fixed-bucket cumulative histogram (Prometheus semantics)."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            cumulative.append([bound, running])
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": cumulative + [["+Inf", self.count]],
+        }
+
+
+class ToolMetrics:
+    """Counters and histograms for a single tool."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors: Dict[str, int] = {}
+        self.cache: Dict[str, int] = {"hit": 0, "miss": 0, "singleflight_wait": 0}
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.phases: Dict[str, Histogram] = {}
+        self.result_bytes = Histogram(SIZE_BUCKETS)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": dict(self.errors),
+            "cache": dict(self.cache),
+            "latency_seconds": self.latency.snapshot(),
+            "phase_seconds": {
+                phase: histogram.snapshot() for phase, histogram in self.phases.items()
+            },
+            "result_bytes": self.result_bytes.snapshot(),
+        }
+
+
+class CallObservation:
+    """Timing and outcome details collected for one tool call."""
+
+    __slots__ = (
+        "registry",
+        "tool_name",
+        "start",
+        "last",
+        "phases",
+        "cache_event",
+        "singleflight_wait",
+    )
+
+    def __init__(self, registry: "MetricsRegistry", tool_name: str):
+        self.registry = registry
+        self.tool_name = tool_name
+        self.start = self.last = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.cache_event: Optional[str] = None
+        self.singleflight_wait = False
+
+    def mark(self, phase: str):
+        """Attribute the time since the previous mark to ``phase``."""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self.last)
+        self.last = now
+
+    def skip(self):
+        """Restart the phase clock without attributing the elapsed time."""
+        self.last = time.perf_counter()
+
+    def finish(self, result: Any):
+        """Record the call outcome in the owning registry."""
+        self.registry.record(self, result, time.perf_counter() - self.start)
+
+
+def _error_type(result: Any) -> Optional[str]:
+    if not isinstance(result, dict) or "error" not in result:
+        return None
+    details = result.get("error_details")
+    if isinstance(details, dict) and details.get("type"):
+        return str(details["type"])
+    return "Error"
+
+
+def _result_size(result: Any) -> int:
+    if isinstance(result, (bytes, bytearray)):
+        return len(result)
+    if isinstance(result, str):
+        return len(result.encode("utf-8"))
+    try:
+        return len(json.dumps(result, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(result).encode("utf-8"))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Thread-safe registry of per-tool execution metrics."""
+
+    def __init__(self, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = os.getenv("TOOLUNIVERSE_METRICS_ENABLED", "false").lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+        self.enabled = enabled
+        self._tools: Dict[str, ToolMetrics] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, tool_name: str) -> Optional[CallObservation]:
+        """Start observing a call, or return None when disabled."""
+        if not self.enabled:
+            return None
+        return CallObservation(self, tool_name)
+
+    def record(self, observation: CallObservation, result: Any, total: float):
+        error_type = _error_type(result)
+        size = _result_size(result)
+        # Sizing the result is the serialization cost of observability itself.
+        observation.mark("serialization")
+
+        with self._lock:
+            metrics = self._tools.get(observation.tool_name)
+            if metrics is None:
+                metrics = self._tools[observation.tool_name] = ToolMetrics()
+            metrics.calls += 1
+            metrics.latency.observe(total)
+            if error_type is not None:
+                metrics.errors[error_type] = metrics.errors.get(error_type, 0) + 1
+            if observation.cache_event is not None:
+                metrics.cache[observation.cache_event] += 1
+            if observation.singleflight_wait:
+                metrics.cache["singleflight_wait"] += 1
+            for phase, seconds in observation.phases.items():
+                histogram = metrics.phases.get(phase)
+                if histogram is None:
+                    histogram = metrics.phases[phase] = Histogram(LATENCY_BUCKETS)
+                histogram.observe(seconds)
+            metrics.result_bytes.observe(size)
+
+    def reset(self):
+        with self._lock:
+            self._tools.clear()
+
+    def snapshot(self, tool_name: Optional[str] = None) -> Dict[str, Any]:
+        """Return metrics as a JSON-serializable dictionary."""
+        with self._lock:
+            if tool_name is not None:
+                metrics = self._tools.get(tool_name)
+                return metrics.snapshot() if metrics else {}
+            tools = {name: m.snapshot() for name, m in self._tools.items()}
+        totals = {
+            "calls": sum(t["calls"] for t in tools.values()),
+            "errors": sum(sum(t["errors"].values()) for t in tools.values()),
+            "cache_hits": sum(t["cache"]["hit"] for t in tools.values()),
+            "cache_misses": sum(t["cache"]["miss"] for t in tools.values()),
+            "singleflight_waits": sum(
+                t["cache"]["singleflight_wait"] for t in tools.values()
+            ),
+        }
+        return {"enabled": self.enabled, "totals": totals, "tools": tools}
+
+    def to_prometheus(self, prefix: str = "tooluniverse") -> str:
+        """Render metrics in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            tools = sorted(
+                (name, metrics.snapshot()) for name, metrics in self._tools.items()
+            )
+
+        lines: List[str] = []
+
+        def header(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def labels(**values: str) -> str:
+            inner = ",".join(
+                f'{k}="{_escape_label(str(v))}"' for k, v in values.items()
+            )
+            return "{" + inner + "}"
+
+        def histogram(name: str, snapshot: Dict[str, Any], **label_values: str):
+            for bound, count in snapshot["buckets"]:
+                le = bound if bound == "+Inf" else repr(float(bound))
+                lines.append(
+                    f"{prefix}_{name}_bucket{labels(**label_values, le=le)} {count}"
+                )
+            lines.append(
+                f"{prefix}_{name}_sum{labels(**label_values)} {snapshot['sum']}"
+            )
+            lines.append(
+                f"{prefix}_{name}_count{labels(**label_values)} {snapshot['count']}"
+            )
+
+        header("tool_calls_total", "counter", "Tool calls executed.")
+        for name, snap in tools:
+            lines.append(
+                f"{prefix}_tool_calls_total{labels(tool=name)} {snap['calls']}"
+            )
+
+        header("tool_errors_total", "counter", "Tool calls that returned an error.")
+        for name, snap in tools:
+            for error_type, count in sorted(snap["errors"].items()):
+                lines.append(
+                    f"{prefix}_tool_errors_total"
+                    f"{labels(tool=name, error_type=error_type)} {count}"
+                )
+
+        header("tool_cache_events_total", "counter", "Result cache events.")
+        for name, snap in tools:
+            for event, count in sorted(snap["cache"].items()):
+                lines.append(
+                    f"{prefix}_tool_cache_events_total"
+                    f"{labels(tool=name, event=event)} {count}"
+                )
+
+        header("tool_latency_seconds", "histogram", "End-to-end call latency.")
+        for name, snap in tools:
+            histogram("tool_latency_seconds", snap["latency_seconds"], tool=name)
+
+        header("tool_phase_seconds", "histogram", "Call latency by phase.")
+        for name, snap in tools:
+            for phase, phase_snap in sorted(snap["phase_seconds"].items()):
+                histogram("tool_phase_seconds", phase_snap, tool=name, phase=phase)
+
+        header("tool_result_bytes", "histogram", "Serialized result size.")
+        for name, snap in tools:
+            histogram("tool_result_bytes", snap["result_bytes"], tool=name)
+
+        return "\n".join(lines) + "\n"
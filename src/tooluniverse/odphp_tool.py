@@ -1,5 +1,6 @@
 import re
 import requests
+from . import http_client
 from typing import Dict, Any, Optional, List
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -23,7 +24,7 @@ class ODPHPRESTTool(BaseTool):
     def _make_request(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{ODPHP_BASE_URL}{self.endpoint}"
         try:
-            resp = requests.get(url, params=params, timeout=30)
+            resp = http_client.get(url, params=params, timeout=30)
             resp.raise_for_status()
             data = resp.json()
             return {
@@ -224,7 +225,7 @@ class ODPHPOutlinkFetch(BaseTool):
         out: List[Dict[str, Any]] = []
         for u in urls[:3]:
             try:
-                resp = requests.get(u, timeout=self.timeout, allow_redirects=True)
+                resp = http_client.get(u, timeout=self.timeout, allow_redirects=True)
                 ct = resp.headers.get("Content-Type", "")
                 item: Dict[str, Any] = {
                     "url": u,
@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 import urllib.parse
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -77,7 +78,7 @@ class OpenAlexTool(BaseTool):
             params["filter"] = ",".join(filters)
 
         try:
-            response = requests.get(self.base_url, params=params)
+            response = http_client.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -215,7 +216,7 @@ class OpenAlexTool(BaseTool):
             url = f"https://api.openalex.org/works/https://doi.org/{doi}"
             params = {"mailto": "support@openalex.org"}
 
-            response = requests.get(url, params=params)
+            response = http_client.get(url, params=params)
             response.raise_for_status()
             work = response.json()
 
@@ -244,7 +245,7 @@ class OpenAlexTool(BaseTool):
                 "mailto": "support@openalex.org",
             }
 
-            response = requests.get(self.base_url, params=params)
+            response = http_client.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
 
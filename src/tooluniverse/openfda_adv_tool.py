@@ -1,6 +1,7 @@
 import os
 import copy
 import requests
+from . import http_client
 import urllib.parse
 from .base_tool import BaseTool
 from .tool_registry import register_tool
@@ -175,7 +176,7 @@ class FDADrugAdverseEventTool(BaseTool):
 
         # API request
         try:
-            response = requests.get(url)
+            response = http_client.get(url)
             response.raise_for_status()
             response = response.json()
             if "results" in response:
@@ -274,7 +275,7 @@ class FDACountAdditiveReactionsTool(FDADrugAdverseEventTool):
             url = f"{self.endpoint_url}?search={search_query}&count={self.count_field}"
 
         try:
-            resp = requests.get(url)
+            resp = http_client.get(url)
             resp.raise_for_status()
             results = resp.json().get("results", [])
             results = self._post_process(results)
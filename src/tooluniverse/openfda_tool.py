@@ -1,4 +1,4 @@
-import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 import copy
@@ -218,7 +218,7 @@ def search_openfda(
 
     print(full_url)
 
-    response = requests.get(full_url)
+    response = http_client.get(full_url)
 
     # Get the JSON response
     response_data = response.json()
@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -35,7 +36,7 @@ class OSFPreprintsTool(BaseTool):
             params["filter[provider]"] = provider
 
         try:
-            resp = requests.get(self.base_url, params=params, timeout=20)
+            resp = http_client.get(self.base_url, params=params, timeout=20)
             resp.raise_for_status()
             data = resp.json()
         except requests.RequestException as e:
@@ -0,0 +1,537 @@
+"""
+Precompiled parameter validation for ToolUniverse tools.
+
+Each tool's ``parameter`` schema is compiled once into a
+:class:`ParameterValidator`. A single pass over the call arguments then covers
+what previously took two independent scans per call:
+
+- the JSON Schema check performed by :meth:`BaseTool.validate_parameters`
+  (previously ``jsonschema.validate``, which rebuilt and re-checked the
+  validator on every call), and
+- the call-format check performed by ``utils.evaluate_function_call``
+  (required parameters, unknown parameters and basic types).
+
+Simple schemas (the vast majority of tool definitions) are checked by
+precompiled per-property predicates. Whenever a predicate cannot prove an
+argument valid, the cached ``jsonschema`` validator is consulted so that error
+messages and structures stay identical to the previous behaviour.
+"""
+
+import math
+import numbers
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .exceptions import ToolError, ToolValidationError
+
+# Keywords that never affect validation outcome (annotations only).
+_ANNOTATION_KEYWORDS = frozenset(
+    {
+        "description",
+        "default",
+        "title",
+        "examples",
+        "format",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "$comment",
+    }
+)
+
+_TOP_LEVEL_KEYWORDS = (
+    frozenset({"type", "properties", "required", "additionalProperties"})
+    | _ANNOTATION_KEYWORDS
+)
+
+# Type names accepted by ``utils.evaluate_function_call``.
+_CALL_TYPE_MAP = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+_INTEGER_PATTERN = re.compile(r"^[+-]?\d+$")
+_TRUE_STRINGS = frozenset({"true", "1", "yes"})
+_FALSE_STRINGS = frozenset({"false", "0", "no"})
+
+_Predicate = Callable[[Any], bool]
+_MISSING = object()
+
+
+def _json_type_predicate(type_name: str) -> Optional[_Predicate]:
+    """Return a predicate matching jsonschema's draft 2020-12 type semantics."""
+    if type_name == "string":
+        return lambda value: isinstance(value, str)
+    if type_name == "integer":
+        return lambda value: (
+            isinstance(value, int) and not isinstance(value, bool)
+        ) or (isinstance(value, float) and value.is_integer())
+    if type_name == "number":
+        return lambda value: isinstance(value, numbers.Number) and not isinstance(
+            value, bool
+        )
+    if type_name == "boolean":
+        return lambda value: isinstance(value, bool)
+    if type_name == "object":
+        return lambda value: isinstance(value, dict)
+    if type_name == "array":
+        return lambda value: isinstance(value, list)
+    if type_name == "null":
+        return lambda value: value is None
+    return None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Number) and not isinstance(value, bool)
+
+
+def _scalar_in(value: Any, options: List[Any]) -> bool:
+    """Strict membership test that never conflates ``True`` with ``1``."""
+    if isinstance(value, (dict, list)):
+        return False
+    return any(type(option) is type(value) and option == value for option in options)
+
+
+def _compile_property(schema: Any) -> Optional[_Predicate]:
+    """Compile a property schema into a predicate that proves validity.
+
+    The predicate returns True only when the value is certainly valid under
+    jsonschema; False means "not proven" and defers to the full validator.
+    Returns None when the schema uses keywords the fast path does not model.
+    """
+    if not isinstance(schema, dict):
+        return None
+
+    checks: List[_Predicate] = []
+    for keyword, expected in schema.items():
+        if keyword in _ANNOTATION_KEYWORDS:
+            continue
+        if keyword == "type":
+            type_names = expected if isinstance(expected, list) else [expected]
+            predicates = [
+                _json_type_predicate(name) if isinstance(name, str) else None
+                for name in type_names
+            ]
+            if not predicates or any(p is None for p in predicates):
+                return None
+            if len(predicates) == 1:
+                checks.append(predicates[0])
+            else:
+                checks.append(
+                    lambda value, preds=tuple(predicates): any(p(value) for p in preds)
+                )
+        elif keyword == "enum" and isinstance(expected, list):
+            checks.append(lambda value, options=expected: _scalar_in(value, options))
+        elif keyword == "const":
+            checks.append(lambda value, option=expected: _scalar_in(value, [option]))
+        elif keyword in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"):
+            if not _is_number(expected):
+                return None
+            compare = {
+                "minimum": lambda value, bound: value >= bound,
+                "maximum": lambda value, bound: value <= bound,
+                "exclusiveMinimum": lambda value, bound: value > bound,
+                "exclusiveMaximum": lambda value, bound: value < bound,
+            }[keyword]
+            checks.append(
+                lambda value, bound=expected, cmp=compare: not _is_number(value)
+                or cmp(value, bound)
+            )
+        elif keyword in ("minLength", "maxLength"):
+            if not isinstance(expected, int) or isinstance(expected, bool):
+                return None
+            if keyword == "minLength":
+                checks.append(
+                    lambda value, bound=expected: not isinstance(value, str)
+                    or len(value) >= bound
+                )
+            else:
+                checks.append(
+                    lambda value, bound=expected: not isinstance(value, str)
+                    or len(value) <= bound
+                )
+        elif keyword == "pattern" and isinstance(expected, str):
+            try:
+                search = re.compile(expected).search
+            except re.error:
+                return None
+            checks.append(
+                lambda value, search=search: not isinstance(value, str)
+                or search(value) is not None
+            )
+        elif keyword in ("minItems", "maxItems"):
+            if not isinstance(expected, int) or isinstance(expected, bool):
+                return None
+            if keyword == "minItems":
+                checks.append(
+                    lambda value, bound=expected: not isinstance(value, list)
+                    or len(value) >= bound
+                )
+            else:
+                checks.append(
+                    lambda value, bound=expected: not isinstance(value, list)
+                    or len(value) <= bound
+                )
+        elif keyword == "items":
+            item_check = _compile_property(expected)
+            if item_check is None:
+                return None
+            checks.append(
+                lambda value, check=item_check: not isinstance(value, list)
+                or all(check(item) for item in value)
+            )
+        else:
+            return None
+
+    if not checks:
+        return lambda value: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda value, checks=tuple(checks): all(check(value) for check in checks)
+
+
+def _call_type_of(param_schema: Dict[str, Any]) -> Optional[Any]:
+    """Extract the expected type exactly as ``utils.evaluate_function_call`` does."""
+    if "type" in param_schema:
+        return param_schema["type"]
+    if "anyOf" in param_schema:
+        for type_option in param_schema["anyOf"]:
+            if type_option.get("type") and type_option["type"] != "null":
+                return type_option["type"]
+    return None
+
+
+def _coerce_value(value: Any, type_name: Any) -> Any:
+    """Apply lossless string conversions for numeric and boolean fields."""
+    if not isinstance(value, str):
+        if type_name == "integer" and isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    text = value.strip()
+    if type_name == "integer" and _INTEGER_PATTERN.match(text):
+        return int(text)
+    if type_name == "number":
+        if _INTEGER_PATTERN.match(text):
+            return int(text)
+        try:
+            parsed = float(text)
+        except ValueError:
+            return value
+        return parsed if math.isfinite(parsed) else value
+    if type_name == "boolean":
+        lowered = text.lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    return value
+
+
+class ParameterValidator:
+    """Compiled validation plan for one tool's ``parameter`` schema."""
+
+    def __init__(self, tool_config: Dict[str, Any], coerce: Optional[bool] = None):
+        self.tool_config = tool_config
+        self.schema = tool_config.get("parameter", {})
+        self.tool_name = tool_config.get("name")
+        if coerce is None:
+            coerce = tool_config.get("coerce_parameters")
+        if coerce is None:
+            coerce = os.getenv("TOOLUNIVERSE_COERCE_PARAMETERS", "false").lower() in (
+                "true",
+                "1",
+                "yes",
+            )
+        self.coerce = bool(coerce)
+
+        self._validator = None
+        self._schema_error: Optional[Exception] = None
+        self._compile_jsonschema()
+
+        # Fast path state (None = always defer to jsonschema)
+        self._fast_properties: Optional[Dict[str, Optional[_Predicate]]] = None
+        self._fast_required: Tuple[str, ...] = ()
+        self._allow_additional = True
+        self._compile_fast_path()
+
+        # evaluate_function_call state (None = delegate to utils)
+        self._call_properties: Optional[Dict[str, Any]] = None
+        self._call_required: Tuple[str, ...] = ()
+        self._call_no_arguments = False
+        self._compile_call_check()
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+    def _compile_jsonschema(self) -> None:
+        if not self.schema:
+            return
+        try:
+            from jsonschema.validators import validator_for
+
+            cls = validator_for(self.schema)
+            cls.check_schema(self.schema)
+            self._validator = cls(self.schema)
+        except Exception as e:
+            self._schema_error = e
+
+    def _compile_fast_path(self) -> None:
+        schema = self.schema
+        if (
+            self._validator is None
+            or not isinstance(schema, dict)
+            or schema.get("type") != "object"
+            or not set(schema) <= _TOP_LEVEL_KEYWORDS
+        ):
+            return
+
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        additional = schema.get("additionalProperties", True)
+        if (
+            not isinstance(properties, dict)
+            or not isinstance(required, list)
+            or not all(isinstance(name, str) for name in required)
+            or not isinstance(additional, bool)
+        ):
+            return
+
+        self._fast_properties = {
+            name: _compile_property(prop) for name, prop in properties.items()
+        }
+        self._fast_required = tuple(required)
+        self._allow_additional = additional
+
+    def _compile_call_check(self) -> None:
+        schema = self.schema
+        if not isinstance(schema, dict) or "properties" not in schema:
+            return
+        properties = schema["properties"]
+        if properties is None:
+            self._call_no_arguments = True
+            self._call_properties = {}
+            return
+        if not isinstance(properties, dict):
+            return
+
+        compiled: Dict[str, Any] = {}
+        required: List[str] = []
+        for name, prop in properties.items():
+            if not isinstance(prop, dict):
+                return
+            if prop.get("required", False):
+                required.append(name)
+            expected_type = _call_type_of(prop)
+            if expected_type is not None and (
+                not isinstance(expected_type, str) or expected_type == "pydantic"
+            ):
+                # Unhashable or class-valued types keep the legacy code path.
+                return
+            compiled[name] = expected_type
+        self._call_properties = compiled
+        self._call_required = tuple(required)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def coerce_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of ``arguments`` with safe type coercions applied."""
+        if not isinstance(arguments, dict) or not isinstance(self.schema, dict):
+            return arguments
+        properties = self.schema.get("properties") or {}
+        coerced = None
+        for name, value in arguments.items():
+            prop = properties.get(name)
+            if not isinstance(prop, dict):
+                continue
+            new_value = _coerce_value(value, _call_type_of(prop))
+            if new_value is not value:
+                if coerced is None:
+                    coerced = dict(arguments)
+                coerced[name] = new_value
+        return coerced if coerced is not None else arguments
+
+    def validate(self, arguments: Dict[str, Any]) -> Optional[ToolError]:
+        """Validate arguments against the JSON schema.
+
+        Returns:
+            ToolError if validation fails, None if validation passes
+        """
+        if not self.schema:
+            return None
+        if self._fast_valid(arguments):
+            return None
+        return self._full_validate(arguments)
+
+    def evaluate(self, function_call: Dict[str, Any]) -> Tuple[bool, str]:
+        """Compiled equivalent of ``utils.evaluate_function_call``."""
+        if self._call_properties is None or self.tool_name != function_call.get("name"):
+            from .utils import evaluate_function_call
+
+            return evaluate_function_call(self.tool_config, function_call)
+        return self._evaluate_arguments(function_call["arguments"])
+
+    def check(
+        self, arguments: Dict[str, Any], validate: bool = True
+    ) -> Tuple[Optional[ToolError], Tuple[bool, str], Dict[str, Any]]:
+        """Run schema validation and the call-format check in one pass.
+
+        Args:
+            arguments: Call arguments
+            validate: Whether to run JSON schema validation
+
+        Returns:
+            Tuple of (validation error or None, (is_valid, message), arguments),
+            where ``arguments`` reflects any coercion that was applied.
+        """
+        if self.coerce:
+            arguments = self.coerce_arguments(arguments)
+
+        if self._call_properties is None or self._fast_properties is None:
+            validation_error = self.validate(arguments) if validate else None
+            if validation_error is not None:
+                return validation_error, (True, ""), arguments
+            return (
+                None,
+                self.evaluate({"name": self.tool_name, "arguments": arguments}),
+                arguments,
+            )
+
+        call_properties = self._call_properties
+        fast_properties = self._fast_properties
+        schema_proven = validate and bool(self.schema)
+        unsupported = None
+        invalid_params: List[str] = []
+        type_mismatches: List[Tuple[str, Any, str]] = []
+
+        for param, value in arguments.items():
+            if schema_proven:
+                predicate = fast_properties.get(param, _MISSING)
+                if predicate is _MISSING:
+                    schema_proven = self._allow_additional
+                elif predicate is None or not predicate(value):
+                    schema_proven = False
+
+            if param == "_tooluniverse_stream" or unsupported is not None:
+                continue
+            if param not in call_properties:
+                invalid_params.append(param)
+                continue
+            expected_type = call_properties[param]
+            if not expected_type:
+                continue
+            python_type = _CALL_TYPE_MAP.get(expected_type)
+            if python_type is None:
+                unsupported = expected_type
+            elif not isinstance(value, python_type):
+                type_mismatches.append((param, expected_type, type(value).__name__))
+
+        if validate and self.schema:
+            if schema_proven and self._fast_required:
+                schema_proven = all(name in arguments for name in self._fast_required)
+            if not schema_proven:
+                validation_error = self._full_validate(arguments)
+                if validation_error is not None:
+                    return validation_error, (True, ""), arguments
+
+        missing_params = [p for p in self._call_required if p not in arguments]
+        if missing_params:
+            return (
+                None,
+                (False, f"Missing required parameters: {missing_params}"),
+                arguments,
+            )
+        if unsupported is not None:
+            return (
+                None,
+                (False, f"Unsupported parameter type: {unsupported}"),
+                arguments,
+            )
+        if invalid_params:
+            return (
+                None,
+                (False, f"Invalid parameters provided: {invalid_params}"),
+                arguments,
+            )
+        if type_mismatches:
+            return None, (False, f"Type mismatches: {type_mismatches}"), arguments
+        return None, (True, "Function call is valid."), arguments
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _fast_valid(self, arguments: Any) -> bool:
+        properties = self._fast_properties
+        if properties is None or not isinstance(arguments, dict):
+            return False
+        for name in self._fast_required:
+            if name not in arguments:
+                return False
+        for name, value in arguments.items():
+            predicate = properties.get(name, _MISSING)
+            if predicate is _MISSING:
+                if not self._allow_additional:
+                    return False
+            elif predicate is None or not predicate(value):
+                return False
+        return True
+
+    def _full_validate(self, arguments: Any) -> Optional[ToolError]:
+        if self._schema_error is not None:
+            return ToolValidationError(f"Validation error: {str(self._schema_error)}")
+        try:
+            from jsonschema.exceptions import best_match
+
+            error = best_match(self._validator.iter_errors(arguments))
+        except Exception as e:
+            return ToolValidationError(f"Validation error: {str(e)}")
+        if error is None:
+            return None
+        return ToolValidationError(
+            f"Parameter validation failed: {error.message}",
+            details={
+                "validation_error": str(error),
+                "path": list(error.absolute_path) if error.absolute_path else [],
+                "schema": self.schema,
+            },
+        )
+
+    def _evaluate_arguments(self, arguments: Dict[str, Any]) -> Tuple[bool, str]:
+        if self._call_no_arguments:
+            if arguments and len(arguments) > 0:
+                return False, "This function does not accept any arguments."
+            return True, "Function call is valid."
+
+        missing_params = [p for p in self._call_required if p not in arguments]
+        if missing_params:
+            return False, f"Missing required parameters: {missing_params}"
+
+        call_properties = self._call_properties
+        invalid_params = []
+        type_mismatches = []
+        for param, value in arguments.items():
+            if param == "_tooluniverse_stream":
+                continue
+            if param not in call_properties:
+                invalid_params.append(param)
+                continue
+            expected_type = call_properties[param]
+            if not expected_type:
+                continue
+            python_type = _CALL_TYPE_MAP.get(expected_type)
+            if python_type is None:
+                return False, f"Unsupported parameter type: {expected_type}"
+            if not isinstance(value, python_type):
+                type_mismatches.append((param, expected_type, type(value).__name__))
+
+        if invalid_params:
+            return False, f"Invalid parameters provided: {invalid_params}"
+        if type_mismatches:
+            return False, f"Type mismatches: {type_mismatches}"
+        return True, "Function call is valid."
@@ -9,6 +9,7 @@ Medicine. This tool provides access to millions of full-text articles.
 
 import requests
 from typing import Dict, List, Any, Optional
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -20,7 +21,7 @@ class PMCTool(BaseTool):
     def __init__(self, tool_config=None):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {"User-Agent": "ToolUniverse/1.0", "Accept": "application/json"}
         )
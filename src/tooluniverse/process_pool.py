@@ -0,0 +1,414 @@
+"""
+Worker-process pool for CPU-bound tools.
+
+Tools whose config sets ``"execution": "process"`` run in worker processes
+instead of the calling thread, so GIL-bound work (RDKit rendering, fuzzy
+matching, searches over large in-memory datasets) runs in parallel and does
+not starve the I/O-bound tools that share ToolUniverse's thread pools.
+
+Each worker keeps one warm instance per tool. Instances are built from the
+tool's class and config, so workers started after a tool was registered
+(including replacements for recycled workers) construct it before taking
+their first call. Arguments and results are pickled across the process
+boundary. A worker is recycled after ``max_tasks`` calls or once its peak
+resident memory passes ``memory_limit_mb``, and a worker that runs past the
+call's deadline is killed.
+
+Settings come from :func:`configure_process_pool` or the environment:
+
+- ``TOOLUNIVERSE_PROCESS_WORKERS``: number of worker processes (default: CPU count)
+- ``TOOLUNIVERSE_PROCESS_MAX_TASKS``: calls served before a worker is recycled (default 500)
+- ``TOOLUNIVERSE_PROCESS_MEMORY_MB``: peak memory per worker before recycling (default: unlimited)
+- ``TOOLUNIVERSE_PROCESS_POOL``: set to ``false`` to run such tools in-process
+- ``TOOLUNIVERSE_PROCESS_PRELOAD``: set to ``true`` to preload tooluniverse in
+  the fork server (default off; see :class:`ProcessPool`)
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import multiprocessing
+import os
+import pickle
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .deadline import Deadline, DeadlineExceeded, current_deadline, deadline_scope
+from .http_client import tool_http_options, tool_options_scope
+from .logging_config import get_logger
+
+logger = get_logger("ProcessPool")
+
+DEFAULT_MAX_TASKS = 500
+
+# How often a waiting caller re-checks its deadline and the worker's health.
+_POLL_INTERVAL = 0.1
+
+
+class ToolProcessError(RuntimeError):
+    """A worker process died, or a call could not cross the process boundary."""
+
+
+def _env_number(name: str, default, cast):
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        return default
+
+
+def _peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _portable_error(error: BaseException) -> BaseException:
+    """Return ``error`` if it survives pickling, else a ToolProcessError copy."""
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return ToolProcessError(f"{type(error).__name__}: {error}")
+
+
+def _worker_main(conn, specs: Dict[str, Tuple[type, dict]], memory_limit_mb):
+    """Serve calls sent over ``conn`` until told to stop."""
+    instances: Dict[str, Any] = {}
+    for key, (tool_class, tool_config) in specs.items():
+        try:
+            instances[key] = tool_class(tool_config)
+        except Exception:
+            pass  # reported when the tool is actually called
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            return
+        key, spec, method, payload, timeout = message
+        try:
+            tool = instances.get(key)
+            if tool is None:
+                tool = instances[key] = spec[0](spec[1])
+            deadline = Deadline(timeout) if timeout is not None else None
+            options = tool_http_options(getattr(tool, "tool_config", None))
+            with deadline_scope(deadline), tool_options_scope(options):
+                reply = ("ok", getattr(tool, method)(payload))
+        except Exception as e:
+            reply = ("error", _portable_error(e))
+
+        retire = bool(memory_limit_mb) and _peak_rss_mb() > memory_limit_mb
+        try:
+            conn.send(reply + (retire,))
+        except Exception as e:
+            conn.send(
+                (
+                    "error",
+                    ToolProcessError(
+                        f"Result of {key.split('#')[0]} cannot be sent back "
+                        f"from the worker process: {e}"
+                    ),
+                    retire,
+                )
+            )
+        if retire:
+            return
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "known", "tasks")
+
+    def __init__(self, process, conn, known):
+        self.process = process
+        self.conn = conn
+        self.known = known
+        self.tasks = 0
+
+    def stop(self, timeout: float = 1.0):
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout)
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join(1.0)
+        self.conn.close()
+
+
+def _poll_interval(deadline: Optional[Deadline]) -> float:
+    remaining = deadline.remaining() if deadline is not None else None
+    return _POLL_INTERVAL if remaining is None else min(_POLL_INTERVAL, remaining)
+
+
+class ProcessPool:
+    """Pool of worker processes running tools with warm per-worker instances.
+
+    Workers use the ``forkserver`` start method where available and ``spawn``
+    elsewhere, so they never inherit the parent's threads and locks. Each
+    worker imports tooluniverse when it starts. With ``preload=True`` the fork
+    server imports it once instead, and new workers start in milliseconds;
+    the fork server and its preload list are shared by the whole process, so
+    this also applies to every other ``forkserver`` user in the application.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_tasks: Optional[int] = None,
+        memory_limit_mb: Optional[float] = None,
+        start_method: Optional[str] = None,
+        enabled: Optional[bool] = None,
+        preload: Optional[bool] = None,
+    ):
+        if max_workers is None:
+            max_workers = _env_number(
+                "TOOLUNIVERSE_PROCESS_WORKERS", os.cpu_count() or 1, int
+            )
+        if max_tasks is None:
+            max_tasks = _env_number(
+                "TOOLUNIVERSE_PROCESS_MAX_TASKS", DEFAULT_MAX_TASKS, int
+            )
+        if memory_limit_mb is None:
+            memory_limit_mb = _env_number("TOOLUNIVERSE_PROCESS_MEMORY_MB", 0, float)
+        if enabled is None:
+            enabled = os.getenv("TOOLUNIVERSE_PROCESS_POOL", "true").lower() not in (
+                "0",
+                "false",
+                "no",
+                "off",
+            )
+        if preload is None:
+            preload = os.getenv("TOOLUNIVERSE_PROCESS_PRELOAD", "false").lower() in (
+                "1",
+                "true",
+                "yes",
+                "on",
+            )
+        self.max_workers = max(0, int(max_workers))
+        self.max_tasks = max(0, int(max_tasks))
+        self.memory_limit_mb = memory_limit_mb or None
+        self.enabled = bool(enabled) and self.max_workers > 0
+        if start_method is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                start_method = "forkserver"
+            else:
+                start_method = "spawn"
+        self._context = multiprocessing.get_context(start_method)
+        if preload and start_method == "forkserver":
+            # Process-wide: only takes effect if the fork server is not
+            # running yet, and applies to every forkserver user.
+            self._context.set_forkserver_preload(["tooluniverse"])
+        self._specs: Dict[str, Tuple[type, dict]] = {}
+        self._keys: Dict[str, str] = {}
+        self._generation = itertools.count(1)
+        self._idle: List[_Worker] = []
+        self._slots = threading.BoundedSemaphore(max(1, self.max_workers))
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def register(self, name: str, tool_class: type, tool_config: dict) -> str:
+        """Make a tool available to workers and return the key to call it by.
+
+        Workers started from now on build the tool before taking calls;
+        running workers build it on its first call.
+        """
+        with self._lock:
+            key = self._keys.get(name)
+            if key is not None and self._specs[key] == (tool_class, tool_config):
+                return key
+            # Earlier keys stay callable for plans that still hold them.
+            key = f"{name}#{next(self._generation)}"
+            self._keys[name] = key
+            self._specs[key] = (tool_class, tool_config)
+        return key
+
+    def warm(self, count: Optional[int] = None):
+        """Start up to ``count`` workers (default: all) ahead of the first call."""
+        with self._lock:
+            missing = min(count or self.max_workers, self.max_workers) - len(self._idle)
+        for _ in range(max(0, missing)):
+            self._release(self._spawn())
+
+    def call(self, key: str, method: str, payload: Any) -> Any:
+        """Run ``tool.<method>(payload)`` in a worker and return its result.
+
+        Exceptions raised by the tool are re-raised here. The current deadline
+        bounds both the wait for a free worker and the call itself.
+
+        Raises:
+            DeadlineExceeded: If the deadline passes first; a busy worker is killed.
+            ToolProcessError: If the worker dies or the call cannot be pickled.
+        """
+        with self._lock:
+            spec = self._specs.get(key)
+        if spec is None:
+            raise ToolProcessError(f"Tool {key!r} is not registered with the pool")
+        name = key.split("#")[0]
+        deadline = current_deadline()
+        if not self._slots.acquire(
+            timeout=deadline.remaining() if deadline is not None else None
+        ):
+            raise DeadlineExceeded(f"No worker process free for {name}")
+        worker = None
+        try:
+            worker = self._checkout()
+            timeout = deadline.remaining() if deadline is not None else None
+            message = (
+                key,
+                None if key in worker.known else spec,
+                method,
+                payload,
+                timeout,
+            )
+            try:
+                worker.conn.send(message)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                raise ToolProcessError(
+                    f"Arguments for {name} cannot be sent to a worker process: {e}"
+                ) from e
+            worker.known.add(key)
+
+            while not worker.conn.poll(_poll_interval(deadline)):
+                if deadline is not None and deadline.expired:
+                    worker.kill()
+                    worker = None
+                    raise DeadlineExceeded(f"{deadline.describe()} in worker process")
+                if not worker.process.is_alive():
+                    break
+            try:
+                status, value, retire = worker.conn.recv()
+            except (EOFError, OSError):
+                exitcode = worker.process.exitcode
+                worker.kill()
+                worker = None
+                raise ToolProcessError(
+                    f"Worker process running {name} exited unexpectedly "
+                    f"(exit code {exitcode})"
+                )
+
+            worker.tasks += 1
+            if retire or (self.max_tasks and worker.tasks >= self.max_tasks):
+                self._recycle(worker)
+                worker = None
+            if status == "error":
+                raise value
+            return value
+        finally:
+            if worker is not None:
+                self._release(worker)
+            self._slots.release()
+
+    def _spawn(self) -> _Worker:
+        with self._lock:
+            specs = {key: self._specs[key] for key in self._keys.values()}
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, specs, self.memory_limit_mb),
+            name="ToolUniverseWorker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn, set(specs))
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                worker.kill()
+        return self._spawn()
+
+    def _release(self, worker: _Worker):
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_workers:
+                self._idle.append(worker)
+                return
+        worker.stop()
+
+    def _recycle(self, worker: _Worker):
+        """Retire ``worker`` and put a freshly started replacement in its place.
+
+        The replacement starts warming up (building the registered tools)
+        right away; the old worker is stopped in the background.
+        """
+        logger.debug(
+            f"Recycling worker process {worker.process.pid} after "
+            f"{worker.tasks} calls"
+        )
+        threading.Thread(
+            target=worker.stop, name="ToolUniverseWorkerRecycle", daemon=True
+        ).start()
+        if not self._closed:
+            self._release(self._spawn())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool settings and the number of idle workers."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_workers": self.max_workers,
+                "max_tasks": self.max_tasks,
+                "memory_limit_mb": self.memory_limit_mb,
+                "idle_workers": len(self._idle),
+                "tools": sorted(self._keys),
+            }
+
+    def shutdown(self):
+        """Stop all idle workers; busy ones stop when their call returns."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+
+_pool: Optional[ProcessPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPool:
+    """Return the process-wide worker pool; workers start on first use."""
+    global _pool
+    pool = _pool
+    if pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPool()
+            pool = _pool
+    return pool
+
+
+def configure_process_pool(**kwargs) -> ProcessPool:
+    """Replace the shared pool, e.g. to change the worker count or memory limit."""
+    global _pool
+    with _pool_lock:
+        old, _pool = _pool, ProcessPool(**kwargs)
+    if old is not None:
+        old.shutdown()
+    return _pool
+
+
+@atexit.register
+def _shutdown_pool():
+    if _pool is not None:
+        _pool.shutdown()
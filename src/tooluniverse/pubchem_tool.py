@@ -1,8 +1,9 @@
 # pubchem_tool.py
 
 import requests
+from . import http_client
 import re
-from .base_tool import BaseTool
+from .base_tool import RUN_SEPARATELY, BaseTool
 from .tool_registry import register_tool
 
 # Base URL for PubChem PUG-REST
@@ -11,6 +12,16 @@ PUBCHEM_BASE_URL = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
 # Base URL for PubChem PUG-View
 PUBCHEM_PUGVIEW_URL = "https://pubchem.ncbi.nlm.nih.gov/rest/pug_view"
 
+# CID endpoints that accept a comma-separated CID list, and where the
+# per-CID records sit in their JSON response.
+BATCH_CID_ENDPOINTS = {
+    "/compound/cid/{cid}/property/{property_list}/JSON": (
+        "PropertyTable",
+        "Properties",
+    ),
+    "/compound/cid/{cid}/synonyms/JSON": ("InformationList", "Information"),
+}
+
 
 @register_tool("PubChemRESTTool")
 class PubChemRESTTool(BaseTool):
@@ -89,6 +100,47 @@ class PubChemRESTTool(BaseTool):
 
         return full_url
 
+    def get_batch_size(self) -> int:
+        if self.use_pugview or self.endpoint_template not in BATCH_CID_ENDPOINTS:
+            return 0
+        return super().get_batch_size()
+
+    def run_batch(self, arguments_list):
+        """Look up many CIDs with one PUG-REST request.
+
+        The response is split back into one single-CID response per call. If
+        the combined request fails (one bad CID fails the whole list), or a
+        CID is missing from it, the affected calls are handed back as
+        ``RUN_SEPARATELY``.
+        """
+        table_key, records_key = BATCH_CID_ENDPOINTS[self.endpoint_template]
+        cids = []
+        for arguments in arguments_list:
+            cid = arguments.get("cid")
+            cids.append(str(cid) if isinstance(cid, (int, str)) else None)
+
+        records = {}
+        unique = [cid for cid in dict.fromkeys(cids) if cid]
+        if unique:
+            try:
+                url = self._build_url({"cid": ",".join(unique)})
+                resp = http_client.get(url, timeout=30)
+                if resp.status_code == 200:
+                    table = resp.json().get(table_key, {})
+                    for record in table.get(records_key, []):
+                        records.setdefault(str(record.get("CID")), record)
+            except (requests.RequestException, ValueError):
+                pass
+
+        return [
+            (
+                {table_key: {records_key: [records[cid]]}}
+                if cid in records
+                else RUN_SEPARATELY
+            )
+            for cid in cids
+        ]
+
     def run(self, arguments: dict):
         # 1. Validate required parameters
         for key, prop in self.param_schema.items():
@@ -110,7 +162,7 @@ class PubChemRESTTool(BaseTool):
                 else:
                     url += "?MaxRecords=10"
 
-            resp = requests.get(url, timeout=30)
+            resp = http_client.get(url, timeout=30)
         except requests.Timeout:
             return {
                 "error": "Request to PubChem PUG-REST timed out, try reducing query scope or retry later."
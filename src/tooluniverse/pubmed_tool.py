@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -26,6 +27,17 @@ class PubMedTool(BaseTool):
         return self._search(query, limit, api_key)
 
     def _search(self, query, limit, api_key=None):
+        id_list = self._esearch(query, limit, api_key)
+        if not isinstance(id_list, list) or not id_list:
+            return id_list
+
+        result = self._esummary(id_list, api_key)
+        if "error" in result:
+            return result
+        return self._format_articles(result, result.get("uids", []))
+
+    def _esearch(self, query, limit, api_key=None):
+        """Return the PMIDs matching ``query``, or an error dict."""
         params = {
             "db": "pubmed",
             "term": query,
@@ -36,7 +48,7 @@ class PubMedTool(BaseTool):
             params["api_key"] = api_key
 
         try:
-            r = requests.get(self.esearch_url, params=params, timeout=20)
+            r = http_client.get(self.esearch_url, params=params, timeout=20)
         except requests.RequestException as e:
             return {
                 "error": "Network error calling PubMed esearch",
@@ -49,10 +61,10 @@ class PubMedTool(BaseTool):
             }
 
         data = r.json()
-        id_list = data.get("esearchresult", {}).get("idlist", [])
-        if not id_list:
-            return []
+        return data.get("esearchresult", {}).get("idlist", [])
 
+    def _esummary(self, id_list, api_key=None):
+        """Return the esummary ``result`` object for ``id_list``, or an error dict."""
         summary_params = {
             "db": "pubmed",
             "id": ",".join(id_list),
@@ -62,7 +74,7 @@ class PubMedTool(BaseTool):
             summary_params["api_key"] = api_key
 
         try:
-            s = requests.get(
+            s = http_client.get(
                 self.esummary_url,
                 params=summary_params,
                 timeout=20,
@@ -78,8 +90,9 @@ class PubMedTool(BaseTool):
                 "reason": s.reason,
             }
 
-        result = s.json().get("result", {})
-        uids = result.get("uids", [])
+        return s.json().get("result", {})
+
+    def _format_articles(self, result, uids):
         articles = []
         for uid in uids:
             rec = result.get(uid, {})
@@ -0,0 +1,242 @@
+"""
+Process-wide rate limiting of outbound HTTP calls, keyed by upstream host.
+
+Each host gets a token bucket. Callers reserve a slot and then wait until it
+comes due, so waiters are served in arrival order, threads sleep instead of
+spinning, and async callers ``await`` without blocking the event loop.
+
+Limits are declared in tool configs with a ``rate_limit`` object (or a list of
+them)::
+
+    "rate_limit": {
+        "host": "eutils.ncbi.nlm.nih.gov",
+        "requests": 3, "period": 1,
+        "key_param": "api_key", "key_env": "NCBI_API_KEY", "keyed_requests": 10
+    }
+
+``requests`` per ``period`` seconds apply to calls without an API key; calls
+that carry ``key_param`` in their query string (or run with ``key_env`` set)
+use ``keyed_requests`` instead. ``burst`` (default 1) allows short bursts.
+Well-known public APIs have built-in defaults (:data:`DEFAULT_HOST_LIMITS`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .deadline import DeadlineExceeded, current_deadline
+from .logging_config import get_logger
+
+logger = get_logger("RateLimiter")
+
+# Published limits of upstream APIs shared by many tools.
+DEFAULT_HOST_LIMITS: List[Dict[str, Any]] = [
+    {
+        # https://www.ncbi.nlm.nih.gov/books/NBK25497/
+        "host": "eutils.ncbi.nlm.nih.gov",
+        "requests": 3,
+        "period": 1,
+        "key_param": "api_key",
+        "key_env": "NCBI_API_KEY",
+        "keyed_requests": 10,
+    },
+    {
+        # https://open.fda.gov/apis/authentication/
+        "host": "api.fda.gov",
+        "requests": 240,
+        "period": 60,
+        "burst": 4,
+        "key_param": "api_key",
+        "key_env": "OPENFDA_API_KEY",
+        "keyed_requests": 240,
+    },
+]
+
+
+class TokenBucket:
+    """Thread-safe token bucket handing out FIFO reservations."""
+
+    __slots__ = ("interval", "burst", "_next", "_lock")
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.interval = 1.0 / rate
+        self.burst = max(1, int(burst))
+        self._next = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return 1.0 / self.interval
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Reserve the next slot and return how long to wait for it.
+
+        Returns None (without reserving) if the wait would exceed ``max_wait``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now - (self.burst - 1) * self.interval)
+            wait = max(0.0, slot - now)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._next = slot + self.interval
+            return wait
+
+    def pause(self, seconds: float):
+        """Hold back every reservation for ``seconds`` (e.g. after HTTP 429)."""
+        with self._lock:
+            resume = time.monotonic() + seconds
+            # The slot after ``resume`` is the first one handed out again.
+            self._next = max(self._next, resume)
+
+
+class _HostRule:
+    __slots__ = ("bucket", "keyed_bucket", "key_param", "key_env")
+
+    def __init__(self, bucket, keyed_bucket=None, key_param=None, key_env=None):
+        self.bucket = bucket
+        self.keyed_bucket = keyed_bucket
+        self.key_param = key_param
+        self.key_env = key_env
+
+    def select(self, query: str) -> TokenBucket:
+        if self.keyed_bucket is None:
+            return self.bucket
+        if self.key_env and os.getenv(self.key_env):
+            return self.keyed_bucket
+        if self.key_param and query:
+            if any(k == self.key_param and v for k, v in parse_qsl(query)):
+                return self.keyed_bucket
+        return self.bucket
+
+
+def _bucket_for(requests: Any, period: Any, burst: Any) -> TokenBucket:
+    return TokenBucket(float(requests) / float(period or 1), int(burst or 1))
+
+
+class RateLimiter:
+    """Registry of per-host token buckets."""
+
+    def __init__(self, limits: Optional[Iterable[Dict[str, Any]]] = None):
+        self._rules: Dict[str, _HostRule] = {}
+        self._lock = threading.Lock()
+        for limit in limits or ():
+            self.add_limit(limit)
+
+    def add_limit(self, limit: Dict[str, Any]) -> bool:
+        """Register one ``rate_limit`` declaration.
+
+        When several declarations name the same host, the strictest wins.
+        Returns False for malformed declarations.
+        """
+        try:
+            host = str(limit["host"]).lower()
+            bucket = _bucket_for(
+                limit["requests"], limit.get("period", 1), limit.get("burst", 1)
+            )
+            keyed_bucket = None
+            if limit.get("keyed_requests"):
+                keyed_bucket = _bucket_for(
+                    limit["keyed_requests"],
+                    limit.get("period", 1),
+                    limit.get("burst", 1),
+                )
+        except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+            logger.warning(f"Ignoring invalid rate_limit {limit!r}: {e}")
+            return False
+
+        with self._lock:
+            existing = self._rules.get(host)
+            if existing is not None and existing.bucket.rate <= bucket.rate:
+                return True
+            self._rules[host] = _HostRule(
+                bucket, keyed_bucket, limit.get("key_param"), limit.get("key_env")
+            )
+        return True
+
+    def add_tool_limits(self, tool_config: Optional[Dict[str, Any]]):
+        """Register the ``rate_limit`` declarations of a tool config."""
+        if not isinstance(tool_config, dict):
+            return
+        limits = tool_config.get("rate_limit")
+        if isinstance(limits, dict):
+            limits = [limits]
+        if not isinstance(limits, list):
+            return
+        for limit in limits:
+            if isinstance(limit, dict):
+                self.add_limit(limit)
+
+    def limits(self) -> Dict[str, float]:
+        """Return the configured unkeyed rate (requests/second) per host."""
+        with self._lock:
+            return {host: rule.bucket.rate for host, rule in self._rules.items()}
+
+    def _bucket(self, url: str) -> Tuple[Optional[TokenBucket], str]:
+        if not self._rules:
+            return None, ""
+        parts = urlsplit(url)
+        rule = self._rules.get((parts.hostname or "").lower())
+        if rule is None:
+            return None, ""
+        return rule.select(parts.query), parts.hostname
+
+    def _reserve(self, url: str) -> Optional[float]:
+        bucket, host = self._bucket(url)
+        if bucket is None:
+            return None
+        deadline = current_deadline()
+        max_wait = deadline.remaining() if deadline is not None else None
+        wait = bucket.reserve(max_wait)
+        if wait is None:
+            raise DeadlineExceeded(
+                f"Rate limit for {host} leaves no slot before the deadline"
+            )
+        return wait
+
+    def acquire(self, url: str):
+        """Block until a request to ``url`` may be sent."""
+        wait = self._reserve(url)
+        if wait:
+            time.sleep(wait)
+
+    async def aacquire(self, url: str):
+        """Wait, without blocking the event loop, until ``url`` may be requested."""
+        wait = self._reserve(url)
+        if wait:
+            await asyncio.sleep(wait)
+
+    def backoff(self, url: str, seconds: float):
+        """Pause all requests to the host of ``url`` (e.g. on ``Retry-After``)."""
+        parts = urlsplit(url)
+        rule = self._rules.get((parts.hostname or "").lower())
+        if rule is None:
+            # Unknown host: create a lenient rule so the pause is shared.
+            self.add_limit({"host": parts.hostname or "", "requests": 1000})
+            rule = self._rules.get((parts.hostname or "").lower())
+        for bucket in (rule.bucket, rule.keyed_bucket):
+            if bucket is not None:
+                bucket.pause(seconds)
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter (seeded with the built-in limits)."""
+    global _limiter
+    limiter = _limiter
+    if limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter(DEFAULT_HOST_LIMITS)
+            limiter = _limiter
+    return limiter
@@ -1,11 +1,12 @@
 from .graphql_tool import GraphQLTool
 import requests
+from . import http_client
 import copy
 from .tool_registry import register_tool
 
 
 def execute_RESTful_query(endpoint_url, variables=None):
-    response = requests.get(endpoint_url, params=variables)
+    response = http_client.get(endpoint_url, params=variables)
     try:
         result = response.json()
 
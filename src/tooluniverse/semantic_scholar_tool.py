@@ -1,5 +1,6 @@
-import requests
+from . import http_client
 from .base_tool import BaseTool
+from .rate_limiter import get_rate_limiter
 from .tool_registry import register_tool
 
 
@@ -32,18 +33,15 @@ class SemanticScholarTool(BaseTool):
             "fields": "title,abstract,year,venue,url",
         }
         headers = {"x-api-key": api_key} if api_key else {}
-        response = requests.get(
+        response = http_client.get(
             self.base_url, params=params, headers=headers, timeout=20
         )
         if response.status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", "2"))
-            import time
-
-            print(
-                f"Semantic Scholar API rate limited, waiting {retry_after} seconds..."
-            )
-            time.sleep(retry_after)
-            response = requests.get(
+            # The shared HTTP client pauses this host for Retry-After; make
+            # sure the retry waits even when the header is missing.
+            if "Retry-After" not in response.headers:
+                get_rate_limiter().backoff(self.base_url, 2)
+            response = http_client.get(
                 self.base_url, params=params, headers=headers, timeout=20
             )
         if response.status_code != 200:
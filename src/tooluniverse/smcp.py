@@ -92,7 +92,6 @@ AI Agent Interface:
 """
 
 import asyncio
-import functools
 import json
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union, Callable, Literal
@@ -264,6 +263,18 @@ class SMCP(FastMCP):
         or a list of both. Provides an easy way to enable hooks without full configuration.
         Takes precedence over hooks_enabled when specified.
 
+    metrics_enabled : bool, optional
+        Record per-tool execution metrics. When None, the
+        TOOLUNIVERSE_METRICS_ENABLED environment variable decides. Metrics are
+        served in Prometheus text format at ``/metrics`` on HTTP transports and
+        through the ``get_tooluniverse_metrics`` utility tool.
+
+    open_circuit_tools : str, default "flag"
+        How ``tools/list`` presents tools whose upstream circuit breaker is
+        open: "flag" prefixes their description with a notice and the
+        retry-after time, "hide" leaves them out, and "show" lists them
+        unchanged. Calls to such tools fail fast either way.
+
     **kwargs**
         Additional arguments passed to the underlying FastMCP server instance.
         Supports all FastMCP configuration options for advanced customization.
@@ -303,6 +314,8 @@ class SMCP(FastMCP):
         hooks_enabled: bool = False,
         hook_config: Optional[Dict[str, Any]] = None,
         hook_type: Optional[str] = None,
+        metrics_enabled: Optional[bool] = None,
+        open_circuit_tools: str = "flag",
         **kwargs,
     ):
         if not FASTMCP_AVAILABLE:
@@ -348,6 +361,9 @@ class SMCP(FastMCP):
         self.hooks_enabled = hooks_enabled
         self.hook_config = hook_config
         self.hook_type = hook_type
+        if metrics_enabled is not None:
+            self.tooluniverse.enable_metrics(metrics_enabled)
+        self.open_circuit_tools = open_circuit_tools
 
         # Space configuration storage
         self.space_llm_config = None
@@ -369,6 +385,24 @@ class SMCP(FastMCP):
         # Register custom MCP methods
         self._register_custom_mcp_methods()
 
+        # Prometheus scrape endpoint (HTTP transports only)
+        self._register_metrics_route()
+
+    def _register_metrics_route(self):
+        """Serve ToolUniverse execution metrics at ``GET /metrics``."""
+        try:
+            from starlette.responses import PlainTextResponse
+        except ImportError:
+            self.logger.debug("starlette not available; /metrics route disabled")
+            return
+
+        @self.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+        async def metrics_endpoint(request):
+            return PlainTextResponse(
+                self.tooluniverse.metrics.to_prometheus(),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
+
     def _load_space_configs(self, space: Union[str, List[str]]):
         """
         Load Space configurations.
@@ -423,6 +457,7 @@ class SMCP(FastMCP):
         - Uses FastMCP's middleware system instead of request handler patching
         - Implements custom middleware methods for tools/find and tools/search
         - Standard MCP methods (tools/list, tools/call) are handled by FastMCP
+        - tools/list results flag or hide tools whose circuit breaker is open
         - Implements proper error handling and JSON-RPC 2.0 compliance
 
         Notes:
@@ -433,11 +468,46 @@ class SMCP(FastMCP):
         try:
             # Add custom middleware for tools/find and tools/search
             self.add_middleware(self._tools_find_middleware)
+            # Flag or hide tools with an open circuit breaker in tools/list
+            self.add_middleware(self._circuit_breaker_middleware)
             self.logger.info("✅ Custom MCP methods registered successfully")
 
         except Exception as e:
             self.logger.error(f"Error registering custom MCP methods: {e}")
 
+    async def _circuit_breaker_middleware(self, context, call_next):
+        """
+        Flag or hide tools whose circuit breaker is open in tools/list results.
+        """
+        result = await call_next(context)
+        if (
+            getattr(context, "method", None) != "tools/list"
+            or self.open_circuit_tools not in ("flag", "hide")
+            or not isinstance(result, list)
+        ):
+            return result
+
+        open_tools = self.tooluniverse.circuit_breakers.open_tools()
+        if not open_tools:
+            return result
+
+        tools = []
+        for tool in result:
+            refusal = open_tools.get(getattr(tool, "name", None))
+            if refusal is None:
+                tools.append(tool)
+            elif self.open_circuit_tools == "flag":
+                notice = (
+                    f"[Temporarily unavailable: upstream circuit open, retry after "
+                    f"{refusal['retry_after']:.0f}s] "
+                )
+                tools.append(
+                    tool.model_copy(
+                        update={"description": notice + (tool.description or "")}
+                    )
+                )
+        return tools
+
     def _get_valid_categories(self):
         """
         Get valid tool categories from ToolUniverse.
@@ -723,9 +793,8 @@ class SMCP(FastMCP):
                 function_call["arguments"]["categories"] = categories
 
             # Execute the search tool
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self.executor, self.tooluniverse.run_one_function, function_call
+            result = await self.tooluniverse.arun_one_function(
+                function_call, executor=self.executor
             )
 
             # All search tools now return JSON format directly
@@ -1497,6 +1566,11 @@ class SMCP(FastMCP):
             - Debugging tool behavior
             - Custom automation scripts
 
+        get_tooluniverse_metrics:
+            Per-tool execution metrics (call and error counts, phase latency
+            histograms, cache events, result sizes) as JSON, optionally for a
+            single tool.
+
         list_available_tooluniverse_tools:
             Comprehensive inventory of all available ToolUniverse tools.
 
@@ -1595,6 +1669,23 @@ class SMCP(FastMCP):
             except Exception as e:
                 return f"Error getting server info: {str(e)}"
 
+        @self.tool()
+        async def get_tooluniverse_metrics(tool_name: Optional[str] = None) -> str:
+            """
+            Get execution metrics recorded for ToolUniverse tools.
+
+            Args:
+                tool_name: Optional tool name to restrict the report to
+
+            Returns:
+                JSON string with call counts, errors by type, latency histograms
+                by phase, cache events and result sizes
+            """
+            try:
+                return json.dumps(self.tooluniverse.get_metrics(tool_name), indent=2)
+            except Exception as e:
+                return json.dumps({"error": f"Error getting metrics: {str(e)}"})
+
         @self.tool()
         async def execute_tooluniverse_function(
             function_name: str, arguments: str
@@ -1620,10 +1711,9 @@ class SMCP(FastMCP):
 
                 function_call = {"name": function_name, "arguments": parsed_args}
 
-                # Execute in thread pool
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    self.executor, self.tooluniverse.run_one_function, function_call
+                # Execute without blocking the event loop
+                result = await self.tooluniverse.arun_one_function(
+                    function_call, executor=self.executor
                 )
 
                 return str(result)
@@ -2405,14 +2495,12 @@ class SMCP(FastMCP):
                         if "_tooluniverse_stream" not in args_dict:
                             args_dict["_tooluniverse_stream"] = True
 
-                    run_callable = functools.partial(
-                        self.tooluniverse.run_one_function,
+                    result = await self.tooluniverse.arun_one_function(
                         function_call,
                         stream_callback=stream_callback,
+                        executor=self.executor,
                     )
 
-                    result = await loop.run_in_executor(self.executor, run_callable)
-
                     if isinstance(result, str):
                         return result
                     else:
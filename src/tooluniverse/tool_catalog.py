@@ -0,0 +1,275 @@
+"""
+Indexed collection of loaded tool configs.
+
+``ToolCatalog`` keeps tool configs in load order with hash indexes by name,
+type, category and label, so lookups and filters touch only the matching
+tools instead of scanning every loaded config. Every change bumps
+``version``. The counter never goes backwards, so caches derived from the
+catalog (prompt views, search results) can use it as part of their key and
+are invalidated automatically.
+
+A tool name is unique within the catalog. Adding a config under a name that
+is already present replaces the old config in place, matching how
+``ToolUniverse.all_tool_dict`` has always resolved duplicates.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Pattern searches remembered per catalog version.
+_SEARCH_CACHE_SIZE = 128
+
+
+def _labels(tool: Dict[str, Any]) -> List[str]:
+    labels = tool.get("label")
+    if isinstance(labels, str):
+        return [labels]
+    if isinstance(labels, (list, tuple)):
+        return [label for label in labels if isinstance(label, str)]
+    return []
+
+
+class ToolCatalog:
+    """Tool configs indexed by name, type, category and label."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tools: Dict[str, Dict[str, Any]] = {}
+        self._positions: Dict[str, int] = {}
+        self._categories: Dict[str, Optional[str]] = {}
+        self._revisions: Dict[str, int] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_category: Dict[str, Set[str]] = {}
+        self._by_label: Dict[str, Set[str]] = {}
+        self._next_position = 0
+        self._version = 0
+        self._tool_list: Optional[List[Dict[str, Any]]] = None
+        self._searches: "OrderedDict[Tuple[Any, ...], List[Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+    def add(self, tool: Dict[str, Any], category: Optional[str] = None) -> bool:
+        """Add ``tool`` (replacing any config with the same name).
+
+        Returns False, leaving the catalog unchanged, for configs without a
+        string ``name``.
+        """
+        name = tool.get("name") if isinstance(tool, dict) else None
+        if not isinstance(name, str):
+            return False
+        with self._lock:
+            if name in self._tools:
+                self._unindex(name)
+            else:
+                self._positions[name] = self._next_position
+                self._next_position += 1
+            self._tools[name] = tool
+            self._categories[name] = category
+            self._index(name, tool, category)
+            self._changed()
+            self._revisions[name] = self._version
+        return True
+
+    def extend(
+        self, tools: Iterable[Dict[str, Any]], category: Optional[str] = None
+    ) -> int:
+        """Add several tools; returns how many were added."""
+        with self._lock:
+            return sum(1 for tool in tools if self.add(tool, category))
+
+    def remove(self, name: str) -> Optional[Dict[str, Any]]:
+        """Remove and return the tool called ``name``, if present."""
+        with self._lock:
+            tool = self._tools.pop(name, None)
+            if tool is None:
+                return None
+            self._unindex(name, tool)
+            del self._positions[name]
+            del self._categories[name]
+            del self._revisions[name]
+            self._changed()
+            return tool
+
+    def clear(self):
+        with self._lock:
+            self._tools.clear()
+            self._positions.clear()
+            self._categories.clear()
+            self._revisions.clear()
+            self._by_type.clear()
+            self._by_category.clear()
+            self._by_label.clear()
+            self._changed()
+
+    def _index(self, name, tool, category):
+        tool_type = tool.get("type")
+        if isinstance(tool_type, str):
+            self._by_type.setdefault(tool_type, set()).add(name)
+        if category is not None:
+            self._by_category.setdefault(category, set()).add(name)
+        for label in _labels(tool):
+            self._by_label.setdefault(label, set()).add(name)
+
+    def _unindex(self, name, tool=None):
+        tool = tool if tool is not None else self._tools[name]
+        keys = [
+            (self._by_type, tool.get("type")),
+            (self._by_category, self._categories.get(name)),
+        ]
+        keys.extend((self._by_label, label) for label in _labels(tool))
+        for index, key in keys:
+            names = index.get(key) if isinstance(key, str) else None
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del index[key]
+
+    def _changed(self):
+        self._version += 1
+        self._tool_list = None
+        self._searches.clear()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    @property
+    def version(self) -> int:
+        """Counter bumped by every change; never decreases."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tools
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.tools())
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._tools.get(name)
+
+    def category_of(self, name: str) -> Optional[str]:
+        return self._categories.get(name)
+
+    def revision(self, name: str) -> Optional[int]:
+        """Catalog version at which ``name`` was last added, if present."""
+        return self._revisions.get(name)
+
+    def tools(self) -> List[Dict[str, Any]]:
+        """All tools in the order they were first added (do not modify)."""
+        with self._lock:
+            if self._tool_list is None:
+                self._tool_list = list(self._tools.values())
+            return self._tool_list
+
+    def names_with_type(self, tool_type: str) -> Set[str]:
+        return set(self._by_type.get(tool_type, ()))
+
+    def names_in_category(self, category: str) -> Set[str]:
+        return set(self._by_category.get(category, ()))
+
+    def names_with_label(self, label: str) -> Set[str]:
+        return set(self._by_label.get(label, ()))
+
+    def types(self) -> List[str]:
+        return sorted(self._by_type)
+
+    def categories(self) -> List[str]:
+        return sorted(self._by_category)
+
+    def labels(self) -> List[str]:
+        return sorted(self._by_label)
+
+    def select(
+        self,
+        include_names: Optional[Iterable[str]] = None,
+        exclude_names: Optional[Iterable[str]] = None,
+        include_types: Optional[Iterable[str]] = None,
+        exclude_types: Optional[Iterable[str]] = None,
+        include_categories: Optional[Iterable[str]] = None,
+        exclude_categories: Optional[Iterable[str]] = None,
+        include_labels: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the tools passing every given filter, in catalog order.
+
+        A filter left as None does not restrict the result; an empty include
+        filter selects nothing. A tool passes an include filter when it
+        matches any of its values.
+        """
+        with self._lock:
+            candidates: Optional[Set[str]] = None
+            includes = [
+                (None, include_names),
+                (self._by_type, include_types),
+                (self._by_category, include_categories),
+                (self._by_label, include_labels),
+            ]
+            for index, values in includes:
+                if values is None:
+                    continue
+                if index is None:
+                    matched = {name for name in values if name in self._tools}
+                else:
+                    matched = set()
+                    for value in values:
+                        matched.update(index.get(value, ()))
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return []
+
+            excluded: Set[str] = set(exclude_names or ())
+            for index, values in (
+                (self._by_type, exclude_types),
+                (self._by_category, exclude_categories),
+            ):
+                for value in values or ():
+                    excluded.update(index.get(value, ()))
+
+            if candidates is None:
+                if not excluded:
+                    return list(self.tools())
+                return [
+                    tool for name, tool in self._tools.items() if name not in excluded
+                ]
+            names = sorted(candidates - excluded, key=self._positions.__getitem__)
+            return [self._tools[name] for name in names]
+
+    def search(
+        self,
+        pattern: str,
+        fields: Tuple[str, ...] = ("name",),
+        case_sensitive: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Return the tools whose ``fields`` match the regex ``pattern``.
+
+        Results are cached until the catalog next changes.
+        """
+        key = (pattern, tuple(fields), case_sensitive)
+        with self._lock:
+            cached = self._searches.get(key)
+            if cached is not None:
+                self._searches.move_to_end(key)
+                return list(cached)
+            version = self._version
+            tools = self.tools()
+
+        regex = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+        matches = [
+            tool
+            for tool in tools
+            if any(regex.search(str(tool.get(field) or "")) for field in fields)
+        ]
+        with self._lock:
+            if self._version == version:
+                self._searches[key] = matches
+                if len(self._searches) > _SEARCH_CACHE_SIZE:
+                    self._searches.popitem(last=False)
+        return list(matches)
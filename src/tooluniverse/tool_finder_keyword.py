@@ -14,6 +14,7 @@ from collections import Counter, defaultdict
 from typing import Dict, List
 from .base_tool import BaseTool
 from .tool_registry import register_tool
+from .tool_snapshot import ToolSnapshot
 
 
 @register_tool("ToolFinderKeyword")
@@ -298,6 +299,38 @@ class ToolFinderKeyword(BaseTool):
         # Calculate document frequencies
         self._document_frequencies = dict(term_doc_count)
 
+    def export_index(self) -> Dict:
+        """
+        Return the built index without tool configs, for saving in a snapshot.
+
+        Returns
+            Dict: Term frequencies per tool, document frequencies and document count
+        """
+        return {
+            "tools": {
+                name: {"terms": data["terms"], "total_terms": data["total_terms"]}
+                for name, data in (self._tool_index or {}).items()
+            },
+            "document_frequencies": self._document_frequencies or {},
+            "total_documents": self._total_documents,
+        }
+
+    def _load_snapshot_index(self) -> None:
+        """Adopt the index saved in the ToolUniverse snapshot, if there is one."""
+        snapshot = getattr(self.tooluniverse, "_snapshot", None)
+        if not isinstance(snapshot, ToolSnapshot):
+            return
+        saved = snapshot.keyword_index(self.exclude_tools)
+        if not saved:
+            return
+        tool_dict = self.tooluniverse.all_tool_dict
+        self._tool_index = {
+            name: {"tool": tool_dict.get(name), **data}
+            for name, data in saved["tools"].items()
+        }
+        self._document_frequencies = saved["document_frequencies"]
+        self._total_documents = saved["total_documents"]
+
     def _extract_parameter_text(self, parameter_schema: Dict) -> List[str]:
         """
         Extract searchable text from parameter schema.
@@ -551,6 +584,8 @@ class ToolFinderKeyword(BaseTool):
                 filtered_tools = all_tools
 
             # Build search index if not already built or if tools changed
+            if self._tool_index is None and not categories:
+                self._load_snapshot_index()
             if self._tool_index is None or self._total_documents != len(
                 [
                     t
@@ -7,8 +7,11 @@ import json
 import glob
 import logging
 import re
+from pathlib import Path
 from typing import Dict, Optional
 
+from .build_optimizer import load_tool_manifest
+
 # Initialize logger for this module
 logger = logging.getLogger("ToolRegistry")
 
@@ -16,6 +19,7 @@ logger = logging.getLogger("ToolRegistry")
 _tool_registry = {}
 _config_registry = {}
 _lazy_registry: Dict[str, str] = {}  # Maps tool names to module names
+_lazy_registry_source: Optional[str] = None  # "manifest" or "scan"
 _discovery_completed = False
 _lazy_cache = {}
 
@@ -46,6 +50,17 @@ def get_tool_errors() -> dict:
     return _TOOL_ERRORS.copy()
 
 
+def is_tool_unavailable(tool_name: str) -> bool:
+    """Check whether a tool has a recorded failure without copying the error map."""
+    return tool_name in _TOOL_ERRORS
+
+
+def get_tool_error(tool_name: str) -> Optional[dict]:
+    """Get the recorded error for a single tool, if any."""
+    error = _TOOL_ERRORS.get(tool_name)
+    return dict(error) if error is not None else None
+
+
 def register_tool(tool_type_name=None, config=None):
     """
     Decorator to automatically register tool classes and their configs.
@@ -159,10 +174,14 @@ def lazy_import_tool(tool_name):
 
 def build_lazy_registry(package_name=None):
     """
-    Build a mapping of tool names to module names using config files and naming patterns.
-    This is truly lazy - it doesn't import any modules, just creates the mapping.
+    Build a mapping of tool names to module names without importing any modules.
+
+    The mapping comes from the build-time tool manifest (see
+    ``build_optimizer.write_tool_manifest``); modules whose source no longer
+    matches the manifest are re-scanned. Without a manifest, it falls back to
+    guessing from config files and naming patterns.
     """
-    global _lazy_registry  # noqa: F824
+    global _lazy_registry, _lazy_registry_source  # noqa: F824
 
     if package_name is None:
         package_name = "tooluniverse"
@@ -176,6 +195,25 @@ def build_lazy_registry(package_name=None):
 
     logger.debug(f"Building lazy registry for package: {package_name}")
 
+    # Strategy 0: the static class -> module manifest, checked against source hashes
+    manifest_mapping, stale_modules = load_tool_manifest(Path(package_path[0]))
+    if manifest_mapping:
+        for tool_class, module_name in manifest_mapping.items():
+            _lazy_registry.setdefault(tool_class, module_name)
+        _lazy_registry_source = "manifest"
+        if stale_modules:
+            logger.info(
+                f"Tool manifest is stale for {len(stale_modules)} modules "
+                f"({', '.join(stale_modules[:5])}); re-scanned them. Rebuild it with "
+                "`python -m tooluniverse.build_optimizer`."
+            )
+        logger.debug(
+            f"Built lazy registry from manifest: {len(manifest_mapping)} tools"
+        )
+        return _lazy_registry.copy()
+
+    _lazy_registry_source = "scan"
+
     # Strategy 1: Parse config files for accurate mappings WITHOUT importing modules
     config_mappings = _discover_from_configs()
     config_count = 0
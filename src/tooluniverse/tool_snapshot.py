@@ -0,0 +1,447 @@
+"""
+ToolUniverse snapshots.
+
+Every SMCP worker, notebook kernel and batch job repeats the same startup
+work: reading tool configs, auto-discovery, filtering and deduplication, MCP
+auto-loading and, on the first keyword search, building the TF-IDF index.
+``ToolUniverse.save_snapshot`` writes the result of that work to one file, and
+``ToolUniverse.from_snapshot`` restores it in another process.
+
+A snapshot file is made of:
+
+- ``SNAPSHOT_MAGIC`` and the length of the header (a little-endian uint64)
+- a JSON header: format, package version, the settings needed to rebuild
+  the universe (tool files, ``load_tools`` calls, hook configuration), the
+  fingerprints that decide whether the snapshot is stale, and the offset,
+  length and SHA-256 of each section
+- the sections, each a pickle: ``state`` holds the loaded tools, their
+  categories and the modules of their tool classes; ``keyword_index`` holds
+  the ``ToolFinderKeyword`` indexes
+
+The file is memory-mapped on restore. ``state`` is decoded right away and
+``keyword_index`` only when a keyword search first needs it.
+
+A snapshot is stale when the package version, a module of the package, a
+tool config file or tool names file used by the load, or the set of
+available API keys has changed since it was written. Files are compared by
+size and modification time first, and by content hash when those differ.
+``from_snapshot`` rebuilds a stale or damaged snapshot from its recorded
+settings and writes it again, or raises ``StaleSnapshotError`` when called
+with ``rebuild=False``.
+
+Classes registered with ``register_custom_tool`` are not stored; their
+configs are, so register the classes again after restoring.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .logging_config import get_logger
+
+logger = get_logger("ToolSnapshot")
+
+SNAPSHOT_MAGIC = b"TUSNAP\x00\x00"
+SNAPSHOT_FORMAT = 1
+
+_HEADER_LENGTH = struct.Struct("<Q")
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# load_tools arguments recorded for rebuilding, in call order
+LOAD_ARGUMENTS = (
+    "tool_type",
+    "exclude_tools",
+    "exclude_categories",
+    "include_tools",
+    "tool_config_files",
+    "tools_file",
+    "include_tool_types",
+    "exclude_tool_types",
+)
+
+
+class SnapshotError(ValueError):
+    """The file is not a usable ToolUniverse snapshot."""
+
+
+class StaleSnapshotError(SnapshotError):
+    """The snapshot no longer matches the package, its config files or API keys."""
+
+
+def load_record(**arguments: Any) -> Dict[str, Any]:
+    """JSON-friendly record of one ``load_tools`` call (``None`` values dropped)."""
+    record = {}
+    for key in LOAD_ARGUMENTS:
+        value = arguments.get(key)
+        if isinstance(value, (set, frozenset)):
+            value = sorted(value)
+        elif isinstance(value, tuple):
+            value = list(value)
+        if value is not None:
+            record[key] = value
+    return record
+
+
+def _file_fingerprint(path: str) -> List[Any]:
+    stat = os.stat(path)
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    return [stat.st_size, stat.st_mtime_ns, digest]
+
+
+def _file_matches(path: str, recorded: List[Any]) -> bool:
+    try:
+        stat = os.stat(path)
+        if stat.st_size == recorded[0] and stat.st_mtime_ns == recorded[1]:
+            return True
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest() == recorded[2]
+    except OSError:
+        return False
+
+
+def package_files() -> Dict[str, str]:
+    """The package modules and manifest a snapshot depends on, by file name."""
+    return {
+        name: os.path.join(_PACKAGE_DIR, name)
+        for name in sorted(os.listdir(_PACKAGE_DIR))
+        if name.endswith(".py") or name == "tool_manifest.json"
+    }
+
+
+def _package_version() -> Optional[str]:
+    try:
+        from importlib.metadata import version
+
+        return version("tooluniverse")
+    except Exception:
+        return None
+
+
+def _api_keys(tool_category_dicts: Dict[str, List[Any]]) -> Dict[str, bool]:
+    # Tools are dropped at load time when their keys are missing, so the
+    # snapshot records which of the keys named by any loaded category are set.
+    names = set()
+    for tools in tool_category_dicts.values():
+        for tool in tools:
+            if isinstance(tool, dict):
+                names.update(tool.get("required_api_keys") or [])
+                names.update(tool.get("optional_api_keys") or [])
+    return {name: bool(os.getenv(name)) for name in sorted(names)}
+
+
+def _source_files(
+    tool_files: Dict[str, str],
+    loads: List[Dict[str, Any]],
+    categories: Iterable[str],
+) -> List[str]:
+    files = dict(tool_files)
+    names_files = []
+    for load in loads:
+        files.update(load.get("tool_config_files") or {})
+        for key in ("tools_file", "include_tools"):
+            if isinstance(load.get(key), str):
+                names_files.append(load[key])
+    paths = [files[category] for category in categories if category in files]
+    return sorted(
+        {os.path.abspath(path) for path in paths + names_files if os.path.exists(path)}
+    )
+
+
+def _tool_modules(tools: List[Any]) -> Dict[str, str]:
+    from . import tool_registry
+
+    registry = tool_registry.get_tool_registry()
+    modules = {}
+    for tool_type in {t.get("type") for t in tools if isinstance(t, dict)}:
+        if not isinstance(tool_type, str):
+            continue
+        tool_class = registry.get(tool_type)
+        module = (
+            tool_class.__module__
+            if tool_class is not None
+            else tool_registry._lazy_registry.get(tool_type)
+        )
+        if module and module.startswith("tooluniverse."):
+            modules[tool_type] = module
+    return modules
+
+
+def _keyword_indexes(tu) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+    from .tool_finder_keyword import ToolFinderKeyword
+
+    finder_configs = [
+        tool
+        for tool in tu.all_tools
+        if isinstance(tool, dict) and tool.get("type") == "ToolFinderKeyword"
+    ] or [{"name": "ToolFinderKeyword"}]
+    indexes = {}
+    for config in finder_configs:
+        finder = ToolFinderKeyword(config)
+        key = tuple(sorted(finder.exclude_tools))
+        if key not in indexes:
+            finder._build_tool_index(tu.all_tools)
+            indexes[key] = finder.export_index()
+    return indexes
+
+
+def save_snapshot(tu, path: str) -> str:
+    """Write the loaded state of ``tu`` to ``path`` and return the path.
+
+    The file is written next to ``path`` and moved into place, so readers
+    never see a partial snapshot.
+    """
+    tu._sync_tool_catalog()
+    loads = list(tu._load_history)
+    hook_config = tu.hook_manager.config if tu.hook_manager is not None else None
+    settings = {
+        "tool_files": dict(tu.tool_files),
+        "hooks_enabled": bool(tu.hooks_enabled),
+        "hook_config": hook_config,
+        "loads": loads,
+    }
+    sections = {
+        "state": pickle.dumps(
+            {
+                "all_tools": tu.all_tools,
+                "tool_category_dicts": tu.tool_category_dicts,
+                "tool_modules": _tool_modules(tu.all_tools),
+            },
+            protocol=pickle.HIGHEST_PROTOCOL,
+        ),
+        "keyword_index": pickle.dumps(
+            _keyword_indexes(tu), protocol=pickle.HIGHEST_PROTOCOL
+        ),
+    }
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "version": _package_version(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "settings": settings,
+        "package": {
+            name: _file_fingerprint(file) for name, file in package_files().items()
+        },
+        "files": {
+            file: _file_fingerprint(file)
+            for file in _source_files(
+                tu.tool_files, loads, tu.tool_category_dicts.keys()
+            )
+        },
+        "api_keys": _api_keys(tu.tool_category_dicts),
+        "sections": {},
+    }
+    offset = 0
+    for name, data in sections.items():
+        header["sections"][name] = [offset, len(data), hashlib.sha256(data).hexdigest()]
+        offset += len(data)
+    try:
+        header_bytes = json.dumps(header).encode()
+    except TypeError as e:
+        raise SnapshotError(f"Snapshot settings are not JSON serializable: {e}")
+
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            f.write(header_bytes)
+            for data in sections.values():
+                f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    logger.debug(f"Saved snapshot of {len(tu.all_tools)} tools to {path}")
+    return path
+
+
+class ToolSnapshot:
+    """A memory-mapped snapshot file."""
+
+    def __init__(self, path: str):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._keyword_indexes: Optional[Dict[Tuple[str, ...], Any]] = None
+        with open(self.path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotError(f"{self.path} is empty")
+        try:
+            self.header = self._read_header()
+        except BaseException:
+            self._mmap.close()
+            raise
+
+    def _read_header(self) -> Dict[str, Any]:
+        prefix = len(SNAPSHOT_MAGIC) + _HEADER_LENGTH.size
+        if self._mmap[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"{self.path} is not a ToolUniverse snapshot")
+        (length,) = _HEADER_LENGTH.unpack(self._mmap[len(SNAPSHOT_MAGIC) : prefix])
+        try:
+            header = json.loads(bytes(self._mmap[prefix : prefix + length]))
+            self._data_offset = prefix + length
+            header["settings"]["tool_files"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise SnapshotError(f"{self.path} has a damaged header: {e}")
+        return header
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        return self.header["settings"]
+
+    def close(self):
+        self._mmap.close()
+
+    def stale_reasons(self) -> List[str]:
+        """Why the snapshot no longer matches this installation (empty if fresh)."""
+        header = self.header
+        if header.get("format") != SNAPSHOT_FORMAT:
+            return [f"snapshot format {header.get('format')!r} is not supported"]
+        if header.get("version") != _package_version():
+            return [
+                f"written by tooluniverse {header.get('version')}, "
+                f"running {_package_version()}"
+            ]
+        reasons = []
+        recorded = header.get("package", {})
+        current = package_files()
+        changed = sorted(set(recorded) ^ set(current)) + [
+            name
+            for name, file in current.items()
+            if name in recorded and not _file_matches(file, recorded[name])
+        ]
+        if changed:
+            reasons.append(f"package files changed: {', '.join(changed[:5])}")
+        changed = [
+            file
+            for file, fingerprint in header.get("files", {}).items()
+            if not _file_matches(file, fingerprint)
+        ]
+        if changed:
+            reasons.append(f"tool config files changed: {', '.join(changed[:5])}")
+        changed = [
+            name
+            for name, available in header.get("api_keys", {}).items()
+            if bool(os.getenv(name)) != available
+        ]
+        if changed:
+            reasons.append(f"API keys changed: {', '.join(changed[:5])}")
+        return reasons
+
+    def load(self, name: str) -> Any:
+        """Decode section ``name`` after checking its hash."""
+        try:
+            offset, length, digest = self.header["sections"][name]
+        except (KeyError, ValueError) as e:
+            raise SnapshotError(f"{self.path} has no usable '{name}' section: {e}")
+        start = self._data_offset + offset
+        if start + length > len(self._mmap):
+            raise SnapshotError(f"{self.path} is truncated")
+        with memoryview(self._mmap) as view, view[start : start + length] as data:
+            if hashlib.sha256(data).hexdigest() != digest:
+                raise SnapshotError(f"{self.path} section '{name}' is corrupted")
+            try:
+                return pickle.loads(data)
+            except Exception as e:
+                raise SnapshotError(f"{self.path} section '{name}' is unreadable: {e}")
+
+    def keyword_index(self, exclude_tools: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """The saved ``ToolFinderKeyword`` index for ``exclude_tools``, if any.
+
+        The section is decoded on first use, after which the file is no
+        longer needed and is unmapped.
+        """
+        with self._lock:
+            if self._keyword_indexes is None:
+                try:
+                    self._keyword_indexes = self.load("keyword_index")
+                except (SnapshotError, ValueError) as e:
+                    logger.warning(f"Ignoring saved keyword index: {e}")
+                    self._keyword_indexes = {}
+                self.close()
+        return self._keyword_indexes.get(tuple(sorted(exclude_tools)))
+
+
+def _rebuild(cls, settings: Dict[str, Any], path: str):
+    tu = cls(
+        tool_files=settings["tool_files"],
+        keep_default_tools=False,
+        hooks_enabled=settings.get("hooks_enabled", False),
+        hook_config=settings.get("hook_config"),
+    )
+    for load in settings.get("loads", []):
+        tu.load_tools(**load)
+    try:
+        tu.save_snapshot(path)
+    except (OSError, SnapshotError) as e:
+        logger.warning(f"Could not rewrite snapshot {path}: {e}")
+    return tu
+
+
+def restore_snapshot(cls, path: str, rebuild: bool = True):
+    """Create a ``cls`` (a ``ToolUniverse``) from the snapshot at ``path``."""
+    snapshot = ToolSnapshot(path)
+    state = None
+    reasons = snapshot.stale_reasons()
+    if not reasons:
+        try:
+            state = snapshot.load("state")
+        except SnapshotError as e:
+            reasons = [str(e)]
+    if reasons:
+        snapshot.close()
+        if not rebuild:
+            raise StaleSnapshotError(f"{path} is stale: {'; '.join(reasons)}")
+        logger.info(f"Rebuilding snapshot {path}: {'; '.join(reasons)}")
+        return _rebuild(cls, snapshot.settings, path)
+
+    from . import tool_registry
+
+    settings = snapshot.settings
+    tu = cls(
+        tool_files=settings["tool_files"],
+        keep_default_tools=False,
+        hooks_enabled=settings.get("hooks_enabled", False),
+        hook_config=settings.get("hook_config"),
+    )
+    tu.all_tools = state["all_tools"]
+    tu.tool_category_dicts = state["tool_category_dicts"]
+    tu._load_history = list(settings.get("loads", []))
+    tu._snapshot = snapshot
+    registry = tool_registry.get_tool_registry()
+    for tool_type, module in state["tool_modules"].items():
+        if tool_type not in registry:
+            tool_registry._lazy_registry.setdefault(tool_type, module)
+    tu._sync_tool_catalog()
+
+    unknown = sorted(
+        {
+            tool.get("type")
+            for tool in tu.all_tools
+            if isinstance(tool, dict)
+            and tool.get("type") not in registry
+            and tool.get("type") not in tool_registry._lazy_registry
+        }
+        - {None}
+    )
+    if unknown:
+        logger.warning(
+            f"Snapshot {path} has tools of unregistered types "
+            f"{', '.join(map(str, unknown[:5]))}; register their classes "
+            "with register_custom_tool before calling them"
+        )
+    logger.debug(f"Restored {len(tu.all_tools)} tools from snapshot {path}")
+    return tu
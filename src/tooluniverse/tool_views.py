@@ -0,0 +1,252 @@
+"""
+Cached read-only views of tool configs.
+
+Agents ask for tool prompts and function specs on every turn, and
+``prepare_tool_prompts`` used to deep-copy each config for every request.
+``ToolViewCache`` builds each view once per tool and returns the same
+read-only object afterwards. The views are ``FrozenDict`` and ``FrozenList``
+objects, which are ``dict`` and ``list`` subclasses that refuse mutation. The
+cache also keeps the JSON serialization of each view.
+
+A cached view is rebuilt when its tool changes: when the config is replaced
+or re-added to the ``ToolCatalog``, or when a top-level key of the config is
+assigned or deleted. An edit nested inside a config (a single parameter
+property, say) is only seen once the config is re-added with
+``ToolCatalog.add`` or the cache entry is dropped with
+``ToolViewCache.invalidate``. Configs that are not in the catalog get a fresh,
+uncached view.
+
+View kinds:
+
+- ``"prompt"``: name, description, parameter and required
+- ``"example"``: the prompt keys plus query_schema, fields, label and type
+- a tuple of keys: just those keys
+- ``"config"``: the whole config
+- ``"default"``: ``tool_specification`` output, with ``required`` flags on
+  each parameter property
+- ``"openai"``: OpenAI function-calling format
+- ``"mcp"``: MCP ``tools/list`` entry with an ``inputSchema``
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import operator
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .tool_catalog import ToolCatalog
+
+PROMPT_KEYS = ("name", "description", "parameter", "required")
+EXAMPLE_KEYS = PROMPT_KEYS + ("query_schema", "fields", "label", "type")
+
+SPEC_FORMATS = ("default", "openai", "mcp")
+
+ViewKind = Union[str, Tuple[str, ...]]
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__} is a read-only tool view; "
+        "use copy.deepcopy() for an editable copy"
+    )
+
+
+class FrozenDict(dict):
+    """A ``dict`` that cannot be modified; copies are plain dicts."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """A ``list`` that cannot be modified; copies are plain lists."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only copy of nested dicts and lists."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def build_specification(tool_config: Dict[str, Any], format: str = "default"):
+    """Specification of ``tool_config`` in ``format`` (see ``SPEC_FORMATS``).
+
+    Returns a new structure, or ``tool_config`` itself when there is no
+    parameter schema to rewrite.
+    """
+    if format == "mcp":
+        parameter = tool_config.get("parameter")
+        if isinstance(parameter, dict) and parameter.get("properties") is not None:
+            input_schema = build_specification(tool_config, "openai")["parameters"]
+        else:
+            input_schema = {"type": "object", "properties": {}, "required": []}
+        return {
+            "name": tool_config.get("name"),
+            "description": tool_config.get("description", ""),
+            "inputSchema": input_schema,
+        }
+
+    if "parameter" not in tool_config or not isinstance(tool_config["parameter"], dict):
+        return tool_config
+
+    processed_config = copy.deepcopy(tool_config)
+    parameter_schema = processed_config["parameter"]
+    if parameter_schema.get("properties") is None:
+        return tool_config
+
+    required_properties = parameter_schema.get("required", [])
+    if format == "openai":
+        # For OpenAI format: remove property-level required fields
+        for prop_config in parameter_schema["properties"].values():
+            if isinstance(prop_config, dict) and "required" in prop_config:
+                del prop_config["required"]
+
+        # Ensure required is a list
+        if not isinstance(parameter_schema.get("required"), list):
+            parameter_schema["required"] = (
+                required_properties if required_properties else []
+            )
+
+        return {
+            "name": processed_config["name"],
+            "description": processed_config["description"],
+            "parameters": parameter_schema,
+        }
+
+    # For default format: add required fields to properties
+    for prop_name, prop_config in parameter_schema["properties"].items():
+        if isinstance(prop_config, dict):
+            prop_config["required"] = prop_name in required_properties
+    return processed_config
+
+
+def build_view(tool: Dict[str, Any], kind: ViewKind = "prompt") -> Any:
+    """Build (without caching) the read-only ``kind`` view of ``tool``."""
+    if kind == "prompt":
+        kind = PROMPT_KEYS
+    elif kind == "example":
+        kind = EXAMPLE_KEYS
+    if isinstance(kind, tuple):
+        return freeze({key: value for key, value in tool.items() if key in kind})
+    if kind == "config":
+        return freeze(tool)
+    if kind in SPEC_FORMATS:
+        return freeze(build_specification(tool, kind))
+    raise ValueError(f"Unknown tool view kind: {kind!r}")
+
+
+class _Entry:
+    __slots__ = ("revision", "keys", "values", "views", "json")
+
+    def __init__(self, revision, tool):
+        self.revision = revision
+        # Top-level keys and values, to notice keys being assigned or removed
+        self.keys = tuple(tool)
+        self.values = tuple(tool.values())
+        self.views: Dict[ViewKind, Any] = {}
+        self.json: Dict[ViewKind, str] = {}
+
+    def matches(self, revision, tool) -> bool:
+        return (
+            self.revision == revision
+            and len(self.keys) == len(tool)
+            and all(map(operator.is_, self.values, tool.values()))
+            and self.keys == tuple(tool)
+        )
+
+
+class ToolViewCache:
+    """Read-only views of the tools in a ``ToolCatalog``, built once per change."""
+
+    def __init__(self, catalog: ToolCatalog):
+        self._catalog = catalog
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._pruned_at = catalog.version
+
+    def _entry(self, tool: Dict[str, Any]) -> Optional[_Entry]:
+        name = tool.get("name")
+        if not isinstance(name, str) or self._catalog.get(name) is not tool:
+            return None
+        revision = self._catalog.revision(name)
+        with self._lock:
+            self._prune()
+            entry = self._entries.get(name)
+            if entry is None or not entry.matches(revision, tool):
+                entry = self._entries[name] = _Entry(revision, tool)
+            return entry
+
+    def _prune(self):
+        # Drop entries of removed tools once the catalog has changed
+        version = self._catalog.version
+        if version != self._pruned_at and len(self._entries) > len(self._catalog):
+            for name in [n for n in self._entries if n not in self._catalog]:
+                del self._entries[name]
+        self._pruned_at = version
+
+    def view(self, tool: Dict[str, Any], kind: ViewKind = "prompt") -> Any:
+        """The read-only ``kind`` view of ``tool``."""
+        entry = self._entry(tool)
+        if entry is None:
+            return build_view(tool, kind)
+        view = entry.views.get(kind)
+        if view is None:
+            view = entry.views[kind] = build_view(tool, kind)
+        return view
+
+    def views(
+        self, tools: Iterable[Dict[str, Any]], kind: ViewKind = "prompt"
+    ) -> List[Any]:
+        return [self.view(tool, kind) for tool in tools]
+
+    def json(self, tool: Dict[str, Any], kind: ViewKind = "config") -> str:
+        """``json.dumps`` of the ``kind`` view of ``tool``, cached with it."""
+        entry = self._entry(tool)
+        if entry is None:
+            return json.dumps(build_view(tool, kind))
+        text = entry.json.get(kind)
+        if text is None:
+            view = entry.views.get(kind)
+            if view is None:
+                view = entry.views[kind] = build_view(tool, kind)
+            text = entry.json[kind] = json.dumps(view)
+        return text
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop the cached views of ``name``, or of every tool."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
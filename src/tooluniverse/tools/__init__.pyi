@@ -0,0 +1,2204 @@
+# Generated by tooluniverse.generate_tools; tools resolve lazily at runtime.
+
+from tooluniverse.exceptions import *
+
+from ._shared_client import (
+    get_shared_client as get_shared_client,
+    reset_shared_client as reset_shared_client,
+)
+
+from .ADMETAI_predict_BBB_penetrance import (
+    ADMETAI_predict_BBB_penetrance as ADMETAI_predict_BBB_penetrance,
+)
+from .ADMETAI_predict_CYP_interactions import (
+    ADMETAI_predict_CYP_interactions as ADMETAI_predict_CYP_interactions,
+)
+from .ADMETAI_predict_bioavailability import (
+    ADMETAI_predict_bioavailability as ADMETAI_predict_bioavailability,
+)
+from .ADMETAI_predict_clearance_distribution import (
+    ADMETAI_predict_clearance_distribution as ADMETAI_predict_clearance_distribution,
+)
+from .ADMETAI_predict_nuclear_receptor_activity import (
+    ADMETAI_predict_nuclear_receptor_activity as ADMETAI_predict_nuclear_receptor_activity,
+)
+from .ADMETAI_predict_physicochemical_properties import (
+    ADMETAI_predict_physicochemical_properties as ADMETAI_predict_physicochemical_properties,
+)
+from .ADMETAI_predict_solubility_lipophilicity_hydration import (
+    ADMETAI_predict_solubility_lipophilicity_hydration as ADMETAI_predict_solubility_lipophilicity_hydration,
+)
+from .ADMETAI_predict_stress_response import (
+    ADMETAI_predict_stress_response as ADMETAI_predict_stress_response,
+)
+from .ADMETAI_predict_toxicity import (
+    ADMETAI_predict_toxicity as ADMETAI_predict_toxicity,
+)
+from .ADMETAnalyzerAgent import ADMETAnalyzerAgent as ADMETAnalyzerAgent
+from .AdvancedCodeQualityAnalyzer import (
+    AdvancedCodeQualityAnalyzer as AdvancedCodeQualityAnalyzer,
+)
+from .AdverseEventICDMapper import AdverseEventICDMapper as AdverseEventICDMapper
+from .AdverseEventPredictionQuestionGenerator import (
+    AdverseEventPredictionQuestionGenerator as AdverseEventPredictionQuestionGenerator,
+)
+from .AdverseEventPredictionQuestionGeneratorWithContext import (
+    AdverseEventPredictionQuestionGeneratorWithContext as AdverseEventPredictionQuestionGeneratorWithContext,
+)
+from .ArXiv_search_papers import ArXiv_search_papers as ArXiv_search_papers
+from .ArgumentDescriptionOptimizer import (
+    ArgumentDescriptionOptimizer as ArgumentDescriptionOptimizer,
+)
+from .BioRxiv_search_preprints import (
+    BioRxiv_search_preprints as BioRxiv_search_preprints,
+)
+from .BiomarkerDiscoveryWorkflow import (
+    BiomarkerDiscoveryWorkflow as BiomarkerDiscoveryWorkflow,
+)
+from .CMA_Guidelines_Search import CMA_Guidelines_Search as CMA_Guidelines_Search
+from .CORE_search_papers import CORE_search_papers as CORE_search_papers
+from .CallAgent import CallAgent as CallAgent
+from .ChEMBL_search_similar_molecules import (
+    ChEMBL_search_similar_molecules as ChEMBL_search_similar_molecules,
+)
+from .ClinVar_search_variants import ClinVar_search_variants as ClinVar_search_variants
+from .ClinicalTrialDesignAgent import (
+    ClinicalTrialDesignAgent as ClinicalTrialDesignAgent,
+)
+from .CodeOptimizer import CodeOptimizer as CodeOptimizer
+from .CodeQualityAnalyzer import CodeQualityAnalyzer as CodeQualityAnalyzer
+from .CompoundDiscoveryAgent import CompoundDiscoveryAgent as CompoundDiscoveryAgent
+from .ComprehensiveDrugDiscoveryPipeline import (
+    ComprehensiveDrugDiscoveryPipeline as ComprehensiveDrugDiscoveryPipeline,
+)
+from .Crossref_search_works import Crossref_search_works as Crossref_search_works
+from .DBLP_search_publications import (
+    DBLP_search_publications as DBLP_search_publications,
+)
+from .DOAJ_search_articles import DOAJ_search_articles as DOAJ_search_articles
+from .DailyMed_get_spl_by_setid import (
+    DailyMed_get_spl_by_setid as DailyMed_get_spl_by_setid,
+)
+from .DailyMed_search_spls import DailyMed_search_spls as DailyMed_search_spls
+from .DataAnalysisValidityReviewer import (
+    DataAnalysisValidityReviewer as DataAnalysisValidityReviewer,
+)
+from .DescriptionAnalyzer import DescriptionAnalyzer as DescriptionAnalyzer
+from .DescriptionQualityEvaluator import (
+    DescriptionQualityEvaluator as DescriptionQualityEvaluator,
+)
+from .DiseaseAnalyzerAgent import DiseaseAnalyzerAgent as DiseaseAnalyzerAgent
+from .DomainExpertValidator import DomainExpertValidator as DomainExpertValidator
+from .DrugInteractionAnalyzerAgent import (
+    DrugInteractionAnalyzerAgent as DrugInteractionAnalyzerAgent,
+)
+from .DrugOptimizationAgent import DrugOptimizationAgent as DrugOptimizationAgent
+from .DrugSafetyAnalyzer import DrugSafetyAnalyzer as DrugSafetyAnalyzer
+from .Ensembl_lookup_gene_by_symbol import (
+    Ensembl_lookup_gene_by_symbol as Ensembl_lookup_gene_by_symbol,
+)
+from .EthicalComplianceReviewer import (
+    EthicalComplianceReviewer as EthicalComplianceReviewer,
+)
+from .EuropePMC_Guidelines_Search import (
+    EuropePMC_Guidelines_Search as EuropePMC_Guidelines_Search,
+)
+from .EuropePMC_search_articles import (
+    EuropePMC_search_articles as EuropePMC_search_articles,
+)
+from .ExperimentalDesignScorer import (
+    ExperimentalDesignScorer as ExperimentalDesignScorer,
+)
+from .FAERS_count_additive_administration_routes import (
+    FAERS_count_additive_administration_routes as FAERS_count_additive_administration_routes,
+)
+from .FAERS_count_additive_adverse_reactions import (
+    FAERS_count_additive_adverse_reactions as FAERS_count_additive_adverse_reactions,
+)
+from .FAERS_count_additive_event_reports_by_country import (
+    FAERS_count_additive_event_reports_by_country as FAERS_count_additive_event_reports_by_country,
+)
+from .FAERS_count_additive_reaction_outcomes import (
+    FAERS_count_additive_reaction_outcomes as FAERS_count_additive_reaction_outcomes,
+)
+from .FAERS_count_additive_reports_by_reporter_country import (
+    FAERS_count_additive_reports_by_reporter_country as FAERS_count_additive_reports_by_reporter_country,
+)
+from .FAERS_count_additive_seriousness_classification import (
+    FAERS_count_additive_seriousness_classification as FAERS_count_additive_seriousness_classification,
+)
+from .FAERS_count_country_by_drug_event import (
+    FAERS_count_country_by_drug_event as FAERS_count_country_by_drug_event,
+)
+from .FAERS_count_death_related_by_drug import (
+    FAERS_count_death_related_by_drug as FAERS_count_death_related_by_drug,
+)
+from .FAERS_count_drug_routes_by_event import (
+    FAERS_count_drug_routes_by_event as FAERS_count_drug_routes_by_event,
+)
+from .FAERS_count_drugs_by_drug_event import (
+    FAERS_count_drugs_by_drug_event as FAERS_count_drugs_by_drug_event,
+)
+from .FAERS_count_outcomes_by_drug_event import (
+    FAERS_count_outcomes_by_drug_event as FAERS_count_outcomes_by_drug_event,
+)
+from .FAERS_count_patient_age_distribution import (
+    FAERS_count_patient_age_distribution as FAERS_count_patient_age_distribution,
+)
+from .FAERS_count_reactions_by_drug_event import (
+    FAERS_count_reactions_by_drug_event as FAERS_count_reactions_by_drug_event,
+)
+from .FAERS_count_reportercountry_by_drug_event import (
+    FAERS_count_reportercountry_by_drug_event as FAERS_count_reportercountry_by_drug_event,
+)
+from .FAERS_count_seriousness_by_drug_event import (
+    FAERS_count_seriousness_by_drug_event as FAERS_count_seriousness_by_drug_event,
+)
+from .FDA_get_abuse_dependence_info_by_drug_name import (
+    FDA_get_abuse_dependence_info_by_drug_name as FDA_get_abuse_dependence_info_by_drug_name,
+)
+from .FDA_get_abuse_info_by_drug_name import (
+    FDA_get_abuse_info_by_drug_name as FDA_get_abuse_info_by_drug_name,
+)
+from .FDA_get_accessories_info_by_drug_name import (
+    FDA_get_accessories_info_by_drug_name as FDA_get_accessories_info_by_drug_name,
+)
+from .FDA_get_active_ingredient_info_by_drug_name import (
+    FDA_get_active_ingredient_info_by_drug_name as FDA_get_active_ingredient_info_by_drug_name,
+)
+from .FDA_get_adverse_reactions_by_drug_name import (
+    FDA_get_adverse_reactions_by_drug_name as FDA_get_adverse_reactions_by_drug_name,
+)
+from .FDA_get_alarms_by_drug_name import (
+    FDA_get_alarms_by_drug_name as FDA_get_alarms_by_drug_name,
+)
+from .FDA_get_animal_pharmacology_info_by_drug_name import (
+    FDA_get_animal_pharmacology_info_by_drug_name as FDA_get_animal_pharmacology_info_by_drug_name,
+)
+from .FDA_get_assembly_installation_info_by_drug_name import (
+    FDA_get_assembly_installation_info_by_drug_name as FDA_get_assembly_installation_info_by_drug_name,
+)
+from .FDA_get_boxed_warning_info_by_drug_name import (
+    FDA_get_boxed_warning_info_by_drug_name as FDA_get_boxed_warning_info_by_drug_name,
+)
+from .FDA_get_brand_name_generic_name import (
+    FDA_get_brand_name_generic_name as FDA_get_brand_name_generic_name,
+)
+from .FDA_get_calibration_instructions_by_drug_name import (
+    FDA_get_calibration_instructions_by_drug_name as FDA_get_calibration_instructions_by_drug_name,
+)
+from .FDA_get_carcinogenic_mutagenic_fertility_by_drug_name import (
+    FDA_get_carcinogenic_mutagenic_fertility_by_drug_name as FDA_get_carcinogenic_mutagenic_fertility_by_drug_name,
+)
+from .FDA_get_child_safety_info_by_drug_name import (
+    FDA_get_child_safety_info_by_drug_name as FDA_get_child_safety_info_by_drug_name,
+)
+from .FDA_get_clinical_pharmacology_by_drug_name import (
+    FDA_get_clinical_pharmacology_by_drug_name as FDA_get_clinical_pharmacology_by_drug_name,
+)
+from .FDA_get_clinical_studies_info_by_drug_name import (
+    FDA_get_clinical_studies_info_by_drug_name as FDA_get_clinical_studies_info_by_drug_name,
+)
+from .FDA_get_contact_for_questions_info_by_drug_name import (
+    FDA_get_contact_for_questions_info_by_drug_name as FDA_get_contact_for_questions_info_by_drug_name,
+)
+from .FDA_get_contraindications_by_drug_name import (
+    FDA_get_contraindications_by_drug_name as FDA_get_contraindications_by_drug_name,
+)
+from .FDA_get_controlled_substance_DEA_schedule_info_by_drug_name import (
+    FDA_get_controlled_substance_DEA_schedule_info_by_drug_name as FDA_get_controlled_substance_DEA_schedule_info_by_drug_name,
+)
+from .FDA_get_dear_health_care_provider_letter_info_by_drug_name import (
+    FDA_get_dear_health_care_provider_letter_info_by_drug_name as FDA_get_dear_health_care_provider_letter_info_by_drug_name,
+)
+from .FDA_get_dependence_info_by_drug_name import (
+    FDA_get_dependence_info_by_drug_name as FDA_get_dependence_info_by_drug_name,
+)
+from .FDA_get_disposal_info_by_drug_name import (
+    FDA_get_disposal_info_by_drug_name as FDA_get_disposal_info_by_drug_name,
+)
+from .FDA_get_do_not_use_info_by_drug_name import (
+    FDA_get_do_not_use_info_by_drug_name as FDA_get_do_not_use_info_by_drug_name,
+)
+from .FDA_get_document_id_by_drug_name import (
+    FDA_get_document_id_by_drug_name as FDA_get_document_id_by_drug_name,
+)
+from .FDA_get_dosage_and_storage_information_by_drug_name import (
+    FDA_get_dosage_and_storage_information_by_drug_name as FDA_get_dosage_and_storage_information_by_drug_name,
+)
+from .FDA_get_dosage_forms_and_strengths_by_drug_name import (
+    FDA_get_dosage_forms_and_strengths_by_drug_name as FDA_get_dosage_forms_and_strengths_by_drug_name,
+)
+from .FDA_get_drug_generic_name import (
+    FDA_get_drug_generic_name as FDA_get_drug_generic_name,
+)
+from .FDA_get_drug_interactions_by_drug_name import (
+    FDA_get_drug_interactions_by_drug_name as FDA_get_drug_interactions_by_drug_name,
+)
+from .FDA_get_drug_name_by_SPL_ID import (
+    FDA_get_drug_name_by_SPL_ID as FDA_get_drug_name_by_SPL_ID,
+)
+from .FDA_get_drug_name_by_adverse_reaction import (
+    FDA_get_drug_name_by_adverse_reaction as FDA_get_drug_name_by_adverse_reaction,
+)
+from .FDA_get_drug_name_by_calibration_instructions import (
+    FDA_get_drug_name_by_calibration_instructions as FDA_get_drug_name_by_calibration_instructions,
+)
+from .FDA_get_drug_name_by_dependence_info import (
+    FDA_get_drug_name_by_dependence_info as FDA_get_drug_name_by_dependence_info,
+)
+from .FDA_get_drug_name_by_document_id import (
+    FDA_get_drug_name_by_document_id as FDA_get_drug_name_by_document_id,
+)
+from .FDA_get_drug_name_by_dosage_info import (
+    FDA_get_drug_name_by_dosage_info as FDA_get_drug_name_by_dosage_info,
+)
+from .FDA_get_drug_name_by_environmental_warning import (
+    FDA_get_drug_name_by_environmental_warning as FDA_get_drug_name_by_environmental_warning,
+)
+from .FDA_get_drug_name_by_inactive_ingredient import (
+    FDA_get_drug_name_by_inactive_ingredient as FDA_get_drug_name_by_inactive_ingredient,
+)
+from .FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation import (
+    FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation as FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation,
+)
+from .FDA_get_drug_name_by_labor_and_delivery_info import (
+    FDA_get_drug_name_by_labor_and_delivery_info as FDA_get_drug_name_by_labor_and_delivery_info,
+)
+from .FDA_get_drug_name_by_microbiology import (
+    FDA_get_drug_name_by_microbiology as FDA_get_drug_name_by_microbiology,
+)
+from .FDA_get_drug_name_by_other_safety_info import (
+    FDA_get_drug_name_by_other_safety_info as FDA_get_drug_name_by_other_safety_info,
+)
+from .FDA_get_drug_name_by_pharmacodynamics import (
+    FDA_get_drug_name_by_pharmacodynamics as FDA_get_drug_name_by_pharmacodynamics,
+)
+from .FDA_get_drug_name_by_pharmacogenomics import (
+    FDA_get_drug_name_by_pharmacogenomics as FDA_get_drug_name_by_pharmacogenomics,
+)
+from .FDA_get_drug_name_by_precautions import (
+    FDA_get_drug_name_by_precautions as FDA_get_drug_name_by_precautions,
+)
+from .FDA_get_drug_name_by_pregnancy_or_breastfeeding_info import (
+    FDA_get_drug_name_by_pregnancy_or_breastfeeding_info as FDA_get_drug_name_by_pregnancy_or_breastfeeding_info,
+)
+from .FDA_get_drug_name_by_principal_display_panel import (
+    FDA_get_drug_name_by_principal_display_panel as FDA_get_drug_name_by_principal_display_panel,
+)
+from .FDA_get_drug_name_by_reference import (
+    FDA_get_drug_name_by_reference as FDA_get_drug_name_by_reference,
+)
+from .FDA_get_drug_name_by_set_id import (
+    FDA_get_drug_name_by_set_id as FDA_get_drug_name_by_set_id,
+)
+from .FDA_get_drug_name_by_stop_use_info import (
+    FDA_get_drug_name_by_stop_use_info as FDA_get_drug_name_by_stop_use_info,
+)
+from .FDA_get_drug_name_by_storage_and_handling_info import (
+    FDA_get_drug_name_by_storage_and_handling_info as FDA_get_drug_name_by_storage_and_handling_info,
+)
+from .FDA_get_drug_name_by_warnings import (
+    FDA_get_drug_name_by_warnings as FDA_get_drug_name_by_warnings,
+)
+from .FDA_get_drug_name_from_patient_package_insert import (
+    FDA_get_drug_name_from_patient_package_insert as FDA_get_drug_name_from_patient_package_insert,
+)
+from .FDA_get_drug_names_by_abuse_dependence_info import (
+    FDA_get_drug_names_by_abuse_dependence_info as FDA_get_drug_names_by_abuse_dependence_info,
+)
+from .FDA_get_drug_names_by_abuse_info import (
+    FDA_get_drug_names_by_abuse_info as FDA_get_drug_names_by_abuse_info,
+)
+from .FDA_get_drug_names_by_accessories import (
+    FDA_get_drug_names_by_accessories as FDA_get_drug_names_by_accessories,
+)
+from .FDA_get_drug_names_by_active_ingredient import (
+    FDA_get_drug_names_by_active_ingredient as FDA_get_drug_names_by_active_ingredient,
+)
+from .FDA_get_drug_names_by_alarm import (
+    FDA_get_drug_names_by_alarm as FDA_get_drug_names_by_alarm,
+)
+from .FDA_get_drug_names_by_animal_pharmacology_info import (
+    FDA_get_drug_names_by_animal_pharmacology_info as FDA_get_drug_names_by_animal_pharmacology_info,
+)
+from .FDA_get_drug_names_by_application_number_NDC_number import (
+    FDA_get_drug_names_by_application_number_NDC_number as FDA_get_drug_names_by_application_number_NDC_number,
+)
+from .FDA_get_drug_names_by_assembly_installation_info import (
+    FDA_get_drug_names_by_assembly_installation_info as FDA_get_drug_names_by_assembly_installation_info,
+)
+from .FDA_get_drug_names_by_boxed_warning import (
+    FDA_get_drug_names_by_boxed_warning as FDA_get_drug_names_by_boxed_warning,
+)
+from .FDA_get_drug_names_by_child_safety_info import (
+    FDA_get_drug_names_by_child_safety_info as FDA_get_drug_names_by_child_safety_info,
+)
+from .FDA_get_drug_names_by_clinical_pharmacology import (
+    FDA_get_drug_names_by_clinical_pharmacology as FDA_get_drug_names_by_clinical_pharmacology,
+)
+from .FDA_get_drug_names_by_clinical_studies import (
+    FDA_get_drug_names_by_clinical_studies as FDA_get_drug_names_by_clinical_studies,
+)
+from .FDA_get_drug_names_by_consulting_doctor_pharmacist_info import (
+    FDA_get_drug_names_by_consulting_doctor_pharmacist_info as FDA_get_drug_names_by_consulting_doctor_pharmacist_info,
+)
+from .FDA_get_drug_names_by_contraindications import (
+    FDA_get_drug_names_by_contraindications as FDA_get_drug_names_by_contraindications,
+)
+from .FDA_get_drug_names_by_controlled_substance_DEA_schedule import (
+    FDA_get_drug_names_by_controlled_substance_DEA_schedule as FDA_get_drug_names_by_controlled_substance_DEA_schedule,
+)
+from .FDA_get_drug_names_by_dear_health_care_provider_letter_info import (
+    FDA_get_drug_names_by_dear_health_care_provider_letter_info as FDA_get_drug_names_by_dear_health_care_provider_letter_info,
+)
+from .FDA_get_drug_names_by_disposal_info import (
+    FDA_get_drug_names_by_disposal_info as FDA_get_drug_names_by_disposal_info,
+)
+from .FDA_get_drug_names_by_dosage_forms_and_strengths_info import (
+    FDA_get_drug_names_by_dosage_forms_and_strengths_info as FDA_get_drug_names_by_dosage_forms_and_strengths_info,
+)
+from .FDA_get_drug_names_by_drug_interactions import (
+    FDA_get_drug_names_by_drug_interactions as FDA_get_drug_names_by_drug_interactions,
+)
+from .FDA_get_drug_names_by_effective_time import (
+    FDA_get_drug_names_by_effective_time as FDA_get_drug_names_by_effective_time,
+)
+from .FDA_get_drug_names_by_food_safety_warnings import (
+    FDA_get_drug_names_by_food_safety_warnings as FDA_get_drug_names_by_food_safety_warnings,
+)
+from .FDA_get_drug_names_by_general_precautions import (
+    FDA_get_drug_names_by_general_precautions as FDA_get_drug_names_by_general_precautions,
+)
+from .FDA_get_drug_names_by_geriatric_use import (
+    FDA_get_drug_names_by_geriatric_use as FDA_get_drug_names_by_geriatric_use,
+)
+from .FDA_get_drug_names_by_health_claim import (
+    FDA_get_drug_names_by_health_claim as FDA_get_drug_names_by_health_claim,
+)
+from .FDA_get_drug_names_by_indication import (
+    FDA_get_drug_names_by_indication as FDA_get_drug_names_by_indication,
+)
+from .FDA_get_drug_names_by_info_for_nursing_mothers import (
+    FDA_get_drug_names_by_info_for_nursing_mothers as FDA_get_drug_names_by_info_for_nursing_mothers,
+)
+from .FDA_get_drug_names_by_information_for_owners_or_caregivers import (
+    FDA_get_drug_names_by_information_for_owners_or_caregivers as FDA_get_drug_names_by_information_for_owners_or_caregivers,
+)
+from .FDA_get_drug_names_by_ingredient import (
+    FDA_get_drug_names_by_ingredient as FDA_get_drug_names_by_ingredient,
+)
+from .FDA_get_drug_names_by_instructions_for_use import (
+    FDA_get_drug_names_by_instructions_for_use as FDA_get_drug_names_by_instructions_for_use,
+)
+from .FDA_get_drug_names_by_lab_test_interference import (
+    FDA_get_drug_names_by_lab_test_interference as FDA_get_drug_names_by_lab_test_interference,
+)
+from .FDA_get_drug_names_by_lab_tests import (
+    FDA_get_drug_names_by_lab_tests as FDA_get_drug_names_by_lab_tests,
+)
+from .FDA_get_drug_names_by_mechanism_of_action import (
+    FDA_get_drug_names_by_mechanism_of_action as FDA_get_drug_names_by_mechanism_of_action,
+)
+from .FDA_get_drug_names_by_medication_guide import (
+    FDA_get_drug_names_by_medication_guide as FDA_get_drug_names_by_medication_guide,
+)
+from .FDA_get_drug_names_by_nonclinical_toxicology_info import (
+    FDA_get_drug_names_by_nonclinical_toxicology_info as FDA_get_drug_names_by_nonclinical_toxicology_info,
+)
+from .FDA_get_drug_names_by_nonteratogenic_effects import (
+    FDA_get_drug_names_by_nonteratogenic_effects as FDA_get_drug_names_by_nonteratogenic_effects,
+)
+from .FDA_get_drug_names_by_overdosage_info import (
+    FDA_get_drug_names_by_overdosage_info as FDA_get_drug_names_by_overdosage_info,
+)
+from .FDA_get_drug_names_by_pediatric_use import (
+    FDA_get_drug_names_by_pediatric_use as FDA_get_drug_names_by_pediatric_use,
+)
+from .FDA_get_drug_names_by_pharmacokinetics import (
+    FDA_get_drug_names_by_pharmacokinetics as FDA_get_drug_names_by_pharmacokinetics,
+)
+from .FDA_get_drug_names_by_population_use import (
+    FDA_get_drug_names_by_population_use as FDA_get_drug_names_by_population_use,
+)
+from .FDA_get_drug_names_by_pregnancy_effects_info import (
+    FDA_get_drug_names_by_pregnancy_effects_info as FDA_get_drug_names_by_pregnancy_effects_info,
+)
+from .FDA_get_drug_names_by_residue_warning import (
+    FDA_get_drug_names_by_residue_warning as FDA_get_drug_names_by_residue_warning,
+)
+from .FDA_get_drug_names_by_risk import (
+    FDA_get_drug_names_by_risk as FDA_get_drug_names_by_risk,
+)
+from .FDA_get_drug_names_by_route import (
+    FDA_get_drug_names_by_route as FDA_get_drug_names_by_route,
+)
+from .FDA_get_drug_names_by_safe_handling_warning import (
+    FDA_get_drug_names_by_safe_handling_warning as FDA_get_drug_names_by_safe_handling_warning,
+)
+from .FDA_get_drug_names_by_safety_summary import (
+    FDA_get_drug_names_by_safety_summary as FDA_get_drug_names_by_safety_summary,
+)
+from .FDA_get_drug_names_by_spl_indexing_data_elements import (
+    FDA_get_drug_names_by_spl_indexing_data_elements as FDA_get_drug_names_by_spl_indexing_data_elements,
+)
+from .FDA_get_drug_names_by_teratogenic_effects import (
+    FDA_get_drug_names_by_teratogenic_effects as FDA_get_drug_names_by_teratogenic_effects,
+)
+from .FDA_get_drug_names_by_user_safety_warning import (
+    FDA_get_drug_names_by_user_safety_warning as FDA_get_drug_names_by_user_safety_warning,
+)
+from .FDA_get_drug_names_by_warnings_and_cautions import (
+    FDA_get_drug_names_by_warnings_and_cautions as FDA_get_drug_names_by_warnings_and_cautions,
+)
+from .FDA_get_drugs_by_carcinogenic_mutagenic_fertility import (
+    FDA_get_drugs_by_carcinogenic_mutagenic_fertility as FDA_get_drugs_by_carcinogenic_mutagenic_fertility,
+)
+from .FDA_get_effective_time_by_drug_name import (
+    FDA_get_effective_time_by_drug_name as FDA_get_effective_time_by_drug_name,
+)
+from .FDA_get_environmental_warning_by_drug_name import (
+    FDA_get_environmental_warning_by_drug_name as FDA_get_environmental_warning_by_drug_name,
+)
+from .FDA_get_general_precautions_by_drug_name import (
+    FDA_get_general_precautions_by_drug_name as FDA_get_general_precautions_by_drug_name,
+)
+from .FDA_get_geriatric_use_info_by_drug_name import (
+    FDA_get_geriatric_use_info_by_drug_name as FDA_get_geriatric_use_info_by_drug_name,
+)
+from .FDA_get_health_claims_by_drug_name import (
+    FDA_get_health_claims_by_drug_name as FDA_get_health_claims_by_drug_name,
+)
+from .FDA_get_inactive_ingredient_info_by_drug_name import (
+    FDA_get_inactive_ingredient_info_by_drug_name as FDA_get_inactive_ingredient_info_by_drug_name,
+)
+from .FDA_get_indications_by_drug_name import (
+    FDA_get_indications_by_drug_name as FDA_get_indications_by_drug_name,
+)
+from .FDA_get_info_for_nursing_mothers_by_drug_name import (
+    FDA_get_info_for_nursing_mothers_by_drug_name as FDA_get_info_for_nursing_mothers_by_drug_name,
+)
+from .FDA_get_info_for_patients_by_drug_name import (
+    FDA_get_info_for_patients_by_drug_name as FDA_get_info_for_patients_by_drug_name,
+)
+from .FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name import (
+    FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name as FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name,
+)
+from .FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name import (
+    FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name as FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name,
+)
+from .FDA_get_information_for_owners_or_caregivers_by_drug_name import (
+    FDA_get_information_for_owners_or_caregivers_by_drug_name as FDA_get_information_for_owners_or_caregivers_by_drug_name,
+)
+from .FDA_get_ingredients_by_drug_name import (
+    FDA_get_ingredients_by_drug_name as FDA_get_ingredients_by_drug_name,
+)
+from .FDA_get_instructions_for_use_by_drug_name import (
+    FDA_get_instructions_for_use_by_drug_name as FDA_get_instructions_for_use_by_drug_name,
+)
+from .FDA_get_lab_test_interference_info_by_drug_name import (
+    FDA_get_lab_test_interference_info_by_drug_name as FDA_get_lab_test_interference_info_by_drug_name,
+)
+from .FDA_get_lab_tests_by_drug_name import (
+    FDA_get_lab_tests_by_drug_name as FDA_get_lab_tests_by_drug_name,
+)
+from .FDA_get_labor_and_delivery_info_by_drug_name import (
+    FDA_get_labor_and_delivery_info_by_drug_name as FDA_get_labor_and_delivery_info_by_drug_name,
+)
+from .FDA_get_manufacturer_name_NDC_number_by_drug_name import (
+    FDA_get_manufacturer_name_NDC_number_by_drug_name as FDA_get_manufacturer_name_NDC_number_by_drug_name,
+)
+from .FDA_get_mechanism_of_action_by_drug_name import (
+    FDA_get_mechanism_of_action_by_drug_name as FDA_get_mechanism_of_action_by_drug_name,
+)
+from .FDA_get_medication_guide_info_by_drug_name import (
+    FDA_get_medication_guide_info_by_drug_name as FDA_get_medication_guide_info_by_drug_name,
+)
+from .FDA_get_microbiology_info_by_drug_name import (
+    FDA_get_microbiology_info_by_drug_name as FDA_get_microbiology_info_by_drug_name,
+)
+from .FDA_get_nonclinical_toxicology_info_by_drug_name import (
+    FDA_get_nonclinical_toxicology_info_by_drug_name as FDA_get_nonclinical_toxicology_info_by_drug_name,
+)
+from .FDA_get_nonteratogenic_effects_by_drug_name import (
+    FDA_get_nonteratogenic_effects_by_drug_name as FDA_get_nonteratogenic_effects_by_drug_name,
+)
+from .FDA_get_other_safety_info_by_drug_name import (
+    FDA_get_other_safety_info_by_drug_name as FDA_get_other_safety_info_by_drug_name,
+)
+from .FDA_get_overdosage_info_by_drug_name import (
+    FDA_get_overdosage_info_by_drug_name as FDA_get_overdosage_info_by_drug_name,
+)
+from .FDA_get_patient_package_insert_from_drug_name import (
+    FDA_get_patient_package_insert_from_drug_name as FDA_get_patient_package_insert_from_drug_name,
+)
+from .FDA_get_pediatric_use_info_by_drug_name import (
+    FDA_get_pediatric_use_info_by_drug_name as FDA_get_pediatric_use_info_by_drug_name,
+)
+from .FDA_get_pharmacodynamics_by_drug_name import (
+    FDA_get_pharmacodynamics_by_drug_name as FDA_get_pharmacodynamics_by_drug_name,
+)
+from .FDA_get_pharmacogenomics_info_by_drug_name import (
+    FDA_get_pharmacogenomics_info_by_drug_name as FDA_get_pharmacogenomics_info_by_drug_name,
+)
+from .FDA_get_pharmacokinetics_by_drug_name import (
+    FDA_get_pharmacokinetics_by_drug_name as FDA_get_pharmacokinetics_by_drug_name,
+)
+from .FDA_get_population_use_info_by_drug_name import (
+    FDA_get_population_use_info_by_drug_name as FDA_get_population_use_info_by_drug_name,
+)
+from .FDA_get_precautions_by_drug_name import (
+    FDA_get_precautions_by_drug_name as FDA_get_precautions_by_drug_name,
+)
+from .FDA_get_pregnancy_effects_info_by_drug_name import (
+    FDA_get_pregnancy_effects_info_by_drug_name as FDA_get_pregnancy_effects_info_by_drug_name,
+)
+from .FDA_get_pregnancy_or_breastfeeding_info_by_drug_name import (
+    FDA_get_pregnancy_or_breastfeeding_info_by_drug_name as FDA_get_pregnancy_or_breastfeeding_info_by_drug_name,
+)
+from .FDA_get_principal_display_panel_by_drug_name import (
+    FDA_get_principal_display_panel_by_drug_name as FDA_get_principal_display_panel_by_drug_name,
+)
+from .FDA_get_purpose_info_by_drug_name import (
+    FDA_get_purpose_info_by_drug_name as FDA_get_purpose_info_by_drug_name,
+)
+from .FDA_get_recent_changes_by_drug_name import (
+    FDA_get_recent_changes_by_drug_name as FDA_get_recent_changes_by_drug_name,
+)
+from .FDA_get_reference_info_by_drug_name import (
+    FDA_get_reference_info_by_drug_name as FDA_get_reference_info_by_drug_name,
+)
+from .FDA_get_residue_warning_by_drug_name import (
+    FDA_get_residue_warning_by_drug_name as FDA_get_residue_warning_by_drug_name,
+)
+from .FDA_get_risk_info_by_drug_name import (
+    FDA_get_risk_info_by_drug_name as FDA_get_risk_info_by_drug_name,
+)
+from .FDA_get_route_info_by_drug_name import (
+    FDA_get_route_info_by_drug_name as FDA_get_route_info_by_drug_name,
+)
+from .FDA_get_safe_handling_warnings_by_drug_name import (
+    FDA_get_safe_handling_warnings_by_drug_name as FDA_get_safe_handling_warnings_by_drug_name,
+)
+from .FDA_get_safety_summary_by_drug_name import (
+    FDA_get_safety_summary_by_drug_name as FDA_get_safety_summary_by_drug_name,
+)
+from .FDA_get_spl_indexing_data_elements_by_drug_name import (
+    FDA_get_spl_indexing_data_elements_by_drug_name as FDA_get_spl_indexing_data_elements_by_drug_name,
+)
+from .FDA_get_spl_unclassified_section_by_drug_name import (
+    FDA_get_spl_unclassified_section_by_drug_name as FDA_get_spl_unclassified_section_by_drug_name,
+)
+from .FDA_get_stop_use_info_by_drug_name import (
+    FDA_get_stop_use_info_by_drug_name as FDA_get_stop_use_info_by_drug_name,
+)
+from .FDA_get_storage_and_handling_info_by_drug_name import (
+    FDA_get_storage_and_handling_info_by_drug_name as FDA_get_storage_and_handling_info_by_drug_name,
+)
+from .FDA_get_teratogenic_effects_by_drug_name import (
+    FDA_get_teratogenic_effects_by_drug_name as FDA_get_teratogenic_effects_by_drug_name,
+)
+from .FDA_get_user_safety_warning_by_drug_names import (
+    FDA_get_user_safety_warning_by_drug_names as FDA_get_user_safety_warning_by_drug_names,
+)
+from .FDA_get_warnings_and_cautions_by_drug_name import (
+    FDA_get_warnings_and_cautions_by_drug_name as FDA_get_warnings_and_cautions_by_drug_name,
+)
+from .FDA_get_warnings_by_drug_name import (
+    FDA_get_warnings_by_drug_name as FDA_get_warnings_by_drug_name,
+)
+from .FDA_get_when_using_info import FDA_get_when_using_info as FDA_get_when_using_info
+from .FDA_retrieve_device_use_by_drug_name import (
+    FDA_retrieve_device_use_by_drug_name as FDA_retrieve_device_use_by_drug_name,
+)
+from .FDA_retrieve_drug_name_by_device_use import (
+    FDA_retrieve_drug_name_by_device_use as FDA_retrieve_drug_name_by_device_use,
+)
+from .FDA_retrieve_drug_names_by_patient_medication_info import (
+    FDA_retrieve_drug_names_by_patient_medication_info as FDA_retrieve_drug_names_by_patient_medication_info,
+)
+from .FDA_retrieve_patient_medication_info_by_drug_name import (
+    FDA_retrieve_patient_medication_info_by_drug_name as FDA_retrieve_patient_medication_info_by_drug_name,
+)
+from .Fatcat_search_scholar import Fatcat_search_scholar as Fatcat_search_scholar
+from .Finish import Finish as Finish
+from .GIN_Guidelines_Search import GIN_Guidelines_Search as GIN_Guidelines_Search
+from .GO_get_annotations_for_gene import (
+    GO_get_annotations_for_gene as GO_get_annotations_for_gene,
+)
+from .GO_get_genes_for_term import GO_get_genes_for_term as GO_get_genes_for_term
+from .GO_get_term_by_id import GO_get_term_by_id as GO_get_term_by_id
+from .GO_get_term_details import GO_get_term_details as GO_get_term_details
+from .GO_search_terms import GO_search_terms as GO_search_terms
+from .GWAS_search_associations_by_gene import (
+    GWAS_search_associations_by_gene as GWAS_search_associations_by_gene,
+)
+from .HAL_search_archive import HAL_search_archive as HAL_search_archive
+from .HPA_get_biological_processes_by_gene import (
+    HPA_get_biological_processes_by_gene as HPA_get_biological_processes_by_gene,
+)
+from .HPA_get_cancer_prognostics_by_gene import (
+    HPA_get_cancer_prognostics_by_gene as HPA_get_cancer_prognostics_by_gene,
+)
+from .HPA_get_comparative_expression_by_gene_and_cellline import (
+    HPA_get_comparative_expression_by_gene_and_cellline as HPA_get_comparative_expression_by_gene_and_cellline,
+)
+from .HPA_get_comprehensive_gene_details_by_ensembl_id import (
+    HPA_get_comprehensive_gene_details_by_ensembl_id as HPA_get_comprehensive_gene_details_by_ensembl_id,
+)
+from .HPA_get_contextual_biological_process_analysis import (
+    HPA_get_contextual_biological_process_analysis as HPA_get_contextual_biological_process_analysis,
+)
+from .HPA_get_disease_expression_by_gene_tissue_disease import (
+    HPA_get_disease_expression_by_gene_tissue_disease as HPA_get_disease_expression_by_gene_tissue_disease,
+)
+from .HPA_get_gene_basic_info_by_ensembl_id import (
+    HPA_get_gene_basic_info_by_ensembl_id as HPA_get_gene_basic_info_by_ensembl_id,
+)
+from .HPA_get_gene_tsv_data_by_ensembl_id import (
+    HPA_get_gene_tsv_data_by_ensembl_id as HPA_get_gene_tsv_data_by_ensembl_id,
+)
+from .HPA_get_protein_interactions_by_gene import (
+    HPA_get_protein_interactions_by_gene as HPA_get_protein_interactions_by_gene,
+)
+from .HPA_get_rna_expression_by_source import (
+    HPA_get_rna_expression_by_source as HPA_get_rna_expression_by_source,
+)
+from .HPA_get_rna_expression_in_specific_tissues import (
+    HPA_get_rna_expression_in_specific_tissues as HPA_get_rna_expression_in_specific_tissues,
+)
+from .HPA_get_subcellular_location import (
+    HPA_get_subcellular_location as HPA_get_subcellular_location,
+)
+from .HPA_search_genes_by_query import (
+    HPA_search_genes_by_query as HPA_search_genes_by_query,
+)
+from .HypothesisGenerator import HypothesisGenerator as HypothesisGenerator
+from .LabelGenerator import LabelGenerator as LabelGenerator
+from .LiteratureContextReviewer import (
+    LiteratureContextReviewer as LiteratureContextReviewer,
+)
+from .LiteratureSearchTool import LiteratureSearchTool as LiteratureSearchTool
+from .LiteratureSynthesisAgent import (
+    LiteratureSynthesisAgent as LiteratureSynthesisAgent,
+)
+from .MedRxiv_search_preprints import (
+    MedRxiv_search_preprints as MedRxiv_search_preprints,
+)
+from .MedicalLiteratureReviewer import (
+    MedicalLiteratureReviewer as MedicalLiteratureReviewer,
+)
+from .MedicalTermNormalizer import MedicalTermNormalizer as MedicalTermNormalizer
+from .MedlinePlus_connect_lookup_by_code import (
+    MedlinePlus_connect_lookup_by_code as MedlinePlus_connect_lookup_by_code,
+)
+from .MedlinePlus_get_genetics_condition_by_name import (
+    MedlinePlus_get_genetics_condition_by_name as MedlinePlus_get_genetics_condition_by_name,
+)
+from .MedlinePlus_get_genetics_gene_by_name import (
+    MedlinePlus_get_genetics_gene_by_name as MedlinePlus_get_genetics_gene_by_name,
+)
+from .MedlinePlus_get_genetics_index import (
+    MedlinePlus_get_genetics_index as MedlinePlus_get_genetics_index,
+)
+from .MedlinePlus_search_topics_by_keyword import (
+    MedlinePlus_search_topics_by_keyword as MedlinePlus_search_topics_by_keyword,
+)
+from .MethodologyRigorReviewer import (
+    MethodologyRigorReviewer as MethodologyRigorReviewer,
+)
+from .NICE_Clinical_Guidelines_Search import (
+    NICE_Clinical_Guidelines_Search as NICE_Clinical_Guidelines_Search,
+)
+from .NICE_Guideline_Full_Text import (
+    NICE_Guideline_Full_Text as NICE_Guideline_Full_Text,
+)
+from .NoveltySignificanceReviewer import (
+    NoveltySignificanceReviewer as NoveltySignificanceReviewer,
+)
+from .OSF_search_preprints import OSF_search_preprints as OSF_search_preprints
+from .OSL_get_efo_id_by_disease_name import (
+    OSL_get_efo_id_by_disease_name as OSL_get_efo_id_by_disease_name,
+)
+from .OpenAIRE_search_publications import (
+    OpenAIRE_search_publications as OpenAIRE_search_publications,
+)
+from .OpenAlex_Guidelines_Search import (
+    OpenAlex_Guidelines_Search as OpenAlex_Guidelines_Search,
+)
+from .OpenTargets_drug_pharmacogenomics_data import (
+    OpenTargets_drug_pharmacogenomics_data as OpenTargets_drug_pharmacogenomics_data,
+)
+from .OpenTargets_get_approved_indications_by_drug_chemblId import (
+    OpenTargets_get_approved_indications_by_drug_chemblId as OpenTargets_get_approved_indications_by_drug_chemblId,
+)
+from .OpenTargets_get_associated_diseases_by_drug_chemblId import (
+    OpenTargets_get_associated_diseases_by_drug_chemblId as OpenTargets_get_associated_diseases_by_drug_chemblId,
+)
+from .OpenTargets_get_associated_drugs_by_disease_efoId import (
+    OpenTargets_get_associated_drugs_by_disease_efoId as OpenTargets_get_associated_drugs_by_disease_efoId,
+)
+from .OpenTargets_get_associated_drugs_by_target_ensemblID import (
+    OpenTargets_get_associated_drugs_by_target_ensemblID as OpenTargets_get_associated_drugs_by_target_ensemblID,
+)
+from .OpenTargets_get_associated_phenotypes_by_disease_efoId import (
+    OpenTargets_get_associated_phenotypes_by_disease_efoId as OpenTargets_get_associated_phenotypes_by_disease_efoId,
+)
+from .OpenTargets_get_associated_targets_by_disease_efoId import (
+    OpenTargets_get_associated_targets_by_disease_efoId as OpenTargets_get_associated_targets_by_disease_efoId,
+)
+from .OpenTargets_get_associated_targets_by_drug_chemblId import (
+    OpenTargets_get_associated_targets_by_drug_chemblId as OpenTargets_get_associated_targets_by_drug_chemblId,
+)
+from .OpenTargets_get_biological_mouse_models_by_ensemblID import (
+    OpenTargets_get_biological_mouse_models_by_ensemblID as OpenTargets_get_biological_mouse_models_by_ensemblID,
+)
+from .OpenTargets_get_chemical_probes_by_target_ensemblID import (
+    OpenTargets_get_chemical_probes_by_target_ensemblID as OpenTargets_get_chemical_probes_by_target_ensemblID,
+)
+from .OpenTargets_get_disease_ancestors_parents_by_efoId import (
+    OpenTargets_get_disease_ancestors_parents_by_efoId as OpenTargets_get_disease_ancestors_parents_by_efoId,
+)
+from .OpenTargets_get_disease_descendants_children_by_efoId import (
+    OpenTargets_get_disease_descendants_children_by_efoId as OpenTargets_get_disease_descendants_children_by_efoId,
+)
+from .OpenTargets_get_disease_description_by_efoId import (
+    OpenTargets_get_disease_description_by_efoId as OpenTargets_get_disease_description_by_efoId,
+)
+from .OpenTargets_get_disease_id_description_by_name import (
+    OpenTargets_get_disease_id_description_by_name as OpenTargets_get_disease_id_description_by_name,
+)
+from .OpenTargets_get_disease_ids_by_efoId import (
+    OpenTargets_get_disease_ids_by_efoId as OpenTargets_get_disease_ids_by_efoId,
+)
+from .OpenTargets_get_disease_ids_by_name import (
+    OpenTargets_get_disease_ids_by_name as OpenTargets_get_disease_ids_by_name,
+)
+from .OpenTargets_get_disease_locations_by_efoId import (
+    OpenTargets_get_disease_locations_by_efoId as OpenTargets_get_disease_locations_by_efoId,
+)
+from .OpenTargets_get_disease_synonyms_by_efoId import (
+    OpenTargets_get_disease_synonyms_by_efoId as OpenTargets_get_disease_synonyms_by_efoId,
+)
+from .OpenTargets_get_disease_therapeutic_areas_by_efoId import (
+    OpenTargets_get_disease_therapeutic_areas_by_efoId as OpenTargets_get_disease_therapeutic_areas_by_efoId,
+)
+from .OpenTargets_get_diseases_phenotypes_by_target_ensembl import (
+    OpenTargets_get_diseases_phenotypes_by_target_ensembl as OpenTargets_get_diseases_phenotypes_by_target_ensembl,
+)
+from .OpenTargets_get_drug_adverse_events_by_chemblId import (
+    OpenTargets_get_drug_adverse_events_by_chemblId as OpenTargets_get_drug_adverse_events_by_chemblId,
+)
+from .OpenTargets_get_drug_approval_status_by_chemblId import (
+    OpenTargets_get_drug_approval_status_by_chemblId as OpenTargets_get_drug_approval_status_by_chemblId,
+)
+from .OpenTargets_get_drug_chembId_by_generic_name import (
+    OpenTargets_get_drug_chembId_by_generic_name as OpenTargets_get_drug_chembId_by_generic_name,
+)
+from .OpenTargets_get_drug_description_by_chemblId import (
+    OpenTargets_get_drug_description_by_chemblId as OpenTargets_get_drug_description_by_chemblId,
+)
+from .OpenTargets_get_drug_id_description_by_name import (
+    OpenTargets_get_drug_id_description_by_name as OpenTargets_get_drug_id_description_by_name,
+)
+from .OpenTargets_get_drug_indications_by_chemblId import (
+    OpenTargets_get_drug_indications_by_chemblId as OpenTargets_get_drug_indications_by_chemblId,
+)
+from .OpenTargets_get_drug_mechanisms_of_action_by_chemblId import (
+    OpenTargets_get_drug_mechanisms_of_action_by_chemblId as OpenTargets_get_drug_mechanisms_of_action_by_chemblId,
+)
+from .OpenTargets_get_drug_synonyms_by_chemblId import (
+    OpenTargets_get_drug_synonyms_by_chemblId as OpenTargets_get_drug_synonyms_by_chemblId,
+)
+from .OpenTargets_get_drug_trade_names_by_chemblId import (
+    OpenTargets_get_drug_trade_names_by_chemblId as OpenTargets_get_drug_trade_names_by_chemblId,
+)
+from .OpenTargets_get_drug_warnings_by_chemblId import (
+    OpenTargets_get_drug_warnings_by_chemblId as OpenTargets_get_drug_warnings_by_chemblId,
+)
+from .OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId import (
+    OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId as OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId,
+)
+from .OpenTargets_get_gene_ontology_terms_by_goID import (
+    OpenTargets_get_gene_ontology_terms_by_goID as OpenTargets_get_gene_ontology_terms_by_goID,
+)
+from .OpenTargets_get_known_drugs_by_drug_chemblId import (
+    OpenTargets_get_known_drugs_by_drug_chemblId as OpenTargets_get_known_drugs_by_drug_chemblId,
+)
+from .OpenTargets_get_parent_child_molecules_by_drug_chembl_ID import (
+    OpenTargets_get_parent_child_molecules_by_drug_chembl_ID as OpenTargets_get_parent_child_molecules_by_drug_chembl_ID,
+)
+from .OpenTargets_get_publications_by_disease_efoId import (
+    OpenTargets_get_publications_by_disease_efoId as OpenTargets_get_publications_by_disease_efoId,
+)
+from .OpenTargets_get_publications_by_drug_chemblId import (
+    OpenTargets_get_publications_by_drug_chemblId as OpenTargets_get_publications_by_drug_chemblId,
+)
+from .OpenTargets_get_publications_by_target_ensemblID import (
+    OpenTargets_get_publications_by_target_ensemblID as OpenTargets_get_publications_by_target_ensemblID,
+)
+from .OpenTargets_get_similar_entities_by_disease_efoId import (
+    OpenTargets_get_similar_entities_by_disease_efoId as OpenTargets_get_similar_entities_by_disease_efoId,
+)
+from .OpenTargets_get_similar_entities_by_drug_chemblId import (
+    OpenTargets_get_similar_entities_by_drug_chemblId as OpenTargets_get_similar_entities_by_drug_chemblId,
+)
+from .OpenTargets_get_similar_entities_by_target_ensemblID import (
+    OpenTargets_get_similar_entities_by_target_ensemblID as OpenTargets_get_similar_entities_by_target_ensemblID,
+)
+from .OpenTargets_get_target_classes_by_ensemblID import (
+    OpenTargets_get_target_classes_by_ensemblID as OpenTargets_get_target_classes_by_ensemblID,
+)
+from .OpenTargets_get_target_constraint_info_by_ensemblID import (
+    OpenTargets_get_target_constraint_info_by_ensemblID as OpenTargets_get_target_constraint_info_by_ensemblID,
+)
+from .OpenTargets_get_target_enabling_packages_by_ensemblID import (
+    OpenTargets_get_target_enabling_packages_by_ensemblID as OpenTargets_get_target_enabling_packages_by_ensemblID,
+)
+from .OpenTargets_get_target_gene_ontology_by_ensemblID import (
+    OpenTargets_get_target_gene_ontology_by_ensemblID as OpenTargets_get_target_gene_ontology_by_ensemblID,
+)
+from .OpenTargets_get_target_genomic_location_by_ensemblID import (
+    OpenTargets_get_target_genomic_location_by_ensemblID as OpenTargets_get_target_genomic_location_by_ensemblID,
+)
+from .OpenTargets_get_target_homologues_by_ensemblID import (
+    OpenTargets_get_target_homologues_by_ensemblID as OpenTargets_get_target_homologues_by_ensemblID,
+)
+from .OpenTargets_get_target_id_description_by_name import (
+    OpenTargets_get_target_id_description_by_name as OpenTargets_get_target_id_description_by_name,
+)
+from .OpenTargets_get_target_interactions_by_ensemblID import (
+    OpenTargets_get_target_interactions_by_ensemblID as OpenTargets_get_target_interactions_by_ensemblID,
+)
+from .OpenTargets_get_target_safety_profile_by_ensemblID import (
+    OpenTargets_get_target_safety_profile_by_ensemblID as OpenTargets_get_target_safety_profile_by_ensemblID,
+)
+from .OpenTargets_get_target_subcellular_locations_by_ensemblID import (
+    OpenTargets_get_target_subcellular_locations_by_ensemblID as OpenTargets_get_target_subcellular_locations_by_ensemblID,
+)
+from .OpenTargets_get_target_synonyms_by_ensemblID import (
+    OpenTargets_get_target_synonyms_by_ensemblID as OpenTargets_get_target_synonyms_by_ensemblID,
+)
+from .OpenTargets_get_target_tractability_by_ensemblID import (
+    OpenTargets_get_target_tractability_by_ensemblID as OpenTargets_get_target_tractability_by_ensemblID,
+)
+from .OpenTargets_map_any_disease_id_to_all_other_ids import (
+    OpenTargets_map_any_disease_id_to_all_other_ids as OpenTargets_map_any_disease_id_to_all_other_ids,
+)
+from .OpenTargets_multi_entity_search_by_query_string import (
+    OpenTargets_multi_entity_search_by_query_string as OpenTargets_multi_entity_search_by_query_string,
+)
+from .OpenTargets_search_category_counts_by_query_string import (
+    OpenTargets_search_category_counts_by_query_string as OpenTargets_search_category_counts_by_query_string,
+)
+from .OpenTargets_target_disease_evidence import (
+    OpenTargets_target_disease_evidence as OpenTargets_target_disease_evidence,
+)
+from .OutputSummarizationComposer import (
+    OutputSummarizationComposer as OutputSummarizationComposer,
+)
+from .PMC_search_papers import PMC_search_papers as PMC_search_papers
+from .ProtocolOptimizer import ProtocolOptimizer as ProtocolOptimizer
+from .PubChem_get_CID_by_SMILES import (
+    PubChem_get_CID_by_SMILES as PubChem_get_CID_by_SMILES,
+)
+from .PubChem_get_CID_by_compound_name import (
+    PubChem_get_CID_by_compound_name as PubChem_get_CID_by_compound_name,
+)
+from .PubChem_get_associated_patents_by_CID import (
+    PubChem_get_associated_patents_by_CID as PubChem_get_associated_patents_by_CID,
+)
+from .PubChem_get_compound_2D_image_by_CID import (
+    PubChem_get_compound_2D_image_by_CID as PubChem_get_compound_2D_image_by_CID,
+)
+from .PubChem_get_compound_properties_by_CID import (
+    PubChem_get_compound_properties_by_CID as PubChem_get_compound_properties_by_CID,
+)
+from .PubChem_get_compound_synonyms_by_CID import (
+    PubChem_get_compound_synonyms_by_CID as PubChem_get_compound_synonyms_by_CID,
+)
+from .PubChem_get_compound_xrefs_by_CID import (
+    PubChem_get_compound_xrefs_by_CID as PubChem_get_compound_xrefs_by_CID,
+)
+from .PubChem_search_compounds_by_similarity import (
+    PubChem_search_compounds_by_similarity as PubChem_search_compounds_by_similarity,
+)
+from .PubChem_search_compounds_by_substructure import (
+    PubChem_search_compounds_by_substructure as PubChem_search_compounds_by_substructure,
+)
+from .PubMed_Guidelines_Search import (
+    PubMed_Guidelines_Search as PubMed_Guidelines_Search,
+)
+from .PubMed_search_articles import PubMed_search_articles as PubMed_search_articles
+from .PubTator3_EntityAutocomplete import (
+    PubTator3_EntityAutocomplete as PubTator3_EntityAutocomplete,
+)
+from .PubTator3_LiteratureSearch import (
+    PubTator3_LiteratureSearch as PubTator3_LiteratureSearch,
+)
+from .QuestionRephraser import QuestionRephraser as QuestionRephraser
+from .Reactome_get_pathway_reactions import (
+    Reactome_get_pathway_reactions as Reactome_get_pathway_reactions,
+)
+from .ReproducibilityTransparencyReviewer import (
+    ReproducibilityTransparencyReviewer as ReproducibilityTransparencyReviewer,
+)
+from .ResultsInterpretationReviewer import (
+    ResultsInterpretationReviewer as ResultsInterpretationReviewer,
+)
+from .ScientificTextSummarizer import (
+    ScientificTextSummarizer as ScientificTextSummarizer,
+)
+from .SemanticScholar_search_papers import (
+    SemanticScholar_search_papers as SemanticScholar_search_papers,
+)
+from .TRIP_Database_Guidelines_Search import (
+    TRIP_Database_Guidelines_Search as TRIP_Database_Guidelines_Search,
+)
+from .TestCaseGenerator import TestCaseGenerator as TestCaseGenerator
+from .ToolCompatibilityAnalyzer import (
+    ToolCompatibilityAnalyzer as ToolCompatibilityAnalyzer,
+)
+from .ToolDescriptionOptimizer import (
+    ToolDescriptionOptimizer as ToolDescriptionOptimizer,
+)
+from .ToolDiscover import ToolDiscover as ToolDiscover
+from .ToolGraphComposer import ToolGraphComposer as ToolGraphComposer
+from .ToolGraphGenerationPipeline import (
+    ToolGraphGenerationPipeline as ToolGraphGenerationPipeline,
+)
+from .ToolImplementationGenerator import (
+    ToolImplementationGenerator as ToolImplementationGenerator,
+)
+from .ToolMetadataGenerationPipeline import (
+    ToolMetadataGenerationPipeline as ToolMetadataGenerationPipeline,
+)
+from .ToolMetadataGenerator import ToolMetadataGenerator as ToolMetadataGenerator
+from .ToolMetadataStandardizer import (
+    ToolMetadataStandardizer as ToolMetadataStandardizer,
+)
+from .ToolOptimizer import ToolOptimizer as ToolOptimizer
+from .ToolOutputSummarizer import ToolOutputSummarizer as ToolOutputSummarizer
+from .ToolQualityEvaluator import ToolQualityEvaluator as ToolQualityEvaluator
+from .ToolRelationshipDetector import (
+    ToolRelationshipDetector as ToolRelationshipDetector,
+)
+from .ToolSpecificationGenerator import (
+    ToolSpecificationGenerator as ToolSpecificationGenerator,
+)
+from .ToolSpecificationOptimizer import (
+    ToolSpecificationOptimizer as ToolSpecificationOptimizer,
+)
+from .Tool_Finder import Tool_Finder as Tool_Finder
+from .Tool_Finder_Keyword import Tool_Finder_Keyword as Tool_Finder_Keyword
+from .Tool_Finder_LLM import Tool_Finder_LLM as Tool_Finder_LLM
+from .Tool_RAG import Tool_RAG as Tool_RAG
+from .UCSC_get_genes_by_region import (
+    UCSC_get_genes_by_region as UCSC_get_genes_by_region,
+)
+from .UniProt_get_alternative_names_by_accession import (
+    UniProt_get_alternative_names_by_accession as UniProt_get_alternative_names_by_accession,
+)
+from .UniProt_get_disease_variants_by_accession import (
+    UniProt_get_disease_variants_by_accession as UniProt_get_disease_variants_by_accession,
+)
+from .UniProt_get_entry_by_accession import (
+    UniProt_get_entry_by_accession as UniProt_get_entry_by_accession,
+)
+from .UniProt_get_function_by_accession import (
+    UniProt_get_function_by_accession as UniProt_get_function_by_accession,
+)
+from .UniProt_get_isoform_ids_by_accession import (
+    UniProt_get_isoform_ids_by_accession as UniProt_get_isoform_ids_by_accession,
+)
+from .UniProt_get_organism_by_accession import (
+    UniProt_get_organism_by_accession as UniProt_get_organism_by_accession,
+)
+from .UniProt_get_ptm_processing_by_accession import (
+    UniProt_get_ptm_processing_by_accession as UniProt_get_ptm_processing_by_accession,
+)
+from .UniProt_get_recommended_name_by_accession import (
+    UniProt_get_recommended_name_by_accession as UniProt_get_recommended_name_by_accession,
+)
+from .UniProt_get_sequence_by_accession import (
+    UniProt_get_sequence_by_accession as UniProt_get_sequence_by_accession,
+)
+from .UniProt_get_subcellular_location_by_accession import (
+    UniProt_get_subcellular_location_by_accession as UniProt_get_subcellular_location_by_accession,
+)
+from .Unpaywall_check_oa_status import (
+    Unpaywall_check_oa_status as Unpaywall_check_oa_status,
+)
+from .WHO_Guideline_Full_Text import WHO_Guideline_Full_Text as WHO_Guideline_Full_Text
+from .WHO_Guidelines_Search import WHO_Guidelines_Search as WHO_Guidelines_Search
+from .Wikidata_SPARQL_query import Wikidata_SPARQL_query as Wikidata_SPARQL_query
+from .WritingPresentationReviewer import (
+    WritingPresentationReviewer as WritingPresentationReviewer,
+)
+from .Zenodo_search_records import Zenodo_search_records as Zenodo_search_records
+from .alphafold_get_annotations import (
+    alphafold_get_annotations as alphafold_get_annotations,
+)
+from .alphafold_get_prediction import (
+    alphafold_get_prediction as alphafold_get_prediction,
+)
+from .alphafold_get_summary import alphafold_get_summary as alphafold_get_summary
+from .call_agentic_human import call_agentic_human as call_agentic_human
+from .cancer_biomarkers_disease_target_score import (
+    cancer_biomarkers_disease_target_score as cancer_biomarkers_disease_target_score,
+)
+from .cancer_gene_census_disease_target_score import (
+    cancer_gene_census_disease_target_score as cancer_gene_census_disease_target_score,
+)
+from .cellosaurus_get_cell_line_info import (
+    cellosaurus_get_cell_line_info as cellosaurus_get_cell_line_info,
+)
+from .cellosaurus_query_converter import (
+    cellosaurus_query_converter as cellosaurus_query_converter,
+)
+from .cellosaurus_search_cell_lines import (
+    cellosaurus_search_cell_lines as cellosaurus_search_cell_lines,
+)
+from .chembl_disease_target_score import (
+    chembl_disease_target_score as chembl_disease_target_score,
+)
+from .convert_to_markdown import convert_to_markdown as convert_to_markdown
+from .dbSNP_get_variant_by_rsid import (
+    dbSNP_get_variant_by_rsid as dbSNP_get_variant_by_rsid,
+)
+from .dict_search import dict_search as dict_search
+from .dili_search import dili_search as dili_search
+from .diqt_search import diqt_search as diqt_search
+from .disease_target_score import disease_target_score as disease_target_score
+from .drugbank_filter_drugs_by_name import (
+    drugbank_filter_drugs_by_name as drugbank_filter_drugs_by_name,
+)
+from .drugbank_full_search import drugbank_full_search as drugbank_full_search
+from .drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id as drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id,
+)
+from .drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id as drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id,
+)
+from .drugbank_get_drug_interactions_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_interactions_by_drug_name_or_drugbank_id as drugbank_get_drug_interactions_by_drug_name_or_drugbank_id,
+)
+from .drugbank_get_drug_name_and_description_by_indication import (
+    drugbank_get_drug_name_and_description_by_indication as drugbank_get_drug_name_and_description_by_indication,
+)
+from .drugbank_get_drug_name_and_description_by_pathway_name import (
+    drugbank_get_drug_name_and_description_by_pathway_name as drugbank_get_drug_name_and_description_by_pathway_name,
+)
+from .drugbank_get_drug_name_and_description_by_target_name import (
+    drugbank_get_drug_name_and_description_by_target_name as drugbank_get_drug_name_and_description_by_target_name,
+)
+from .drugbank_get_drug_name_description_pharmacology_by_mechanism_of_action import (
+    drugbank_get_drug_name_description_pharmacology_by_mechanism_of_action as drugbank_get_drug_name_description_pharmacology_by_mechanism_of_action,
+)
+from .drugbank_get_drug_pathways_and_reactions_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_pathways_and_reactions_by_drug_name_or_drugbank_id as drugbank_get_drug_pathways_and_reactions_by_drug_name_or_drugbank_id,
+)
+from .drugbank_get_drug_products_by_name_or_drugbank_id import (
+    drugbank_get_drug_products_by_name_or_drugbank_id as drugbank_get_drug_products_by_name_or_drugbank_id,
+)
+from .drugbank_get_drug_references_by_drug_name_or_drugbank_id import (
+    drugbank_get_drug_references_by_drug_name_or_drugbank_id as drugbank_get_drug_references_by_drug_name_or_drugbank_id,
+)
+from .drugbank_get_indications_by_drug_name_or_drugbank_id import (
+    drugbank_get_indications_by_drug_name_or_drugbank_id as drugbank_get_indications_by_drug_name_or_drugbank_id,
+)
+from .drugbank_get_pharmacology_by_drug_name_or_drugbank_id import (
+    drugbank_get_pharmacology_by_drug_name_or_drugbank_id as drugbank_get_pharmacology_by_drug_name_or_drugbank_id,
+)
+from .drugbank_get_safety_by_drug_name_or_drugbank_id import (
+    drugbank_get_safety_by_drug_name_or_drugbank_id as drugbank_get_safety_by_drug_name_or_drugbank_id,
+)
+from .drugbank_get_targets_by_drug_name_or_drugbank_id import (
+    drugbank_get_targets_by_drug_name_or_drugbank_id as drugbank_get_targets_by_drug_name_or_drugbank_id,
+)
+from .drugbank_links_search import drugbank_links_search as drugbank_links_search
+from .drugbank_vocab_filter import drugbank_vocab_filter as drugbank_vocab_filter
+from .drugbank_vocab_search import drugbank_vocab_search as drugbank_vocab_search
+from .embedding_database_add import embedding_database_add as embedding_database_add
+from .embedding_database_create import (
+    embedding_database_create as embedding_database_create,
+)
+from .embedding_database_load import embedding_database_load as embedding_database_load
+from .embedding_database_search import (
+    embedding_database_search as embedding_database_search,
+)
+from .embedding_sync_download import embedding_sync_download as embedding_sync_download
+from .embedding_sync_upload import embedding_sync_upload as embedding_sync_upload
+from .enrichr_gene_enrichment_analysis import (
+    enrichr_gene_enrichment_analysis as enrichr_gene_enrichment_analysis,
+)
+from .europepmc_disease_target_score import (
+    europepmc_disease_target_score as europepmc_disease_target_score,
+)
+from .eva_disease_target_score import (
+    eva_disease_target_score as eva_disease_target_score,
+)
+from .eva_somatic_disease_target_score import (
+    eva_somatic_disease_target_score as eva_somatic_disease_target_score,
+)
+from .expression_atlas_disease_target_score import (
+    expression_atlas_disease_target_score as expression_atlas_disease_target_score,
+)
+from .extract_clinical_trial_adverse_events import (
+    extract_clinical_trial_adverse_events as extract_clinical_trial_adverse_events,
+)
+from .extract_clinical_trial_outcomes import (
+    extract_clinical_trial_outcomes as extract_clinical_trial_outcomes,
+)
+from .genomics_england_disease_target_score import (
+    genomics_england_disease_target_score as genomics_england_disease_target_score,
+)
+from .get_HPO_ID_by_phenotype import get_HPO_ID_by_phenotype as get_HPO_ID_by_phenotype
+from .get_albumentations_info import get_albumentations_info as get_albumentations_info
+from .get_altair_info import get_altair_info as get_altair_info
+from .get_anndata_info import get_anndata_info as get_anndata_info
+from .get_arboreto_info import get_arboreto_info as get_arboreto_info
+from .get_arxiv_info import get_arxiv_info as get_arxiv_info
+from .get_ase_info import get_ase_info as get_ase_info
+from .get_assembly_info_by_pdb_id import (
+    get_assembly_info_by_pdb_id as get_assembly_info_by_pdb_id,
+)
+from .get_assembly_summary import get_assembly_summary as get_assembly_summary
+from .get_astropy_info import get_astropy_info as get_astropy_info
+from .get_binding_affinity_by_pdb_id import (
+    get_binding_affinity_by_pdb_id as get_binding_affinity_by_pdb_id,
+)
+from .get_biopandas_info import get_biopandas_info as get_biopandas_info
+from .get_biopython_info import get_biopython_info as get_biopython_info
+from .get_bioservices_info import get_bioservices_info as get_bioservices_info
+from .get_biotite_info import get_biotite_info as get_biotite_info
+from .get_bokeh_info import get_bokeh_info as get_bokeh_info
+from .get_brian2_info import get_brian2_info as get_brian2_info
+from .get_cartopy_info import get_cartopy_info as get_cartopy_info
+from .get_catboost_info import get_catboost_info as get_catboost_info
+from .get_cellpose_info import get_cellpose_info as get_cellpose_info
+from .get_cellrank_info import get_cellrank_info as get_cellrank_info
+from .get_cellxgene_census_info import (
+    get_cellxgene_census_info as get_cellxgene_census_info,
+)
+from .get_cftime_info import get_cftime_info as get_cftime_info
+from .get_chem_comp_audit_info import (
+    get_chem_comp_audit_info as get_chem_comp_audit_info,
+)
+from .get_chem_comp_charge_and_ambiguity import (
+    get_chem_comp_charge_and_ambiguity as get_chem_comp_charge_and_ambiguity,
+)
+from .get_chembl_webresource_client_info import (
+    get_chembl_webresource_client_info as get_chembl_webresource_client_info,
+)
+from .get_citation_info_by_pdb_id import (
+    get_citation_info_by_pdb_id as get_citation_info_by_pdb_id,
+)
+from .get_clair3_info import get_clair3_info as get_clair3_info
+from .get_clinical_trial_conditions_and_interventions import (
+    get_clinical_trial_conditions_and_interventions as get_clinical_trial_conditions_and_interventions,
+)
+from .get_clinical_trial_descriptions import (
+    get_clinical_trial_descriptions as get_clinical_trial_descriptions,
+)
+from .get_clinical_trial_eligibility_criteria import (
+    get_clinical_trial_eligibility_criteria as get_clinical_trial_eligibility_criteria,
+)
+from .get_clinical_trial_locations import (
+    get_clinical_trial_locations as get_clinical_trial_locations,
+)
+from .get_clinical_trial_outcome_measures import (
+    get_clinical_trial_outcome_measures as get_clinical_trial_outcome_measures,
+)
+from .get_clinical_trial_references import (
+    get_clinical_trial_references as get_clinical_trial_references,
+)
+from .get_clinical_trial_status_and_dates import (
+    get_clinical_trial_status_and_dates as get_clinical_trial_status_and_dates,
+)
+from .get_cobra_info import get_cobra_info as get_cobra_info
+from .get_cobrapy_info import get_cobrapy_info as get_cobrapy_info
+from .get_cooler_info import get_cooler_info as get_cooler_info
+from .get_core_refinement_statistics import (
+    get_core_refinement_statistics as get_core_refinement_statistics,
+)
+from .get_cryosparc_tools_info import (
+    get_cryosparc_tools_info as get_cryosparc_tools_info,
+)
+from .get_crystal_growth_conditions_by_pdb_id import (
+    get_crystal_growth_conditions_by_pdb_id as get_crystal_growth_conditions_by_pdb_id,
+)
+from .get_crystallization_ph_by_pdb_id import (
+    get_crystallization_ph_by_pdb_id as get_crystallization_ph_by_pdb_id,
+)
+from .get_crystallographic_properties_by_pdb_id import (
+    get_crystallographic_properties_by_pdb_id as get_crystallographic_properties_by_pdb_id,
+)
+from .get_cupy_info import get_cupy_info as get_cupy_info
+from .get_cyvcf2_info import get_cyvcf2_info as get_cyvcf2_info
+from .get_dask_info import get_dask_info as get_dask_info
+from .get_datamol_info import get_datamol_info as get_datamol_info
+from .get_datashader_info import get_datashader_info as get_datashader_info
+from .get_deepchem_info import get_deepchem_info as get_deepchem_info
+from .get_deeppurpose_info import get_deeppurpose_info as get_deeppurpose_info
+from .get_deeptools_info import get_deeptools_info as get_deeptools_info
+from .get_deepxde_info import get_deepxde_info as get_deepxde_info
+from .get_dendropy_info import get_dendropy_info as get_dendropy_info
+from .get_descriptastorus_info import (
+    get_descriptastorus_info as get_descriptastorus_info,
+)
+from .get_diffdock_info import get_diffdock_info as get_diffdock_info
+from .get_dscribe_info import get_dscribe_info as get_dscribe_info
+from .get_ec_number_by_entity_id import (
+    get_ec_number_by_entity_id as get_ec_number_by_entity_id,
+)
+from .get_elephant_info import get_elephant_info as get_elephant_info
+from .get_em_3d_fitting_and_reconstruction_details import (
+    get_em_3d_fitting_and_reconstruction_details as get_em_3d_fitting_and_reconstruction_details,
+)
+from .get_emdb_ids_by_pdb_id import get_emdb_ids_by_pdb_id as get_emdb_ids_by_pdb_id
+from .get_episcanpy_info import get_episcanpy_info as get_episcanpy_info
+from .get_ete3_info import get_ete3_info as get_ete3_info
+from .get_faiss_info import get_faiss_info as get_faiss_info
+from .get_fanc_info import get_fanc_info as get_fanc_info
+from .get_flask_info import get_flask_info as get_flask_info
+from .get_flowio_info import get_flowio_info as get_flowio_info
+from .get_flowkit_info import get_flowkit_info as get_flowkit_info
+from .get_flowutils_info import get_flowutils_info as get_flowutils_info
+from .get_freesasa_info import get_freesasa_info as get_freesasa_info
+from .get_galpy_info import get_galpy_info as get_galpy_info
+from .get_gene_name_by_entity_id import (
+    get_gene_name_by_entity_id as get_gene_name_by_entity_id,
+)
+from .get_geopandas_info import get_geopandas_info as get_geopandas_info
+from .get_gget_info import get_gget_info as get_gget_info
+from .get_googlesearch_python_info import (
+    get_googlesearch_python_info as get_googlesearch_python_info,
+)
+from .get_gseapy_info import get_gseapy_info as get_gseapy_info
+from .get_h5py_info import get_h5py_info as get_h5py_info
+from .get_harmony_pytorch_info import (
+    get_harmony_pytorch_info as get_harmony_pytorch_info,
+)
+from .get_hmmlearn_info import get_hmmlearn_info as get_hmmlearn_info
+from .get_holoviews_info import get_holoviews_info as get_holoviews_info
+from .get_host_organism_by_pdb_id import (
+    get_host_organism_by_pdb_id as get_host_organism_by_pdb_id,
+)
+from .get_htmd_info import get_htmd_info as get_htmd_info
+from .get_hyperopt_info import get_hyperopt_info as get_hyperopt_info
+from .get_igraph_info import get_igraph_info as get_igraph_info
+from .get_imageio_info import get_imageio_info as get_imageio_info
+from .get_imbalanced_learn_info import (
+    get_imbalanced_learn_info as get_imbalanced_learn_info,
+)
+from .get_jcvi_info import get_jcvi_info as get_jcvi_info
+from .get_joblib_info import get_joblib_info as get_joblib_info
+from .get_joint_associated_diseases_by_HPO_ID_list import (
+    get_joint_associated_diseases_by_HPO_ID_list as get_joint_associated_diseases_by_HPO_ID_list,
+)
+from .get_khmer_info import get_khmer_info as get_khmer_info
+from .get_kipoiseq_info import get_kipoiseq_info as get_kipoiseq_info
+from .get_lifelines_info import get_lifelines_info as get_lifelines_info
+from .get_ligand_bond_count_by_pdb_id import (
+    get_ligand_bond_count_by_pdb_id as get_ligand_bond_count_by_pdb_id,
+)
+from .get_ligand_smiles_by_chem_comp_id import (
+    get_ligand_smiles_by_chem_comp_id as get_ligand_smiles_by_chem_comp_id,
+)
+from .get_lightgbm_info import get_lightgbm_info as get_lightgbm_info
+from .get_loompy_info import get_loompy_info as get_loompy_info
+from .get_mageck_info import get_mageck_info as get_mageck_info
+from .get_matplotlib_info import get_matplotlib_info as get_matplotlib_info
+from .get_mdanalysis_info import get_mdanalysis_info as get_mdanalysis_info
+from .get_mdtraj_info import get_mdtraj_info as get_mdtraj_info
+from .get_mne_info import get_mne_info as get_mne_info
+from .get_molfeat_info import get_molfeat_info as get_molfeat_info
+from .get_molvs_info import get_molvs_info as get_molvs_info
+from .get_mordred_info import get_mordred_info as get_mordred_info
+from .get_msprime_info import get_msprime_info as get_msprime_info
+from .get_mudata_info import get_mudata_info as get_mudata_info
+from .get_mutation_annotations_by_pdb_id import (
+    get_mutation_annotations_by_pdb_id as get_mutation_annotations_by_pdb_id,
+)
+from .get_neo_info import get_neo_info as get_neo_info
+from .get_netcdf4_info import get_netcdf4_info as get_netcdf4_info
+from .get_networkx_info import get_networkx_info as get_networkx_info
+from .get_nglview_info import get_nglview_info as get_nglview_info
+from .get_nilearn_info import get_nilearn_info as get_nilearn_info
+from .get_numba_info import get_numba_info as get_numba_info
+from .get_numpy_info import get_numpy_info as get_numpy_info
+from .get_oligosaccharide_descriptors_by_entity_id import (
+    get_oligosaccharide_descriptors_by_entity_id as get_oligosaccharide_descriptors_by_entity_id,
+)
+from .get_openbabel_info import get_openbabel_info as get_openbabel_info
+from .get_openchem_info import get_openchem_info as get_openchem_info
+from .get_opencv_info import get_opencv_info as get_opencv_info
+from .get_openmm_info import get_openmm_info as get_openmm_info
+from .get_optlang_info import get_optlang_info as get_optlang_info
+from .get_optuna_info import get_optuna_info as get_optuna_info
+from .get_palantir_info import get_palantir_info as get_palantir_info
+from .get_pandas_info import get_pandas_info as get_pandas_info
+from .get_patsy_info import get_patsy_info as get_patsy_info
+from .get_pdbfixer_info import get_pdbfixer_info as get_pdbfixer_info
+from .get_phenotype_by_HPO_ID import get_phenotype_by_HPO_ID as get_phenotype_by_HPO_ID
+from .get_pillow_info import get_pillow_info as get_pillow_info
+from .get_plantcv_info import get_plantcv_info as get_plantcv_info
+from .get_plip_info import get_plip_info as get_plip_info
+from .get_plotly_info import get_plotly_info as get_plotly_info
+from .get_poliastro_info import get_poliastro_info as get_poliastro_info
+from .get_polymer_entity_annotations import (
+    get_polymer_entity_annotations as get_polymer_entity_annotations,
+)
+from .get_polymer_entity_count_by_pdb_id import (
+    get_polymer_entity_count_by_pdb_id as get_polymer_entity_count_by_pdb_id,
+)
+from .get_polymer_entity_ids_by_pdb_id import (
+    get_polymer_entity_ids_by_pdb_id as get_polymer_entity_ids_by_pdb_id,
+)
+from .get_polymer_entity_type_by_entity_id import (
+    get_polymer_entity_type_by_entity_id as get_polymer_entity_type_by_entity_id,
+)
+from .get_polymer_molecular_weight_by_entity_id import (
+    get_polymer_molecular_weight_by_entity_id as get_polymer_molecular_weight_by_entity_id,
+)
+from .get_poretools_info import get_poretools_info as get_poretools_info
+from .get_prody_info import get_prody_info as get_prody_info
+from .get_protein_classification_by_pdb_id import (
+    get_protein_classification_by_pdb_id as get_protein_classification_by_pdb_id,
+)
+from .get_protein_metadata_by_pdb_id import (
+    get_protein_metadata_by_pdb_id as get_protein_metadata_by_pdb_id,
+)
+from .get_pubchempy_info import get_pubchempy_info as get_pubchempy_info
+from .get_pybedtools_info import get_pybedtools_info as get_pybedtools_info
+from .get_pybigwig_info import get_pybigwig_info as get_pybigwig_info
+from .get_pydeseq2_info import get_pydeseq2_info as get_pydeseq2_info
+from .get_pyensembl_info import get_pyensembl_info as get_pyensembl_info
+from .get_pyephem_info import get_pyephem_info as get_pyephem_info
+from .get_pyfaidx_info import get_pyfaidx_info as get_pyfaidx_info
+from .get_pyfasta_info import get_pyfasta_info as get_pyfasta_info
+from .get_pykalman_info import get_pykalman_info as get_pykalman_info
+from .get_pyliftover_info import get_pyliftover_info as get_pyliftover_info
+from .get_pymassspec_info import get_pymassspec_info as get_pymassspec_info
+from .get_pymed_info import get_pymed_info as get_pymed_info
+from .get_pymzml_info import get_pymzml_info as get_pymzml_info
+from .get_pypdf2_info import get_pypdf2_info as get_pypdf2_info
+from .get_pyranges_info import get_pyranges_info as get_pyranges_info
+from .get_pyrosetta_info import get_pyrosetta_info as get_pyrosetta_info
+from .get_pysam_info import get_pysam_info as get_pysam_info
+from .get_pyscenic_info import get_pyscenic_info as get_pyscenic_info
+from .get_pyscf_info import get_pyscf_info as get_pyscf_info
+from .get_pyscreener_info import get_pyscreener_info as get_pyscreener_info
+from .get_pytdc_info import get_pytdc_info as get_pytdc_info
+from .get_python_libsbml_info import get_python_libsbml_info as get_python_libsbml_info
+from .get_pytorch_info import get_pytorch_info as get_pytorch_info
+from .get_pyvcf_info import get_pyvcf_info as get_pyvcf_info
+from .get_pyvis_info import get_pyvis_info as get_pyvis_info
+from .get_qutip_info import get_qutip_info as get_qutip_info
+from .get_rasterio_info import get_rasterio_info as get_rasterio_info
+from .get_rdkit_info import get_rdkit_info as get_rdkit_info
+from .get_refinement_resolution_by_pdb_id import (
+    get_refinement_resolution_by_pdb_id as get_refinement_resolution_by_pdb_id,
+)
+from .get_release_deposit_dates_by_pdb_id import (
+    get_release_deposit_dates_by_pdb_id as get_release_deposit_dates_by_pdb_id,
+)
+from .get_reportlab_info import get_reportlab_info as get_reportlab_info
+from .get_requests_info import get_requests_info as get_requests_info
+from .get_ruptures_info import get_ruptures_info as get_ruptures_info
+from .get_scanorama_info import get_scanorama_info as get_scanorama_info
+from .get_scanpy_info import get_scanpy_info as get_scanpy_info
+from .get_schnetpack_info import get_schnetpack_info as get_schnetpack_info
+from .get_scholarly_info import get_scholarly_info as get_scholarly_info
+from .get_scikit_bio_info import get_scikit_bio_info as get_scikit_bio_info
+from .get_scikit_image_info import get_scikit_image_info as get_scikit_image_info
+from .get_scikit_learn_info import get_scikit_learn_info as get_scikit_learn_info
+from .get_scipy_info import get_scipy_info as get_scipy_info
+from .get_scrublet_info import get_scrublet_info as get_scrublet_info
+from .get_scvelo_info import get_scvelo_info as get_scvelo_info
+from .get_scvi_tools_info import get_scvi_tools_info as get_scvi_tools_info
+from .get_seaborn_info import get_seaborn_info as get_seaborn_info
+from .get_sequence_by_pdb_id import get_sequence_by_pdb_id as get_sequence_by_pdb_id
+from .get_sequence_lengths_by_pdb_id import (
+    get_sequence_lengths_by_pdb_id as get_sequence_lengths_by_pdb_id,
+)
+from .get_sequence_positional_features_by_instance_id import (
+    get_sequence_positional_features_by_instance_id as get_sequence_positional_features_by_instance_id,
+)
+from .get_skopt_info import get_skopt_info as get_skopt_info
+from .get_souporcell_info import get_souporcell_info as get_souporcell_info
+from .get_source_organism_by_pdb_id import (
+    get_source_organism_by_pdb_id as get_source_organism_by_pdb_id,
+)
+from .get_space_group_by_pdb_id import (
+    get_space_group_by_pdb_id as get_space_group_by_pdb_id,
+)
+from .get_statsmodels_info import get_statsmodels_info as get_statsmodels_info
+from .get_structure_determination_software_by_pdb_id import (
+    get_structure_determination_software_by_pdb_id as get_structure_determination_software_by_pdb_id,
+)
+from .get_structure_title_by_pdb_id import (
+    get_structure_title_by_pdb_id as get_structure_title_by_pdb_id,
+)
+from .get_structure_validation_metrics_by_pdb_id import (
+    get_structure_validation_metrics_by_pdb_id as get_structure_validation_metrics_by_pdb_id,
+)
+from .get_sunpy_info import get_sunpy_info as get_sunpy_info
+from .get_sympy_info import get_sympy_info as get_sympy_info
+from .get_target_cofactor_info import (
+    get_target_cofactor_info as get_target_cofactor_info,
+)
+from .get_taxonomy_by_pdb_id import get_taxonomy_by_pdb_id as get_taxonomy_by_pdb_id
+from .get_tiledb_info import get_tiledb_info as get_tiledb_info
+from .get_tiledbsoma_info import get_tiledbsoma_info as get_tiledbsoma_info
+from .get_torch_geometric_info import (
+    get_torch_geometric_info as get_torch_geometric_info,
+)
+from .get_tqdm_info import get_tqdm_info as get_tqdm_info
+from .get_trackpy_info import get_trackpy_info as get_trackpy_info
+from .get_tskit_info import get_tskit_info as get_tskit_info
+from .get_umap_learn_info import get_umap_learn_info as get_umap_learn_info
+from .get_uniprot_accession_by_entity_id import (
+    get_uniprot_accession_by_entity_id as get_uniprot_accession_by_entity_id,
+)
+from .get_velocyto_info import get_velocyto_info as get_velocyto_info
+from .get_viennarna_info import get_viennarna_info as get_viennarna_info
+from .get_webpage_text_from_url import (
+    get_webpage_text_from_url as get_webpage_text_from_url,
+)
+from .get_webpage_title import get_webpage_title as get_webpage_title
+from .get_xarray_info import get_xarray_info as get_xarray_info
+from .get_xesmf_info import get_xesmf_info as get_xesmf_info
+from .get_xgboost_info import get_xgboost_info as get_xgboost_info
+from .get_zarr_info import get_zarr_info as get_zarr_info
+from .gnomAD_query_variant import gnomAD_query_variant as gnomAD_query_variant
+from .gwas_get_association_by_id import (
+    gwas_get_association_by_id as gwas_get_association_by_id,
+)
+from .gwas_get_associations_for_snp import (
+    gwas_get_associations_for_snp as gwas_get_associations_for_snp,
+)
+from .gwas_get_associations_for_study import (
+    gwas_get_associations_for_study as gwas_get_associations_for_study,
+)
+from .gwas_get_associations_for_trait import (
+    gwas_get_associations_for_trait as gwas_get_associations_for_trait,
+)
+from .gwas_get_snp_by_id import gwas_get_snp_by_id as gwas_get_snp_by_id
+from .gwas_get_snps_for_gene import gwas_get_snps_for_gene as gwas_get_snps_for_gene
+from .gwas_get_studies_for_trait import (
+    gwas_get_studies_for_trait as gwas_get_studies_for_trait,
+)
+from .gwas_get_study_by_id import gwas_get_study_by_id as gwas_get_study_by_id
+from .gwas_get_variants_for_trait import (
+    gwas_get_variants_for_trait as gwas_get_variants_for_trait,
+)
+from .gwas_search_associations import (
+    gwas_search_associations as gwas_search_associations,
+)
+from .gwas_search_snps import gwas_search_snps as gwas_search_snps
+from .gwas_search_studies import gwas_search_studies as gwas_search_studies
+from .humanbase_ppi_analysis import humanbase_ppi_analysis as humanbase_ppi_analysis
+from .mesh_get_subjects_by_pharmacological_action import (
+    mesh_get_subjects_by_pharmacological_action as mesh_get_subjects_by_pharmacological_action,
+)
+from .mesh_get_subjects_by_subject_id import (
+    mesh_get_subjects_by_subject_id as mesh_get_subjects_by_subject_id,
+)
+from .mesh_get_subjects_by_subject_name import (
+    mesh_get_subjects_by_subject_name as mesh_get_subjects_by_subject_name,
+)
+from .mesh_get_subjects_by_subject_scope_or_definition import (
+    mesh_get_subjects_by_subject_scope_or_definition as mesh_get_subjects_by_subject_scope_or_definition,
+)
+from .odphp_itemlist import odphp_itemlist as odphp_itemlist
+from .odphp_myhealthfinder import odphp_myhealthfinder as odphp_myhealthfinder
+from .odphp_outlink_fetch import odphp_outlink_fetch as odphp_outlink_fetch
+from .odphp_topicsearch import odphp_topicsearch as odphp_topicsearch
+from .openalex_literature_search import (
+    openalex_literature_search as openalex_literature_search,
+)
+from .reactome_disease_target_score import (
+    reactome_disease_target_score as reactome_disease_target_score,
+)
+from .search_clinical_trials import search_clinical_trials as search_clinical_trials
+from .visualize_molecule_2d import visualize_molecule_2d as visualize_molecule_2d
+from .visualize_molecule_3d import visualize_molecule_3d as visualize_molecule_3d
+from .visualize_protein_structure_3d import (
+    visualize_protein_structure_3d as visualize_protein_structure_3d,
+)
+
+__all__ = [
+    "get_shared_client",
+    "reset_shared_client",
+    "ADMETAI_predict_BBB_penetrance",
+    "ADMETAI_predict_CYP_interactions",
+    "ADMETAI_predict_bioavailability",
+    "ADMETAI_predict_clearance_distribution",
+    "ADMETAI_predict_nuclear_receptor_activity",
+    "ADMETAI_predict_physicochemical_properties",
+    "ADMETAI_predict_solubility_lipophilicity_hydration",
+    "ADMETAI_predict_stress_response",
+    "ADMETAI_predict_toxicity",
+    "ADMETAnalyzerAgent",
+    "AdvancedCodeQualityAnalyzer",
+    "AdverseEventICDMapper",
+    "AdverseEventPredictionQuestionGenerator",
+    "AdverseEventPredictionQuestionGeneratorWithContext",
+    "ArXiv_search_papers",
+    "ArgumentDescriptionOptimizer",
+    "BioRxiv_search_preprints",
+    "BiomarkerDiscoveryWorkflow",
+    "CMA_Guidelines_Search",
+    "CORE_search_papers",
+    "CallAgent",
+    "ChEMBL_search_similar_molecules",
+    "ClinVar_search_variants",
+    "ClinicalTrialDesignAgent",
+    "CodeOptimizer",
+    "CodeQualityAnalyzer",
+    "CompoundDiscoveryAgent",
+    "ComprehensiveDrugDiscoveryPipeline",
+    "Crossref_search_works",
+    "DBLP_search_publications",
+    "DOAJ_search_articles",
+    "DailyMed_get_spl_by_setid",
+    "DailyMed_search_spls",
+    "DataAnalysisValidityReviewer",
+    "DescriptionAnalyzer",
+    "DescriptionQualityEvaluator",
+    "DiseaseAnalyzerAgent",
+    "DomainExpertValidator",
+    "DrugInteractionAnalyzerAgent",
+    "DrugOptimizationAgent",
+    "DrugSafetyAnalyzer",
+    "Ensembl_lookup_gene_by_symbol",
+    "EthicalComplianceReviewer",
+    "EuropePMC_Guidelines_Search",
+    "EuropePMC_search_articles",
+    "ExperimentalDesignScorer",
+    "FAERS_count_additive_administration_routes",
+    "FAERS_count_additive_adverse_reactions",
+    "FAERS_count_additive_event_reports_by_country",
+    "FAERS_count_additive_reaction_outcomes",
+    "FAERS_count_additive_reports_by_reporter_country",
+    "FAERS_count_additive_seriousness_classification",
+    "FAERS_count_country_by_drug_event",
+    "FAERS_count_death_related_by_drug",
+    "FAERS_count_drug_routes_by_event",
+    "FAERS_count_drugs_by_drug_event",
+    "FAERS_count_outcomes_by_drug_event",
+    "FAERS_count_patient_age_distribution",
+    "FAERS_count_reactions_by_drug_event",
+    "FAERS_count_reportercountry_by_drug_event",
+    "FAERS_count_seriousness_by_drug_event",
+    "FDA_get_abuse_dependence_info_by_drug_name",
+    "FDA_get_abuse_info_by_drug_name",
+    "FDA_get_accessories_info_by_drug_name",
+    "FDA_get_active_ingredient_info_by_drug_name",
+    "FDA_get_adverse_reactions_by_drug_name",
+    "FDA_get_alarms_by_drug_name",
+    "FDA_get_animal_pharmacology_info_by_drug_name",
+    "FDA_get_assembly_installation_info_by_drug_name",
+    "FDA_get_boxed_warning_info_by_drug_name",
+    "FDA_get_brand_name_generic_name",
+    "FDA_get_calibration_instructions_by_drug_name",
+    "FDA_get_carcinogenic_mutagenic_fertility_by_drug_name",
+    "FDA_get_child_safety_info_by_drug_name",
+    "FDA_get_clinical_pharmacology_by_drug_name",
+    "FDA_get_clinical_studies_info_by_drug_name",
+    "FDA_get_contact_for_questions_info_by_drug_name",
+    "FDA_get_contraindications_by_drug_name",
+    "FDA_get_controlled_substance_DEA_schedule_info_by_drug_name",
+    "FDA_get_dear_health_care_provider_letter_info_by_drug_name",
+    "FDA_get_dependence_info_by_drug_name",
+    "FDA_get_disposal_info_by_drug_name",
+    "FDA_get_do_not_use_info_by_drug_name",
+    "FDA_get_document_id_by_drug_name",
+    "FDA_get_dosage_and_storage_information_by_drug_name",
+    "FDA_get_dosage_forms_and_strengths_by_drug_name",
+    "FDA_get_drug_generic_name",
+    "FDA_get_drug_interactions_by_drug_name",
+    "FDA_get_drug_name_by_SPL_ID",
+    "FDA_get_drug_name_by_adverse_reaction",
+    "FDA_get_drug_name_by_calibration_instructions",
+    "FDA_get_drug_name_by_dependence_info",
+    "FDA_get_drug_name_by_document_id",
+    "FDA_get_drug_name_by_dosage_info",
+    "FDA_get_drug_name_by_environmental_warning",
+    "FDA_get_drug_name_by_inactive_ingredient",
+    "FDA_get_drug_name_by_info_on_conditions_for_doctor_consultation",
+    "FDA_get_drug_name_by_labor_and_delivery_info",
+    "FDA_get_drug_name_by_microbiology",
+    "FDA_get_drug_name_by_other_safety_info",
+    "FDA_get_drug_name_by_pharmacodynamics",
+    "FDA_get_drug_name_by_pharmacogenomics",
+    "FDA_get_drug_name_by_precautions",
+    "FDA_get_drug_name_by_pregnancy_or_breastfeeding_info",
+    "FDA_get_drug_name_by_principal_display_panel",
+    "FDA_get_drug_name_by_reference",
+    "FDA_get_drug_name_by_set_id",
+    "FDA_get_drug_name_by_stop_use_info",
+    "FDA_get_drug_name_by_storage_and_handling_info",
+    "FDA_get_drug_name_by_warnings",
+    "FDA_get_drug_name_from_patient_package_insert",
+    "FDA_get_drug_names_by_abuse_dependence_info",
+    "FDA_get_drug_names_by_abuse_info",
+    "FDA_get_drug_names_by_accessories",
+    "FDA_get_drug_names_by_active_ingredient",
+    "FDA_get_drug_names_by_alarm",
+    "FDA_get_drug_names_by_animal_pharmacology_info",
+    "FDA_get_drug_names_by_application_number_NDC_number",
+    "FDA_get_drug_names_by_assembly_installation_info",
+    "FDA_get_drug_names_by_boxed_warning",
+    "FDA_get_drug_names_by_child_safety_info",
+    "FDA_get_drug_names_by_clinical_pharmacology",
+    "FDA_get_drug_names_by_clinical_studies",
+    "FDA_get_drug_names_by_consulting_doctor_pharmacist_info",
+    "FDA_get_drug_names_by_contraindications",
+    "FDA_get_drug_names_by_controlled_substance_DEA_schedule",
+    "FDA_get_drug_names_by_dear_health_care_provider_letter_info",
+    "FDA_get_drug_names_by_disposal_info",
+    "FDA_get_drug_names_by_dosage_forms_and_strengths_info",
+    "FDA_get_drug_names_by_drug_interactions",
+    "FDA_get_drug_names_by_effective_time",
+    "FDA_get_drug_names_by_food_safety_warnings",
+    "FDA_get_drug_names_by_general_precautions",
+    "FDA_get_drug_names_by_geriatric_use",
+    "FDA_get_drug_names_by_health_claim",
+    "FDA_get_drug_names_by_indication",
+    "FDA_get_drug_names_by_info_for_nursing_mothers",
+    "FDA_get_drug_names_by_information_for_owners_or_caregivers",
+    "FDA_get_drug_names_by_ingredient",
+    "FDA_get_drug_names_by_instructions_for_use",
+    "FDA_get_drug_names_by_lab_test_interference",
+    "FDA_get_drug_names_by_lab_tests",
+    "FDA_get_drug_names_by_mechanism_of_action",
+    "FDA_get_drug_names_by_medication_guide",
+    "FDA_get_drug_names_by_nonclinical_toxicology_info",
+    "FDA_get_drug_names_by_nonteratogenic_effects",
+    "FDA_get_drug_names_by_overdosage_info",
+    "FDA_get_drug_names_by_pediatric_use",
+    "FDA_get_drug_names_by_pharmacokinetics",
+    "FDA_get_drug_names_by_population_use",
+    "FDA_get_drug_names_by_pregnancy_effects_info",
+    "FDA_get_drug_names_by_residue_warning",
+    "FDA_get_drug_names_by_risk",
+    "FDA_get_drug_names_by_route",
+    "FDA_get_drug_names_by_safe_handling_warning",
+    "FDA_get_drug_names_by_safety_summary",
+    "FDA_get_drug_names_by_spl_indexing_data_elements",
+    "FDA_get_drug_names_by_teratogenic_effects",
+    "FDA_get_drug_names_by_user_safety_warning",
+    "FDA_get_drug_names_by_warnings_and_cautions",
+    "FDA_get_drugs_by_carcinogenic_mutagenic_fertility",
+    "FDA_get_effective_time_by_drug_name",
+    "FDA_get_environmental_warning_by_drug_name",
+    "FDA_get_general_precautions_by_drug_name",
+    "FDA_get_geriatric_use_info_by_drug_name",
+    "FDA_get_health_claims_by_drug_name",
+    "FDA_get_inactive_ingredient_info_by_drug_name",
+    "FDA_get_indications_by_drug_name",
+    "FDA_get_info_for_nursing_mothers_by_drug_name",
+    "FDA_get_info_for_patients_by_drug_name",
+    "FDA_get_info_on_conditions_for_doctor_consultation_by_drug_name",
+    "FDA_get_info_on_consulting_doctor_pharmacist_by_drug_name",
+    "FDA_get_information_for_owners_or_caregivers_by_drug_name",
+    "FDA_get_ingredients_by_drug_name",
+    "FDA_get_instructions_for_use_by_drug_name",
+    "FDA_get_lab_test_interference_info_by_drug_name",
+    "FDA_get_lab_tests_by_drug_name",
+    "FDA_get_labor_and_delivery_info_by_drug_name",
+    "FDA_get_manufacturer_name_NDC_number_by_drug_name",
+    "FDA_get_mechanism_of_action_by_drug_name",
+    "FDA_get_medication_guide_info_by_drug_name",
+    "FDA_get_microbiology_info_by_drug_name",
+    "FDA_get_nonclinical_toxicology_info_by_drug_name",
+    "FDA_get_nonteratogenic_effects_by_drug_name",
+    "FDA_get_other_safety_info_by_drug_name",
+    "FDA_get_overdosage_info_by_drug_name",
+    "FDA_get_patient_package_insert_from_drug_name",
+    "FDA_get_pediatric_use_info_by_drug_name",
+    "FDA_get_pharmacodynamics_by_drug_name",
+    "FDA_get_pharmacogenomics_info_by_drug_name",
+    "FDA_get_pharmacokinetics_by_drug_name",
+    "FDA_get_population_use_info_by_drug_name",
+    "FDA_get_precautions_by_drug_name",
+    "FDA_get_pregnancy_effects_info_by_drug_name",
+    "FDA_get_pregnancy_or_breastfeeding_info_by_drug_name",
+    "FDA_get_principal_display_panel_by_drug_name",
+    "FDA_get_purpose_info_by_drug_name",
+    "FDA_get_recent_changes_by_drug_name",
+    "FDA_get_reference_info_by_drug_name",
+    "FDA_get_residue_warning_by_drug_name",
+    "FDA_get_risk_info_by_drug_name",
+    "FDA_get_route_info_by_drug_name",
+    "FDA_get_safe_handling_warnings_by_drug_name",
+    "FDA_get_safety_summary_by_drug_name",
+    "FDA_get_spl_indexing_data_elements_by_drug_name",
+    "FDA_get_spl_unclassified_section_by_drug_name",
+    "FDA_get_stop_use_info_by_drug_name",
+    "FDA_get_storage_and_handling_info_by_drug_name",
+    "FDA_get_teratogenic_effects_by_drug_name",
+    "FDA_get_user_safety_warning_by_drug_names",
+    "FDA_get_warnings_and_cautions_by_drug_name",
+    "FDA_get_warnings_by_drug_name",
+    "FDA_get_when_using_info",
+    "FDA_retrieve_device_use_by_drug_name",
+    "FDA_retrieve_drug_name_by_device_use",
+    "FDA_retrieve_drug_names_by_patient_medication_info",
+    "FDA_retrieve_patient_medication_info_by_drug_name",
+    "Fatcat_search_scholar",
+    "Finish",
+    "GIN_Guidelines_Search",
+    "GO_get_annotations_for_gene",
+    "GO_get_genes_for_term",
+    "GO_get_term_by_id",
+    "GO_get_term_details",
+    "GO_search_terms",
+    "GWAS_search_associations_by_gene",
+    "HAL_search_archive",
+    "HPA_get_biological_processes_by_gene",
+    "HPA_get_cancer_prognostics_by_gene",
+    "HPA_get_comparative_expression_by_gene_and_cellline",
+    "HPA_get_comprehensive_gene_details_by_ensembl_id",
+    "HPA_get_contextual_biological_process_analysis",
+    "HPA_get_disease_expression_by_gene_tissue_disease",
+    "HPA_get_gene_basic_info_by_ensembl_id",
+    "HPA_get_gene_tsv_data_by_ensembl_id",
+    "HPA_get_protein_interactions_by_gene",
+    "HPA_get_rna_expression_by_source",
+    "HPA_get_rna_expression_in_specific_tissues",
+    "HPA_get_subcellular_location",
+    "HPA_search_genes_by_query",
+    "HypothesisGenerator",
+    "LabelGenerator",
+    "LiteratureContextReviewer",
+    "LiteratureSearchTool",
+    "LiteratureSynthesisAgent",
+    "MedRxiv_search_preprints",
+    "MedicalLiteratureReviewer",
+    "MedicalTermNormalizer",
+    "MedlinePlus_connect_lookup_by_code",
+    "MedlinePlus_get_genetics_condition_by_name",
+    "MedlinePlus_get_genetics_gene_by_name",
+    "MedlinePlus_get_genetics_index",
+    "MedlinePlus_search_topics_by_keyword",
+    "MethodologyRigorReviewer",
+    "NICE_Clinical_Guidelines_Search",
+    "NICE_Guideline_Full_Text",
+    "NoveltySignificanceReviewer",
+    "OSF_search_preprints",
+    "OSL_get_efo_id_by_disease_name",
+    "OpenAIRE_search_publications",
+    "OpenAlex_Guidelines_Search",
+    "OpenTargets_drug_pharmacogenomics_data",
+    "OpenTargets_get_approved_indications_by_drug_chemblId",
+    "OpenTargets_get_associated_diseases_by_drug_chemblId",
+    "OpenTargets_get_associated_drugs_by_disease_efoId",
+    "OpenTargets_get_associated_drugs_by_target_ensemblID",
+    "OpenTargets_get_associated_phenotypes_by_disease_efoId",
+    "OpenTargets_get_associated_targets_by_disease_efoId",
+    "OpenTargets_get_associated_targets_by_drug_chemblId",
+    "OpenTargets_get_biological_mouse_models_by_ensemblID",
+    "OpenTargets_get_chemical_probes_by_target_ensemblID",
+    "OpenTargets_get_disease_ancestors_parents_by_efoId",
+    "OpenTargets_get_disease_descendants_children_by_efoId",
+    "OpenTargets_get_disease_description_by_efoId",
+    "OpenTargets_get_disease_id_description_by_name",
+    "OpenTargets_get_disease_ids_by_efoId",
+    "OpenTargets_get_disease_ids_by_name",
+    "OpenTargets_get_disease_locations_by_efoId",
+    "OpenTargets_get_disease_synonyms_by_efoId",
+    "OpenTargets_get_disease_therapeutic_areas_by_efoId",
+    "OpenTargets_get_diseases_phenotypes_by_target_ensembl",
+    "OpenTargets_get_drug_adverse_events_by_chemblId",
+    "OpenTargets_get_drug_approval_status_by_chemblId",
+    "OpenTargets_get_drug_chembId_by_generic_name",
+    "OpenTargets_get_drug_description_by_chemblId",
+    "OpenTargets_get_drug_id_description_by_name",
+    "OpenTargets_get_drug_indications_by_chemblId",
+    "OpenTargets_get_drug_mechanisms_of_action_by_chemblId",
+    "OpenTargets_get_drug_synonyms_by_chemblId",
+    "OpenTargets_get_drug_trade_names_by_chemblId",
+    "OpenTargets_get_drug_warnings_by_chemblId",
+    "OpenTargets_get_drug_withdrawn_blackbox_status_by_chemblId",
+    "OpenTargets_get_gene_ontology_terms_by_goID",
+    "OpenTargets_get_known_drugs_by_drug_chemblId",
+    "OpenTargets_get_parent_child_molecules_by_drug_chembl_ID",
+    "OpenTargets_get_publications_by_disease_efoId",
+    "OpenTargets_get_publications_by_drug_chemblId",
+    "OpenTargets_get_publications_by_target_ensemblID",
+    "OpenTargets_get_similar_entities_by_disease_efoId",
+    "OpenTargets_get_similar_entities_by_drug_chemblId",
+    "OpenTargets_get_similar_entities_by_target_ensemblID",
+    "OpenTargets_get_target_classes_by_ensemblID",
+    "OpenTargets_get_target_constraint_info_by_ensemblID",
+    "OpenTargets_get_target_enabling_packages_by_ensemblID",
+    "OpenTargets_get_target_gene_ontology_by_ensemblID",
+    "OpenTargets_get_target_genomic_location_by_ensemblID",
+    "OpenTargets_get_target_homologues_by_ensemblID",
+    "OpenTargets_get_target_id_description_by_name",
+    "OpenTargets_get_target_interactions_by_ensemblID",
+    "OpenTargets_get_target_safety_profile_by_ensemblID",
+    "OpenTargets_get_target_subcellular_locations_by_ensemblID",
+    "OpenTargets_get_target_synonyms_by_ensemblID",
+    "OpenTargets_get_target_tractability_by_ensemblID",
+    "OpenTargets_map_any_disease_id_to_all_other_ids",
+    "OpenTargets_multi_entity_search_by_query_string",
+    "OpenTargets_search_category_counts_by_query_string",
+    "OpenTargets_target_disease_evidence",
+    "OutputSummarizationComposer",
+    "PMC_search_papers",
+    "ProtocolOptimizer",
+    "PubChem_get_CID_by_SMILES",
+    "PubChem_get_CID_by_compound_name",
+    "PubChem_get_associated_patents_by_CID",
+    "PubChem_get_compound_2D_image_by_CID",
+    "PubChem_get_compound_properties_by_CID",
+    "PubChem_get_compound_synonyms_by_CID",
+    "PubChem_get_compound_xrefs_by_CID",
+    "PubChem_search_compounds_by_similarity",
+    "PubChem_search_compounds_by_substructure",
+    "PubMed_Guidelines_Search",
+    "PubMed_search_articles",
+    "PubTator3_EntityAutocomplete",
+    "PubTator3_LiteratureSearch",
+    "QuestionRephraser",
+    "Reactome_get_pathway_reactions",
+    "ReproducibilityTransparencyReviewer",
+    "ResultsInterpretationReviewer",
+    "ScientificTextSummarizer",
+    "SemanticScholar_search_papers",
+    "TRIP_Database_Guidelines_Search",
+    "TestCaseGenerator",
+    "ToolCompatibilityAnalyzer",
+    "ToolDescriptionOptimizer",
+    "ToolDiscover",
+    "ToolGraphComposer",
+    "ToolGraphGenerationPipeline",
+    "ToolImplementationGenerator",
+    "ToolMetadataGenerationPipeline",
+    "ToolMetadataGenerator",
+    "ToolMetadataStandardizer",
+    "ToolOptimizer",
+    "ToolOutputSummarizer",
+    "ToolQualityEvaluator",
+    "ToolRelationshipDetector",
+    "ToolSpecificationGenerator",
+    "ToolSpecificationOptimizer",
+    "Tool_Finder",
+    "Tool_Finder_Keyword",
+    "Tool_Finder_LLM",
+    "Tool_RAG",
+    "UCSC_get_genes_by_region",
+    "UniProt_get_alternative_names_by_accession",
+    "UniProt_get_disease_variants_by_accession",
+    "UniProt_get_entry_by_accession",
+    "UniProt_get_function_by_accession",
+    "UniProt_get_isoform_ids_by_accession",
+    "UniProt_get_organism_by_accession",
+    "UniProt_get_ptm_processing_by_accession",
+    "UniProt_get_recommended_name_by_accession",
+    "UniProt_get_sequence_by_accession",
+    "UniProt_get_subcellular_location_by_accession",
+    "Unpaywall_check_oa_status",
+    "WHO_Guideline_Full_Text",
+    "WHO_Guidelines_Search",
+    "Wikidata_SPARQL_query",
+    "WritingPresentationReviewer",
+    "Zenodo_search_records",
+    "alphafold_get_annotations",
+    "alphafold_get_prediction",
+    "alphafold_get_summary",
+    "call_agentic_human",
+    "cancer_biomarkers_disease_target_score",
+    "cancer_gene_census_disease_target_score",
+    "cellosaurus_get_cell_line_info",
+    "cellosaurus_query_converter",
+    "cellosaurus_search_cell_lines",
+    "chembl_disease_target_score",
+    "convert_to_markdown",
+    "dbSNP_get_variant_by_rsid",
+    "dict_search",
+    "dili_search",
+    "diqt_search",
+    "disease_target_score",
+    "drugbank_filter_drugs_by_name",
+    "drugbank_full_search",
+    "drugbank_get_drug_basic_info_by_drug_name_or_drugbank_id",
+    "drugbank_get_drug_chemistry_by_drug_name_or_drugbank_id",
+    "drugbank_get_drug_interactions_by_drug_name_or_drugbank_id",
+    "drugbank_get_drug_name_and_description_by_indication",
+    "drugbank_get_drug_name_and_description_by_pathway_name",
+    "drugbank_get_drug_name_and_description_by_target_name",
+    "drugbank_get_drug_name_description_pharmacology_by_mechanism_of_action",
+    "drugbank_get_drug_pathways_and_reactions_by_drug_name_or_drugbank_id",
+    "drugbank_get_drug_products_by_name_or_drugbank_id",
+    "drugbank_get_drug_references_by_drug_name_or_drugbank_id",
+    "drugbank_get_indications_by_drug_name_or_drugbank_id",
+    "drugbank_get_pharmacology_by_drug_name_or_drugbank_id",
+    "drugbank_get_safety_by_drug_name_or_drugbank_id",
+    "drugbank_get_targets_by_drug_name_or_drugbank_id",
+    "drugbank_links_search",
+    "drugbank_vocab_filter",
+    "drugbank_vocab_search",
+    "embedding_database_add",
+    "embedding_database_create",
+    "embedding_database_load",
+    "embedding_database_search",
+    "embedding_sync_download",
+    "embedding_sync_upload",
+    "enrichr_gene_enrichment_analysis",
+    "europepmc_disease_target_score",
+    "eva_disease_target_score",
+    "eva_somatic_disease_target_score",
+    "expression_atlas_disease_target_score",
+    "extract_clinical_trial_adverse_events",
+    "extract_clinical_trial_outcomes",
+    "genomics_england_disease_target_score",
+    "get_HPO_ID_by_phenotype",
+    "get_albumentations_info",
+    "get_altair_info",
+    "get_anndata_info",
+    "get_arboreto_info",
+    "get_arxiv_info",
+    "get_ase_info",
+    "get_assembly_info_by_pdb_id",
+    "get_assembly_summary",
+    "get_astropy_info",
+    "get_binding_affinity_by_pdb_id",
+    "get_biopandas_info",
+    "get_biopython_info",
+    "get_bioservices_info",
+    "get_biotite_info",
+    "get_bokeh_info",
+    "get_brian2_info",
+    "get_cartopy_info",
+    "get_catboost_info",
+    "get_cellpose_info",
+    "get_cellrank_info",
+    "get_cellxgene_census_info",
+    "get_cftime_info",
+    "get_chem_comp_audit_info",
+    "get_chem_comp_charge_and_ambiguity",
+    "get_chembl_webresource_client_info",
+    "get_citation_info_by_pdb_id",
+    "get_clair3_info",
+    "get_clinical_trial_conditions_and_interventions",
+    "get_clinical_trial_descriptions",
+    "get_clinical_trial_eligibility_criteria",
+    "get_clinical_trial_locations",
+    "get_clinical_trial_outcome_measures",
+    "get_clinical_trial_references",
+    "get_clinical_trial_status_and_dates",
+    "get_cobra_info",
+    "get_cobrapy_info",
+    "get_cooler_info",
+    "get_core_refinement_statistics",
+    "get_cryosparc_tools_info",
+    "get_crystal_growth_conditions_by_pdb_id",
+    "get_crystallization_ph_by_pdb_id",
+    "get_crystallographic_properties_by_pdb_id",
+    "get_cupy_info",
+    "get_cyvcf2_info",
+    "get_dask_info",
+    "get_datamol_info",
+    "get_datashader_info",
+    "get_deepchem_info",
+    "get_deeppurpose_info",
+    "get_deeptools_info",
+    "get_deepxde_info",
+    "get_dendropy_info",
+    "get_descriptastorus_info",
+    "get_diffdock_info",
+    "get_dscribe_info",
+    "get_ec_number_by_entity_id",
+    "get_elephant_info",
+    "get_em_3d_fitting_and_reconstruction_details",
+    "get_emdb_ids_by_pdb_id",
+    "get_episcanpy_info",
+    "get_ete3_info",
+    "get_faiss_info",
+    "get_fanc_info",
+    "get_flask_info",
+    "get_flowio_info",
+    "get_flowkit_info",
+    "get_flowutils_info",
+    "get_freesasa_info",
+    "get_galpy_info",
+    "get_gene_name_by_entity_id",
+    "get_geopandas_info",
+    "get_gget_info",
+    "get_googlesearch_python_info",
+    "get_gseapy_info",
+    "get_h5py_info",
+    "get_harmony_pytorch_info",
+    "get_hmmlearn_info",
+    "get_holoviews_info",
+    "get_host_organism_by_pdb_id",
+    "get_htmd_info",
+    "get_hyperopt_info",
+    "get_igraph_info",
+    "get_imageio_info",
+    "get_imbalanced_learn_info",
+    "get_jcvi_info",
+    "get_joblib_info",
+    "get_joint_associated_diseases_by_HPO_ID_list",
+    "get_khmer_info",
+    "get_kipoiseq_info",
+    "get_lifelines_info",
+    "get_ligand_bond_count_by_pdb_id",
+    "get_ligand_smiles_by_chem_comp_id",
+    "get_lightgbm_info",
+    "get_loompy_info",
+    "get_mageck_info",
+    "get_matplotlib_info",
+    "get_mdanalysis_info",
+    "get_mdtraj_info",
+    "get_mne_info",
+    "get_molfeat_info",
+    "get_molvs_info",
+    "get_mordred_info",
+    "get_msprime_info",
+    "get_mudata_info",
+    "get_mutation_annotations_by_pdb_id",
+    "get_neo_info",
+    "get_netcdf4_info",
+    "get_networkx_info",
+    "get_nglview_info",
+    "get_nilearn_info",
+    "get_numba_info",
+    "get_numpy_info",
+    "get_oligosaccharide_descriptors_by_entity_id",
+    "get_openbabel_info",
+    "get_openchem_info",
+    "get_opencv_info",
+    "get_openmm_info",
+    "get_optlang_info",
+    "get_optuna_info",
+    "get_palantir_info",
+    "get_pandas_info",
+    "get_patsy_info",
+    "get_pdbfixer_info",
+    "get_phenotype_by_HPO_ID",
+    "get_pillow_info",
+    "get_plantcv_info",
+    "get_plip_info",
+    "get_plotly_info",
+    "get_poliastro_info",
+    "get_polymer_entity_annotations",
+    "get_polymer_entity_count_by_pdb_id",
+    "get_polymer_entity_ids_by_pdb_id",
+    "get_polymer_entity_type_by_entity_id",
+    "get_polymer_molecular_weight_by_entity_id",
+    "get_poretools_info",
+    "get_prody_info",
+    "get_protein_classification_by_pdb_id",
+    "get_protein_metadata_by_pdb_id",
+    "get_pubchempy_info",
+    "get_pybedtools_info",
+    "get_pybigwig_info",
+    "get_pydeseq2_info",
+    "get_pyensembl_info",
+    "get_pyephem_info",
+    "get_pyfaidx_info",
+    "get_pyfasta_info",
+    "get_pykalman_info",
+    "get_pyliftover_info",
+    "get_pymassspec_info",
+    "get_pymed_info",
+    "get_pymzml_info",
+    "get_pypdf2_info",
+    "get_pyranges_info",
+    "get_pyrosetta_info",
+    "get_pysam_info",
+    "get_pyscenic_info",
+    "get_pyscf_info",
+    "get_pyscreener_info",
+    "get_pytdc_info",
+    "get_python_libsbml_info",
+    "get_pytorch_info",
+    "get_pyvcf_info",
+    "get_pyvis_info",
+    "get_qutip_info",
+    "get_rasterio_info",
+    "get_rdkit_info",
+    "get_refinement_resolution_by_pdb_id",
+    "get_release_deposit_dates_by_pdb_id",
+    "get_reportlab_info",
+    "get_requests_info",
+    "get_ruptures_info",
+    "get_scanorama_info",
+    "get_scanpy_info",
+    "get_schnetpack_info",
+    "get_scholarly_info",
+    "get_scikit_bio_info",
+    "get_scikit_image_info",
+    "get_scikit_learn_info",
+    "get_scipy_info",
+    "get_scrublet_info",
+    "get_scvelo_info",
+    "get_scvi_tools_info",
+    "get_seaborn_info",
+    "get_sequence_by_pdb_id",
+    "get_sequence_lengths_by_pdb_id",
+    "get_sequence_positional_features_by_instance_id",
+    "get_skopt_info",
+    "get_souporcell_info",
+    "get_source_organism_by_pdb_id",
+    "get_space_group_by_pdb_id",
+    "get_statsmodels_info",
+    "get_structure_determination_software_by_pdb_id",
+    "get_structure_title_by_pdb_id",
+    "get_structure_validation_metrics_by_pdb_id",
+    "get_sunpy_info",
+    "get_sympy_info",
+    "get_target_cofactor_info",
+    "get_taxonomy_by_pdb_id",
+    "get_tiledb_info",
+    "get_tiledbsoma_info",
+    "get_torch_geometric_info",
+    "get_tqdm_info",
+    "get_trackpy_info",
+    "get_tskit_info",
+    "get_umap_learn_info",
+    "get_uniprot_accession_by_entity_id",
+    "get_velocyto_info",
+    "get_viennarna_info",
+    "get_webpage_text_from_url",
+    "get_webpage_title",
+    "get_xarray_info",
+    "get_xesmf_info",
+    "get_xgboost_info",
+    "get_zarr_info",
+    "gnomAD_query_variant",
+    "gwas_get_association_by_id",
+    "gwas_get_associations_for_snp",
+    "gwas_get_associations_for_study",
+    "gwas_get_associations_for_trait",
+    "gwas_get_snp_by_id",
+    "gwas_get_snps_for_gene",
+    "gwas_get_studies_for_trait",
+    "gwas_get_study_by_id",
+    "gwas_get_variants_for_trait",
+    "gwas_search_associations",
+    "gwas_search_snps",
+    "gwas_search_studies",
+    "humanbase_ppi_analysis",
+    "mesh_get_subjects_by_pharmacological_action",
+    "mesh_get_subjects_by_subject_id",
+    "mesh_get_subjects_by_subject_name",
+    "mesh_get_subjects_by_subject_scope_or_definition",
+    "odphp_itemlist",
+    "odphp_myhealthfinder",
+    "odphp_outlink_fetch",
+    "odphp_topicsearch",
+    "openalex_literature_search",
+    "reactome_disease_target_score",
+    "search_clinical_trials",
+    "visualize_molecule_2d",
+    "visualize_molecule_3d",
+    "visualize_protein_structure_3d",
+]
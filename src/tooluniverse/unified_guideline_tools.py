@@ -5,7 +5,7 @@ Consolidated clinical guidelines search tools from multiple sources.
 """
 
 import requests
-import time
+from . import http_client
 import re
 import xml.etree.ElementTree as ET
 from bs4 import BeautifulSoup
@@ -58,7 +58,7 @@ class NICEWebScrapingTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.nice.org.uk"
         self.search_url = f"{self.base_url}/search"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -77,7 +77,6 @@ class NICEWebScrapingTool(BaseTool):
     def _fetch_guideline_summary(self, url):
         """Fetch summary from a guideline detail page."""
         try:
-            time.sleep(0.5)  # Be respectful
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "html.parser")
@@ -108,9 +107,6 @@ class NICEWebScrapingTool(BaseTool):
     def _search_nice_guidelines_real(self, query, limit):
         """Search NICE guidelines using real web scraping."""
         try:
-            # Add delay to be respectful
-            time.sleep(1)
-
             params = {"q": query, "type": "guidance"}
 
             response = self.session.get(self.search_url, params=params, timeout=30)
@@ -249,7 +245,7 @@ class PubMedGuidelinesTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
 
     def run(self, arguments):
         query = arguments.get("query", "")
@@ -290,8 +286,6 @@ class PubMedGuidelinesTool(BaseTool):
                 return []
 
             # Get details for PMIDs
-            time.sleep(0.5)  # Be respectful with API calls
-
             detail_params = {"db": "pubmed", "id": ",".join(pmids), "retmode": "json"}
             if api_key:
                 detail_params["api_key"] = api_key
@@ -303,7 +297,6 @@ class PubMedGuidelinesTool(BaseTool):
             detail_data = detail_response.json()
 
             # Fetch abstracts using efetch
-            time.sleep(0.5)
             abstract_params = {
                 "db": "pubmed",
                 "id": ",".join(pmids),
@@ -411,7 +404,7 @@ class EuropePMCGuidelinesTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
 
     def run(self, arguments):
         query = arguments.get("query", "")
@@ -701,7 +694,7 @@ class TRIPDatabaseTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.tripdatabase.com/api/search"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
@@ -837,8 +830,6 @@ class TRIPDatabaseTool(BaseTool):
     def _fetch_guideline_content(self, url):
         """Extract content from a guideline URL using targeted parsers when available."""
         try:
-            time.sleep(0.5)  # Be respectful
-
             if "bmj.com/content/" in url:
                 return self._extract_bmj_guideline_content(url)
 
@@ -1114,7 +1105,7 @@ class WHOGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.who.int"
         self.guidelines_url = f"{self.base_url}/publications/who-guidelines"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1133,7 +1124,6 @@ class WHOGuidelinesTool(BaseTool):
     def _fetch_guideline_description(self, url):
         """Fetch description from a WHO guideline detail page."""
         try:
-            time.sleep(0.5)  # Be respectful
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "html.parser")
@@ -1180,9 +1170,6 @@ class WHOGuidelinesTool(BaseTool):
     def _search_who_guidelines(self, query, limit):
         """Search WHO guidelines by scraping their official website."""
         try:
-            # Add delay to be respectful
-            time.sleep(1)
-
             # First, get the guidelines page
             response = self.session.get(self.guidelines_url, timeout=30)
             response.raise_for_status()
@@ -1353,7 +1340,7 @@ class OpenAlexGuidelinesTool(BaseTool):
             if filters:
                 params["filter"] = ",".join(filters)
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = http_client.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -1544,7 +1531,7 @@ class NICEGuidelineFullTextTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.nice.org.uk"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1566,7 +1553,6 @@ class NICEGuidelineFullTextTool(BaseTool):
     def _fetch_full_guideline(self, url):
         """Fetch complete guideline content from NICE page."""
         try:
-            time.sleep(1)  # Be respectful
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
@@ -1709,7 +1695,7 @@ class WHOGuidelineFullTextTool(BaseTool):
     def __init__(self, tool_config):
         super().__init__(tool_config)
         self.base_url = "https://www.who.int"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -1731,7 +1717,6 @@ class WHOGuidelineFullTextTool(BaseTool):
     def _fetch_who_guideline(self, url):
         """Fetch WHO guideline content and PDF link."""
         try:
-            time.sleep(1)  # Be respectful
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
@@ -1861,7 +1846,7 @@ class GINGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://www.g-i-n.net"
         self.search_url = f"{self.base_url}/library/international-guidelines-library"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -1885,8 +1870,6 @@ class GINGuidelinesTool(BaseTool):
     def _search_gin_guidelines(self, query, limit):
         """Search GIN guidelines using web scraping."""
         try:
-            time.sleep(1)  # Be respectful
-
             # Try to search GIN guidelines
             try:
                 # GIN search typically uses form parameters
@@ -2042,7 +2025,6 @@ class GINGuidelinesTool(BaseTool):
     def _extract_guideline_content(self, url):
         """Extract actual content from a guideline URL."""
         try:
-            time.sleep(0.5)  # Be respectful
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
 
@@ -2100,7 +2082,7 @@ class CMAGuidelinesTool(BaseTool):
         super().__init__(tool_config)
         self.base_url = "https://joulecma.ca"
         self.search_url = f"{self.base_url}/infobase"
-        self.session = requests.Session()
+        self.session = http_client.rate_limited_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -2124,8 +2106,6 @@ class CMAGuidelinesTool(BaseTool):
     def _search_cma_guidelines(self, query, limit):
         """Search CMA Infobase guidelines using web scraping."""
         try:
-            time.sleep(1)  # Be respectful
-
             # Try to search CMA Infobase
             try:
                 # CMA search typically uses form parameters
@@ -2281,7 +2261,6 @@ class CMAGuidelinesTool(BaseTool):
     def _extract_guideline_content(self, url):
         """Extract actual content from a guideline URL."""
         try:
-            time.sleep(0.5)  # Be respectful
             response = self.session.get(url, timeout=15)
             response.raise_for_status()
 
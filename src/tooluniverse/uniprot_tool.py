@@ -1,8 +1,15 @@
 import requests
-from typing import Any, Dict
-from .base_tool import BaseTool
+from . import http_client
+from typing import Any, Dict, List
+from .base_tool import RUN_SEPARATELY, BaseTool
 from .tool_registry import register_tool
 
+ENTRY_ENDPOINT = "https://rest.uniprot.org/uniprotkb/{accession}.json"
+# Paginated like search: one page holds at most 500 entries (default 25), so
+# each request asks for ``size`` equal to its accession count.
+BATCH_ENDPOINT = "https://rest.uniprot.org/uniprotkb/accessions"
+BATCH_MAX_SIZE = 500
+
 
 @register_tool("UniProtRESTTool")
 class UniProtRESTTool(BaseTool):
@@ -104,7 +111,7 @@ class UniProtRESTTool(BaseTool):
         # Build URL
         url = self._build_url(arguments)
         try:
-            resp = requests.get(url, timeout=self.timeout)
+            resp = http_client.get(url, timeout=self.timeout)
             if resp.status_code != 200:
                 return {
                     "error": f"UniProt API returned status code: {resp.status_code}",
@@ -118,6 +125,52 @@ class UniProtRESTTool(BaseTool):
         except ValueError as e:
             return {"error": f"Failed to parse JSON response: {e}"}
 
+        return self._process_entry(data)
+
+    def get_batch_size(self) -> int:
+        # Only whole-entry lookups by accession map onto the accessions endpoint.
+        if self.endpoint != ENTRY_ENDPOINT:
+            return 0
+        return min(super().get_batch_size(), BATCH_MAX_SIZE)
+
+    def run_batch(self, arguments_list: List[Dict[str, Any]]) -> List[Any]:
+        """Fetch entries from the UniProtKB accessions endpoint, 500 per request.
+
+        Accessions missing from the response (obsolete, mistyped, ...) are
+        handed back as ``RUN_SEPARATELY``, so :meth:`run` reports the per-entry
+        error.
+        """
+        accessions = [str(args.get("accession", "")).strip() for args in arguments_list]
+        entries: Dict[str, Dict] = {}
+        unique = [acc for acc in dict.fromkeys(accessions) if acc]
+        for start in range(0, len(unique), BATCH_MAX_SIZE):
+            chunk = unique[start : start + BATCH_MAX_SIZE]
+            try:
+                resp = http_client.get(
+                    BATCH_ENDPOINT,
+                    params={
+                        "accessions": ",".join(chunk),
+                        "format": "json",
+                        "size": len(chunk),
+                    },
+                    timeout=self.timeout * 2,
+                )
+                if resp.status_code == 200:
+                    for entry in resp.json().get("results", []):
+                        for acc in [entry.get("primaryAccession")] + entry.get(
+                            "secondaryAccessions", []
+                        ):
+                            if acc:
+                                entries.setdefault(acc, entry)
+            except (requests.exceptions.RequestException, ValueError):
+                pass
+
+        return [
+            self._process_entry(entries[acc]) if acc in entries else RUN_SEPARATELY
+            for acc in accessions
+        ]
+
+    def _process_entry(self, data: Dict) -> Any:
         # If extract_path is configured, extract the corresponding subset
         if self.extract_path:
             result = self._extract_data(data, self.extract_path)
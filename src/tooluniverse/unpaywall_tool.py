@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 
@@ -27,7 +28,7 @@ class UnpaywallTool(BaseTool):
         url = f"{self.base_url}{doi}"
         params = {"email": email}
         try:
-            response = requests.get(
+            response = http_client.get(
                 url,
                 params=params,
                 timeout=20,
@@ -1,4 +1,5 @@
 import requests
+from . import http_client
 import re
 from .base_tool import BaseTool
 from html import unescape
@@ -38,7 +39,7 @@ class URLHTMLTagTool(BaseTool):
 
         timeout = arguments.get("timeout", 20)
         try:
-            resp = requests.get(url, timeout=timeout)
+            resp = http_client.get(url, timeout=timeout)
         except requests.Timeout:
             return {"error": "Request timed out."}
         except Exception as e:
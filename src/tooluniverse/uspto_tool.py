@@ -2,8 +2,8 @@ import requests
 import json
 import re
 import os
-from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from . import http_client
 from .base_tool import BaseTool
 from .tool_registry import register_tool
 from dotenv import load_dotenv, find_dotenv
@@ -41,15 +41,13 @@ class USPTOOpenDataPortalTool(BaseTool):
                 "You must set a USPTO API key via the USPTO_API_KEY environment variable."
             )
         self.headers = {"X-API-KEY": api_key, "Accept": "application/json"}
-        self.session = requests.Session()
         retry_strategy = Retry(
             total=5,
             status_forcelist=[429, 500, 502, 503, 504],
             backoff_factor=5,  # first retry waits 5s, then 10s, 20s, …
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
+        self.session = http_client.rate_limited_session(max_retries=retry_strategy)
 
     def get_by_path(self, d, keys):
         """Safely navigate nested dicts by a list of keys."""
@@ -6,11 +6,11 @@ import os
 import time
 import sys
 from typing import Dict, Any, Union, List
-from huggingface_hub import hf_hub_download
-from pydantic._internal._model_construction import ModelMetaclass
 
 
 def download_from_hf(tool_config):
+    from huggingface_hub import hf_hub_download
+
     # Extract dataset configuration
     hf_parameters = tool_config.get("hf_dataset_path")
     relative_local_path = hf_parameters.get("save_to_local_dir")
@@ -142,6 +142,8 @@ def read_json_list(file_path):
 
 
 def evaluate_function_call(tool_definition, function_call):
+    from pydantic._internal._model_construction import ModelMetaclass
+
     # Map for type conversion
     type_map = {
         "string": str,
@@ -93,7 +93,7 @@ class TestGEOTool:
         assert params["term"] == expected_term
         assert params["retmax"] == 20
     
-    @patch('requests.get')
+    @patch('tooluniverse.http_client.get')
     def test_make_request_success(self, mock_get):
         """Test successful API request"""
         # Mock successful response
@@ -114,7 +114,7 @@ class TestGEOTool:
         assert len(result["esearchresult"]["idlist"]) == 3
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('tooluniverse.http_client.get')
     def test_make_request_error(self, mock_get):
         """Test API request error handling"""
         mock_get.side_effect = Exception("Network error")
@@ -130,7 +130,7 @@ class TestGEOTool:
         assert "error" in result
         assert "Missing required parameter" in result["error"]
     
-    @patch('requests.get')
+    @patch('tooluniverse.http_client.get')
     def test_run_success(self, mock_get):
         """Test successful run"""
         # Mock successful response
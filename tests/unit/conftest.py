@@ -0,0 +1,54 @@
+"""Shared fixtures for unit tests that register their own tools."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+
+
+def _tool_config(name, properties=None, required=None, **extra):
+    config = {
+        "name": name,
+        "type": name,
+        "description": f"{name} test tool",
+        "parameter": {"type": "object", "properties": dict(properties or {})},
+    }
+    if required:
+        config["parameter"]["required"] = list(required)
+    config.update(extra)
+    return config
+
+
+@pytest.fixture
+def make_tool_config():
+    """Build a minimal tool config.
+
+    ``make_tool_config(name, properties, required, **extra)`` describes an
+    object parameter with the given properties; ``extra`` keys (``timeout``,
+    ``batch_size``, a whole ``parameter`` schema, ...) are set on the config.
+    """
+    return _tool_config
+
+
+@pytest.fixture
+def make_tu():
+    """Build an empty ToolUniverse with custom tools; closed after the test.
+
+    ``make_tu((ToolClass, config), ...)`` registers each tool class under its
+    config and returns the engine.
+    """
+    engines = []
+
+    def make(*tools):
+        engine = ToolUniverse(tool_files={}, keep_default_tools=False)
+        engines.append(engine)
+        for tool_class, config in tools:
+            engine.register_custom_tool(tool_class, tool_config=config)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.close()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Tests for the asyncio execution API (arun / arun_one_function)."""
+
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.base_tool import BaseTool
+
+
+class AsyncEchoTool(BaseTool):
+    calls = 0
+    active = 0
+    max_active = 0
+
+    async def arun(self, arguments=None, **kwargs):
+        AsyncEchoTool.calls += 1
+        AsyncEchoTool.active += 1
+        AsyncEchoTool.max_active = max(AsyncEchoTool.max_active, AsyncEchoTool.active)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            AsyncEchoTool.active -= 1
+        return {"value": arguments["value"], "thread": threading.get_ident()}
+
+
+class SyncEchoTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        return {"value": arguments["value"], "thread": threading.get_ident()}
+
+
+@pytest.fixture
+def tu(make_tool_config, make_tu):
+    AsyncEchoTool.calls = 0
+    AsyncEchoTool.active = 0
+    AsyncEchoTool.max_active = 0
+
+    value = {"value": {"type": "integer"}}
+    engine = make_tu(
+        (
+            AsyncEchoTool,
+            make_tool_config(
+                "AsyncEchoTool", value, ["value"], batch_max_concurrency=2
+            ),
+        ),
+        (SyncEchoTool, make_tool_config("SyncEchoTool", value, ["value"])),
+    )
+    engine.cache_manager.clear()
+    return engine
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_native_async_tool_runs_on_event_loop(tu):
+    """Tools overriding arun are awaited directly on the loop thread."""
+    result = await tu.arun_one_function(
+        {"name": "AsyncEchoTool", "arguments": {"value": 1}}
+    )
+
+    assert result["value"] == 1
+    assert result["thread"] == threading.get_ident()
+    assert tu._get_tool_instance("AsyncEchoTool").supports_async()
+    assert not tu._get_tool_instance("SyncEchoTool").supports_async()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sync_tool_runs_in_managed_executor(tu):
+    """Synchronous tools are offloaded so the event loop is never blocked."""
+    result = await tu.arun_one_function(
+        {"name": "SyncEchoTool", "arguments": {"value": 2}}
+    )
+
+    assert result["value"] == 2
+    assert result["thread"] != threading.get_ident()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_validation_errors_match_sync_path(tu):
+    """Validation failures keep the dual-format error structure."""
+    call = {"name": "AsyncEchoTool", "arguments": {"value": "not-an-int"}}
+
+    async_result = await tu.arun_one_function(call)
+    sync_result = tu.run_one_function(call)
+
+    assert async_result == sync_result
+    assert async_result["error_details"]["type"] == "ToolValidationError"
+    assert AsyncEchoTool.calls == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_singleflight_collapses_concurrent_misses(tu):
+    """Concurrent identical cached calls execute the native tool only once."""
+    call = {"name": "AsyncEchoTool", "arguments": {"value": 3}}
+
+    results = await asyncio.gather(
+        *(tu.arun_one_function(call, use_cache=True) for _ in range(5))
+    )
+
+    assert AsyncEchoTool.calls == 1
+    assert all(result["value"] == 3 for result in results)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_persistent_cache_reads_stay_off_the_event_loop(tu, monkeypatch):
+    """A memory-tier miss reads SQLite on a worker thread, not on the loop."""
+    call = {"name": "AsyncEchoTool", "arguments": {"value": 4}}
+    first = await tu.arun_one_function(call, use_cache=True)
+    tu.cache_manager.flush()
+    tu.cache_manager.memory.clear()
+
+    read_threads = []
+    read = tu.cache_manager._get_from_persistent
+
+    def recording_read(composed_key):
+        read_threads.append(threading.get_ident())
+        return read(composed_key)
+
+    monkeypatch.setattr(tu.cache_manager, "_get_from_persistent", recording_read)
+    again = await tu.arun_one_function(call, use_cache=True)
+
+    assert again == first
+    assert AsyncEchoTool.calls == 1
+    assert read_threads and threading.get_ident() not in read_threads
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_arun_batch_preserves_order_and_limits(tu):
+    """arun batches de-duplicate calls and honour per-tool concurrency limits."""
+    calls = [
+        {"name": "AsyncEchoTool", "arguments": {"value": i % 4}} for i in range(8)
+    ] + [{"name": "SyncEchoTool", "arguments": {"value": 9}}]
+
+    messages = await tu.arun(calls, use_cache=False, max_workers=8)
+
+    contents = [json.loads(message["content"])["content"] for message in messages[1:]]
+    assert [content["value"] for content in contents] == [0, 1, 2, 3] * 2 + [9]
+    assert AsyncEchoTool.calls == 4
+    assert AsyncEchoTool.max_active <= 2
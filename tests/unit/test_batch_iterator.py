@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Tests for streaming batch execution (run_iter / map)."""
+
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+
+
+class DelayTool(BaseTool):
+    calls = 0
+    lock = threading.Lock()
+
+    def run(self, arguments=None, **kwargs):
+        with DelayTool.lock:
+            DelayTool.calls += 1
+        time.sleep(arguments.get("delay", 0))
+        return {"value": arguments["value"]}
+
+
+@pytest.fixture
+def tu():
+    DelayTool.calls = 0
+    engine = ToolUniverse(tool_files={}, keep_default_tools=False)
+    engine.register_custom_tool(
+        DelayTool,
+        tool_config={
+            "name": "DelayTool",
+            "type": "DelayTool",
+            "description": "Tool with configurable latency",
+            "cacheable": False,
+            "parameter": {
+                "type": "object",
+                "properties": {
+                    "value": {"type": "integer"},
+                    "delay": {"type": "number"},
+                },
+                "required": ["value"],
+            },
+        },
+    )
+    yield engine
+    engine.close()
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(10)
+def test_run_iter_yields_in_completion_order(tu):
+    """A slow call does not hold back results that finished earlier."""
+    calls = [{"name": "DelayTool", "arguments": {"value": 0, "delay": 0.3}}] + [
+        {"name": "DelayTool", "arguments": {"value": i}} for i in range(1, 6)
+    ]
+
+    indices = [idx for idx, _ in tu.run_iter(calls, max_workers=4)]
+
+    assert sorted(indices) == list(range(6))
+    assert indices[-1] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(10)
+def test_map_ordered_matches_input_order(tu):
+    """ordered=True yields results in input order with matching indices."""
+    arguments = ({"value": i, "delay": 0.01 * (i % 3)} for i in range(20))
+
+    results = list(tu.map("DelayTool", arguments, max_workers=4, ordered=True))
+
+    assert [idx for idx, _ in results] == list(range(20))
+    assert [result["value"] for _, result in results] == list(range(20))
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(10)
+def test_run_iter_consumes_input_lazily(tu):
+    """Input is read in bounded windows rather than materialised up front."""
+    consumed = []
+
+    def calls():
+        for i in range(1000):
+            consumed.append(i)
+            yield {"name": "DelayTool", "arguments": {"value": i}}
+
+    iterator = tu.run_iter(calls(), max_workers=2, window=8)
+    first = [next(iterator) for _ in range(3)]
+    iterator.close()
+
+    assert len(first) == 3
+    assert len(consumed) <= 16
+
+
+@pytest.mark.unit
+@pytest.mark.timeout(10)
+def test_run_iter_deduplicates_identical_calls(tu):
+    """Identical calls share one execution but every index gets a result."""
+    calls = [{"name": "DelayTool", "arguments": {"value": i % 3}} for i in range(12)]
+
+    results = dict(tu.run_iter(calls, max_workers=3))
+
+    assert sorted(results) == list(range(12))
+    assert all(results[i]["value"] == i % 3 for i in range(12))
+    assert DelayTool.calls == 3
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Tests for batch-native tools (``BaseTool.run_batch``)."""
+
+import json
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import http_client
+from tooluniverse.base_tool import RUN_SEPARATELY, BaseTool
+from tooluniverse.pubchem_tool import PubChemRESTTool
+from tooluniverse.ensembl_tool import EnsemblTool
+from tooluniverse.uniprot_tool import BATCH_ENDPOINT, BATCH_MAX_SIZE, UniProtRESTTool
+
+
+class LookupTool(BaseTool):
+    """Looks up ids; ``run_batch`` resolves a whole chunk in one call."""
+
+    batches = []
+    single_calls = 0
+
+    def run(self, arguments=None, **kwargs):
+        LookupTool.single_calls += 1
+        return {"id": arguments["id"], "via": "run"}
+
+    def run_batch(self, arguments_list):
+        LookupTool.batches.append([args["id"] for args in arguments_list])
+        results = []
+        for args in arguments_list:
+            if args["id"] == "boom":
+                results.append(ValueError("upstream rejected boom"))
+            else:
+                results.append({"id": args["id"], "via": "batch"})
+        return results
+
+
+class PlainTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        return {"id": arguments["id"]}
+
+
+ID = {"id": {"type": "string"}}
+
+
+@pytest.fixture
+def tu(monkeypatch, tmp_path, make_tool_config, make_tu):
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_PERSIST", "false")
+    LookupTool.batches = []
+    LookupTool.single_calls = 0
+    return make_tu(
+        (LookupTool, make_tool_config("LookupTool", ID, ["id"], batch_size=3)),
+        (PlainTool, make_tool_config("PlainTool", ID, ["id"])),
+    )
+
+
+def _calls(name, ids):
+    return [{"name": name, "arguments": {"id": i}} for i in ids]
+
+
+def _run(tu, calls, **kwargs):
+    messages = tu.run(calls, **kwargs)
+    return [json.loads(message["content"])["content"] for message in messages[1:]]
+
+
+@pytest.mark.unit
+def test_batch_is_chunked_and_results_keep_their_positions(tu):
+    """Calls to a batch-native tool share run_batch chunks of ``batch_size``."""
+    ids = [f"id{i}" for i in range(7)]
+    calls = _calls("LookupTool", ids) + _calls("PlainTool", ["p1", "p2"])
+
+    results = _run(tu, calls, use_cache=False, max_workers=4)
+
+    assert sorted(LookupTool.batches) == [
+        ["id0", "id1", "id2"],
+        ["id3", "id4", "id5"],
+        ["id6"],
+    ]
+    assert LookupTool.single_calls == 0
+    assert [r["id"] for r in results[:7]] == ids
+    assert all(r["via"] == "batch" for r in results[:7])
+    assert results[7:] == [{"id": "p1"}, {"id": "p2"}]
+
+
+@pytest.mark.unit
+def test_invalid_and_failing_items_only_affect_their_own_call(tu):
+    """Validation errors and per-item exceptions are reported per call."""
+    calls = _calls("LookupTool", ["a", "boom"])
+    calls.insert(1, {"name": "LookupTool", "arguments": {}})
+
+    results = _run(tu, calls, use_cache=False)
+
+    assert LookupTool.batches == [["a", "boom"]]
+    assert results[0] == {"id": "a", "via": "batch"}
+    assert results[1]["error_details"]["type"] == "ToolValidationError"
+    assert "upstream rejected boom" in results[2]["error"]
+
+
+@pytest.mark.unit
+def test_batched_results_populate_the_cache(tu):
+    """Each call of a run_batch chunk is cached under its own key."""
+    _run(tu, _calls("LookupTool", ["x", "y"]), use_cache=True)
+    assert LookupTool.batches == [["x", "y"]]
+
+    again = _run(tu, _calls("LookupTool", ["x", "y"]), use_cache=True)
+    single = tu.run_one_function(
+        {"name": "LookupTool", "arguments": {"id": "x"}}, use_cache=True
+    )
+
+    assert LookupTool.batches == [["x", "y"]]
+    assert LookupTool.single_calls == 0
+    assert [r["id"] for r in again] == ["x", "y"]
+    assert single == {"id": "x", "via": "batch"}
+
+
+class FallbackTool(BaseTool):
+    """Answers nothing in bulk; every call falls back to a 50 ms run()."""
+
+    def run(self, arguments=None, **kwargs):
+        time.sleep(0.05)
+        return {"id": arguments["id"], "via": "run"}
+
+    def run_batch(self, arguments_list):
+        return [RUN_SEPARATELY] * len(arguments_list)
+
+
+@pytest.mark.unit
+def test_separate_calls_get_their_own_deadline(make_tool_config, make_tu):
+    """Per-item fallbacks run under the call timeout each, not the chunk's."""
+    tu = make_tu((FallbackTool, make_tool_config("FallbackTool", ID, ["id"])))
+    ids = [f"id{i}" for i in range(20)]
+
+    results = _run(tu, _calls("FallbackTool", ids), timeout=0.3)
+
+    assert [r.get("id") for r in results] == ids
+    assert all(r["via"] == "run" for r in results)
+
+
+@pytest.mark.unit
+def test_batch_size_defaults_and_opt_out(make_tool_config):
+    """Only run_batch implementers batch; ``batch_size`` 0 disables it."""
+    assert PlainTool(make_tool_config("PlainTool")).get_batch_size() == 0
+    assert LookupTool(make_tool_config("LookupTool")).get_batch_size() == 50
+    lookup = LookupTool(make_tool_config("LookupTool", batch_size=0))
+    assert lookup.get_batch_size() == 0
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+
+@pytest.mark.unit
+def test_uniprot_batch_uses_the_accessions_endpoint(monkeypatch):
+    """UniProt entries come from one accessions request; secondaries map back."""
+    requested = []
+
+    def fake_get(url, params=None, **kwargs):
+        requested.append((url, params))
+        return _Response(
+            {
+                "results": [
+                    {"primaryAccession": "P05067", "secondaryAccessions": ["Q1"]},
+                    {"primaryAccession": "P69905"},
+                ]
+            }
+        )
+
+    monkeypatch.setattr(http_client, "get", fake_get)
+    tool = UniProtRESTTool(
+        {
+            "name": "UniProt_get_entry_by_accession",
+            "type": "UniProtRESTTool",
+            "parameter": {"type": "object", "properties": {}},
+            "fields": {
+                "endpoint": "https://rest.uniprot.org/uniprotkb/{accession}.json"
+            },
+        }
+    )
+
+    results = tool.run_batch(
+        [{"accession": "P69905"}, {"accession": "Q1"}, {"accession": "P69905"}]
+    )
+
+    assert requested == [
+        (BATCH_ENDPOINT, {"accessions": "P69905,Q1", "format": "json", "size": 2})
+    ]
+    assert tool.get_batch_size() == 50
+    assert UniProtRESTTool(
+        {**tool.tool_config, "batch_size": 5000}
+    ).get_batch_size() == (BATCH_MAX_SIZE)
+    assert [r["primaryAccession"] for r in results] == ["P69905", "P05067", "P69905"]
+
+
+@pytest.mark.unit
+def test_ensembl_batch_posts_symbols_and_hands_back_misses(monkeypatch):
+    """Symbols resolve with one POST per species; misses and failures run alone."""
+    tool = EnsemblTool({"name": "Ensembl_lookup_gene_by_symbol", "type": "EnsemblTool"})
+    posted = []
+
+    def fake_post(url, params=None, json=None, **kwargs):
+        posted.append((url, params, json["symbols"]))
+        if "mus_musculus" in url:
+            return _Response({}, status_code=503)
+        return _Response({"BRCA1": {"id": "ENSG00000012048", "Transcript": [{}, {}]}})
+
+    monkeypatch.setattr(tool.session, "post", fake_post)
+    monkeypatch.setattr(tool.session, "get", None)
+
+    results = tool.run_batch(
+        [
+            {"symbol": "BRCA1"},
+            {"symbol": "OLDNAME"},
+            {"symbol": "Trp53", "species": "mus_musculus"},
+            {},
+            {"symbol": "BRCA1"},
+        ]
+    )
+
+    assert posted == [
+        (
+            "https://rest.ensembl.org/lookup/symbol/homo_sapiens",
+            {"expand": 1},
+            ["BRCA1", "OLDNAME"],
+        ),
+        (
+            "https://rest.ensembl.org/lookup/symbol/mus_musculus",
+            {"expand": 1},
+            ["Trp53"],
+        ),
+    ]
+    assert results[0]["id"] == "ENSG00000012048"
+    assert results[0]["transcript_count"] == 2
+    assert results[4] == results[0]
+    assert results[1] is results[2] is RUN_SEPARATELY
+    assert results[3] == {"error": "Missing required parameter: symbol"}
+    assert tool.get_batch_request_count([{"symbol": "A"}, {"symbol": "B"}]) == 1
+    assert (
+        tool.get_batch_request_count(
+            [{"symbol": "A"}, {"symbol": "B", "species": "mus_musculus"}]
+        )
+        == 2
+    )
+
+
+@pytest.mark.unit
+def test_pubchem_batch_splits_the_property_table(monkeypatch):
+    """A comma-joined CID request is split into single-CID responses."""
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        return _Response(
+            {
+                "PropertyTable": {
+                    "Properties": [
+                        {"CID": 2244, "MolecularWeight": "180.16"},
+                        {"CID": 702, "MolecularWeight": "46.07"},
+                    ]
+                }
+            }
+        )
+
+    monkeypatch.setattr(http_client, "get", fake_get)
+    tool = PubChemRESTTool(
+        {
+            "name": "PubChem_get_compound_properties_by_CID",
+            "type": "PubChemRESTTool",
+            "parameter": {
+                "type": "object",
+                "properties": {"cid": {"type": "integer"}},
+                "required": ["cid"],
+            },
+            "fields": {
+                "endpoint": "/compound/cid/{cid}/property/{property_list}/JSON",
+                "property_list": ["MolecularWeight"],
+            },
+        }
+    )
+    assert tool.get_batch_size() > 0
+
+    results = tool.run_batch([{"cid": 702}, {"cid": 2244}])
+
+    assert len(requested) == 1
+    assert "/cid/702,2244/property/" in requested[0]
+    assert results == [
+        {"PropertyTable": {"Properties": [{"CID": 702, "MolecularWeight": "46.07"}]}},
+        {"PropertyTable": {"Properties": [{"CID": 2244, "MolecularWeight": "180.16"}]}},
+    ]
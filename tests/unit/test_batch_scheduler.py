@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Tests for the latency-aware batch scheduler."""
+
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.batch_scheduler import (
+    ERROR,
+    OK,
+    THROTTLED,
+    TIMEOUT,
+    BatchScheduler,
+    ScheduledTask,
+    classify_result,
+    note_throttled,
+)
+
+EXAMPLES = Path(__file__).resolve().parents[2] / "examples"
+
+
+def _tasks(tool, count, upstream=None, ceiling=8):
+    return [
+        ScheduledTask(None, (tool, i), tool, upstream or tool, ceiling)
+        for i in range(count)
+    ]
+
+
+def _drain(dispatch):
+    order = []
+    while True:
+        task = dispatch.next_task()
+        if task is None:
+            return order
+        order.append(task)
+
+
+@pytest.mark.unit
+def test_longest_expected_first_with_fair_shares():
+    """Slow tools start first; unknown tools count as average ones."""
+    scheduler = BatchScheduler(enabled=True)
+    scheduler.record("fast", 0.1)
+    scheduler.record("slow", 3.0)
+    tasks = _tasks("fast", 4) + _tasks("slow", 2) + _tasks("new", 1)
+
+    order = _drain(scheduler.dispatch(tasks, max_workers=8))
+
+    assert [task.tool for task in order[:3]] == ["slow", "slow", "new"]
+    assert [task.item for task in order if task.tool == "fast"] == [
+        ("fast", i) for i in range(4)
+    ]
+    assert scheduler.expected_latency("new") == pytest.approx(1.55)
+
+    # Upstreams with equal work share the workers instead of one taking all.
+    dispatch = scheduler.dispatch(
+        _tasks("x", 3, upstream="a") + _tasks("y", 3, upstream="b"), 2
+    )
+    first, second = dispatch.next_task(), dispatch.next_task()
+    assert {first.upstream, second.upstream} == {"a", "b"}
+
+
+@pytest.mark.unit
+def test_aimd_concurrency_limit():
+    """Throttles and timeouts halve the limit; successes grow it back."""
+    now = [0.0]
+    scheduler = BatchScheduler(enabled=True, clock=lambda: now[0])
+    assert scheduler.concurrency_limit("api", 8) == 8
+
+    scheduler.record("api", 0.5, THROTTLED, ceiling=8)
+    scheduler.record("api", 0.5, THROTTLED, ceiling=8)  # same burst
+    assert scheduler.concurrency_limit("api", 8) == 4
+
+    now[0] += 1
+    scheduler.record("api", 0.5, TIMEOUT, ceiling=8)
+    assert scheduler.concurrency_limit("api", 8) == 2
+
+    for _ in range(2 + 3):
+        scheduler.record("api", 0.5, OK, ceiling=8)
+    assert scheduler.concurrency_limit("api", 8) == 4
+
+    dispatch = scheduler.dispatch(_tasks("api", 6), max_workers=8)
+    assert len(_drain(dispatch)) == 4
+
+    for _ in range(4 + 5 + 6 + 7):
+        scheduler.record("api", 0.5, OK, ceiling=8)
+    assert scheduler.snapshot()["api"]["concurrency_limit"] is None
+
+
+@pytest.mark.unit
+def test_outcomes_are_classified_from_results_and_signals():
+    """Results map to outcomes; a 429 seen during the call marks it throttled."""
+    assert classify_result({"ok": 1}) == OK
+    assert classify_result({"error": "boom"}) == ERROR
+    assert (
+        classify_result(
+            {"error": "slow", "error_details": {"details": {"deadline_exceeded": True}}}
+        )
+        == TIMEOUT
+    )
+    assert classify_result([{"ok": 1}, {"error": "x"}]) == ERROR
+
+    scheduler = BatchScheduler(enabled=True)
+
+    def throttled_then_ok(_):
+        note_throttled()
+        return {"ok": True}
+
+    scheduler.run([ScheduledTask(throttled_then_ok, None, "api", "api", 4)], 1)
+    assert scheduler.snapshot()["api"]["concurrency_limit"] == 2
+
+
+class NapTool(BaseTool):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def run(self, arguments=None, **kwargs):
+        with NapTool.lock:
+            NapTool.active += 1
+            NapTool.peak = max(NapTool.peak, NapTool.active)
+        time.sleep(arguments["seconds"])
+        with NapTool.lock:
+            NapTool.active -= 1
+        return {"slept": arguments["seconds"]}
+
+
+@pytest.mark.unit
+def test_tool_universe_batches_run_through_the_scheduler():
+    """Batch results keep their positions and respect batch_max_concurrency."""
+    NapTool.peak = 0
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        NapTool,
+        tool_config={
+            "name": "NapTool",
+            "type": "NapTool",
+            "description": "Sleeps",
+            "batch_max_concurrency": 2,
+            "parameter": {
+                "type": "object",
+                "properties": {"seconds": {"type": "number"}},
+                "required": ["seconds"],
+            },
+        },
+    )
+    seconds = [0.005 * i for i in range(9)]
+    calls = [{"name": "NapTool", "arguments": {"seconds": s}} for s in seconds]
+
+    messages = tu.run(calls, max_workers=6)
+
+    results = [json.loads(m["content"])["content"] for m in messages[1:]]
+    assert [r["slept"] for r in results] == seconds
+    assert NapTool.peak <= 2
+    assert tu.batch_scheduler.snapshot()["NapTool"]["calls"] == 9
+    tu.close()
+
+
+@pytest.mark.unit
+def test_simulated_benchmark_beats_in_order_execution():
+    """The deterministic benchmark shows a shorter makespan than in-order runs."""
+    sys.path.insert(0, str(EXAMPLES))
+    try:
+        import benchmark_batch_scheduler as benchmark
+    finally:
+        sys.path.remove(str(EXAMPLES))
+
+    rows = benchmark.simulate(seed=7, workers=8, rounds=3)
+
+    assert rows == benchmark.simulate(seed=7, workers=8, rounds=3)
+    for in_order, scheduled, in_order_throttled, scheduled_throttled in rows:
+        assert scheduled < in_order * 0.85
+        assert scheduled_throttled <= in_order_throttled
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Tests for buffered access statistics and per-thread read connections."""
+
+import gc
+import os
+import threading
+import time
+
+import pytest
+
+from tooluniverse.cache import sqlite_backend
+from tooluniverse.cache.codecs import CacheCodec
+from tooluniverse.cache.sqlite_backend import PersistentCache
+
+RAW = CacheCodec("pickle", "none")
+
+
+def _cache(tmp_path, **kwargs):
+    kwargs.setdefault("maintenance_interval", 0)
+    return PersistentCache(str(tmp_path / "cache.sqlite"), codec=RAW, **kwargs)
+
+
+def _stored(cache, key):
+    return cache._conn.execute(
+        "SELECT hit_count, last_accessed FROM cache_entries WHERE cache_key = ?",
+        (key,),
+    ).fetchone()
+
+
+@pytest.mark.unit
+def test_hits_are_buffered_and_flushed_in_one_update(tmp_path):
+    """Reads do not write; hits are aggregated and flushed together."""
+    cache = _cache(tmp_path, access_flush_interval=3600)
+    cache.set("a", 1, namespace="tool", version="v1", ttl=None)
+    cache.set("b", 2, namespace="tool", version="v1", ttl=None)
+    _, created = _stored(cache, "a")
+    writes = []
+    cache._conn.set_trace_callback(writes.append)
+    for _ in range(3):
+        assert cache.get("a").value == 1
+    assert set(cache.get_many(["a", "b", "missing"])) == {"a", "b"}
+    assert writes == []
+    assert _stored(cache, "a")[0] == 0
+    assert cache.stats()["access"]["pending"] == 2
+
+    assert cache.flush_access_stats() == 2
+    hits, accessed = _stored(cache, "a")
+    assert hits == 4 and accessed > created
+    assert _stored(cache, "b")[0] == 1
+    assert writes.count("BEGIN IMMEDIATE") == writes.count("COMMIT") == 1
+
+    cache.get("b")
+    cache.close()
+    cache = _cache(tmp_path)
+    assert cache.get("b").hit_count == 2
+    cache.close()
+
+
+@pytest.mark.unit
+def test_background_flush_by_interval_and_buffer_size(tmp_path, monkeypatch):
+    """The maintenance thread flushes hits periodically and when many are pending."""
+    cache = _cache(tmp_path, access_flush_interval=0.05)
+    cache.set("a", 1, namespace="tool", version="v1", ttl=None)
+    cache.get("a")
+    deadline = time.monotonic() + 5
+    while _stored(cache, "a")[0] == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert _stored(cache, "a")[0] == 1
+    cache.close()
+
+    monkeypatch.setattr(sqlite_backend, "ACCESS_FLUSH_KEYS", 5)
+    cache = _cache(tmp_path, access_flush_interval=3600)
+    cache.set_many([(f"k{i}", i, "tool", "v1", None) for i in range(5)])
+    cache.get_many([f"k{i}" for i in range(5)])
+    deadline = time.monotonic() + 5
+    while cache.access_flushes == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert cache.access_flushes == 1 and _stored(cache, "k4")[0] == 1
+    cache.close()
+
+
+@pytest.mark.unit
+def test_reads_use_per_thread_connections(tmp_path):
+    """Concurrent hits do not wait on the writer and see committed writes."""
+    cache = _cache(tmp_path)
+    cache.set("a", "old", namespace="tool", version="v1", ttl=None)
+    assert cache.get("a").value == "old"
+    cache.set("a", "new", namespace="tool", version="v1", ttl=None)
+    assert cache.get("a").value == "new"
+
+    results = []
+    with cache._lock:  # a writer holding the lock does not block readers
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("a").value))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert results == ["new"] * 4
+    # The worker threads' connections closed when they exited
+    gc.collect()
+    assert cache.stats()["access"]["read_connections"] == 1
+    cache.close()
+    assert len(cache._readers) == 0 and cache.get("a") is None
+
+    shared = _cache(tmp_path, read_connections=False)
+    assert shared.get("a").value == "new"
+    assert shared.stats()["access"]["read_connections"] == 0
+    shared.close()
+
+
+@pytest.mark.unit
+def test_read_connections_close_with_their_threads(tmp_path, monkeypatch):
+    """Short-lived threads do not accumulate connections or file descriptors."""
+    monkeypatch.setattr(sqlite_backend, "MAX_READ_CONNECTIONS", 4)
+    cache = _cache(tmp_path)
+    cache.set("a", 1, namespace="tool", version="v1", ttl=None)
+    cache.get("a")
+
+    def open_fds():
+        return len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else 0
+
+    def churn(rounds):
+        for _ in range(rounds):
+            threads = [
+                threading.Thread(target=lambda: cache.get("a").value) for _ in range(6)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        gc.collect()
+
+    # SQLite keeps a few descriptors of closed connections for reuse while
+    # the file is locked, so compare against a warmed-up count
+    churn(10)
+    fds = open_fds()
+    churn(100)
+    assert len(cache._readers) == 1  # the main thread's
+    assert open_fds() <= fds + 4
+
+    # Threads beyond the cap read through the writer connection
+    release = threading.Event()
+    values = []
+
+    def hold():
+        values.append(cache.get("a").value)
+        release.wait(5)
+
+    threads = [threading.Thread(target=hold) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    while len(values) < 6:
+        time.sleep(0.01)
+    assert values == [1] * 6 and len(cache._readers) == 4
+    release.set()
+    for thread in threads:
+        thread.join()
+    cache.close()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for bulk cache reads and writes and writer group commits."""
+
+import threading
+
+import pytest
+
+from tooluniverse.cache import sqlite_backend
+from tooluniverse.cache.result_cache_manager import ResultCacheManager
+from tooluniverse.cache.sqlite_backend import PersistentCache
+
+
+def _statements(cache):
+    seen = []
+    cache._conn.set_trace_callback(seen.append)
+    return seen
+
+
+@pytest.mark.unit
+def test_persistent_get_many_and_set_many(tmp_path, monkeypatch):
+    """Bulk operations use chunked queries and one transaction."""
+    monkeypatch.setattr(sqlite_backend, "BULK_CHUNK_SIZE", 3)
+    # Read and record hits on the traced writer connection
+    cache = PersistentCache(
+        str(tmp_path / "cache.sqlite"), read_connections=False, access_flush_interval=0
+    )
+    statements = _statements(cache)
+    written = cache.set_many(
+        [(f"k{i}", {"i": i}, "tool", "v1", None) for i in range(7)]
+        + [("lock", threading.Lock(), "tool", "v1", None)]
+        + [("expired", 1, "tool", "v1", -1)]
+    )
+    # The unpicklable lock is skipped instead of failing the batch
+    assert written == 8
+    assert statements.count("BEGIN IMMEDIATE") == statements.count("COMMIT") == 1
+
+    statements.clear()
+    entries = cache.get_many([f"k{i}" for i in range(7)] + ["missing", "expired"])
+    assert sorted(entries) == [f"k{i}" for i in range(7)]
+    assert entries["k5"].value == {"i": 5} and entries["k5"].namespace == "tool"
+    selects = [s for s in statements if "WHERE cache_key IN" in s]
+    # One transaction deletes the expired row, one records the hits
+    assert len(selects) == 3 and statements.count("COMMIT") == 2
+    # Expired rows are removed and hit counts bumped like single gets
+    assert cache.get("expired") is None
+    assert cache.get("k0").hit_count == 1
+    assert cache.get_many([]) == {}
+    cache.close()
+
+
+@pytest.mark.unit
+def test_manager_bulk_get_reads_memory_then_persistent(tmp_path, monkeypatch):
+    """bulk_get serves memory hits and fetches the rest with one bulk read."""
+    path = str(tmp_path / "cache.sqlite")
+    writer = ResultCacheManager(persistent_path=path, async_persist=False)
+    writer.bulk_set(
+        [
+            {"namespace": "tool", "version": "v1", "cache_key": str(i), "value": i}
+            for i in range(5)
+        ]
+        + [
+            {
+                "namespace": "tool",
+                "version": "v1",
+                "cache_key": "ttl",
+                "value": 9,
+                "ttl": 60,
+            }
+        ]
+    )
+    assert writer.persistent.stats()["entries"] == 6
+    writer.close()
+
+    manager = ResultCacheManager(persistent_path=path, async_persist=False)
+    manager.set(namespace="tool", version="v1", cache_key="mem", value="m")
+
+    def no_single_get(key):
+        raise AssertionError("bulk_get should not read keys one by one")
+
+    monkeypatch.setattr(manager.persistent, "get", no_single_get)
+    requests = [
+        {"namespace": "tool", "version": "v1", "cache_key": key}
+        for key in ["0", "3", "ttl", "mem", "absent"]
+    ]
+    hits = manager.bulk_get(requests)
+    compose = manager.compose_key
+    assert hits == {
+        compose("tool", "v1", "0"): 0,
+        compose("tool", "v1", "3"): 3,
+        compose("tool", "v1", "ttl"): 9,
+        compose("tool", "v1", "mem"): "m",
+    }
+    # Persistent hits are promoted to memory
+    assert manager.memory.get(compose("tool", "v1", "3")).value == 3
+    manager.close()
+
+
+@pytest.mark.unit
+def test_async_writer_group_commits(tmp_path):
+    """Queued writes are committed in groups bounded by size."""
+    path = str(tmp_path / "cache.sqlite")
+    manager = ResultCacheManager(
+        persistent_path=path,
+        async_persist=True,
+        group_commit_size=100,
+        group_commit_latency=0.2,
+    )
+    for i in range(250):
+        manager.set(namespace="tool", version="v1", cache_key=str(i), value=i)
+    manager.bulk_set(
+        [
+            {"namespace": "bulk", "version": "v1", "cache_key": str(i), "value": i}
+            for i in range(50)
+        ]
+    )
+    manager.flush()
+    stats = manager.stats()
+    assert stats["grouped_writes"] == 300
+    assert 3 <= stats["group_commits"] <= 6
+    manager.close()
+
+    cache = PersistentCache(path)
+    assert cache.stats()["entries"] == 300
+    assert cache.get("tool::v1::249").value == 249
+    cache.close()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Tests for persistent cache value codecs."""
+
+import math
+import pickle
+import sqlite3
+
+import pytest
+
+from tooluniverse.cache import codecs
+from tooluniverse.cache.codecs import CacheCodec, CodecError, parse_tag
+from tooluniverse.cache.sqlite_backend import PersistentCache
+
+
+def _legacy_cache(path, rows):
+    """A cache file in the format written before codec tags existed."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """
+        CREATE TABLE cache_entries (
+            cache_key TEXT PRIMARY KEY, namespace TEXT NOT NULL, version TEXT,
+            value BLOB NOT NULL, ttl INTEGER, created_at REAL NOT NULL,
+            last_accessed REAL NOT NULL, expires_at REAL,
+            hit_count INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    for key, value in rows.items():
+        conn.execute(
+            "INSERT INTO cache_entries VALUES (?, 'tool', 'v1', ?, NULL, 0, 0, NULL, 0)",
+            (key, pickle.dumps(value)),
+        )
+    conn.commit()
+    conn.close()
+
+
+def _tags(cache):
+    return dict(cache._conn.execute("SELECT cache_key, codec FROM cache_entries"))
+
+
+@pytest.mark.unit
+def test_codec_tags_compression_threshold_and_legacy_rows(tmp_path):
+    """Large values are compressed; old untagged rows still read as pickle."""
+    path = str(tmp_path / "cache.sqlite")
+    _legacy_cache(path, {"old": {"answer": 42}})
+    cache = PersistentCache(
+        path, codec=CacheCodec("pickle", "zlib", compress_threshold=256)
+    )
+    assert cache.get("old").value == {"answer": 42}
+
+    large = {"text": "adverse reaction " * 200}
+    cache.set("large", large, namespace="tool", version="v1", ttl=None)
+    cache.set("small", {"id": 1}, namespace="tool", version="v1", ttl=None)
+    assert _tags(cache) == {"old": None, "large": "pickle+zlib", "small": "pickle"}
+    assert cache.get("large").value == large
+    stored = cache._conn.execute(
+        "SELECT LENGTH(value) FROM cache_entries WHERE cache_key = 'large'"
+    ).fetchone()[0]
+    assert stored < len(pickle.dumps(large)) / 10
+    assert cache.stats()["codecs"] == {"pickle": 2, "pickle+zlib": 1}
+
+    # Another codec configuration still reads every row by its tag
+    cache.close()
+    cache = PersistentCache(path, codec=CacheCodec("pickle", "none"))
+    assert {e.key: e.value for e in cache.iter_entries()} == {
+        "old": {"answer": 42},
+        "large": large,
+        "small": {"id": 1},
+    }
+    cache.close()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(codecs.orjson is None, reason="orjson is not installed")
+def test_json_serializer_falls_back_to_pickle_when_lossy():
+    """Values that do not survive JSON unchanged are pickled instead."""
+    codec = CacheCodec("json", "none")
+    for value in ({"a": [1, 2.5, None, True]}, "text", [{"nested": {}}]):
+        payload, tag, _ = codec.encode(value)
+        assert tag == "json" and codec.decode(payload, tag) == value
+    for value in ((1, 2), {1: "int key"}, {"x": math.nan}, {"s": {1, 2}}):
+        payload, tag, _ = codec.encode(value)
+        assert tag == "pickle"
+        decoded = codec.decode(payload, tag)
+        assert type(decoded) is type(value)
+
+    assert parse_tag("json+zstd:3") == ("json", "zstd", 3)
+    assert parse_tag(None) == ("pickle", None, None)
+    with pytest.raises(CodecError):
+        codec.decode(b"garbage", "pickle+zlib")
+    with pytest.raises(CodecError, match="dictionary 9"):
+        codec.decode(b"", "pickle+zlib:9")
+
+
+@pytest.mark.unit
+def test_namespace_dictionaries_shrink_small_values(tmp_path, monkeypatch):
+    """A dictionary is built per namespace and reused after reopening."""
+    monkeypatch.setattr("tooluniverse.cache.sqlite_backend.DICTIONARY_SAMPLES", 8)
+    path = str(tmp_path / "cache.sqlite")
+    cache = PersistentCache(path, codec=CacheCodec("pickle", "zlib"))
+
+    def record(i):
+        return {
+            "status": "success",
+            "data": {"accession": f"P{i:05d}", "organism": "Homo sapiens"},
+            "url": f"https://rest.uniprot.org/uniprotkb/P{i:05d}",
+        }
+
+    for i in range(20):
+        cache.set(f"k{i}", record(i), namespace="uniprot", version="v1", ttl=None)
+    cache.set("other", record(0), namespace="ensembl", version="v1", ttl=None)
+    tags = _tags(cache)
+    assert all(tags[f"k{i}"] == "pickle" for i in range(8))
+    assert all(tags[f"k{i}"].startswith("pickle+zlib:") for i in range(8, 20))
+    assert tags["other"] == "pickle"
+    sizes = dict(
+        cache._conn.execute("SELECT cache_key, LENGTH(value) FROM cache_entries")
+    )
+    assert sizes["k19"] < sizes["k0"] / 2
+    assert cache.stats()["dictionaries"] == 1
+    cache.close()
+
+    cache = PersistentCache(path, codec=CacheCodec("pickle", "zlib"))
+    assert cache.get("k19").value == record(19)
+    cache.set("k20", record(20), namespace="uniprot", version="v1", ttl=None)
+    assert _tags(cache)["k20"] == tags["k19"]
+
+    cache.clear(namespace="uniprot")
+    assert cache.stats()["dictionaries"] == 0
+    assert cache.get("other").value == record(0)
+    cache.close()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for bounded persistent caches: eviction, vacuum and maintenance."""
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from tooluniverse.cache import sqlite_backend
+from tooluniverse.cache.codecs import CacheCodec
+from tooluniverse.cache.sqlite_backend import PersistentCache
+
+RAW = CacheCodec("pickle", "none")
+
+
+def _cache(tmp_path, **kwargs):
+    kwargs.setdefault("maintenance_interval", 0)
+    return PersistentCache(str(tmp_path / "cache.sqlite"), codec=RAW, **kwargs)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("eviction", ["lru", "lfu"])
+def test_max_entries_evicts_by_policy(tmp_path, eviction):
+    """LRU keeps recently read entries, LFU keeps frequently read ones."""
+    cache = _cache(tmp_path, max_entries=10, eviction=eviction)
+    for i in range(20):
+        cache.set(f"k{i}", i, namespace="tool", version="v1", ttl=None)
+    for _ in range(3):
+        cache.get("k0")  # frequent, but long ago
+    time.sleep(0.01)
+    cache.get("k1")  # once, most recently
+    assert cache.maintain()["evicted"] == 11
+    kept = {entry.key for entry in cache.iter_entries()}
+    assert len(kept) == 9
+    if eviction == "lru":
+        assert {"k0", "k1"} <= kept and "k2" not in kept
+    else:
+        assert {"k0", "k1"} <= kept and kept >= {"k19", "k18"}
+    assert cache.stats()["disk"]["evictions"] == 11
+    cache.close()
+
+    with pytest.raises(ValueError, match="eviction policy"):
+        _cache(tmp_path, eviction="random")
+
+
+@pytest.mark.unit
+def test_max_disk_bytes_evicts_and_shrinks_the_file(tmp_path):
+    """Eviction brings used pages under the bound and vacuum frees them."""
+    cache = _cache(tmp_path, max_disk_bytes=256 * 1024)
+    for i in range(40):
+        namespace = "big" if i % 2 else "small"
+        cache.set(
+            f"k{i}",
+            os.urandom(32 * 1024 if i % 2 else 512),
+            namespace=namespace,
+            version="v1",
+            ttl=None,
+        )
+    before = cache.stats()["disk"]
+    assert before["auto_vacuum"] == "incremental"
+    assert before["used_bytes"] > 600 * 1024
+
+    cache.maintain()
+    stats = cache.stats()
+    assert stats["disk"]["used_bytes"] <= 256 * 1024
+    assert stats["disk"]["free_bytes"] == 0
+    assert stats["disk"]["file_bytes"] <= 256 * 1024
+    assert set(stats["namespaces"]) == {"big", "small"}
+    assert stats["namespaces"]["big"]["bytes"] > 32 * 1024
+    assert sum(ns["entries"] for ns in stats["namespaces"].values()) == stats["entries"]
+    cache.close()
+
+
+@pytest.mark.unit
+def test_disk_bound_counts_the_write_ahead_log(tmp_path):
+    """Main file plus -wal stay under the bound without evicting everything."""
+    cache = _cache(tmp_path, max_disk_bytes=200_000)
+    for i in range(500):
+        cache.set(f"k{i}", os.urandom(8 * 1024), namespace="t", version="v1", ttl=None)
+    assert cache.stats()["disk"]["file_bytes"] > 1_000_000
+
+    result = cache.maintain()
+    disk = cache.stats()["disk"]
+    assert disk["file_bytes"] <= 200_000
+    assert os.path.getsize(cache.path + "-wal") == 0
+    assert result["reclaimed_pages"] > 0
+    assert 0 < cache.stats()["entries"] < 25
+    cache.close()
+
+
+@pytest.mark.unit
+def test_existing_files_are_converted_and_maintained_in_background(
+    tmp_path, monkeypatch
+):
+    """Old files switch to incremental vacuum; the thread sweeps and evicts."""
+    path = str(tmp_path / "cache.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE legacy (x)")
+    conn.close()
+    cache = PersistentCache(path, codec=RAW, maintenance_interval=0)
+    assert cache.stats()["disk"]["auto_vacuum"] == "none"
+    cache.close()
+
+    monkeypatch.setattr(sqlite_backend, "MAINTENANCE_WRITES", 5)
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_MAX_DISK_BYTES", "1MB")
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_MAX_ENTRIES", "20")
+    cache = PersistentCache(path, codec=RAW, maintenance_interval=60)
+    assert (cache.max_disk_bytes, cache.max_entries) == (1024**2, 20)
+    assert _wait_for(lambda: cache.last_maintenance is not None)
+    assert cache.stats()["disk"]["auto_vacuum"] == "incremental"
+
+    cache.set("old", 1, namespace="tool", version="v1", ttl=-1)
+    cache.set_many([(f"k{i}", i, "tool", "v1", None) for i in range(30)])
+    # Enough writes wake the thread long before its 60s interval
+    assert _wait_for(lambda: cache.stats()["entries"] <= 20)
+    assert cache.get("old") is None
+    assert cache.stats()["disk"]["expired_removed"] >= 1
+    cache.close()
+    assert cache._maintenance_thread is None
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Tests for per-upstream circuit breakers."""
+
+import asyncio
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import circuit_breaker, http_client
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
+
+
+class _DownHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = 0
+
+    def do_GET(self):
+        _DownHandler.hits += 1
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _DownHandler.hits = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _DownHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class FlakyTool(BaseTool):
+    calls = 0
+
+    def run(self, arguments=None, **kwargs):
+        FlakyTool.calls += 1
+        raise requests.exceptions.ConnectionError("connection refused")
+
+
+class HangingTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        time.sleep(1)
+        return {"ok": True}
+
+
+class FetchTool(BaseTool):
+    url = None
+
+    def run(self, arguments=None, **kwargs):
+        response = http_client.get(self.url)
+        return {"status": response.status_code}
+
+
+@pytest.fixture
+def tu(monkeypatch, make_tool_config, make_tu):
+    monkeypatch.setattr(circuit_breaker, "_registry", CircuitBreakerRegistry(True))
+    FlakyTool.calls = 0
+    settings = {"consecutive_failures": 2, "reset_timeout": 60}
+    return make_tu(
+        (FlakyTool, make_tool_config("FlakyTool", circuit_breaker=settings)),
+        (
+            HangingTool,
+            make_tool_config(
+                "HangingTool", circuit_breaker={"consecutive_timeouts": 2}
+            ),
+        ),
+        (FetchTool, make_tool_config("FetchTool")),
+    )
+
+
+def _circuit_details(result):
+    assert result["error_details"]["type"] == "ToolUnavailableError"
+    return result["error_details"]["details"]
+
+
+@pytest.mark.unit
+def test_breaker_opens_half_opens_and_closes():
+    """Consecutive failures open the breaker; a successful probe closes it."""
+    breaker = CircuitBreaker("type:Demo", consecutive_failures=3, reset_timeout=0.1)
+    for _ in range(3):
+        assert breaker.allow() is None
+        breaker.record(False)
+
+    assert breaker.state == OPEN
+    assert 0 < breaker.allow() <= 0.1
+
+    time.sleep(0.12)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is None
+    assert breaker.allow() is not None  # one probe at a time
+    breaker.record(False)
+    assert breaker.state == OPEN
+
+    time.sleep(0.12)
+    assert breaker.allow() is None
+    breaker.record(True)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["recent_calls"] == 0
+
+
+@pytest.mark.unit
+def test_error_rate_threshold_uses_a_sliding_window():
+    """The error-rate threshold applies once the window has enough calls."""
+    breaker = CircuitBreaker(
+        "host:example.org",
+        failure_rate=0.5,
+        window=4,
+        min_calls=4,
+        consecutive_failures=100,
+    )
+    for outcome in (True, False, True):
+        breaker.record(outcome)
+    assert breaker.state == CLOSED
+    breaker.record(False)
+    assert breaker.state == OPEN
+
+
+def _half_open_registry():
+    registry = CircuitBreakerRegistry(True, consecutive_failures=1, reset_timeout=0.05)
+    registry.register_tool("Demo", {"type": "Demo"})
+    registry.breaker("type:Demo").record(False)
+    time.sleep(0.06)
+    assert registry.breaker("type:Demo").state == HALF_OPEN
+    return registry
+
+
+@pytest.mark.unit
+def test_open_host_breaker_does_not_spend_the_tool_probe():
+    """A call refused by a host breaker leaves the tool's half-open probe free."""
+    registry = _half_open_registry()
+    registry.add_tool_host("Demo", "api.example.org")
+    registry.configure("host:api.example.org", reset_timeout=60)
+    registry.breaker("host:api.example.org").record(False)
+
+    assert registry.check_tool("Demo")[0] == "host:api.example.org"
+    assert registry.breaker("type:Demo").allow() is None
+
+
+@pytest.mark.unit
+def test_probe_is_released_when_the_call_fails_for_other_reasons():
+    """A probe call raising a non-transport error does not wedge the breaker."""
+    registry = _half_open_registry()
+    assert registry.check_tool("Demo") is None
+    assert registry.check_tool("Demo") is not None  # probe in flight
+
+    with pytest.raises(ValueError):
+        with registry.track("Demo"):
+            raise ValueError("bad arguments")
+    assert registry.breaker("type:Demo").state == HALF_OPEN
+
+    assert registry.check_tool("Demo") is None
+    with registry.track("Demo"):
+        pass
+    assert registry.breaker("type:Demo").state == CLOSED
+
+
+@pytest.mark.unit
+def test_open_tool_circuit_fails_fast_with_retry_after(tu):
+    """After the threshold, calls fail immediately without running the tool."""
+    for _ in range(2):
+        result = tu.run_one_function({"name": "FlakyTool", "arguments": {}})
+        assert "circuit_breaker" not in result["error_details"]["details"]
+
+    result = tu.run_one_function({"name": "FlakyTool", "arguments": {}})
+    details = _circuit_details(result)
+    assert details["circuit_breaker"] == "type:FlakyTool"
+    assert 0 < details["retry_after"] <= 60
+    assert FlakyTool.calls == 2
+
+    health = tu.get_tool_health("FlakyTool")
+    assert health["circuit_open"] is True
+    assert health["circuit_breakers"]["type:FlakyTool"]["state"] == OPEN
+    assert "FlakyTool" in tu.get_tool_health()["circuit_open"]
+
+
+@pytest.mark.unit
+def test_consecutive_timeouts_open_the_circuit(tu):
+    """Repeated deadline overruns open the breaker."""
+    for _ in range(2):
+        result = tu.run_one_function(
+            {"name": "HangingTool", "arguments": {}}, timeout=0.05
+        )
+        assert _circuit_details(result)["deadline_exceeded"] is True
+
+    start = time.monotonic()
+    result = tu.run_one_function({"name": "HangingTool", "arguments": {}}, timeout=5)
+    assert time.monotonic() - start < 0.5
+    assert _circuit_details(result)["circuit_breaker"] == "type:HangingTool"
+
+
+@pytest.mark.unit
+def test_failing_host_is_refused_before_contacting_it(tu, server):
+    """5xx responses open the host breaker, which then guards the tool."""
+    FetchTool.url = server + "/status"
+    tu.circuit_breakers.configure(consecutive_failures=3, reset_timeout=60)
+
+    for _ in range(3):
+        assert tu.run_one_function({"name": "FetchTool", "arguments": {}}) == {
+            "status": 503
+        }
+    assert _DownHandler.hits == 3
+
+    result = tu.run_one_function({"name": "FetchTool", "arguments": {}})
+    key = _circuit_details(result)["circuit_breaker"]
+    assert key == "host:" + server.split("//")[1]
+
+    with pytest.raises(circuit_breaker.CircuitOpenError):
+        http_client.get(server + "/other")
+    assert _DownHandler.hits == 3
+
+
+@pytest.mark.unit
+def test_smcp_flags_or_hides_tools_with_open_circuits(tu):
+    """tools/list flags (or hides) tools whose breaker is open."""
+    pytest.importorskip("fastmcp")
+    from tooluniverse.smcp import SMCP
+
+    for _ in range(2):
+        tu.run_one_function({"name": "FlakyTool", "arguments": {}})
+
+    flagged = SMCP(tooluniverse_config=tu, search_enabled=False)
+    tools = {tool.name: tool for tool in asyncio.run(flagged._list_tools())}
+    assert tools["FlakyTool"].description.startswith("[Temporarily unavailable")
+    assert not tools["FetchTool"].description.startswith("[Temporarily")
+
+    hidden = SMCP(
+        tooluniverse_config=tu, search_enabled=False, open_circuit_tools="hide"
+    )
+    names = {tool.name for tool in asyncio.run(hidden._list_tools())}
+    assert "FlakyTool" not in names
+    assert "FetchTool" in names
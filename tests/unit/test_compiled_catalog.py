@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests for the precompiled tool catalog."""
+
+import json
+import os
+import sqlite3
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse import compiled_catalog
+from tooluniverse.compiled_catalog import (
+    CompiledToolCatalog,
+    compile_catalog,
+    open_catalog,
+)
+
+
+def _wait_for_refresh():
+    for thread in list(compiled_catalog._refreshing.values()):
+        thread.join(30)
+
+
+def _tool(name, tool_type="DemoTool"):
+    return {"name": name, "type": tool_type, "description": f"{name} tool"}
+
+
+@pytest.fixture
+def tool_files(tmp_path):
+    alpha = tmp_path / "alpha_tools.json"
+    alpha.write_text(json.dumps([_tool("a1"), _tool("a2", "OtherTool"), _tool("a3")]))
+    beta = tmp_path / "beta_tools.json"
+    beta.write_text(json.dumps({"b1": _tool("b1"), "b2": _tool("b2")}))
+    broken = tmp_path / "broken_tools.json"
+    broken.write_text("[{")
+    return {"alpha": str(alpha), "beta": str(beta), "broken": str(broken)}
+
+
+@pytest.mark.unit
+def test_catalog_loads_categories_and_pushes_filters_down(tmp_path, tool_files):
+    """Categories round-trip in file order; name and type filters select rows."""
+    path = compile_catalog(tool_files, str(tmp_path / "catalog.sqlite"))
+
+    with CompiledToolCatalog(path) as catalog:
+        assert catalog.categories() == ["alpha", "beta"]
+        assert len(catalog.content_hash) == 64
+        alpha = catalog.load_category("alpha", tool_files["alpha"])
+        assert alpha == json.loads(open(tool_files["alpha"]).read())
+        beta = catalog.load_category("beta", tool_files["beta"])
+        assert [tool["name"] for tool in beta] == ["b1", "b2"]
+        assert catalog.load_category(
+            "alpha", tool_files["alpha"], names={"a3", "a1", "b1"}
+        ) == [_tool("a1"), _tool("a3")]
+        assert catalog.load_category(
+            "alpha", tool_files["alpha"], names={"a1", "a2"}, types={"OtherTool"}
+        ) == [_tool("a2", "OtherTool")]
+        assert catalog.load_category("broken", tool_files["broken"]) is None
+        assert catalog.load_category("alpha", tool_files["beta"]) is None
+
+
+@pytest.mark.unit
+def test_changed_sources_are_stale_until_recompiled(tmp_path, tool_files):
+    """A touched but identical file stays fresh; edited content does not."""
+    path = compile_catalog(tool_files, str(tmp_path / "catalog.sqlite"))
+    alpha = tool_files["alpha"]
+    stat = os.stat(alpha)
+    os.utime(alpha, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    with CompiledToolCatalog(path) as catalog:
+        assert catalog.is_fresh("alpha", alpha)
+
+    with open(alpha, "w") as f:
+        json.dump([_tool("a1")], f)
+    with CompiledToolCatalog(path) as catalog:
+        assert catalog.load_category("alpha", alpha) is None
+        assert catalog.load_category("beta", tool_files["beta"]) is not None
+
+    (tmp_path / "bogus.sqlite").write_text("not a database")
+    assert open_catalog(str(tmp_path / "bogus.sqlite")) is None
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE meta SET value = '0' WHERE key = 'format'")
+    assert open_catalog(path) is None
+
+
+@pytest.mark.unit
+def test_load_tools_uses_and_rebuilds_the_catalog(monkeypatch, tmp_path):
+    """load_tools compiles a missing catalog off-thread, then reads the same tools."""
+    path = tmp_path / "catalog.sqlite"
+    monkeypatch.setenv("TOOLUNIVERSE_TOOL_CATALOG_PATH", str(path))
+    names = ["ArXiv_search_papers", "PubMed_search_articles", "not_a_tool"]
+
+    monkeypatch.setenv("TOOLUNIVERSE_TOOL_CATALOG", "false")
+    from_json = ToolUniverse()
+    from_json.load_tools(include_tools=names)
+    assert not path.exists()
+
+    monkeypatch.setenv("TOOLUNIVERSE_TOOL_CATALOG", "true")
+    ToolUniverse().load_tools(tool_type=["arxiv"])
+    _wait_for_refresh()
+    assert path.exists()
+
+    reads = []
+    monkeypatch.setattr(
+        "tooluniverse.execute_function.read_json_list",
+        lambda file_path: reads.append(file_path) or [],
+    )
+    from_catalog = ToolUniverse()
+    from_catalog.load_tools(include_tools=names)
+    assert reads == []
+    assert from_catalog.all_tools == from_json.all_tools
+    assert from_catalog.tool_category_dicts == from_json.tool_category_dicts
+    assert sorted(from_catalog.all_tool_dict) == names[:2]
+
+    custom = tmp_path / "custom_tools.json"
+    custom.write_text(json.dumps([_tool("custom_tool")]))
+    ToolUniverse().load_tools(
+        tool_type=["arxiv", "custom"], tool_config_files={"custom": str(custom)}
+    )
+    assert reads == [str(custom)]
+
+
+@pytest.mark.unit
+def test_filtered_load_keeps_whole_categories_with_or_without_catalog(
+    monkeypatch, tmp_path
+):
+    """include_tools filters all_tools only; categories stay complete."""
+    monkeypatch.setenv("TOOLUNIVERSE_TOOL_CATALOG_PATH", str(tmp_path / "c.sqlite"))
+    selection = {
+        "tool_type": ["uniprot"],
+        "include_tools": ["UniProt_get_entry_by_accession"],
+    }
+
+    first = ToolUniverse()
+    first.load_tools(**selection)
+    _wait_for_refresh()
+    second = ToolUniverse()
+    second.load_tools(**selection)
+
+    assert len(first.tool_category_dicts["uniprot"]) > 1
+    assert second.tool_category_dicts == first.tool_category_dicts
+    assert [t["name"] for t in second.all_tools] == ["UniProt_get_entry_by_accession"]
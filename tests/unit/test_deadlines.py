@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Tests for per-call deadlines and cooperative cancellation."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.deadline import DeadlineExceeded, check_deadline, remaining_time
+
+
+class SleepyTool(BaseTool):
+    """Blocks without checking the deadline, like a hung HTTP request."""
+
+    def run(self, arguments=None, **kwargs):
+        time.sleep(arguments["seconds"])
+        return {"slept": arguments["seconds"]}
+
+
+class CooperativeTool(BaseTool):
+    stopped = threading.Event()
+
+    def run(self, arguments=None, **kwargs):
+        try:
+            end = time.monotonic() + arguments["seconds"]
+            while time.monotonic() < end:
+                check_deadline()
+                time.sleep(0.01)
+        except DeadlineExceeded:
+            CooperativeTool.stopped.set()
+            raise
+        return {"done": True}
+
+
+class NestingTool(BaseTool):
+    """Calls another tool, the way ComposeTool.call_tool does."""
+
+    engine = None
+
+    def run(self, arguments=None, **kwargs):
+        inner = self.engine.run_one_function(
+            {"name": "SleepyTool", "arguments": {"seconds": arguments["seconds"]}}
+        )
+        return {"inner": inner, "remaining": remaining_time()}
+
+
+class AsyncSleepyTool(BaseTool):
+    cancelled = threading.Event()
+
+    async def arun(self, arguments=None, **kwargs):
+        try:
+            await asyncio.sleep(arguments["seconds"])
+        except asyncio.CancelledError:
+            AsyncSleepyTool.cancelled.set()
+            raise
+        return {"slept": arguments["seconds"]}
+
+
+@pytest.fixture
+def tu(make_tool_config, make_tu):
+    CooperativeTool.stopped.clear()
+    AsyncSleepyTool.cancelled.clear()
+
+    def config(name, **extra):
+        return make_tool_config(
+            name, {"seconds": {"type": "number"}}, ["seconds"], **extra
+        )
+
+    engine = make_tu(
+        (SleepyTool, config("SleepyTool")),
+        (CooperativeTool, config("CooperativeTool", timeout=0.1)),
+        (NestingTool, config("NestingTool")),
+        (AsyncSleepyTool, config("AsyncSleepyTool")),
+    )
+    NestingTool.engine = engine
+    return engine
+
+
+def _assert_deadline_error(result):
+    assert result["error_details"]["type"] == "ToolUnavailableError"
+    assert result["error_details"]["details"]["deadline_exceeded"] is True
+
+
+@pytest.mark.unit
+def test_timeout_returns_structured_error_and_frees_caller(tu):
+    """A hung tool returns ToolUnavailableError once the timeout passes."""
+    start = time.monotonic()
+    result = tu.run_one_function(
+        {"name": "SleepyTool", "arguments": {"seconds": 5}}, timeout=0.1
+    )
+
+    assert time.monotonic() - start < 2
+    _assert_deadline_error(result)
+    assert result["error_details"]["details"]["timeout"] == 0.1
+
+    assert tu.run_one_function(
+        {"name": "SleepyTool", "arguments": {"seconds": 0}}, timeout=5
+    ) == {"slept": 0}
+
+
+@pytest.mark.unit
+def test_tool_config_timeout_and_cooperative_cancellation(tu):
+    """The per-tool ``timeout`` field applies and cancels cooperative work."""
+    result = tu.run_one_function(
+        {"name": "CooperativeTool", "arguments": {"seconds": 5}}
+    )
+
+    _assert_deadline_error(result)
+    assert CooperativeTool.stopped.wait(2)
+
+
+@pytest.mark.unit
+def test_nested_calls_inherit_the_remaining_deadline(tu):
+    """Calls issued from inside a tool never outlive the outer deadline."""
+    result = tu.run_one_function(
+        {"name": "NestingTool", "arguments": {"seconds": 0}}, timeout=5
+    )
+    assert result["inner"] == {"slept": 0}
+    assert 0 < result["remaining"] <= 5
+
+    start = time.monotonic()
+    result = tu.run_one_function(
+        {"name": "NestingTool", "arguments": {"seconds": 5}}, timeout=0.1
+    )
+    assert time.monotonic() - start < 2
+    _assert_deadline_error(result)
+
+
+@pytest.mark.unit
+def test_batch_applies_timeout_per_call(tu):
+    """Each call in a batch gets its own deadline."""
+    results = tu.run(
+        [
+            {"name": "SleepyTool", "arguments": {"seconds": 5}},
+            {"name": "SleepyTool", "arguments": {"seconds": 0}},
+        ],
+        max_workers=2,
+        timeout=0.2,
+    )
+
+    assert "deadline_exceeded" in results[1]["content"]
+    assert '"slept": 0' in results[2]["content"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_native_async_tool_is_cancelled_on_expiry(tu):
+    """Native async tools are cancelled when their deadline passes."""
+    result = await tu.arun_one_function(
+        {"name": "AsyncSleepyTool", "arguments": {"seconds": 5}}, timeout=0.1
+    )
+
+    _assert_deadline_error(result)
+    assert AsyncSleepyTool.cancelled.is_set()
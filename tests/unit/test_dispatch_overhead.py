@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for run_one_function framework overhead."""
+
+import os
+import statistics
+import sys
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse import execute_function
+from tooluniverse.base_tool import BaseTool
+
+# Per-call budget for a cache hit on a no-op tool. Tracers (coverage,
+# debuggers) slow every Python line down, so the budget scales with them.
+CACHE_HIT_BUDGET_SECONDS = 50e-6 * (10 if sys.gettrace() is not None else 1)
+
+
+class NoOpTool(BaseTool):
+    def run(self, arguments=None, stream_callback=None, use_cache=False):
+        return {"ok": True}
+
+
+@pytest.fixture
+def tu(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_PERSIST", "false")
+    engine = ToolUniverse(tool_files={}, keep_default_tools=False)
+    engine.register_custom_tool(
+        NoOpTool,
+        tool_config={
+            "name": "NoOpTool",
+            "type": "NoOpTool",
+            "description": "Returns immediately",
+            "parameter": {
+                "type": "object",
+                "properties": {"query": {"type": "string"}},
+                "required": ["query"],
+            },
+        },
+    )
+    yield engine
+    engine.close()
+
+
+@pytest.mark.unit
+def test_cache_hit_overhead_within_budget(tu):
+    """A cache hit on a no-op tool costs well under the per-call budget."""
+    call = {"name": "NoOpTool", "arguments": {"query": "TP53"}}
+    assert tu.run_one_function(call, use_cache=True) == {"ok": True}
+
+    samples = []
+    for _ in range(20):
+        start = time.perf_counter()
+        for _ in range(200):
+            tu.run_one_function(call, use_cache=True)
+        samples.append((time.perf_counter() - start) / 200)
+
+    assert statistics.median(samples) < CACHE_HIT_BUDGET_SECONDS
+
+
+@pytest.mark.unit
+def test_hot_path_only_looks_things_up(tu, monkeypatch):
+    """Repeated calls reuse the dispatch plan instead of re-resolving the tool."""
+    call = {"name": "NoOpTool", "arguments": {"query": "BRCA1"}}
+    tu.run_one_function(call)
+    plan = tu._dispatch_plans["NoOpTool"]
+    assert plan.run_params == frozenset({"stream_callback", "use_cache"})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("hot path must not call this")
+
+    monkeypatch.setattr(execute_function, "get_tool_errors", fail)
+    monkeypatch.setattr(execute_function.inspect, "signature", fail)
+
+    for use_cache in (False, True, True):
+        assert tu.run_one_function(call, use_cache=use_cache) == {"ok": True}
+    assert tu._dispatch_plans["NoOpTool"] is plan
+
+
+@pytest.mark.unit
+def test_dispatch_plan_rebuilt_when_tool_replaced(tu):
+    """Re-registering a tool invalidates its cached dispatch plan."""
+    call = {"name": "NoOpTool", "arguments": {"query": "EGFR"}}
+    tu.run_one_function(call)
+    old_plan = tu._dispatch_plans["NoOpTool"]
+
+    tu.callable_functions["NoOpTool"] = NoOpTool(tu.all_tool_dict["NoOpTool"])
+    tu.run_one_function(call)
+
+    assert tu._dispatch_plans["NoOpTool"] is not old_plan
+    assert (
+        tu._dispatch_plans["NoOpTool"].tool_instance
+        is tu.callable_functions["NoOpTool"]
+    )
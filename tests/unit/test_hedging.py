@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Tests for hedged requests."""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse import http_client
+from tooluniverse.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    current_deadline,
+    deadline_scope,
+    remaining_time,
+)
+from tooluniverse.ensembl_tool import EnsemblTool
+from tooluniverse.hedging import HedgePolicy, hedge_policy
+
+
+def _warm(policy, seconds=0.01, count=5):
+    for _ in range(count):
+        policy.record(seconds)
+
+
+@pytest.mark.unit
+def test_delay_follows_the_latency_percentile():
+    """No hedging before min_samples; then the delay is the configured percentile."""
+    policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0)
+    _warm(policy, count=9)
+    assert policy.delay() is None
+
+    for seconds in (0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1, 0.11):
+        policy.record(seconds)
+    assert policy.delay() == pytest.approx(0.1)
+    capped = HedgePolicy(min_samples=1, max_delay=0.5)
+    capped.record(2.0)
+    assert capped.delay() == 0.5
+
+    assert hedge_policy({"hedge": True}).budget == 0.05
+    assert hedge_policy({"hedge": {"budget": 0.1, "unknown": 1}}).budget == 0.1
+    assert hedge_policy({"name": "x"}) is None
+
+
+@pytest.mark.unit
+def test_slow_attempt_is_hedged_and_loser_cancelled():
+    """A slow first attempt is raced by a second; the loser's deadline is cancelled."""
+    policy = HedgePolicy(min_samples=5, budget=1.0, min_delay=0.05)
+    _warm(policy)
+    calls = []
+    lock = threading.Lock()
+
+    def lookup():
+        with lock:
+            index = len(calls)
+            calls.append(current_deadline())
+        if index == 0:
+            time.sleep(1)
+            return "slow"
+        return "fast"
+
+    start = time.monotonic()
+    assert policy.call(lookup) == "fast"
+    assert time.monotonic() - start < 0.5
+    assert calls[0].cancelled and not calls[1].cancelled
+    assert policy.stats()["hedges"] == policy.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.unit
+def test_budget_and_failures():
+    """Hedges are limited by the budget; a failed attempt defers to the other."""
+    policy = HedgePolicy(min_samples=5, budget=0.0, min_delay=0.01)
+    _warm(policy)
+    assert policy.call(lambda: time.sleep(0.1) or "done") == "done"
+    assert policy.stats()["hedges"] == 0
+
+    policy = HedgePolicy(min_samples=5, budget=1.0, min_delay=0.01)
+    _warm(policy)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            time.sleep(0.1)
+            raise ConnectionError("replica reset the connection")
+        return "ok"
+
+    assert policy.call(flaky) == "ok"
+
+    def broken():
+        time.sleep(0.05)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        policy.call(broken)
+
+
+class MirrorTool(BaseTool):
+    calls = 0
+    lock = threading.Lock()
+
+    def run(self, arguments=None, **kwargs):
+        with MirrorTool.lock:
+            MirrorTool.calls += 1
+            attempt = MirrorTool.calls
+        if arguments["id"] == "slow" and attempt % 2 == 1:
+            time.sleep(1)
+        return {"id": arguments["id"], "attempt": attempt}
+
+
+@pytest.mark.unit
+def test_hedged_tool_stores_one_cached_result(monkeypatch, tmp_path):
+    """Hedging runs inside the cache path: the winner is cached, once."""
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_PERSIST", "false")
+    MirrorTool.calls = 0
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        MirrorTool,
+        tool_config={
+            "name": "MirrorTool",
+            "type": "MirrorTool",
+            "description": "Reads from a mirrored service",
+            "hedge": {"min_samples": 4, "budget": 1.0, "min_delay": 0.05},
+            "parameter": {
+                "type": "object",
+                "properties": {"id": {"type": "string"}},
+                "required": ["id"],
+            },
+        },
+    )
+    for i in range(4):
+        tu.run_one_function({"name": "MirrorTool", "arguments": {"id": f"warm{i}"}})
+
+    call = {"name": "MirrorTool", "arguments": {"id": "slow"}}
+    start = time.monotonic()
+    first = tu.run_one_function(call, use_cache=True)
+    assert time.monotonic() - start < 0.6
+    assert first == {"id": "slow", "attempt": 6}
+
+    assert tu.run_one_function(call, use_cache=True) == first
+    assert MirrorTool.calls == 6
+    tu.close()
+
+
+class _EnsemblHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    paths = []
+
+    def do_GET(self):
+        _EnsemblHandler.paths.append(self.path)
+        if self.path.startswith("/xrefs/") and len(_EnsemblHandler.paths) == 1:
+            time.sleep(0.4)
+        if self.path.startswith("/xrefs/"):
+            payload = [{"type": "gene", "id": "ENSG00000012048"}]
+        else:
+            payload = {"id": "ENSG00000012048", "display_name": "BRCA1"}
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.unit
+def test_hedged_ensembl_loser_stops_at_its_next_request():
+    """EnsemblTool's session honours the cancelled deadline of a losing attempt."""
+    _EnsemblHandler.paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EnsemblHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    tool = EnsemblTool({"name": "Ensembl_lookup_gene_by_symbol", "type": "Ensembl"})
+    tool.base = f"http://127.0.0.1:{server.server_address[1]}"
+    policy = HedgePolicy(min_samples=5, budget=1.0, min_delay=0.05)
+    _warm(policy)
+
+    try:
+        result = policy.call(tool.run, {"symbol": "BRCA1"})
+        time.sleep(0.6)  # let the slow attempt's xrefs response come back
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert result["id"] == "ENSG00000012048"
+    assert policy.stats()["hedge_wins"] == 1
+    # Both attempts asked for the xrefs, but only the winner went on to lookup/id.
+    assert sum(p.startswith("/xrefs/") for p in _EnsemblHandler.paths) == 2
+    assert sum(p.startswith("/lookup/") for p in _EnsemblHandler.paths) == 1
+
+
+@pytest.mark.unit
+def test_attempts_without_a_deadline_keep_default_timeouts():
+    """An unbounded attempt is cancel-only: remaining_time() keeps its default."""
+    policy = HedgePolicy(min_samples=5, budget=1.0, min_delay=0.01)
+    _warm(policy)
+    seen = []
+
+    def lookup():
+        seen.append((remaining_time(), remaining_time(20), current_deadline()))
+        return "ok"
+
+    assert policy.call(lookup) == "ok"
+    assert seen[0][:2] == (None, 20)
+    assert seen[0][2].remaining() is None and not seen[0][2].expired
+
+    with deadline_scope(Deadline(None)):
+        assert http_client._cap_timeout(None) is None
+        assert http_client._cap_timeout((3, 10)) == (3, 10)
+
+
+@pytest.mark.unit
+def test_waiting_is_bounded_by_the_callers_deadline():
+    """A hung attempt with no hedge budget left cannot outlive the caller's deadline."""
+    policy = HedgePolicy(min_samples=5, budget=0.0, min_delay=0.01)
+    _warm(policy)
+    attempt_deadlines = []
+
+    def hang():
+        attempt_deadlines.append(current_deadline())
+        time.sleep(2)
+        return "late"
+
+    start = time.monotonic()
+    with deadline_scope(Deadline(0.2)):
+        with pytest.raises(DeadlineExceeded):
+            policy.call(hang)
+    assert time.monotonic() - start < 1
+    assert attempt_deadlines[0].cancelled
+
+
+@pytest.mark.unit
+def test_budget_refill_hedges_a_call_already_waiting():
+    """A call past its delay is hedged once other calls earn budget."""
+    policy = HedgePolicy(min_samples=5, budget=0.5, min_delay=0.02)
+    _warm(policy)
+    calls = []
+
+    def lookup():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(1)
+            return "slow"
+        return "fast"
+
+    result = []
+    waiter = threading.Thread(target=lambda: result.append(policy.call(lookup)))
+    waiter.start()
+    time.sleep(0.1)
+    assert len(calls) == 1  # half a token: not hedged yet
+    policy._start_call()  # another call earns the other half
+    waiter.join(0.5)
+
+    assert result == ["fast"]
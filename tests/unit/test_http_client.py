@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for the shared pooled HTTP client."""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse import http_client
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.deadline import Deadline, deadline_scope
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_GET(self):
+        _KeepAliveHandler.connections.add(self.client_address)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _KeepAliveHandler.connections = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """Record the kwargs the shared session receives instead of sending."""
+    calls = []
+
+    def fake_request(method, url, **kwargs):
+        calls.append(kwargs)
+        return None
+
+    monkeypatch.setattr(http_client.get_http_client().session, "request", fake_request)
+    return calls
+
+
+@pytest.mark.unit
+def test_requests_reuse_pooled_connections(server):
+    """Repeated calls to one host share a single keep-alive connection."""
+    client = http_client.HTTPClient()
+    try:
+        for _ in range(5):
+            assert client.get(server + "/lookup").json() == {"ok": True}
+    finally:
+        client.close()
+
+    assert len(_KeepAliveHandler.connections) == 1
+
+
+@pytest.mark.unit
+def test_pool_sizes_and_timeout_from_environment(monkeypatch):
+    """Pool sizes and the default timeout are configurable."""
+    monkeypatch.setenv("TOOLUNIVERSE_HTTP_POOL_CONNECTIONS", "4")
+    monkeypatch.setenv("TOOLUNIVERSE_HTTP_POOL_MAXSIZE", "8")
+    monkeypatch.setenv("TOOLUNIVERSE_HTTP_TIMEOUT", "12.5")
+    client = http_client.HTTPClient()
+
+    adapter = client.session.get_adapter("https://rest.uniprot.org")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 8
+    assert client.timeout == 12.5
+    assert "gzip" in client.session.headers["Accept-Encoding"]
+    client.close()
+
+
+@pytest.mark.unit
+def test_default_timeout_is_capped_by_deadline(captured):
+    """Calls get the default timeout, never more than the deadline allows."""
+    client = http_client.get_http_client()
+    http_client.get("https://example.org")
+    assert captured[-1]["timeout"] == client.timeout
+
+    http_client.get("https://example.org", timeout=(3, 30))
+    assert captured[-1]["timeout"] == (3, 30)
+
+    with deadline_scope(Deadline(1.0)):
+        http_client.post("https://example.org", json={}, timeout=30)
+    assert 0 < captured[-1]["timeout"] <= 1.0
+
+
+class HTTPOptionsTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        http_client.get("https://example.org", headers={"X-Call": "1"}, timeout=5)
+        return {"ok": True}
+
+
+@pytest.mark.unit
+def test_tool_config_overrides_apply_while_tool_runs(captured):
+    """An ``http`` block in a tool config overrides request options."""
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        HTTPOptionsTool,
+        tool_config={
+            "name": "HTTPOptionsTool",
+            "type": "HTTPOptionsTool",
+            "description": "Issues one request",
+            "parameter": {"type": "object", "properties": {}},
+            "http": {"timeout": 90, "headers": {"X-Api": "key", "X-Call": "0"}},
+        },
+    )
+
+    assert tu.run_one_function({"name": "HTTPOptionsTool", "arguments": {}}) == {
+        "ok": True
+    }
+    assert captured[-1]["timeout"] == 90
+    assert captured[-1]["headers"] == {"X-Api": "key", "X-Call": "1"}
+
+    # Outside the tool the overrides no longer apply.
+    http_client.get("https://example.org", timeout=5)
+    assert captured[-1]["timeout"] == 5
+    assert tu.http_client is http_client.get_http_client()
+    tu.close()
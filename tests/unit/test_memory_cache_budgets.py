@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Tests for byte budgets in the in-memory result cache."""
+
+import os
+import sys
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.cache.memory_cache import (
+    LRUCache,
+    estimate_size,
+    parse_bytes,
+    parse_namespace_bytes,
+)
+from tooluniverse.cache.result_cache_manager import ResultCacheManager
+
+
+def _deep_size(obj):
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k) + _deep_size(v) for k, v in obj.items())
+    elif isinstance(obj, list):
+        size += sum(_deep_size(item) for item in obj)
+    return size
+
+
+@pytest.mark.unit
+def test_estimate_size_is_close_and_cheap_for_large_results():
+    """Large results are weighed from a sample within a few percent."""
+    page = {
+        "hitCount": 5000,
+        "resultList": {
+            "result": [
+                {"id": str(i), "title": "protein " * 20, "abstractText": "x" * 800}
+                for i in range(20000)
+            ]
+        },
+    }
+    exact = _deep_size(page)
+    start = time.perf_counter()
+    estimate = estimate_size(page)
+    elapsed = time.perf_counter() - start
+    assert abs(estimate - exact) / exact < 0.05
+    assert elapsed < 0.01
+    assert estimate_size("x" * 1000) == sys.getsizeof("x" * 1000)
+
+    assert parse_bytes("1.5kb") == 1536 and parse_bytes("64MB") == 64 * 1024**2
+    assert parse_bytes("") is None
+    assert parse_namespace_bytes("a=1KB, *=2") == {"a": 1024, "*": 2}
+    with pytest.raises(ValueError):
+        parse_bytes("lots")
+
+
+@pytest.mark.unit
+def test_byte_and_namespace_budgets_evict_least_recently_used():
+    """Large values evict by bytes, and a namespace only evicts its own entries."""
+    cache = LRUCache(
+        max_size=None,
+        max_bytes=1000,
+        namespace_bytes={"big": 600},
+        weigher=len,
+    )
+    for i in range(10):
+        cache.set(f"small{i}", "s" * 20, namespace="small")
+    cache.set("big1", "b" * 300, namespace="big")
+    cache.set("big2", "b" * 300, namespace="big")
+    cache.get("small0")
+    cache.set("big3", "b" * 300, namespace="big")
+    assert cache.get("big1") is None and cache.get("big3") is not None
+    assert all(cache.get(f"small{i}") for i in range(10))
+    assert cache.stats()["namespace_bytes"] == {"big": 600, "small": 200}
+
+    cache.set("too_big", "b" * 700, namespace="big")
+    assert cache.get("too_big") is None and cache.stats()["rejected"] == 1
+    cache.set("other", "o" * 500, namespace="other")
+    # The global budget evicts in LRU order across namespaces
+    assert cache.current_bytes == 1000
+    assert cache.get("big2") is None and cache.get("big3") is not None
+    cache.delete("other")
+    stats = cache.stats()
+    assert stats["current_bytes"] == sum(stats["namespace_bytes"].values())
+    assert "other" not in stats["namespace_bytes"]
+
+    counted = LRUCache(max_size=2)
+    counted.set("a", "x" * 10**6)
+    assert "current_bytes" not in counted.stats()
+
+
+@pytest.mark.unit
+def test_budgets_are_configured_from_the_environment(tmp_path, monkeypatch):
+    """``TOOLUNIVERSE_CACHE_*`` byte settings reach the manager and its stats."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_PERSIST", "false")
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_MEMORY_BYTES", "2KB")
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_NAMESPACE_BYTES", "*=1KB")
+    monkeypatch.delenv("TOOLUNIVERSE_CACHE_MEMORY_SIZE", raising=False)
+    tu = ToolUniverse(keep_default_tools=False)
+    memory = tu.cache_manager.memory
+    assert (memory.max_size, memory.max_bytes) == (None, 2048)
+    assert memory.namespace_bytes == {"*": 1024}
+    tu.close()
+
+    manager = ResultCacheManager(
+        memory_size=None, memory_bytes=4096, persistence_enabled=False
+    )
+    for i in range(20):
+        manager.set(namespace="tool", version="v1", cache_key=str(i), value="x" * 500)
+    stats = manager.stats()["memory"]
+    assert 0 < stats["current_bytes"] <= 4096
+    assert stats["evictions"] == 20 - stats["current_size"]
+    assert manager.get(namespace="tool", version="v1", cache_key="19") == "x" * 500
+    manager.close()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for per-tool execution metrics."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.metrics import MetricsRegistry
+
+
+class MetricsProbeTool(BaseTool):
+    def run(self, arguments=None, stream_callback=None, use_cache=False):
+        if arguments.get("query") == "boom":
+            raise RuntimeError("upstream exploded")
+        return {"echo": arguments["query"]}
+
+
+@pytest.fixture
+def tu(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("TOOLUNIVERSE_CACHE_PERSIST", "false")
+    engine = ToolUniverse(tool_files={}, keep_default_tools=False)
+    engine.register_custom_tool(
+        MetricsProbeTool,
+        tool_config={
+            "name": "MetricsProbeTool",
+            "type": "MetricsProbeTool",
+            "description": "Echoes the query",
+            "parameter": {
+                "type": "object",
+                "properties": {"query": {"type": "string"}},
+                "required": ["query"],
+            },
+        },
+    )
+    yield engine
+    engine.close()
+
+
+@pytest.mark.unit
+def test_metrics_disabled_by_default_records_nothing(tu, monkeypatch):
+    """Without opting in, calls leave the registry empty."""
+    monkeypatch.delenv("TOOLUNIVERSE_METRICS_ENABLED", raising=False)
+    assert MetricsRegistry().enabled is False
+
+    tu.enable_metrics(False)
+    tu.run_one_function({"name": "MetricsProbeTool", "arguments": {"query": "a"}})
+    assert tu.get_metrics()["tools"] == {}
+
+
+@pytest.mark.unit
+def test_metrics_record_calls_errors_phases_and_cache(tu):
+    """Calls, error types, cache events and phase timings are recorded."""
+    tu.enable_metrics()
+    call = {"name": "MetricsProbeTool", "arguments": {"query": "TP53"}}
+    tu.run_one_function(call, use_cache=True)
+    tu.run_one_function(call, use_cache=True)
+    tu.run_one_function({"name": "MetricsProbeTool", "arguments": {}})
+    tu.run_one_function({"name": "MetricsProbeTool", "arguments": {"query": "boom"}})
+
+    tool = tu.get_metrics("MetricsProbeTool")
+    assert tool["calls"] == 4
+    assert tool["errors"] == {"ToolValidationError": 1, "ToolServerError": 1}
+    assert tool["cache"] == {"hit": 1, "miss": 1, "singleflight_wait": 0}
+    assert tool["latency_seconds"]["count"] == 4
+    assert tool["phase_seconds"]["cache_lookup"]["count"] == 2
+    assert tool["phase_seconds"]["execution"]["count"] == 2
+    assert tool["result_bytes"]["count"] == 4
+
+    totals = tu.get_metrics()["totals"]
+    assert totals["calls"] == 4
+    assert totals["errors"] == 2
+
+
+@pytest.mark.unit
+def test_metrics_native_async_path(tu):
+    """arun_one_function feeds the same registry."""
+    tu.enable_metrics()
+    call = {"name": "MetricsProbeTool", "arguments": {"query": "EGFR"}}
+    assert asyncio.run(tu.arun_one_function(call)) == {"echo": "EGFR"}
+    assert tu.get_metrics("MetricsProbeTool")["calls"] == 1
+
+
+@pytest.mark.unit
+def test_prometheus_exposition_format():
+    """The text export uses Prometheus names, cumulative buckets and escaping."""
+    registry = MetricsRegistry(enabled=True)
+    observation = registry.observe('odd"tool')
+    observation.mark("execution")
+    observation.finish({"error": "nope"})
+
+    text = registry.to_prometheus()
+    assert "# TYPE tooluniverse_tool_calls_total counter" in text
+    assert 'tooluniverse_tool_calls_total{tool="odd\\"tool"} 1' in text
+    assert (
+        'tooluniverse_tool_errors_total{tool="odd\\"tool",error_type="Error"} 1' in text
+    )
+    assert (
+        'tooluniverse_tool_phase_seconds_bucket{tool="odd\\"tool",'
+        'phase="execution",le="+Inf"} 1' in text
+    )
+    assert text.endswith("\n")
+
+
+@pytest.mark.unit
+def test_smcp_exposes_metrics_tool_and_route(tu):
+    """SMCP serves metrics through a utility tool and a /metrics route."""
+    pytest.importorskip("fastmcp")
+    from starlette.testclient import TestClient
+
+    from tooluniverse.smcp import SMCP
+
+    server = SMCP(
+        tooluniverse_config=tu,
+        auto_expose_tools=False,
+        search_enabled=False,
+        metrics_enabled=True,
+    )
+    tu.run_one_function({"name": "MetricsProbeTool", "arguments": {"query": "x"}})
+
+    tools = asyncio.run(server.get_tools())
+    report = asyncio.run(tools["get_tooluniverse_metrics"].fn())
+    assert json.loads(report)["tools"]["MetricsProbeTool"]["calls"] == 1
+
+    with TestClient(server.http_app()) as client:
+        response = client.get("/metrics")
+    assert response.status_code == 200
+    assert 'tooluniverse_tool_calls_total{tool="MetricsProbeTool"} 1' in response.text
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Tests for the precompiled parameter validation engine."""
+
+import glob
+import json
+import os
+
+import jsonschema
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.parameter_validator import ParameterValidator
+from tooluniverse.utils import evaluate_function_call
+
+DATA_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "src", "tooluniverse", "data"
+)
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "minLength": 2, "pattern": "^[a-z]+$"},
+        "count": {"type": "integer", "minimum": 1, "maximum": 10},
+        "ratio": {"type": "number"},
+        "flag": {"type": "boolean"},
+        "mode": {"type": "string", "enum": ["fast", "slow"]},
+        "ids": {"type": "array", "items": {"type": "integer"}, "maxItems": 3},
+        "extra": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+    },
+    "required": ["name"],
+}
+
+ARGUMENT_CASES = [
+    {"name": "abc"},
+    {"name": "abc", "count": 5, "ratio": 0.5, "flag": True, "mode": "fast"},
+    {},
+    {"name": "a"},
+    {"name": "ABC"},
+    {"name": "abc", "count": 0},
+    {"name": "abc", "count": "5"},
+    {"name": "abc", "count": True},
+    {"name": "abc", "count": 5.0},
+    {"name": "abc", "ratio": 1},
+    {"name": "abc", "flag": 1},
+    {"name": "abc", "mode": "medium"},
+    {"name": "abc", "ids": [1, 2]},
+    {"name": "abc", "ids": [1, "2"]},
+    {"name": "abc", "ids": [1, 2, 3, 4]},
+    {"name": "abc", "extra": None},
+    {"name": "abc", "extra": 3},
+    {"name": "abc", "unknown": 1},
+    {"name": "abc", "_tooluniverse_stream": True},
+]
+
+
+def _reference_validate(schema, arguments):
+    try:
+        jsonschema.validate(arguments, schema)
+        return None
+    except jsonschema.ValidationError as e:
+        return (e.message, str(e), list(e.absolute_path))
+
+
+def _compiled_validate(validator, arguments):
+    error = validator.validate(arguments)
+    if error is None:
+        return None
+    return (
+        str(error).replace("Parameter validation failed: ", "", 1),
+        error.details["validation_error"],
+        error.details["path"],
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("arguments", ARGUMENT_CASES)
+def test_compiled_validation_matches_jsonschema(arguments, make_tool_config):
+    """Compiled validation returns exactly what jsonschema.validate reports."""
+    validator = ParameterValidator(make_tool_config("validated_tool", parameter=SCHEMA))
+
+    assert _compiled_validate(validator, arguments) == _reference_validate(
+        SCHEMA, arguments
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("arguments", ARGUMENT_CASES)
+def test_compiled_call_check_matches_evaluate_function_call(
+    arguments, make_tool_config
+):
+    """The call-format check mirrors utils.evaluate_function_call messages."""
+    config = make_tool_config("validated_tool", parameter=SCHEMA)
+    call = {"name": config["name"], "arguments": arguments}
+    validator = ParameterValidator(config)
+
+    expected = evaluate_function_call(config, call)
+    assert validator.evaluate(call) == expected
+
+    validation_error, check, _ = validator.check(arguments, validate=True)
+    reference_error = _reference_validate(SCHEMA, arguments)
+    if reference_error is None:
+        assert validation_error is None
+        assert check == expected
+    else:
+        assert validation_error is not None
+
+
+@pytest.mark.unit
+def test_compiled_validation_matches_bundled_tool_schemas():
+    """Every bundled tool schema agrees with jsonschema on sample arguments."""
+    samples = {
+        "string": ["x", 1],
+        "integer": [1, "1", 1.5],
+        "number": [1.5, "x"],
+        "boolean": [True, "true"],
+        "array": [[], "x"],
+        "object": [{}, []],
+    }
+    checked = 0
+    for path in glob.glob(os.path.join(DATA_DIR, "**", "*.json"), recursive=True):
+        try:
+            with open(path, encoding="utf-8") as f:
+                tools = json.load(f)
+        except (ValueError, OSError):
+            continue
+        if not isinstance(tools, list):
+            continue
+        for tool in tools:
+            schema = tool.get("parameter") if isinstance(tool, dict) else None
+            if not isinstance(schema, dict) or not schema.get("properties"):
+                continue
+            validator = ParameterValidator(tool)
+            for variant in range(2):
+                arguments = {}
+                for name, prop in schema["properties"].items():
+                    options = samples.get(prop.get("type"), ["x"])
+                    arguments[name] = options[min(variant, len(options) - 1)]
+                assert _compiled_validate(validator, arguments) == (
+                    _reference_validate(schema, arguments)
+                ), tool["name"]
+            checked += 1
+    assert checked > 0
+
+
+@pytest.mark.unit
+def test_coercion_is_opt_in_and_lossless(make_tool_config):
+    """Coercion converts numeric/boolean strings only when enabled."""
+    plain = ParameterValidator(make_tool_config("validated_tool", parameter=SCHEMA))
+    coercing = ParameterValidator(
+        make_tool_config("validated_tool", parameter=SCHEMA, coerce_parameters=True)
+    )
+    arguments = {"name": "abc", "count": "5", "ratio": "0.25", "flag": "false"}
+
+    error, _, unchanged = plain.check(arguments)
+    assert error is not None
+    assert unchanged is arguments
+
+    error, check, coerced = coercing.check(arguments)
+    assert error is None
+    assert check == (True, "Function call is valid.")
+    assert coerced == {"name": "abc", "count": 5, "ratio": 0.25, "flag": False}
+    assert arguments["count"] == "5"
+
+    assert coercing.coerce_arguments({"count": "5x"}) == {"count": "5x"}
+
+
+class EchoTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        return arguments
+
+
+@pytest.mark.unit
+def test_tooluniverse_reuses_compiled_validator(make_tool_config, make_tu):
+    """Repeated calls reuse one compiled validator and keep error structures."""
+    tu = make_tu((EchoTool, make_tool_config("EchoTool", parameter=SCHEMA)))
+
+    assert tu.run_one_function({"name": "EchoTool", "arguments": {"name": "abc"}}) == {
+        "name": "abc"
+    }
+    validator = tu._get_tool_instance("EchoTool").get_parameter_validator()
+    assert tu._get_compiled_validator("EchoTool") is validator
+
+    missing = tu.run_one_function({"name": "EchoTool", "arguments": {}})
+    assert missing["error_details"]["type"] == "ToolValidationError"
+    assert "'name' is a required property" in missing["error"]
+
+    unknown = tu.run_one_function(
+        {"name": "EchoTool", "arguments": {"name": "abc", "bogus": 1}}
+    )
+    assert unknown["error"] == (
+        "Invalid function call: Invalid parameters provided: ['bogus']"
+    )
+    assert tu._get_tool_instance("EchoTool").get_parameter_validator() is validator
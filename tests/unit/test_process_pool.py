@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Tests for running CPU-bound tools in worker processes."""
+
+import json
+import multiprocessing
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import process_pool
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.process_pool import ProcessPool
+
+
+class CrunchTool(BaseTool):
+    """Counts its own calls so tests can tell warm instances apart."""
+
+    def __init__(self, tool_config):
+        super().__init__(tool_config)
+        self.calls = 0
+
+    def run(self, arguments=None, **kwargs):
+        self.calls += 1
+        if arguments.get("fail"):
+            raise ValueError("cannot crunch")
+        time.sleep(arguments.get("sleep", 0))
+        return {"pid": os.getpid(), "calls": self.calls, "n": arguments["n"] ** 2}
+
+
+CRUNCH_PROPERTIES = {
+    "n": {"type": "integer"},
+    "fail": {"type": "boolean"},
+    "sleep": {"type": "number"},
+}
+
+
+@pytest.fixture
+def crunch_engine(monkeypatch, make_tool_config, make_tu):
+    """Build an engine running CrunchTool on a fresh pool (``pool_settings``)."""
+    pools = []
+
+    def make(**pool_settings):
+        pool = ProcessPool(**{"max_workers": 2, **pool_settings})
+        pools.append(pool)
+        monkeypatch.setattr(process_pool, "_pool", pool)
+        config = make_tool_config(
+            "CrunchTool", CRUNCH_PROPERTIES, ["n"], execution="process"
+        )
+        return make_tu((CrunchTool, config))
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+
+@pytest.fixture
+def tu(crunch_engine):
+    return crunch_engine()
+
+
+def _call(tu, timeout=None, **arguments):
+    return tu.run_one_function(
+        {"name": "CrunchTool", "arguments": arguments}, timeout=timeout
+    )
+
+
+@pytest.mark.unit
+def test_calls_run_in_warm_worker_processes(tu):
+    """The tool runs outside the caller's process on a reused instance."""
+    first = _call(tu, n=3)
+    second = _call(tu, n=4)
+
+    assert first["n"] == 9 and second["n"] == 16
+    assert first["pid"] != os.getpid()
+    assert second["pid"] == first["pid"]
+    assert second["calls"] == first["calls"] + 1
+
+
+@pytest.mark.unit
+def test_batches_fan_out_across_workers(tu):
+    """Batch calls are routed to the pool and run in parallel."""
+    calls = [
+        {"name": "CrunchTool", "arguments": {"n": i, "sleep": 0.5}} for i in range(2)
+    ]
+    tu.process_pool.warm()
+    _call(tu, n=0)  # wait until a worker is up
+
+    start = time.monotonic()
+    messages = tu.run(calls, max_workers=2)
+    elapsed = time.monotonic() - start
+
+    results = [json.loads(m["content"])["content"] for m in messages[1:]]
+    assert [r["n"] for r in results] == [0, 1]
+    assert all(r["pid"] != os.getpid() for r in results)
+    assert elapsed < 0.9
+
+
+@pytest.mark.unit
+def test_worker_errors_and_deadlines_are_reported(tu):
+    """Tool exceptions cross the boundary; a hung worker is killed on timeout."""
+    result = _call(tu, n=1, fail=True)
+    assert "cannot crunch" in result["error"]
+
+    start = time.monotonic()
+    result = _call(tu, timeout=0.5, n=1, sleep=30)
+    assert time.monotonic() - start < 2
+    assert result["error_details"]["details"]["deadline_exceeded"] is True
+
+    assert _call(tu, n=5)["n"] == 25
+
+
+@pytest.mark.unit
+def test_workers_are_recycled(crunch_engine):
+    """Workers are replaced after max_tasks calls or past their memory limit."""
+    engine = crunch_engine(max_workers=1, max_tasks=2)
+    pids = [_call(engine, n=i)["pid"] for i in range(4)]
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+    engine.close()
+
+    engine = crunch_engine(max_workers=1, memory_limit_mb=1)
+    first, second = _call(engine, n=1), _call(engine, n=2)
+    assert first["pid"] != second["pid"]
+    assert first["calls"] == second["calls"] == 1
+
+
+@pytest.mark.unit
+def test_disabled_pool_runs_in_process(crunch_engine):
+    """With the pool disabled the tool runs in the calling process."""
+    engine = crunch_engine(enabled=False)
+    assert _call(engine, n=2)["pid"] == os.getpid()
+
+
+@pytest.mark.unit
+def test_forkserver_preload_is_opt_in(monkeypatch):
+    """The process-wide fork server is only changed when preload is requested."""
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        pytest.skip("forkserver start method not available")
+    context = multiprocessing.get_context("forkserver")
+    preloaded = []
+    monkeypatch.setattr(context, "set_forkserver_preload", preloaded.append)
+    monkeypatch.delenv("TOOLUNIVERSE_PROCESS_PRELOAD", raising=False)
+
+    ProcessPool(max_workers=1).shutdown()
+    assert preloaded == []
+
+    ProcessPool(max_workers=1, preload=True).shutdown()
+    monkeypatch.setenv("TOOLUNIVERSE_PROCESS_PRELOAD", "true")
+    ProcessPool(max_workers=1).shutdown()
+    assert preloaded == [["tooluniverse"], ["tooluniverse"]]
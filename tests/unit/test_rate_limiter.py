@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Tests for the per-host rate limiter."""
+
+import asyncio
+import importlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse import http_client, rate_limiter
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.deadline import Deadline, DeadlineExceeded, deadline_scope
+from tooluniverse.rate_limiter import RateLimiter
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    times = []
+    throttle_next = 0
+
+    def do_GET(self):
+        _Handler.times.append(time.monotonic())
+        if _Handler.throttle_next:
+            _Handler.throttle_next -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "0.5")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.times = []
+    _Handler.throttle_next = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """A fresh process-wide limiter, so rules never leak between tests."""
+    fresh = RateLimiter()
+    monkeypatch.setattr(rate_limiter, "_limiter", fresh)
+    return fresh
+
+
+@pytest.mark.unit
+def test_threads_are_spaced_and_served_in_arrival_order(limiter):
+    """Concurrent callers respect the rate and are served first come, first served."""
+    limiter.add_limit({"host": "api.example.org", "requests": 20, "period": 1})
+    order = []
+    lock = threading.Lock()
+
+    def worker(i):
+        limiter.acquire(f"https://api.example.org/item/{i}")
+        with lock:
+            order.append((i, time.monotonic()))
+
+    start = time.monotonic()
+    threads = []
+    for i in range(8):
+        thread = threading.Thread(target=worker, args=(i,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.005)
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 7 * 0.05 * 0.9
+    assert [i for i, _ in sorted(order, key=lambda item: item[1])] == list(range(8))
+    # Hosts without a rule are never delayed.
+    before = time.monotonic()
+    for _ in range(20):
+        limiter.acquire("https://other.example.org/")
+    assert time.monotonic() - before < 0.05
+
+
+@pytest.mark.unit
+def test_api_key_selects_keyed_limit_and_strictest_rule_wins(limiter, monkeypatch):
+    """Keyed requests get the keyed rate; duplicate hosts keep the strictest rule."""
+    monkeypatch.delenv("NCBI_API_KEY", raising=False)
+    limiter.add_tool_limits({"rate_limit": rate_limiter.DEFAULT_HOST_LIMITS[0]})
+    limiter.add_tool_limits(
+        {"rate_limit": [{"host": "eutils.ncbi.nlm.nih.gov", "requests": 100}]}
+    )
+    assert limiter.limits() == {"eutils.ncbi.nlm.nih.gov": 3.0}
+
+    unkeyed, _ = limiter._bucket("https://eutils.ncbi.nlm.nih.gov/esearch.fcgi")
+    keyed, _ = limiter._bucket(
+        "https://eutils.ncbi.nlm.nih.gov/esearch.fcgi?db=pubmed&api_key=abc"
+    )
+    assert unkeyed.rate == 3.0
+    assert keyed.rate == 10.0
+
+    assert limiter.add_limit({"host": "bad.example.org"}) is False
+
+
+@pytest.mark.unit
+def test_deadline_rejects_waits_that_cannot_finish(limiter):
+    """A caller whose deadline ends before its slot fails without reserving it."""
+    limiter.add_limit({"host": "slow.example.org", "requests": 1, "period": 10})
+    limiter.acquire("https://slow.example.org/")
+
+    with deadline_scope(Deadline(0.1)):
+        with pytest.raises(DeadlineExceeded):
+            limiter.acquire("https://slow.example.org/")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_waiters_do_not_block_the_event_loop(limiter):
+    """aacquire() sleeps on the event loop instead of blocking it."""
+    limiter.add_limit({"host": "api.example.org", "requests": 20, "period": 1})
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    start = time.monotonic()
+    await asyncio.gather(
+        *(limiter.aacquire("https://api.example.org/") for _ in range(6))
+    )
+    elapsed = time.monotonic() - start
+    task.cancel()
+
+    assert elapsed >= 5 * 0.05 * 0.9
+    assert ticks >= 10
+
+
+class FetchTool(BaseTool):
+    url = None
+
+    def run(self, arguments=None, **kwargs):
+        return http_client.get(f"{self.url}/{arguments['i']}").json()
+
+
+@pytest.mark.unit
+def test_batch_respects_limit_declared_in_tool_config(limiter, server):
+    """A ``rate_limit`` block caps a wide batch at the provider's rate."""
+    FetchTool.url = server
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.register_custom_tool(
+        FetchTool,
+        tool_config={
+            "name": "FetchTool",
+            "type": "FetchTool",
+            "description": "Fetches one item",
+            "parameter": {
+                "type": "object",
+                "properties": {"i": {"type": "integer"}},
+                "required": ["i"],
+            },
+            "rate_limit": {"host": "127.0.0.1", "requests": 20, "period": 1},
+        },
+    )
+
+    results = tu.run(
+        [{"name": "FetchTool", "arguments": {"i": i}} for i in range(10)],
+        max_workers=8,
+    )
+
+    assert all('"ok": true' in result["content"] for result in results[1:])
+    assert limiter.limits() == {"127.0.0.1": 20.0}
+    assert len(_Handler.times) == 10
+    assert _Handler.times[-1] - _Handler.times[0] >= 9 * 0.05 * 0.9
+    tu.close()
+
+
+@pytest.mark.unit
+def test_retry_after_pauses_the_host(limiter, server):
+    """A 429 with Retry-After holds back the next request to that host."""
+    _Handler.throttle_next = 1
+    client = http_client.HTTPClient()
+    try:
+        assert client.get(server + "/a").status_code == 429
+        assert client.get(server + "/b").json() == {"ok": True}
+    finally:
+        client.close()
+
+    assert _Handler.times[1] - _Handler.times[0] >= 0.45
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "module, cls",
+    [
+        ("clinvar_tool", "ClinVarTool"),
+        ("pmc_tool", "PMCTool"),
+        ("ensembl_tool", "EnsemblTool"),
+        ("dbsnp_tool", "DbSnpTool"),
+        ("gnomad_tool", "GnomadTool"),
+        ("ucsc_tool", "UCSCTool"),
+        ("core_tool", "CoreTool"),
+        ("uspto_tool", "USPTOOpenDataPortalTool"),
+        ("genomics_gene_search_tool", "GWASGeneSearch"),
+    ],
+)
+def test_tool_sessions_go_through_the_limiter(module, cls):
+    """Tools that keep their own session still mount the rate-limited adapter."""
+    tool_class = getattr(importlib.import_module(f"tooluniverse.{module}"), cls)
+    config = {"name": cls, "type": cls, "parameter": {"properties": {}}}
+    if cls == "USPTOOpenDataPortalTool":
+        tool = tool_class(config, api_key="test-key")
+    else:
+        tool = tool_class(config)
+
+    for url in ("https://example.org/", "http://example.org/"):
+        adapter = tool.session.get_adapter(url)
+        assert isinstance(adapter, http_client.RateLimitedAdapter)
+
+
+@pytest.mark.unit
+def test_rate_limited_session_honours_cancelled_deadline(limiter, server):
+    """A cancelled deadline (e.g. a losing hedge) stops the request before sending."""
+    session = http_client.rate_limited_session()
+    deadline = Deadline(30)
+    deadline.cancel()
+    try:
+        with deadline_scope(deadline):
+            with pytest.raises(DeadlineExceeded):
+                session.get(server + "/late", timeout=10)
+        assert session.get(server + "/ok", timeout=10).json() == {"ok": True}
+    finally:
+        session.close()
+
+    assert len(_Handler.times) == 1
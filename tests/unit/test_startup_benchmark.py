@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Tests for the offline startup benchmark runner (scripts/benchmark_startup.py)."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "benchmark_startup.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("benchmark_startup", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _record(seconds, environment="py linux"):
+    return {
+        "environment": environment,
+        "results": {"demo": {"seconds": seconds, "modules": 100, "peak_rss_mb": 40}},
+    }
+
+
+@pytest.mark.unit
+def test_ceilings_and_regressions_against_history(bench):
+    """Ceilings are absolute; regressions compare with recent same-env runs."""
+    thresholds = {
+        "max_regression": 0.5,
+        "baseline_runs": 3,
+        "regression_slack": {"seconds": 0.05},
+        "scenarios": {"demo": {"modules": 120}},
+    }
+    history = [_record(9.0), _record(1.0), _record(1.2), _record(0.8)]
+    history.append(_record(0.1, environment="other"))
+
+    def check(seconds, modules=100):
+        results = {"demo": {"seconds": seconds, "modules": modules, "peak_rss_mb": 40}}
+        return bench.check_results(results, thresholds, history, "py linux")
+
+    assert check(1.4) == []
+    assert check(1.6) == [
+        "demo.seconds = 1.6 is more than 50% above the recent median 1.0"
+    ]
+    assert check(1.0, modules=121) == ["demo.modules = 121 exceeds ceiling 120"]
+    assert (
+        bench.check_results(
+            {"demo": {"seconds": 0.03, "modules": 1, "peak_rss_mb": 1}},
+            thresholds,
+            [_record(0.01)],
+            "py linux",
+        )
+        == []
+    )
+
+
+@pytest.mark.unit
+def test_runner_measures_offline_and_appends_history(bench, tmp_path):
+    """A real import probe is recorded; a tight ceiling fails the run."""
+    history = tmp_path / "history.json"
+    thresholds = tmp_path / "thresholds.json"
+    thresholds.write_text(json.dumps({"scenarios": {}}))
+    args = [
+        "--scenario",
+        "import_tooluniverse",
+        "--repeat",
+        "1",
+        "--history",
+        str(history),
+        "--thresholds",
+        str(thresholds),
+    ]
+    assert bench.main(args) == 0
+    (record,) = json.loads(history.read_text())
+    metrics = record["results"]["import_tooluniverse"]
+    assert metrics["seconds"] > 0 and metrics["modules"] > 50
+    assert metrics["peak_rss_mb"] > 0
+    assert record["environment"] == bench.environment_key()
+    assert record["failures"] == []
+
+    thresholds.write_text(
+        json.dumps({"scenarios": {"import_tooluniverse": {"modules": 1}}})
+    )
+    assert bench.main(args) == 1
+    assert json.loads(history.read_text())[-1]["failures"]
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for the indexed tool catalog behind ToolUniverse lookups."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.base_tool import BaseTool
+from tooluniverse.tool_catalog import ToolCatalog
+
+
+def _tool(name, tool_type="DemoTool", label=None, description=""):
+    tool = {"name": name, "type": tool_type, "description": description or name}
+    if label is not None:
+        tool["label"] = label
+    return tool
+
+
+class EchoTool(BaseTool):
+    def run(self, arguments=None, **kwargs):
+        return arguments
+
+
+@pytest.fixture
+def catalog():
+    catalog = ToolCatalog()
+    catalog.extend([_tool("a1", label=["x"]), _tool("a2", "Other")], "alpha")
+    catalog.extend([_tool("b1", label=["x", "y"]), _tool("b2", "Other")], "beta")
+    return catalog
+
+
+@pytest.mark.unit
+def test_select_uses_indexes_and_keeps_load_order(catalog):
+    """Filters intersect; None means unfiltered and an empty include means none."""
+
+    def names(tools):
+        return [tool["name"] for tool in tools]
+
+    assert names(catalog.select()) == ["a1", "a2", "b1", "b2"]
+    assert names(catalog.select(include_types=["Other"])) == ["a2", "b2"]
+    assert names(catalog.select(include_names=["b1", "a1", "zz"])) == ["a1", "b1"]
+    assert names(
+        catalog.select(include_categories=["beta"], exclude_types=["Other"])
+    ) == ["b1"]
+    assert names(catalog.select(include_labels=["x"], exclude_names=["a1"])) == ["b1"]
+    assert names(catalog.select(exclude_categories=["alpha"])) == ["b1", "b2"]
+    assert catalog.select(include_names=[]) == []
+    assert catalog.select(include_types=["Missing"]) == []
+    assert catalog.types() == ["DemoTool", "Other"]
+    assert catalog.labels() == ["x", "y"]
+    assert catalog.category_of("b2") == "beta"
+
+
+@pytest.mark.unit
+def test_version_bumps_and_invalidates_searches(catalog):
+    """Every change moves the version forward and drops cached searches."""
+    version = catalog.version
+    assert [t["name"] for t in catalog.search("^a")] == ["a1", "a2"]
+    assert catalog.search("A1", case_sensitive=True) == []
+
+    catalog.add(_tool("a1", "Other", description="replaced"), "beta")
+    assert catalog.version > version
+    assert [t["name"] for t in catalog.tools()] == ["a1", "a2", "b1", "b2"]
+    assert catalog.names_with_type("DemoTool") == {"b1"}
+    assert catalog.names_in_category("alpha") == {"a2"}
+    assert catalog.names_with_label("x") == {"b1"}
+    assert [t["name"] for t in catalog.search("replaced", ("description",))] == ["a1"]
+
+    version = catalog.version
+    assert catalog.remove("a2")["name"] == "a2"
+    assert catalog.remove("a2") is None
+    assert catalog.version > version
+    assert [t["name"] for t in catalog.search("^a")] == ["a1"]
+    assert catalog.names_in_category("alpha") == set()
+    assert not catalog.add({"type": "NoName"})
+
+
+@pytest.mark.unit
+def test_tooluniverse_lookups_follow_all_tools():
+    """filter/select/find return the same shapes and see later additions."""
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    first, second, dup = _tool("t1"), _tool("t2", "Other"), _tool("t1", "Other")
+    tu.all_tools = [first, second, dup]
+    tu.tool_category_dicts = {"demo": [first, second, dup]}
+    tu._filter_and_deduplicate_tools(set(), None)
+
+    assert tu.all_tools == [first, second]
+    assert tu.all_tool_dict == {"t1": first, "t2": second}
+    assert tu.filter_tools(include_tool_types=["Other"]) == [second]
+    assert tu.filter_tools(exclude_tools=["t2"]) == [first]
+    with pytest.warns(DeprecationWarning):
+        assert tu.select_tools(include_categories=["demo"]) == [first, second]
+    assert tu.find_tools_by_pattern("T2") == [second]
+    assert tu.find_tools_by_pattern("t", search_in="nowhere") == []
+
+    late = _tool("t3", "Other")
+    tu.all_tools.append(late)
+    assert tu.filter_tools(include_tool_types=["Other"]) == [second, late]
+    assert tu.all_tool_dict["t3"] is late
+
+    tu.register_custom_tool(
+        EchoTool, tool_config={"name": "echo", "type": "EchoTool", "category": "fx"}
+    )
+    with pytest.warns(DeprecationWarning):
+        assert [t["name"] for t in tu.select_tools(include_categories=["fx"])] == [
+            "echo"
+        ]
+    assert [t["name"] for t in tu.find_tools_by_pattern("^(echo|t3)$")] == [
+        "t3",
+        "echo",
+    ]
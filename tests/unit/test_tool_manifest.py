@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Tests for the build-time tool class manifest and lazy tool loading."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+import tooluniverse
+from tooluniverse import tool_registry
+from tooluniverse.build_optimizer import (
+    build_tool_manifest,
+    load_tool_manifest,
+    scan_tool_classes,
+    write_tool_manifest,
+)
+
+PACKAGE_DIR = Path(tooluniverse.__file__).parent
+
+MAX_COLD_START_SECONDS = 1.5
+
+SELECTED_TOOLS = [
+    "UniProt_get_entry_by_accession",
+    "ArXiv_search_papers",
+    "PubMed_search_articles",
+    "Crossref_search_works",
+    "DBLP_search_publications",
+    "EuropePMC_search_articles",
+    "SemanticScholar_search_papers",
+    "openalex_literature_search",
+    "HAL_search_archive",
+    "CORE_search_papers",
+    "DOAJ_search_articles",
+    "Unpaywall_check_oa_status",
+    "BioRxiv_search_preprints",
+    "MedRxiv_search_preprints",
+    "Zenodo_search_records",
+    "PMC_search_papers",
+    "FDA_get_active_ingredient_info_by_drug_name",
+    "OpenTargets_get_disease_id_description_by_name",
+    "ChEMBL_search_similar_molecules",
+    "get_joint_associated_diseases_by_HPO_ID_list",
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from tooluniverse import ToolUniverse
+tu = ToolUniverse()
+tu.load_tools(include_tools=json.loads(sys.argv[1]))
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "types": sorted({t["type"] for t in tu.all_tools}),
+    "modules": sorted(sys.modules),
+    "source": tu.get_lazy_loading_status()["lazy_registry_source"],
+}))
+"""
+
+
+@pytest.mark.unit
+def test_manifest_scan_and_staleness(tmp_path):
+    """Decorated classes are indexed; edited or new modules are re-scanned."""
+    (tmp_path / "alpha_tool.py").write_text(
+        "@register_tool('AlphaTool')\nclass Alpha:\n    pass\n\n\n"
+        "@tool_registry.register_tool\nclass BetaTool:\n    pass\n"
+    )
+    (tmp_path / "helpers.py").write_text("def helper():\n    pass\n")
+    assert scan_tool_classes(tmp_path / "alpha_tool.py") == ["AlphaTool", "BetaTool"]
+
+    write_tool_manifest(tmp_path)
+    assert set(build_tool_manifest(tmp_path)["modules"]) == {"alpha_tool"}
+    assert load_tool_manifest(tmp_path) == (
+        {"AlphaTool": "alpha_tool", "BetaTool": "alpha_tool"},
+        [],
+    )
+
+    (tmp_path / "helpers.py").write_text("def helper():\n    return 1\n")
+    assert load_tool_manifest(tmp_path)[1] == []
+
+    (tmp_path / "alpha_tool.py").write_text(
+        "@register_tool\nclass GammaTool:\n    pass\n"
+    )
+    (tmp_path / "delta_tool.py").write_text(
+        "@register_tool('DeltaTool')\nclass Delta:\n    pass\n"
+    )
+    mapping, stale = load_tool_manifest(tmp_path)
+    assert mapping == {"GammaTool": "alpha_tool", "DeltaTool": "delta_tool"}
+    assert stale == ["alpha_tool", "delta_tool"]
+
+    (tmp_path / "tool_manifest.json").write_text('{"version": 0}')
+    assert load_tool_manifest(tmp_path) == ({}, [])
+
+
+@pytest.mark.unit
+def test_shipped_manifest_is_current_and_used():
+    """The packaged manifest matches the source and backs the lazy registry."""
+    mapping, stale = load_tool_manifest(PACKAGE_DIR)
+    assert stale == [], "rebuild with `python -m tooluniverse.build_optimizer`"
+    assert mapping["UniProtRESTTool"] == "uniprot_tool"
+    assert tool_registry._lazy_registry_source == "manifest"
+    assert tool_registry.lazy_import_tool("UniProtRESTTool").__name__ == (
+        "UniProtRESTTool"
+    )
+
+
+@pytest.mark.unit
+def test_cold_start_imports_only_selected_tool_modules():
+    """A 20-tool configuration imports just its modules within the time budget."""
+    env = {k: v for k, v in os.environ.items() if k != "TOOLUNIVERSE_LIGHT_IMPORT"}
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE, json.dumps(SELECTED_TOOLS)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    probe = json.loads(output.strip().splitlines()[-1])
+
+    mapping, _ = load_tool_manifest(PACKAGE_DIR)
+    expected = {mapping[tool_type] for tool_type in probe["types"]}
+    tool_modules = {
+        name.split(".", 1)[1]
+        for name in probe["modules"]
+        if name.startswith("tooluniverse.") and name.count(".") == 1
+    }
+    assert probe["source"] == "manifest"
+    assert expected <= tool_modules
+    assert tool_modules & set(mapping.values()) == expected
+    assert "fastmcp" not in probe["modules"]
+    assert probe["elapsed"] < MAX_COLD_START_SECONDS
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Tests for saving and restoring ToolUniverse snapshots."""
+
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse import tool_snapshot
+from tooluniverse.tool_finder_keyword import ToolFinderKeyword
+from tooluniverse.tool_snapshot import SnapshotError, StaleSnapshotError
+
+API_KEY = "TU_SNAPSHOT_TEST_KEY"
+
+
+def _tool(name, description, **extra):
+    return {
+        "name": name,
+        "type": "DemoTool",
+        "description": description,
+        "parameter": {
+            "type": "object",
+            "properties": {"query": {"type": "string"}},
+            "required": ["query"],
+        },
+        **extra,
+    }
+
+
+def _write_tools(path, description="Look up protein structures"):
+    tools = [
+        _tool("protein_lookup", description),
+        _tool("gene_search", "Search genes by symbol"),
+        _tool("keyed_tool", "Needs a key", required_api_keys=[API_KEY]),
+        _tool("dropped_tool", "Excluded by the load filter"),
+    ]
+    path.write_text(json.dumps(tools))
+
+
+@pytest.fixture
+def universe(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(API_KEY, raising=False)
+    config = tmp_path / "demo_tools.json"
+    _write_tools(config)
+    tu = ToolUniverse(tool_files={"demo": str(config)}, keep_default_tools=False)
+    tu.load_tools(exclude_tools=["dropped_tool"])
+    return tu, config, str(tmp_path / "demo.tus")
+
+
+@pytest.mark.unit
+def test_snapshot_round_trip_and_keyword_index(universe, monkeypatch):
+    """A restored universe has the same tools and reuses the saved search index."""
+    tu, _, path = universe
+    names = [t["name"] for t in tu.all_tools]
+    assert names[:2] == ["protein_lookup", "gene_search"]
+    assert "dropped_tool" not in names and "keyed_tool" not in names
+    tu.save_snapshot(path)
+
+    restored = ToolUniverse.from_snapshot(path, rebuild=False)
+    assert restored.all_tools == tu.all_tools
+    assert list(restored.all_tool_dict) == list(tu.all_tool_dict)
+    assert restored.tool_category_dicts == tu.tool_category_dicts
+    assert restored.all_tool_dict["gene_search"] is restored.all_tools[1]
+    assert restored.tool_catalog.category_of("gene_search") == "demo"
+    assert restored.tool_files == tu.tool_files
+    assert restored._load_history == [{"exclude_tools": ["dropped_tool"]}]
+
+    query = {"description": "protein structure", "limit": 2}
+    expected = json.loads(
+        ToolFinderKeyword({}, tooluniverse=tu)._run_json_search(query)
+    )
+
+    def no_rebuild(self, tools):
+        raise AssertionError("index should come from the snapshot")
+
+    monkeypatch.setattr(ToolFinderKeyword, "_build_tool_index", no_rebuild)
+    finder = ToolFinderKeyword({}, tooluniverse=restored)
+    assert json.loads(finder._run_json_search(query)) == expected
+    assert expected["tools"][0]["name"] == "protein_lookup"
+    restored.close()
+
+
+@pytest.mark.unit
+def test_stale_snapshots_are_rejected_or_rebuilt(universe, monkeypatch):
+    """Config, API key and package changes make the snapshot stale."""
+    tu, config, path = universe
+    tu.save_snapshot(path)
+
+    monkeypatch.setenv(API_KEY, "secret")
+    with pytest.raises(StaleSnapshotError, match="API keys changed"):
+        ToolUniverse.from_snapshot(path, rebuild=False)
+    monkeypatch.delenv(API_KEY)
+
+    files = tool_snapshot.package_files()
+    with monkeypatch.context() as m:
+        m.setattr(
+            tool_snapshot, "package_files", lambda: {**files, "new_module.py": "x"}
+        )
+        with pytest.raises(StaleSnapshotError, match="new_module.py"):
+            ToolUniverse.from_snapshot(path, rebuild=False)
+
+    _write_tools(config, description="Look up protein complexes")
+    with pytest.raises(StaleSnapshotError, match="tool config files changed"):
+        ToolUniverse.from_snapshot(path, rebuild=False)
+
+    rebuilt = ToolUniverse.from_snapshot(path)
+    assert rebuilt.all_tool_dict["protein_lookup"]["description"] == (
+        "Look up protein complexes"
+    )
+    assert "dropped_tool" not in rebuilt.all_tool_dict
+    restored = ToolUniverse.from_snapshot(path, rebuild=False)
+    assert restored.all_tools == rebuilt.all_tools
+    restored.close()
+
+
+@pytest.mark.unit
+def test_damaged_snapshots(universe, tmp_path):
+    """Corrupted sections are detected by hash; other files are not snapshots."""
+    tu, _, path = universe
+    tu.save_snapshot(path)
+    snapshot = tool_snapshot.ToolSnapshot(path)
+    state_offset = snapshot._data_offset + snapshot.header["sections"]["state"][0]
+    snapshot.close()
+    data = bytearray(open(path, "rb").read())
+    data[-10] ^= 0xFF
+    with open(path, "wb") as f:
+        f.write(data)
+
+    restored = ToolUniverse.from_snapshot(path, rebuild=False)
+    assert restored.all_tools == tu.all_tools
+    assert restored._snapshot.keyword_index(ToolFinderKeyword({}).exclude_tools) is None
+    restored.close()
+
+    data[state_offset + 10] ^= 0xFF
+    with open(path, "wb") as f:
+        f.write(data)
+    with pytest.raises(StaleSnapshotError, match="corrupted"):
+        ToolUniverse.from_snapshot(path, rebuild=False)
+    assert ToolUniverse.from_snapshot(path).all_tools == tu.all_tools
+
+    other = tmp_path / "other.tus"
+    other.write_text("not a snapshot")
+    with pytest.raises(SnapshotError, match="not a ToolUniverse snapshot"):
+        ToolUniverse.from_snapshot(str(other))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Tests for cached read-only tool prompt and specification views."""
+
+import copy
+import json
+import os
+import pickle
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+from tooluniverse import ToolUniverse
+from tooluniverse.tool_views import FrozenDict, FrozenList, freeze
+
+
+def _tool(name, **extra):
+    return {
+        "name": name,
+        "type": "DemoTool",
+        "description": f"{name} tool",
+        "parameter": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "required": True},
+                "limit": {"type": "integer"},
+            },
+            "required": ["query"],
+        },
+        **extra,
+    }
+
+
+@pytest.fixture
+def tu():
+    tu = ToolUniverse(tool_files={}, keep_default_tools=False)
+    tu.all_tools = [_tool("alpha", label=["x"]), _tool("beta")]
+    tu._filter_and_deduplicate_tools(set(), None)
+    return tu
+
+
+@pytest.mark.unit
+def test_frozen_views_behave_like_plain_json_values():
+    """Views compare, serialize and copy like dicts/lists but reject edits."""
+    config = _tool("alpha")
+    view = freeze(config)
+    assert isinstance(view, FrozenDict) and isinstance(view, dict)
+    assert isinstance(view["parameter"]["required"], FrozenList)
+    assert view == config
+    assert json.dumps(view) == json.dumps(config)
+
+    with pytest.raises(TypeError, match="read-only"):
+        view["name"] = "other"
+    with pytest.raises(TypeError):
+        view["parameter"]["properties"].pop("limit")
+    with pytest.raises(TypeError):
+        view["parameter"]["required"].append("limit")
+
+    for editable in (copy.deepcopy(view), pickle.loads(pickle.dumps(view))):
+        assert type(editable) is dict
+        assert type(editable["parameter"]["required"]) is list
+        editable["parameter"]["required"].append("limit")
+        assert editable != view
+
+
+@pytest.mark.unit
+def test_views_are_cached_until_the_tool_changes(tu):
+    """Repeated requests return the same view; changes rebuild only that tool."""
+    alpha, beta = tu.all_tools
+    first = tu.prepare_tool_prompts(tu.all_tools)
+    assert first == [
+        {k: tool[k] for k in ("name", "description", "parameter")}
+        for tool in (alpha, beta)
+    ]
+    second = tu.prepare_tool_prompts(tu.all_tools)
+    assert all(a is b for a, b in zip(first, second))
+    assert tu.prepare_one_tool_prompt(alpha) is first[0]
+    assert tu.prepare_tool_prompts([alpha], mode="custom", valid_keys=["label"]) == [
+        {"label": ["x"]}
+    ]
+
+    alpha["description"] = "changed"
+    assert tu.prepare_one_tool_prompt(alpha)["description"] == "changed"
+    assert tu.prepare_one_tool_prompt(beta) is first[1]
+
+    alpha["parameter"]["properties"]["limit"]["type"] = "number"
+    assert tu.prepare_one_tool_prompt(alpha)["parameter"]["properties"]["limit"] == {
+        "type": "integer"
+    }
+    tu.tool_catalog.add(alpha)
+    assert tu.prepare_one_tool_prompt(alpha)["parameter"]["properties"]["limit"] == {
+        "type": "number"
+    }
+
+    detached = _tool("alpha")
+    assert tu.prepare_one_tool_prompt(detached) is not tu.prepare_one_tool_prompt(
+        detached
+    )
+
+
+@pytest.mark.unit
+def test_specification_formats_and_json(tu):
+    """tool_specification keeps its formats; JSON output joins cached strings."""
+    default = tu.tool_specification("alpha")
+    assert default["parameter"]["properties"] == {
+        "query": {"type": "string", "required": True},
+        "limit": {"type": "integer", "required": False},
+    }
+    assert "required" not in tu.all_tools[0]["parameter"]["properties"]["limit"]
+
+    openai = tu.tool_specification("alpha", format="openai")
+    assert openai == {
+        "name": "alpha",
+        "description": "alpha tool",
+        "parameters": {
+            "type": "object",
+            "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+            "required": ["query"],
+        },
+    }
+    mcp = tu.tool_specification("alpha", format="mcp")
+    assert mcp["inputSchema"] == openai["parameters"]
+    assert tu.tool_specification("alpha", return_prompt=True) is (
+        tu.prepare_one_tool_prompt(tu.all_tools[0])
+    )
+
+    assert json.loads(tu.get_tool_specifications_json()) == [
+        openai,
+        tu.tool_specification("beta", format="openai"),
+    ]
+    assert json.loads(tu.get_tool_specifications_json(["beta", "missing"], "mcp")) == [
+        tu.tool_specification("beta", format="mcp")
+    ]
+    with pytest.raises(ValueError):
+        tu.get_tool_specifications_json(format="yaml")
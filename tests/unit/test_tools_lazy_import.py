@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Import-time regression tests for the lazy ``tooluniverse.tools`` package."""
+
+import ast
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("TOOLUNIVERSE_LIGHT_IMPORT", "1")
+
+import tooluniverse.tools as tools
+from tooluniverse.generate_tools import generate_init
+
+TOOLS_DIR = Path(tools.__file__).parent
+
+# Hard ceilings for importing one tool once ``tooluniverse`` itself is loaded.
+MAX_IMPORT_SECONDS = 0.5
+MAX_NEW_MODULES = 10
+
+_PROBE = """
+import json, sys, time
+import tooluniverse
+before = set(sys.modules)
+start = time.perf_counter()
+from tooluniverse.tools import UniProt_get_entry_by_accession
+elapsed = time.perf_counter() - start
+new = sorted(set(sys.modules) - before)
+print(json.dumps({"elapsed": elapsed, "modules": new,
+                  "callable": callable(UniProt_get_entry_by_accession)}))
+"""
+
+
+@pytest.mark.unit
+def test_importing_one_tool_stays_under_ceilings():
+    """One tool import loads only its own module, within a fixed time budget."""
+    env = dict(os.environ, TOOLUNIVERSE_LIGHT_IMPORT="1")
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    probe = json.loads(output.strip().splitlines()[-1])
+
+    assert probe["callable"]
+    assert len(probe["modules"]) <= MAX_NEW_MODULES, probe["modules"]
+    tool_modules = [m for m in probe["modules"] if m.startswith("tooluniverse.tools.")]
+    assert sorted(tool_modules) == [
+        "tooluniverse.tools.UniProt_get_entry_by_accession",
+        "tooluniverse.tools._shared_client",
+    ]
+    assert probe["elapsed"] < MAX_IMPORT_SECONDS
+
+
+@pytest.mark.unit
+def test_lazy_attributes_dir_and_stub_agree():
+    """__all__, __dir__, the module map and the .pyi stub list the same tools."""
+    names = set(tools._TOOL_MODULES)
+    assert set(tools.__all__) == names | {"get_shared_client", "reset_shared_client"}
+    assert names <= set(dir(tools))
+
+    tool = tools.ArXiv_search_papers
+    assert callable(tool) and tool.__name__ == "ArXiv_search_papers"
+    assert tools.__dict__["ArXiv_search_papers"] is tool
+    with pytest.raises(AttributeError):
+        tools.not_a_real_tool
+
+    stub = ast.parse((TOOLS_DIR / "__init__.pyi").read_text())
+    stubbed = {
+        alias.asname
+        for node in stub.body
+        if isinstance(node, ast.ImportFrom) and node.module != "_shared_client"
+        for alias in node.names
+        if alias.asname
+    }
+    assert stubbed == names
+
+
+@pytest.mark.unit
+def test_generate_init_writes_lazy_package(tmp_path):
+    """The generator emits the lazy __init__.py and a matching stub."""
+    (tmp_path / "_shared_client.py").write_text(
+        "def get_shared_client():\n    pass\n\n\ndef reset_shared_client():\n    pass\n"
+    )
+    (tmp_path / "beta_tool.py").write_text("def beta_tool():\n    return 'b'\n")
+    (tmp_path / "alpha_tool.py").write_text("def alpha_tool():\n    return 'a'\n")
+
+    init_path = generate_init(["beta_tool", "alpha_tool"], tmp_path)
+
+    assert "from .alpha_tool import" not in init_path.read_text()
+    stub = (tmp_path / "__init__.pyi").read_text()
+    assert "from .alpha_tool import alpha_tool as alpha_tool" in stub
+
+    sys.path.insert(0, str(tmp_path.parent))
+    try:
+        package = __import__(tmp_path.name)
+        assert package._TOOL_MODULES == {
+            "alpha_tool": "alpha_tool",
+            "beta_tool": "beta_tool",
+        }
+        assert f"{tmp_path.name}.alpha_tool" not in sys.modules
+        assert package.alpha_tool() == "a"
+    finally:
+        sys.path.remove(str(tmp_path.parent))
+        for name in [m for m in sys.modules if m.split(".")[0] == tmp_path.name]:
+            del sys.modules[name]